@@ -0,0 +1,33 @@
+"""Add portfolio_snapshot_version table
+
+Revision ID: a4d6f8b0c2e3
+Revises: c7e1a9d3f5b2
+Create Date: 2026-10-19 14:36:08.127640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d6f8b0c2e3'
+down_revision: Union[str, Sequence[str], None] = 'c7e1a9d3f5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'portfolio_snapshot_version',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('generation', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('portfolio_snapshot_version')
@@ -0,0 +1,40 @@
+"""Add llm_response_cache table
+
+Revision ID: c7e1a9d3f5b2
+Revises: f2b8d41c6a07
+Create Date: 2026-10-19 11:02:17.504913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e1a9d3f5b2'
+down_revision: Union[str, Sequence[str], None] = 'f2b8d41c6a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'llm_response_cache',
+        sa.Column('key', sa.String(length=64), nullable=False),
+        sa.Column('provider', sa.String(), nullable=False),
+        sa.Column('model', sa.String(), nullable=False),
+        sa.Column('response_text', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_used_at', sa.DateTime(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index('ix_llm_response_cache_last_used_at', 'llm_response_cache', ['last_used_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_llm_response_cache_last_used_at', table_name='llm_response_cache')
+    op.drop_table('llm_response_cache')
@@ -0,0 +1,31 @@
+"""Clear portfolio snapshots cached with generated_at
+
+Revision ID: d9b3e5f7a1c4
+Revises: a4d6f8b0c2e3
+Create Date: 2026-10-19 16:12:44.503918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b3e5f7a1c4'
+down_revision: Union[str, Sequence[str], None] = 'a4d6f8b0c2e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Payloads are now stored without generated_at and stamped when served;
+    # older rows would carry the key twice, so let them rebuild.
+    op.execute(sa.text("DELETE FROM portfolio_snapshots"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Snapshots are a cache; the older code rebuilds them on its own
+    op.execute(sa.text("DELETE FROM portfolio_snapshots"))
@@ -0,0 +1,79 @@
+"""Add extraction_root/portfolio_id to repo_stats and indexes for hot query shapes.
+
+Revision ID: e3c5a7d90b12
+Revises: 9b4e55b3f8c4
+Create Date: 2026-10-19 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e3c5a7d90b12"
+down_revision: Union[str, Sequence[str], None] = "9b4e55b3f8c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_repo_stats_portfolio_id_deleted_at", "repo_stats", ["portfolio_id", "deleted_at"]),
+    ("ix_repo_stats_extraction_root_deleted_at", "repo_stats", ["extraction_root", "deleted_at"]),
+    ("ix_repo_stats_project_path_deleted_at", "repo_stats", ["project_path", "deleted_at"]),
+    ("ix_repo_stats_project_name_id", "repo_stats", ["project_name", "id"]),
+    (
+        "ix_user_repo_stats_project_name_path_id",
+        "user_repo_stats",
+        ["project_name", "project_path", "id"],
+    ),
+    ("ix_user_repo_stats_project_path_id", "user_repo_stats", ["project_path", "id"]),
+    (
+        "ix_user_intelligence_summaries_user_email_repo_path",
+        "user_intelligence_summaries",
+        ["user_email", "repo_path"],
+    ),
+    ("ix_resume_items_repo_stat_id", "resume_items", ["repo_stat_id"]),
+    ("ix_project_evidence_repo_stat_id_date", "project_evidence", ["repo_stat_id", "date"]),
+]
+
+# The newest analyzed ZIP whose extraction root contains the repo's path
+_OWNING_ZIP = """
+    SELECT {column} FROM uploaded_zips uz
+    WHERE uz.extraction_path IS NOT NULL
+      AND (
+        repo_stats.project_path = rtrim(uz.extraction_path, '/')
+        OR repo_stats.project_path LIKE rtrim(uz.extraction_path, '/') || '/%'
+      )
+    ORDER BY uz.id DESC
+    LIMIT 1
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("repo_stats") as batch_op:
+        batch_op.add_column(sa.Column("extraction_root", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("portfolio_id", sa.String(), nullable=True))
+
+    # Backfill rows analyzed before the columns existed
+    root = _OWNING_ZIP.format(column="rtrim(uz.extraction_path, '/')")
+    portfolio = _OWNING_ZIP.format(column="uz.portfolio_id")
+    op.execute(
+        sa.text(
+            f"UPDATE repo_stats SET extraction_root = ({root}), portfolio_id = ({portfolio}) "
+            "WHERE extraction_root IS NULL"
+        )
+    )
+
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    with op.batch_alter_table("repo_stats") as batch_op:
+        batch_op.drop_column("portfolio_id")
+        batch_op.drop_column("extraction_root")
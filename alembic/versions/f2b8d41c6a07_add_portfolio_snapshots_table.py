@@ -0,0 +1,36 @@
+"""Add portfolio_snapshots table
+
+Revision ID: f2b8d41c6a07
+Revises: e3c5a7d90b12
+Create Date: 2026-10-19 10:12:44.318206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d41c6a07'
+down_revision: Union[str, Sequence[str], None] = 'e3c5a7d90b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'portfolio_snapshots',
+        sa.Column('portfolio_id', sa.String(), nullable=False),
+        sa.Column('prefs_hash', sa.String(length=64), nullable=False),
+        sa.Column('etag', sa.String(length=64), nullable=False),
+        sa.Column('payload_json', sa.Text(), nullable=False),
+        sa.Column('built_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('portfolio_id', 'prefs_hash')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('portfolio_snapshots')
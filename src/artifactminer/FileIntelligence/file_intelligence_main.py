@@ -4,12 +4,12 @@
 # also using basic string matching in order to comply with non-AI file analysis.
 
 
-from git import List, Tuple
-from pypdf import PdfReader
+from typing import List, Tuple
 
+from artifactminer.db.consent_snapshot import ConsentSnapshot, load_consent_snapshot
 from artifactminer.RepositoryIntelligence.repo_intelligence_AI import user_allows_llm, getLLMResponse
 #CRAWLER INTEGRATION
-async def get_crawler_file_contents(file_values : List[Tuple[str, str, str]]) -> List[str]:
+async def get_crawler_file_contents(file_values : List[Tuple[str, str, str]], consent: ConsentSnapshot | None = None) -> List[str]:
     
 
     if file_values is None:
@@ -18,12 +18,13 @@ async def get_crawler_file_contents(file_values : List[Tuple[str, str, str]]) ->
         return ["no response, file value is empty."]
     
     str_response_list = [] #update this message based on file type...
+    consent = consent or load_consent_snapshot() #read consent once for the whole batch of files
     
     for file_data in file_values:
         if file_data[2] == ".pdf":
-            str_response = await analyze_pdf(file_path=file_data[1]) #get relative path
+            str_response = await analyze_pdf(file_path=file_data[1], consent=consent) #get relative path
         elif file_data[2] == ".md":
-            str_response = await analyze_markdown(file_path=file_data[1])
+            str_response = await analyze_markdown(file_path=file_data[1], consent=consent)
         else:
             continue #skip other file types for now, can add more analysis functions later for different file types.
         str_response_list.append(str_response)
@@ -34,12 +35,13 @@ async def get_crawler_file_contents(file_values : List[Tuple[str, str, str]]) ->
     return str_response_list
 
 
-async def analyze_pdf(file_path):
+async def analyze_pdf(file_path, consent: ConsentSnapshot | None = None):
     """
     Analyze a PDF file, detecting if it's a resume and extracting relevant information.
     
     Args:
         file_path: Path to the PDF file to analyze
+        consent: Consent snapshot from the caller; loaded (cached) when omitted
         
     Returns:
         Analysis results as a string or dict
@@ -56,7 +58,7 @@ async def analyze_pdf(file_path):
     if is_resume:
         print(f"Detected resume in: {file_path}")
     
-    if user_allows_llm():
+    if user_allows_llm(consent):
         # Customize prompt based on whether it's a resume
         if is_resume:
             prompt = (
@@ -68,7 +70,7 @@ async def analyze_pdf(file_path):
             prompt = "Analyze the following PDF file and extract key information relevant for a resume:\n\n"
         
         prompt += text
-        response = await getLLMResponse(prompt)
+        response = await getLLMResponse(prompt, consent)
         return response
     else:
         print("User has not consented to LLM usage. Performing basic analysis.")
@@ -85,6 +87,8 @@ async def analyze_pdf(file_path):
     return f"Basic analysis of PDF file at {file_path} completed."
 
 def extract_text_from_pdf(file_path):
+    from pypdf import PdfReader  # only PDF analysis needs pypdf; keep it off the import path
+
     text = ""
     try:
         with open(file_path, 'rb') as file:
@@ -96,12 +100,13 @@ def extract_text_from_pdf(file_path):
     return text
 
 
-async def analyze_markdown(file_path):
+async def analyze_markdown(file_path, consent: ConsentSnapshot | None = None):
     """
     Analyze a Markdown file, detecting if it's a resume and extracting relevant information.
 
     Args:
         file_path: Path to the Markdown file to analyze
+        consent: Consent snapshot from the caller; loaded (cached) when omitted
 
     Returns:
         Analysis results as a string
@@ -137,7 +142,7 @@ async def analyze_markdown(file_path):
         print(f"Detected resume-style Markdown in: {file_path}")
 
     # LLM path
-    if user_allows_llm():
+    if user_allows_llm(consent):
         if is_resume:
             prompt = (
                 "Summarize the following resume written in Markdown and extract key information. "
@@ -151,7 +156,7 @@ async def analyze_markdown(file_path):
             )
 
         prompt += text
-        response = await getLLMResponse(prompt)
+        response = await getLLMResponse(prompt, consent)
         return response
 
     # Non-LLM basic analysis (string format)
@@ -1,216 +1,240 @@
-from typing import List, Dict
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
 
 ActivityKey = ["code", "test", "design", "docs", "config"]
 
+# Commits kept in the per-sha memo; enough for several large repos in one run
+DEFAULT_COMMIT_CACHE_SIZE = 50_000
+
+# --------------------
+# Line rules, compiled once. Keyword rules run on the line lowercased once.
+# --------------------
+_COMMENT_MARKER = re.compile(r"#|//|/\*")  # leftmost of the three markers
+_TEST_MARKERS = re.compile(r"assert |assert\(|pytest|unittest|expect\(|describe\(| it\(| test_")
+_TEST_PREFIXES = ("def test_", "test(")
+_CONFIG_KEYWORDS = re.compile(r"toml|yaml|yml|json|settings|config")
+_DESIGN_KEYWORDS = re.compile(
+    r"figma|wireframe|mockup|prototype|ui spec|ux spec|screen flow|user flow"
+)
+_DOCSTRING_QUOTES = ('"""', "'''")
+_CONTROL_PREFIXES = ("if ", "while ", "for ")
+_DEFINITION_PREFIXES = ("def ", "class ")
+
+
+class CommitActivity(NamedTuple):
+    """Per-commit line counts; what gets memoized for a commit sha."""
+
+    lines_added: int = 0
+    code_lines: int = 0
+    doc_lines: int = 0
+    config_lines: int = 0
+    has_test: bool = False
+    has_design: bool = False
+
+
+_commit_cache: "OrderedDict[str, CommitActivity]" = OrderedDict()
+_commit_cache_lock = threading.Lock()
+
+
+def is_commit_classified(sha: str) -> bool:
+    """True when ``sha``'s activity is memoized, so its patch needn't be read again."""
+    with _commit_cache_lock:
+        return sha in _commit_cache
+
+
+def clear_commit_activity_cache() -> None:
+    with _commit_cache_lock:
+        _commit_cache.clear()
+
+
+def _config_signals(raw: str, stripped: str, lower: str) -> int:
+    """Number of config-like signals on one line (env assignment + one structural rule)."""
+    hits = 1 if "environ" in raw and "=" in raw else 0
+    # env-style: FOO=bar (no '==' and uppercase key)
+    if (
+        "=" in raw
+        and "==" not in raw
+        and not stripped.startswith(_CONTROL_PREFIXES)
+        and raw.split("=", 1)[0].strip().isupper()
+    ):
+        return hits + 1
+    # yaml-style: key: value (no trailing ';', no def/class)
+    if ":" in raw and not stripped.endswith(";") and not stripped.startswith(_DEFINITION_PREFIXES):
+        key_part = raw.split(":", 1)[0].strip()
+        if key_part and key_part.replace("-", "_").replace(".", "").isalnum():
+            hits += 1
+        return hits
+    # obvious config keywords on simple lines
+    if _CONFIG_KEYWORDS.search(lower) and len(stripped.split()) <= 4:
+        hits += 1
+    return hits
+
+
+def classify_addition(addition: str) -> CommitActivity:
+    """Classify one commit's added lines. Pure function of the text."""
+    lines = [ln for ln in addition.splitlines() if ln.strip()]
+    if not lines:
+        return CommitActivity()
+
+    code_lines = doc_lines = config_lines = 0
+    has_test = has_design = False
+    in_docstring_block = False  # multi-line Python docstrings
+
+    for raw in lines:
+        stripped = raw.strip()
+
+        # DOCSTRING handling (Python triple-quoted strings): docs only, never code/config
+        if in_docstring_block:
+            doc_lines += 1
+            if stripped.endswith(_DOCSTRING_QUOTES):
+                in_docstring_block = False
+            continue
+        if stripped.startswith(_DOCSTRING_QUOTES):
+            doc_lines += 1
+            # Multi-line block if it doesn't close here
+            if not stripped.endswith(_DOCSTRING_QUOTES) or len(stripped) == 3:
+                in_docstring_block = True
+            continue
+
+        # HTML comment-only docs (e.g. PR templates)
+        if stripped.startswith("<!--"):
+            doc_lines += 1
+            continue
 
-def classify_commit_activities(additions: List[str]) -> dict:
+        # Split into code vs comment part at the first #, //, or /*
+        lower = raw.lower()
+        marker = _COMMENT_MARKER.search(lower)
+        if marker is None:
+            code_lower, comment_lower = lower.strip(), ""
+        else:
+            code_lower = lower[: marker.start()].strip()
+            comment_lower = lower[marker.start():].strip()
+
+        if code_lower:
+            code_lines += 1
+            # TEST detection (code-focused)
+            if not has_test and (
+                _TEST_MARKERS.search(code_lower) or code_lower.startswith(_TEST_PREFIXES)
+            ):
+                has_test = True
+            # Inline comments on code lines count as docs too
+            if comment_lower:
+                doc_lines += 1
+        elif comment_lower:
+            # Pure comment-only lines: docs, and the only place design refs count
+            doc_lines += 1
+            if not has_design and _DESIGN_KEYWORDS.search(comment_lower):
+                has_design = True
+
+        # CONFIG detection (config-like structure)
+        config_lines += _config_signals(raw, stripped, lower)
+
+    return CommitActivity(
+        lines_added=len(lines),
+        code_lines=code_lines,
+        doc_lines=doc_lines,
+        config_lines=config_lines,
+        has_test=has_test,
+        has_design=has_design,
+    )
+
+
+def classify_commit(sha: str, addition: Optional[str]) -> Optional[CommitActivity]:
+    """``classify_addition`` memoized per commit sha.
+
+    ``addition`` may be None when the caller skipped reading the patch because
+    ``is_commit_classified(sha)`` was true. If the entry was evicted since,
+    None is returned (and nothing memoized) so the caller can read the patch.
+    """
+    with _commit_cache_lock:
+        cached = _commit_cache.get(sha)
+        if cached is not None:
+            _commit_cache.move_to_end(sha)
+            return cached
+    if addition is None:
+        return None
+    activity = classify_addition(addition)
+    with _commit_cache_lock:
+        _commit_cache[sha] = activity
+        while len(_commit_cache) > DEFAULT_COMMIT_CACHE_SIZE:
+            _commit_cache.popitem(last=False)
+    return activity
+
+
+def classify_user_commits(
+    commits: Iterable[Tuple[str, Optional[str], bool]],
+    read_commit: Optional[Callable[[str], Tuple[str, Optional[str], bool]]] = None,
+) -> dict:
+    """``classify_commit_activities`` over ``(sha, text, partial)`` items, memoized per sha.
+
+    Items are ``iter_user_additions``' ``CommitAdditions``. Re-analysing a repo
+    never reclassifies (or needs the patch of) a known commit; partial patches
+    are classified but not memoized, so a later full read replaces them.
+    An item without text whose memo entry was evicted in the meantime is
+    read again with ``read_commit(sha)``.
+    """
+
+    def classify(sha: str, text: Optional[str], partial: bool) -> Optional[CommitActivity]:
+        return classify_addition(text or "") if partial else classify_commit(sha, text)
+
+    def activities() -> Iterator[CommitActivity]:
+        for sha, text, partial in commits:
+            activity = classify(sha, text, partial)
+            if activity is None:
+                if read_commit is None:
+                    raise KeyError(f"commit {sha} is no longer classified and can't be re-read")
+                activity = classify(*read_commit(sha))
+            yield activity
+
+    return _summarize_activities(activities())
+
+
+def classify_commit_activities(additions: Iterable[str]) -> dict:
     """
     Classify commit activity based on added text blobs.
 
+    - ``additions`` may be any iterable of per-commit blobs (e.g. a generator); it is
+      consumed once and only the running per-category counters are kept.
+
     - A single commit can contribute to multiple categories (code + test + docs + config, etc.)
     - Docs are detected from comment-only lines, inline comments, and Python/HTML doc-like blocks.
     - A line with both code and a comment counts as one code line AND one docs line.
     - Percentages are based on category line counts and normalized to sum to 100.
     """
+    return _summarize_activities(classify_addition(addition) for addition in additions)
+
+
+def _summarize_activities(activities: Iterable[CommitActivity]) -> dict:
     activity_summary: Dict[str, dict] = {
         key: {"commits": 0, "lines_added": 0} for key in ActivityKey
     }
 
-    for addition in additions:
-        lines = addition.splitlines()
-        non_blank_lines = [ln for ln in lines if ln.strip()]
-        lines_added = len(non_blank_lines)
-        if lines_added == 0:
+    for activity in activities:
+        if activity.lines_added == 0:
             continue
 
-        has_test = False
-        has_docs = False
-        has_config = False
-        has_design = False
-
-
-        code_lines = 0
-        doc_like_lines = 0
-        config_like_lines = 0
-
-        # Track multi-line Python docstrings
-        in_docstring_block = False
-
-        for line in non_blank_lines:
-            raw = line.rstrip("\n")
-            stripped = raw.strip()
-
-            # --------------------
-            # DOCSTRING handling (Python triple-quoted strings)
-            # --------------------
-            if in_docstring_block:
-                # Entire line is considered docs
-                doc_like_lines += 1
-
-                if stripped.endswith('"""') or stripped.endswith("'''"):
-                    in_docstring_block = False
-
-                # Don't treat as code/config
-                continue
-
-            if stripped.startswith('"""') or stripped.startswith("'''"):
-                # Opening (or one-line) docstring: docs++
-                doc_like_lines += 1
-
-                # Multi-line block if it doesn't close here
-                if not (stripped.endswith('"""') or stripped.endswith("'''")) or len(
-                    stripped
-                ) == 3:
-                    in_docstring_block = True
-
-                # Docstrings are treated as docs only, not code
-                continue
-
-            # --------------------
-            # HTML comment-only docs (e.g. PR templates)
-            # --------------------
-            if stripped.startswith("<!--"):
-                doc_like_lines += 1
-                continue
-
-            # --------------------
-            # Split into code vs comment part for #, //, /*, etc.
-            # --------------------
-            comment_markers = ["#", "//", "/*"]
-            split_index = None
-
-            for marker in comment_markers:
-                idx = raw.find(marker)
-                if idx != -1 and (split_index is None or idx < split_index):
-                    split_index = idx
-
-            if split_index is None:
-                code_part = raw
-                comment_part = ""
-            else:
-                code_part = raw[:split_index]
-                comment_part = raw[split_index:]
-
-            code_part_stripped = code_part.strip()
-            comment_part_stripped = comment_part.strip()
-
-            has_code = bool(code_part_stripped)
-            has_comment_only = (not has_code) and bool(comment_part_stripped)
-            has_inline_comment = has_code and bool(comment_part_stripped)
-
-            if has_code:
-                code_lines += 1
-
-            code_lower = code_part_stripped.lower()
-            comment_lower = comment_part_stripped.lower()
-            lower_whole = raw.strip().lower()
-
-            # --------------------
-            # TEST detection (code-focused)
-            # --------------------
-            if code_lower:
-                if (
-                    "assert " in code_lower
-                    or "assert(" in code_lower
-                    or "pytest" in code_lower
-                    or "unittest" in code_lower
-                    or "expect(" in code_lower
-                    or "describe(" in code_lower
-                    or " it(" in code_lower
-                    or code_lower.startswith("def test_")
-                    or " test_" in code_lower
-                    or code_lower.startswith("test(")
-                ):
-                    has_test = True
-
-            # --------------------
-            # DOCS detection (comments / inline docs)
-            # --------------------
-            # Pure comment-only lines → docs
-            if has_comment_only:
-                doc_like_lines += 1
-
-            # Inline comments on code lines → count as docs too
-            if has_inline_comment:
-                doc_like_lines += 1
-
-            # --------------------
-            # CONFIG detection (config-like structure)
-            # --------------------
-            # env-style: FOO=bar (no '==' and uppercase key)
-            if "environ" in raw and "=" in raw:
-                config_like_lines += 1
-
-            if (
-                "=" in raw
-                and "==" not in raw
-                and not raw.strip().startswith(("if ", "while ", "for "))
-                and raw.split("=", 1)[0].strip().isupper()
-            ):
-                config_like_lines += 1
-            # yaml-style: key: value (no trailing ';', no def/class)
-            elif (
-                ":" in raw
-                and not raw.strip().endswith(";")
-                and not raw.lstrip().startswith(("def ", "class "))
-            ):
-                key_part = raw.split(":", 1)[0].strip()
-                if key_part and key_part.replace("-", "_").replace(".", "").isalnum():
-                    config_like_lines += 1
-            # obvious config keywords on simple lines
-            elif any(
-                kw in lower_whole
-                for kw in ["toml", "yaml", "yml", "json", "settings", "config"]
-            ):
-                if len(raw.strip().split()) <= 4:
-                    config_like_lines += 1
-
-            # --------------------
-            # DESIGN detection (comment-only or doc-style references)
-            # --------------------
-            if has_comment_only:
-                if any(
-                    kw in comment_lower
-                    for kw in [
-                        "figma",
-                        "wireframe",
-                        "mockup",
-                        "prototype",
-                        "ui spec",
-                        "ux spec",
-                        "screen flow",
-                        "user flow",
-                    ]
-                ):
-                    has_design = True
-
-        # Decide docs/config based on line counts
-        if doc_like_lines > 0:
-            has_docs = True
-
-        if config_like_lines > 0:
-            has_config = True
-
         # --- accumulate per-category stats ---
-        if has_test:
+        if activity.has_test:
             activity_summary["test"]["commits"] += 1
-            activity_summary["test"]["lines_added"] += lines_added  # commit-level
+            activity_summary["test"]["lines_added"] += activity.lines_added  # commit-level
 
-        if has_docs:
+        if activity.doc_lines > 0:
             activity_summary["docs"]["commits"] += 1
-            activity_summary["docs"]["lines_added"] += doc_like_lines
+            activity_summary["docs"]["lines_added"] += activity.doc_lines
 
-        if has_config:
+        if activity.config_lines > 0:
             activity_summary["config"]["commits"] += 1
-            activity_summary["config"]["lines_added"] += config_like_lines
+            activity_summary["config"]["lines_added"] += activity.config_lines
 
-        if has_design:
+        if activity.has_design:
             activity_summary["design"]["commits"] += 1
-            activity_summary["design"]["lines_added"] += lines_added
+            activity_summary["design"]["lines_added"] += activity.lines_added
 
-        if code_lines > 0:
+        if activity.code_lines > 0:
             activity_summary["code"]["commits"] += 1
-            activity_summary["code"]["lines_added"] += code_lines
+            activity_summary["code"]["lines_added"] += activity.code_lines
 
     # --- percentages based on category line counts ---
     total_lines = sum(v["lines_added"] for v in activity_summary.values())
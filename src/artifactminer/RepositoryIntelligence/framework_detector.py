@@ -3,159 +3,90 @@ Framework Detection Module for Repository Intelligence
 Detects frameworks by analyzing dependency files and configuration files
 """
 
-from pathlib import Path
-from typing import Dict, List
-
-import json
+from typing import Dict, List, Optional
 
 from artifactminer.mappings import FRAMEWORK_DEPENDENCIES_BY_ECOSYSTEM
-
-
-def _framework_needles(ecosystem: str) -> Dict[str, str]:
-    return FRAMEWORK_DEPENDENCIES_BY_ECOSYSTEM.get(ecosystem, {})
-
-
-def _scan_text_for_frameworks(content: str, needles: Dict[str, str]) -> List[str]:
-    """Return frameworks whose dependency needle appears in the provided text content."""
-    found: List[str] = []
-    for dep, skill in needles.items():
-        if dep in content and skill not in found:
-            found.append(skill)
-    return found
-
-
-def detect_python_frameworks(repo_path: str) -> List[str]:
-    frameworks: List[str] = []
-    repo_path = Path(repo_path)
-    needles = _framework_needles("python")
-    if not needles:
-        return frameworks
-
-    for filename in ("requirements.txt", "pyproject.toml", "Pipfile", "setup.py"):
-        path = repo_path / filename
-        if not path.exists():
-            continue
-        try:
-            content = path.read_text().lower()
-        except Exception:
-            continue
-        frameworks.extend(_scan_text_for_frameworks(content, needles))
-
-    # preserve insertion order without duplicates
-    seen = set()
-    unique = []
-    for fw in frameworks:
-        if fw not in seen:
-            seen.add(fw)
-            unique.append(fw)
-    return unique
-
-
-def detect_javascript_frameworks(repo_path: str) -> List[str]:
-    frameworks: List[str] = []
-    repo_path = Path(repo_path)
-    needles = _framework_needles("javascript")
-    if not needles:
-        return frameworks
-
-    package_path = repo_path / "package.json"
-    if not package_path.exists():
-        return frameworks
-
-    try:
-        package_data = json.loads(package_path.read_text())
-    except Exception:
-        return frameworks
-
-    dependencies = package_data.get("dependencies", {}) or {}
-    dev_dependencies = package_data.get("devDependencies", {}) or {}
-    all_deps = {**dependencies, **dev_dependencies}
-    dep_keys = {k.lower() for k in all_deps.keys()}
-
-    for dep in dep_keys:
-        skill = needles.get(dep)
-        if skill and skill not in frameworks:
-            frameworks.append(skill)
-
-    return frameworks
-
-
-def detect_java_frameworks(repo_path: str) -> List[str]:
-    frameworks: List[str] = []
-    repo_path = Path(repo_path)
-    needles = _framework_needles("java")
-    if not needles:
-        return frameworks
-
-    for filename in ("pom.xml", "build.gradle", "build.gradle.kts"):
-        path = repo_path / filename
-        if not path.exists():
-            continue
-        try:
-            content = path.read_text().lower()
-        except Exception:
-            continue
-        frameworks.extend(_scan_text_for_frameworks(content, needles))
-
-    seen = set()
-    unique = []
-    for fw in frameworks:
-        if fw not in seen:
-            seen.add(fw)
-            unique.append(fw)
-    return unique
-
-
-def detect_go_frameworks(repo_path: str) -> List[str]:
-    frameworks: List[str] = []
-    repo_path = Path(repo_path)
-    needles = _framework_needles("go")
-    if not needles:
-        return frameworks
-
-    go_mod_path = repo_path / "go.mod"
-    if not go_mod_path.exists():
-        return frameworks
-    try:
-        content = go_mod_path.read_text().lower()
-    except Exception:
-        return frameworks
-
-    frameworks.extend(_scan_text_for_frameworks(content, needles))
-    seen = set()
-    unique = []
-    for fw in frameworks:
-        if fw not in seen:
-            seen.add(fw)
-            unique.append(fw)
-    return unique
-
-
-def detect_frameworks(repo_path: str) -> List[str]:
+from artifactminer.RepositoryIntelligence.manifest_index import (
+    DependencyIndex,
+    NeedleTable,
+    build_dependency_index,
+)
+from artifactminer.RepositoryIntelligence.object_reader import GitObjectReader
+
+
+# One normalized needle table per ecosystem, built once at import
+_FRAMEWORK_TABLES: Dict[str, NeedleTable[str]] = {
+    ecosystem: NeedleTable(ecosystem, needles)
+    for ecosystem, needles in FRAMEWORK_DEPENDENCIES_BY_ECOSYSTEM.items()
+}
+
+
+def _detect_ecosystem_frameworks(
+    ecosystem: str,
+    repo_path: str,
+    reader: Optional[GitObjectReader],
+    index: Optional[DependencyIndex],
+) -> List[str]:
+    """Return frameworks whose dependency is declared in the ecosystem's manifests, in mapping order."""
+    table = _FRAMEWORK_TABLES.get(ecosystem)
+    if not table:
+        return []
+    index = index or build_dependency_index(repo_path, reader=reader)
+    return list(dict.fromkeys(skill for _, skill in table.find(index)))
+
+
+def detect_python_frameworks(
+    repo_path: str, reader: Optional[GitObjectReader] = None, index: Optional[DependencyIndex] = None
+) -> List[str]:
+    """Frameworks from requirements*.txt, pyproject.toml, Pipfile and setup.py."""
+    return _detect_ecosystem_frameworks("python", repo_path, reader, index)
+
+
+def detect_javascript_frameworks(
+    repo_path: str, reader: Optional[GitObjectReader] = None, index: Optional[DependencyIndex] = None
+) -> List[str]:
+    """Frameworks from package.json (all dependency sections)."""
+    return _detect_ecosystem_frameworks("javascript", repo_path, reader, index)
+
+
+def detect_java_frameworks(
+    repo_path: str, reader: Optional[GitObjectReader] = None, index: Optional[DependencyIndex] = None
+) -> List[str]:
+    """Frameworks from pom.xml, build.gradle and build.gradle.kts."""
+    return _detect_ecosystem_frameworks("java", repo_path, reader, index)
+
+
+def detect_go_frameworks(
+    repo_path: str, reader: Optional[GitObjectReader] = None, index: Optional[DependencyIndex] = None
+) -> List[str]:
+    """Frameworks from go.mod."""
+    return _detect_ecosystem_frameworks("go", repo_path, reader, index)
+
+
+def detect_frameworks(
+    repo_path: str, reader: Optional[GitObjectReader] = None, index: Optional[DependencyIndex] = None
+) -> List[str]:
     """
     Detect frameworks in a repository by analyzing:
     - package.json (JavaScript/TypeScript)
-    - requirements.txt, pyproject.toml, Pipfile, setup.py (Python)
+    - requirements*.txt, pyproject.toml, Pipfile, setup.py (Python)
     - pom.xml, build.gradle (Java)
     - go.mod (Go)
 
+    Manifests of nested workspaces are included.
+
     Args:
         repo_path: Path to the repository
+        reader: Optional object reader; manifests are read from HEAD through
+            it before falling back to the working tree
+        index: Optional pre-built dependency index for the repo, shared with
+            skill extraction so manifests are parsed only once
 
     Returns:
         List of detected framework names
     """
-    all_frameworks = []
-    all_frameworks.extend(detect_python_frameworks(repo_path))
-    all_frameworks.extend(detect_javascript_frameworks(repo_path))
-    all_frameworks.extend(detect_java_frameworks(repo_path))
-    all_frameworks.extend(detect_go_frameworks(repo_path))
-
-    seen = set()
-    unique_frameworks = []
-    for framework in all_frameworks:
-        if framework not in seen:
-            seen.add(framework)
-            unique_frameworks.append(framework)
-
-    return unique_frameworks
+    index = index or build_dependency_index(repo_path, reader=reader)
+    frameworks: Dict[str, None] = {}  # insertion-ordered set
+    for ecosystem in ("python", "javascript", "java", "go"):
+        frameworks.update(dict.fromkeys(_detect_ecosystem_frameworks(ecosystem, repo_path, None, index)))
+    return list(frameworks)
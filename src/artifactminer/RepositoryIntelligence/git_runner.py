@@ -0,0 +1,362 @@
+"""Bounded git execution for the Repository Intelligence Module.
+
+Every git call made during analysis goes through ``run_git`` so that a single
+pathological repository (huge binary history, enormous patches) cannot stall a
+whole portfolio run. Output is streamed from the child process and the call is
+cancelled, killing git and any children it spawned, as soon as either the
+per-call or the per-repo time/byte budget is exhausted. Callers get whatever was
+read before the cut-off together with flags saying the result is partial.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, TypeVar, Union
+
+Pathish = Union[os.PathLike, str]
+T = TypeVar("T")
+
+DEFAULT_CALL_TIMEOUT_SECONDS = 30.0
+DEFAULT_CALL_MAX_BYTES = 16_000_000
+DEFAULT_REPO_TIMEOUT_SECONDS = 300.0
+DEFAULT_REPO_MAX_BYTES = 256_000_000
+
+_READ_CHUNK_BYTES = 64 * 1024
+_STDERR_MAX_BYTES = 64 * 1024
+_KILL_WAIT_SECONDS = 5.0
+
+__all__ = [
+    "DEFAULT_CALL_MAX_BYTES",
+    "DEFAULT_CALL_TIMEOUT_SECONDS",
+    "DEFAULT_REPO_MAX_BYTES",
+    "DEFAULT_REPO_TIMEOUT_SECONDS",
+    "GitBudget",
+    "GitBudgetExceededError",
+    "GitResult",
+    "RepoGitBudget",
+    "iter_within_budget",
+    "read_commit_patch",
+    "run_git",
+]
+
+
+@dataclass(frozen=True)
+class GitBudget:
+    """Time and byte limits for git work. ``None`` disables a limit."""
+
+    call_timeout: Optional[float] = DEFAULT_CALL_TIMEOUT_SECONDS
+    call_max_bytes: Optional[int] = DEFAULT_CALL_MAX_BYTES
+    repo_timeout: Optional[float] = DEFAULT_REPO_TIMEOUT_SECONDS
+    repo_max_bytes: Optional[int] = DEFAULT_REPO_MAX_BYTES
+
+
+class RepoGitBudget:
+    """Running account of the git time and bytes spent on one repository.
+
+    Create one per repository and pass it to every git-backed helper that
+    analyzes that repository. Once the repo budget is spent, further calls are
+    skipped and return empty partial results instead of spawning git again.
+    """
+
+    def __init__(self, budget: GitBudget | None = None) -> None:
+        self.budget = budget or GitBudget()
+        self.started_at = time.monotonic()
+        self.bytes_read = 0
+        self.partial = False
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining_time(self) -> Optional[float]:
+        if self.budget.repo_timeout is None:
+            return None
+        return max(0.0, self.budget.repo_timeout - self.elapsed())
+
+    def remaining_bytes(self) -> Optional[int]:
+        if self.budget.repo_max_bytes is None:
+            return None
+        with self._lock:
+            return max(0, self.budget.repo_max_bytes - self.bytes_read)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining_time() == 0.0 or self.remaining_bytes() == 0
+
+    def call_limits(
+        self,
+        timeout: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> tuple[Optional[float], Optional[int]]:
+        """Return the effective (timeout, max_bytes) for the next call."""
+        timeout = _min_limit(
+            timeout if timeout is not None else self.budget.call_timeout,
+            self.remaining_time(),
+        )
+        max_bytes = _min_limit(
+            max_bytes if max_bytes is not None else self.budget.call_max_bytes,
+            self.remaining_bytes(),
+        )
+        return timeout, max_bytes
+
+    def charge(self, nbytes: int) -> None:
+        with self._lock:
+            self.bytes_read += nbytes
+
+    def mark_partial(self) -> None:
+        self.partial = True
+
+
+@dataclass
+class GitResult:
+    """Outcome of a bounded git call."""
+
+    args: List[str]
+    stdout: str = ""
+    stderr: str = ""
+    returncode: Optional[int] = None
+    timed_out: bool = False
+    truncated: bool = False
+    skipped: bool = False  # repo budget was already spent, git never ran
+    elapsed: float = 0.0
+    bytes_read: int = 0
+
+    @property
+    def partial(self) -> bool:
+        return self.timed_out or self.truncated or self.skipped
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.partial
+
+
+class GitBudgetExceededError(RuntimeError):
+    """Raised by ``run_git(check=True)`` when a call was cut short by its budget."""
+
+    def __init__(self, result: GitResult) -> None:
+        self.result = result
+        reason = "skipped" if result.skipped else "timed out" if result.timed_out else "exceeded byte budget"
+        super().__init__(f"git {' '.join(result.args)} {reason} after {result.elapsed:.1f}s")
+
+
+def _min_limit(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+def _wait_remaining(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def _popen_kwargs() -> dict:
+    # Run git in its own process group so cancellation also reaches the
+    # helpers it spawns (pagers, external diff drivers, pack-objects).
+    if os.name == "posix":
+        return {"start_new_session": True}
+    return {"creationflags": getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    if proc.poll() is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
+    try:
+        proc.wait(timeout=_KILL_WAIT_SECONDS)
+    except subprocess.TimeoutExpired:
+        pass
+
+
+def _pump(stream, sink: "queue.Queue[Optional[bytes]]") -> None:
+    try:
+        for chunk in iter(lambda: stream.read1(_READ_CHUNK_BYTES), b""):
+            sink.put(chunk)
+    except (OSError, ValueError):
+        pass
+    finally:
+        sink.put(None)
+
+
+def _drain_stderr(stream, out: bytearray) -> None:
+    try:
+        for chunk in iter(lambda: stream.read1(_READ_CHUNK_BYTES), b""):
+            if len(out) < _STDERR_MAX_BYTES:
+                out.extend(chunk[: _STDERR_MAX_BYTES - len(out)])
+    except (OSError, ValueError):
+        pass
+
+
+def run_git(
+    repo_path: Pathish,
+    args: Iterable[str],
+    *,
+    budget: RepoGitBudget | None = None,
+    timeout: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    check: bool = False,
+) -> GitResult:
+    """Run ``git <args>`` in ``repo_path`` under time and byte budgets.
+
+    Args:
+        repo_path: Working directory for the git command.
+        args: Git arguments, e.g. ``["log", "--format=%H"]``.
+        budget: Per-repo budget to draw from. A fresh default budget is used
+            when omitted, so a lone call is still bounded.
+        timeout: Per-call timeout override in seconds.
+        max_bytes: Per-call stdout cap override. Reading stops (and git is
+            killed) once this many bytes have been received.
+        check: Raise ``subprocess.CalledProcessError`` on a non-zero exit and
+            ``GitBudgetExceededError`` on a partial result.
+
+    Returns:
+        GitResult with decoded stdout (possibly partial) and cut-off flags.
+    """
+    budget = budget or RepoGitBudget()
+    argv = [str(a) for a in args]
+    result = GitResult(args=argv)
+
+    if budget.exhausted:
+        result.skipped = True
+        budget.mark_partial()
+        if check:
+            raise GitBudgetExceededError(result)
+        return result
+
+    call_timeout, call_max_bytes = budget.call_limits(timeout, max_bytes)
+    started = time.monotonic()
+    deadline = started + call_timeout if call_timeout is not None else None
+
+    proc = subprocess.Popen(
+        ["git", *argv],
+        cwd=Path(repo_path),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **_popen_kwargs(),
+    )
+    chunks: "queue.Queue[Optional[bytes]]" = queue.Queue()
+    stderr_buf = bytearray()
+    readers = [
+        threading.Thread(target=_pump, args=(proc.stdout, chunks), daemon=True),
+        threading.Thread(target=_drain_stderr, args=(proc.stderr, stderr_buf), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    out = bytearray()
+    try:
+        while True:
+            wait = None if deadline is None else deadline - time.monotonic()
+            if wait is not None and wait <= 0:
+                result.timed_out = True
+                break
+            try:
+                chunk = chunks.get(timeout=wait)
+            except queue.Empty:
+                result.timed_out = True
+                break
+            if chunk is None:
+                break
+            if call_max_bytes is not None and len(out) + len(chunk) > call_max_bytes:
+                out.extend(chunk[: call_max_bytes - len(out)])
+                result.truncated = True
+                break
+            out.extend(chunk)
+    finally:
+        if result.partial:
+            _kill(proc)
+        else:
+            try:
+                proc.wait(timeout=_wait_remaining(deadline))
+            except subprocess.TimeoutExpired:
+                result.timed_out = True
+                _kill(proc)
+        for reader in readers:
+            reader.join(timeout=_KILL_WAIT_SECONDS)
+
+    result.elapsed = time.monotonic() - started
+    result.bytes_read = len(out)
+    result.returncode = proc.returncode
+    result.stdout = bytes(out).decode("utf-8", errors="replace")
+    result.stderr = bytes(stderr_buf).decode("utf-8", errors="replace")
+    budget.charge(len(out))
+    if result.partial:
+        budget.mark_partial()
+
+    if check:
+        if result.partial:
+            raise GitBudgetExceededError(result)
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, ["git", *argv], output=result.stdout, stderr=result.stderr
+            )
+    return result
+
+
+def iter_within_budget(items: Iterable[T], budget: RepoGitBudget | None) -> Iterator[T]:
+    """Yield from ``items`` until the repo time budget runs out.
+
+    Used around GitPython iterators such as ``repo.iter_commits()``: when the
+    budget is spent, iteration stops early, the budget is flagged partial, and
+    the generator is closed so GitPython terminates its ``rev-list`` process.
+
+    The budget is only checked between items: a ``rev-list`` that stalls
+    before producing the next commit is not interrupted. Git work that must
+    be bounded even then should go through ``run_git``.
+    """
+    if budget is None:
+        yield from items
+        return
+    iterator = iter(items)
+    try:
+        for item in iterator:
+            if budget.exhausted:
+                budget.mark_partial()
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def read_commit_patch(
+    repo_path: Pathish,
+    hexsha: str,
+    *,
+    max_patch_bytes: int = 200_000,
+    budget: RepoGitBudget | None = None,
+) -> str:
+    """Return the unified diff for one commit, reading at most ``max_patch_bytes``.
+
+    git is stopped as soon as the cap is reached instead of buffering the whole
+    patch, so huge binary or generated diffs cost no more than the cap. A cut
+    patch ends with a ``... [truncated]`` marker line.
+    """
+    result = run_git(
+        repo_path,
+        ["show", hexsha, "--patch", "--unified=3", "--no-color", "--no-ext-diff"],
+        budget=budget,
+        max_bytes=max_patch_bytes,
+    )
+    patch = result.stdout
+    if result.partial:
+        patch += "\n... [truncated]"
+    return patch
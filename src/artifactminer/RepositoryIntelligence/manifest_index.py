@@ -0,0 +1,372 @@
+"""Parsed dependency manifests for the Repository Intelligence Module.
+
+``DependencyIndex`` reads every dependency manifest in a repository once
+(``package.json``, ``pyproject.toml``, ``requirements*.txt``, ``Pipfile``,
+``setup.py``, ``go.mod``, ``pom.xml``, Gradle build files), including manifests
+of nested workspaces (any depth up to ``MAX_MANIFEST_DEPTH``, skipping vendored
+directories), and parses them into normalized dependency names per
+ecosystem. Framework detection and skill extraction both query it, so each
+manifest is read and parsed once per repository and every lookup is a set
+membership test instead of a substring scan over the raw file.
+
+Name matching per ecosystem:
+
+- python: PEP 503 normalized project names (``Email_Validator`` == ``email-validator``)
+- javascript: exact package names (``react`` does not match ``react-native-foo``)
+- java: ``group:artifact`` coordinates; a needle matches an artifact equal to it or
+  extending it at a ``-`` boundary (``spring-boot`` matches ``spring-boot-starter-web``)
+- go: module paths; a needle matches the module or a ``/`` sub-path
+  (``github.com/labstack/echo`` matches ``github.com/labstack/echo/v4``)
+- cross: any ecosystem
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import tomllib
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import AbstractSet, Callable, Dict, Generic, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, TypeVar
+
+from artifactminer.RepositoryIntelligence.git_runner import Pathish
+from artifactminer.RepositoryIntelligence.object_reader import GitObjectReader, read_repo_text
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
+
+# Manifests below these directories are vendored or generated, never the project's own.
+EXCLUDED_MANIFEST_DIRS = frozenset(
+    {
+        "node_modules",
+        "bower_components",
+        "vendor",
+        "third_party",
+        ".venv",
+        "venv",
+        "env",
+        "site-packages",
+        ".tox",
+        "build",
+        "dist",
+        "target",
+        ".gradle",
+    }
+)
+# Deepest directory level searched for workspace manifests (packages/api/package.json is 2).
+MAX_MANIFEST_DEPTH = 4
+
+_PYTHON_MANIFESTS = ("pyproject.toml", "Pipfile", "setup.py")
+_JAVA_MANIFESTS = ("pom.xml", "build.gradle", "build.gradle.kts")
+
+_REQ_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_PEP503_SEP = re.compile(r"[-_.]+")
+_SETUP_REQUIRES = re.compile(
+    r"(?:install_requires|tests_require|setup_requires)\s*=\s*\[(.*?)\]", re.DOTALL
+)
+_QUOTED = re.compile(r"""['"]([^'"]+)['"]""")
+_GRADLE_COORD = re.compile(r"""['"]([\w.\-]+):([\w.\-]+)(?::[^'"]*)?['"]""")
+_GRADLE_MAP = re.compile(
+    r"""group\s*[:=]\s*['"]([^'"]+)['"]\s*,\s*name\s*[:=]\s*['"]([^'"]+)['"]"""
+)
+_POM_ARTIFACT = re.compile(r"<artifactId>\s*([^<\s]+)\s*</artifactId>")
+
+_V = TypeVar("_V")
+
+__all__ = [
+    "DependencyIndex",
+    "EXCLUDED_MANIFEST_DIRS",
+    "NeedleTable",
+    "build_dependency_index",
+    "normalize_dependency",
+]
+
+
+def normalize_dependency(ecosystem: str, name: str) -> str:
+    """Normalize a dependency name the way its ecosystem compares names."""
+    name = name.strip().lower()
+    if ecosystem == "python":
+        return _PEP503_SEP.sub("-", name)
+    return name
+
+
+def _manifest_ecosystem(name: str) -> Optional[str]:
+    if name == "package.json":
+        return "javascript"
+    if name in _PYTHON_MANIFESTS or (name.startswith("requirements") and name.endswith(".txt")):
+        return "python"
+    if name in _JAVA_MANIFESTS:
+        return "java"
+    if name == "go.mod":
+        return "go"
+    return None
+
+
+# ----------------------------------------------------------------- parsers
+
+
+def _requirement_name(spec: str) -> Optional[str]:
+    spec = spec.split("#", 1)[0].strip()
+    if not spec or spec.startswith("-"):
+        return None  # -r other.txt, -e ./pkg, --index-url ...
+    match = _REQ_NAME.match(spec)
+    return match.group(1) if match else None
+
+
+def _parse_requirements(text: str) -> Iterator[str]:
+    for line in text.splitlines():
+        name = _requirement_name(line)
+        if name:
+            yield name
+
+
+def _parse_pyproject(text: str) -> Iterator[str]:
+    try:
+        data = tomllib.loads(text)
+    except tomllib.TOMLDecodeError:
+        # Unparseable file: fall back to anything that looks like a quoted requirement
+        for spec in _QUOTED.findall(text):
+            name = _requirement_name(spec)
+            if name:
+                yield name
+        return
+
+    project = data.get("project", {}) or {}
+    specs: List[str] = list(project.get("dependencies", []) or [])
+    specs.extend(data.get("dependencies", []) or [])  # non-standard top-level list
+    for group in (project.get("optional-dependencies", {}) or {}).values():
+        specs.extend(group or [])
+    for group in (data.get("dependency-groups", {}) or {}).values():
+        specs.extend(item for item in group or [] if isinstance(item, str))
+    for spec in specs:
+        if isinstance(spec, str):
+            name = _requirement_name(spec)
+            if name:
+                yield name
+
+    poetry = (data.get("tool", {}) or {}).get("poetry", {}) or {}
+    tables = [poetry.get("dependencies", {}), poetry.get("dev-dependencies", {})]
+    tables.extend(g.get("dependencies", {}) for g in (poetry.get("group", {}) or {}).values())
+    for table in tables:
+        for name in (table or {}):
+            if name.lower() != "python":
+                yield name
+
+
+def _parse_pipfile(text: str) -> Iterator[str]:
+    try:
+        data = tomllib.loads(text)
+    except tomllib.TOMLDecodeError:
+        return
+    for section in ("packages", "dev-packages"):
+        yield from (data.get(section, {}) or {}).keys()
+
+
+def _parse_setup_py(text: str) -> Iterator[str]:
+    for block in _SETUP_REQUIRES.findall(text):
+        for spec in _QUOTED.findall(block):
+            name = _requirement_name(spec)
+            if name:
+                yield name
+
+
+def _parse_package_json(text: str) -> Iterator[str]:
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return
+    if not isinstance(data, dict):
+        return
+    for section in ("dependencies", "devDependencies", "peerDependencies", "optionalDependencies"):
+        deps = data.get(section) or {}
+        if isinstance(deps, dict):
+            yield from deps.keys()
+
+
+def _parse_go_mod(text: str) -> Iterator[str]:
+    in_block = False
+    for raw in text.splitlines():
+        line = raw.split("//", 1)[0].strip()
+        if not line:
+            continue
+        if in_block:
+            if line.startswith(")"):
+                in_block = False
+            else:
+                yield line.split()[0]
+        elif line.startswith("require"):
+            rest = line[len("require"):].strip()
+            if rest.startswith("("):
+                in_block = True
+            elif rest:
+                yield rest.split()[0]
+
+
+def _xml_local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_pom(text: str) -> Iterator[str]:
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError:
+        for artifact in _POM_ARTIFACT.findall(text):
+            yield f":{artifact}"
+        return
+    for element in root.iter():
+        if _xml_local(element.tag) not in ("dependency", "parent", "plugin"):
+            continue
+        coords = {_xml_local(child.tag): (child.text or "").strip() for child in element}
+        artifact = coords.get("artifactId")
+        if artifact:
+            yield f"{coords.get('groupId', '')}:{artifact}"
+
+
+def _parse_gradle(text: str) -> Iterator[str]:
+    for group, artifact in _GRADLE_COORD.findall(text):
+        yield f"{group}:{artifact}"
+    for group, artifact in _GRADLE_MAP.findall(text):
+        yield f"{group}:{artifact}"
+
+
+def _lookup_keys(ecosystem: str, name: str) -> Set[str]:
+    """All keys under which a parsed dependency can be found by a needle."""
+    if ecosystem == "java":
+        group, _, artifact = name.rpartition(":")
+        keys = {name}
+        parts = artifact.split("-")
+        keys.update("-".join(parts[:i]) for i in range(1, len(parts) + 1))
+        if group:
+            keys.add(group)
+        return keys
+    if ecosystem == "go":
+        parts = name.split("/")
+        return {"/".join(parts[:i]) for i in range(1, len(parts) + 1)}
+    return {name}
+
+
+# ----------------------------------------------------------------- index
+
+
+@dataclass
+class DependencyIndex:
+    """Normalized dependencies per ecosystem, with the manifests declaring them."""
+
+    manifests: Dict[str, str] = field(default_factory=dict)  # rel path -> ecosystem
+    _keys: Dict[str, Dict[str, Set[str]]] = field(default_factory=dict)  # eco -> key -> manifests
+    _names: Dict[str, Set[str]] = field(default_factory=dict)  # eco -> declared names
+
+    def add(self, ecosystem: str, name: str, manifest: str) -> None:
+        normalized = normalize_dependency(ecosystem, name)
+        if not normalized:
+            return
+        self._names.setdefault(ecosystem, set()).add(normalized)
+        keys = self._keys.setdefault(ecosystem, {})
+        for key in _lookup_keys(ecosystem, normalized):
+            keys.setdefault(key, set()).add(manifest)
+        cross = self._keys.setdefault("cross", {})
+        cross.setdefault(normalized, set()).add(manifest)
+
+    def names(self, ecosystem: str) -> Set[str]:
+        """Every normalized dependency name declared for ``ecosystem``."""
+        return set(self._names.get(ecosystem, ()))
+
+    def has(self, ecosystem: str, needle: str) -> bool:
+        """True when any manifest declares a dependency matching ``needle`` (O(1))."""
+        return normalize_dependency(ecosystem, needle) in self._keys.get(ecosystem, {})
+
+    def count(
+        self,
+        ecosystem: str,
+        needle: str,
+        *,
+        manifest_filter: Optional[Callable[[str], bool]] = None,
+    ) -> int:
+        """Number of manifests declaring ``needle``, optionally filtered by path."""
+        manifests = self._keys.get(ecosystem, {}).get(normalize_dependency(ecosystem, needle), ())
+        if manifest_filter is None:
+            return len(manifests)
+        return sum(1 for manifest in manifests if manifest_filter(manifest))
+
+    def keys(self, ecosystem: str) -> AbstractSet[str]:
+        """Every lookup key (names and their boundary prefixes) for ``ecosystem``."""
+        return self._keys.get(ecosystem, {}).keys()
+
+
+class NeedleTable(Generic[_V]):
+    """Needle -> value mapping for one ecosystem, normalized once up front.
+
+    Build one per mapping table at import time. ``find`` intersects the table
+    with the index's lookup keys in a single set operation, so matching costs
+    the same however many needles the mapping grows to, and returns each hit
+    once, in mapping order.
+    """
+
+    def __init__(self, ecosystem: str, needles: Mapping[str, _V]) -> None:
+        self.ecosystem = ecosystem
+        self._order: Dict[str, int] = {}
+        self._entries: Dict[str, Tuple[str, _V]] = {}
+        for needle, value in needles.items():
+            key = normalize_dependency(ecosystem, needle)
+            if key not in self._entries:
+                self._order[key] = len(self._order)
+                self._entries[key] = (needle, value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find(self, index: DependencyIndex) -> List[Tuple[str, _V]]:
+        """``(needle, value)`` pairs declared in ``index``, in mapping order."""
+        hits = self._entries.keys() & index.keys(self.ecosystem)
+        return [self._entries[key] for key in sorted(hits, key=self._order.__getitem__)]
+
+
+def _candidate_manifests(tree: RepoTreeSnapshot) -> Iterable[str]:
+    for rel in tree.files:
+        parts = rel.split("/")
+        if len(parts) - 1 > MAX_MANIFEST_DEPTH:
+            continue
+        if any(part in EXCLUDED_MANIFEST_DIRS for part in parts[:-1]):
+            continue
+        if _manifest_ecosystem(parts[-1]):
+            yield rel
+
+
+def build_dependency_index(
+    repo_path: Pathish,
+    *,
+    reader: Optional[GitObjectReader] = None,
+    tree: Optional[RepoTreeSnapshot] = None,
+) -> DependencyIndex:
+    """Parse every project manifest in ``repo_path`` into a ``DependencyIndex``.
+
+    Manifests are located through ``tree`` (scanned when omitted) and read from
+    HEAD through ``reader`` when one is given, falling back to the working tree.
+    """
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
+    index = DependencyIndex()
+    for rel in _candidate_manifests(tree):
+        text = read_repo_text(repo_path, rel, reader)
+        if text is None:
+            continue
+        name = rel.rpartition("/")[2]
+        ecosystem = _manifest_ecosystem(name)
+        index.manifests[rel] = ecosystem
+        if name == "package.json":
+            deps = _parse_package_json(text)
+        elif name == "pyproject.toml":
+            deps = _parse_pyproject(text)
+        elif name == "Pipfile":
+            deps = _parse_pipfile(text)
+        elif name == "setup.py":
+            deps = _parse_setup_py(text)
+        elif name == "go.mod":
+            deps = _parse_go_mod(text)
+        elif name == "pom.xml":
+            deps = _parse_pom(text)
+        elif ecosystem == "java":
+            deps = _parse_gradle(text)
+        else:
+            deps = _parse_requirements(text)
+        for dep in deps:
+            index.add(ecosystem, dep, rel)
+    return index
@@ -0,0 +1,343 @@
+"""Persistent git object reader for the Repository Intelligence Module.
+
+``GitObjectReader`` keeps one long-lived ``git cat-file --batch-check`` and one
+``git cat-file --batch`` process per repository and answers every blob read
+and size lookup over their pipes. Detectors use it to read manifests and config
+files straight from ``HEAD`` instead of spawning a git process (or touching the
+extracted working tree) per file. A small LRU keeps recently read blobs.
+"""
+
+from __future__ import annotations
+
+import queue
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from artifactminer.RepositoryIntelligence.git_runner import (
+    DEFAULT_CALL_TIMEOUT_SECONDS,
+    Pathish,
+    RepoGitBudget,
+    _kill,
+    _popen_kwargs,
+    _pump,
+    _wait_remaining,
+    run_git,
+)
+
+DEFAULT_MAX_BLOB_BYTES = 2_000_000
+DEFAULT_CACHE_ENTRIES = 256
+DEFAULT_CACHE_BYTES = 8_000_000
+
+_OBJECT_TYPES = {b"blob", b"tree", b"commit", b"tag"}
+
+__all__ = [
+    "DEFAULT_MAX_BLOB_BYTES",
+    "GitObjectInfo",
+    "GitObjectReader",
+    "TreeEntry",
+    "read_repo_text",
+]
+
+
+@dataclass(frozen=True)
+class GitObjectInfo:
+    sha: str
+    type: str
+    size: int
+
+
+@dataclass(frozen=True)
+class TreeEntry:
+    path: str
+    sha: str
+    size: int
+
+
+class _CatFile:
+    """One ``git cat-file`` batch process speaking the line protocol.
+
+    Output is pumped by a reader thread into a queue, so every read can wait
+    with a deadline; a process that stops answering is killed (with its
+    process group) instead of stalling the analysis.
+    """
+
+    def __init__(self, repo_path: Path, mode: str, budget: RepoGitBudget | None = None) -> None:
+        self.repo_path = repo_path
+        self.mode = mode
+        self.budget = budget
+        self.proc: subprocess.Popen | None = None
+        self.broken = False
+        self._chunks: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._buffer = bytearray()
+
+    def _ensure(self) -> subprocess.Popen | None:
+        if self.broken:
+            return None
+        if self.proc is None or self.proc.poll() is not None:
+            try:
+                self.proc = subprocess.Popen(
+                    ["git", "cat-file", self.mode],
+                    cwd=self.repo_path,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    **_popen_kwargs(),
+                )
+            except OSError:
+                self.broken = True
+                return None
+            self._chunks = queue.Queue()
+            self._buffer = bytearray()
+            threading.Thread(target=_pump, args=(self.proc.stdout, self._chunks), daemon=True).start()
+        return self.proc
+
+    def _fill(self, deadline: Optional[float]) -> bool:
+        """Wait for more output; False at EOF or when ``deadline`` passes."""
+        try:
+            chunk = self._chunks.get(timeout=_wait_remaining(deadline))
+        except queue.Empty:
+            self._fail(timed_out=True)
+            return False
+        if chunk is None:
+            self._fail()
+            return False
+        self._buffer += chunk
+        return True
+
+    def _read_line(self, deadline: Optional[float]) -> bytes | None:
+        while b"\n" not in self._buffer:
+            if not self._fill(deadline):
+                return None
+        end = self._buffer.index(b"\n") + 1
+        line = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return line
+
+    def _read_exact(self, size: int, deadline: Optional[float]) -> bytes | None:
+        while len(self._buffer) < size:
+            if not self._fill(deadline):
+                return None
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def _fail(self, *, timed_out: bool = False) -> None:
+        # git exited (not a repository, or crashed) or hung; don't keep respawning
+        proc, self.proc = self.proc, None
+        if proc is not None:
+            _kill(proc)
+        self.broken = True
+        if timed_out and self.budget is not None:
+            self.budget.mark_partial()
+
+    def request(self, spec: str, deadline: Optional[float]) -> GitObjectInfo | None:
+        """Send one object name and return its header, or None if missing or failed."""
+        proc = self._ensure()
+        if proc is None:
+            return None
+        try:
+            proc.stdin.write(spec.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError):
+            self._fail()
+            return None
+        header = self._read_line(deadline)
+        if header is None:
+            return None
+        parts = header.rstrip(b"\n").rsplit(b" ", 2)
+        if len(parts) != 3 or parts[1] not in _OBJECT_TYPES or not parts[2].isdigit():
+            return None  # "<spec> missing" / "ambiguous"
+        return GitObjectInfo(
+            sha=parts[0].decode("ascii", errors="replace"),
+            type=parts[1].decode("ascii"),
+            size=int(parts[2]),
+        )
+
+    def read_body(self, size: int, deadline: Optional[float]) -> bytes | None:
+        """Read an object body of ``size`` bytes and its trailing LF."""
+        data = self._read_exact(size + 1, deadline)
+        return data[:-1] if data is not None else None
+
+    def close(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            _kill(proc)
+
+
+class GitObjectReader:
+    """Read blobs and object metadata from one repository over persistent pipes.
+
+    Use as a context manager (or call ``close()``) so the two ``cat-file``
+    processes are shut down when analysis of the repository finishes::
+
+        with GitObjectReader(repo_path) as reader:
+            text = reader.read_text("package.json")
+    """
+
+    def __init__(
+        self,
+        repo_path: Pathish,
+        *,
+        rev: str = "HEAD",
+        budget: RepoGitBudget | None = None,
+        max_blob_bytes: int = DEFAULT_MAX_BLOB_BYTES,
+        cache_entries: int = DEFAULT_CACHE_ENTRIES,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ) -> None:
+        self.repo_path = Path(repo_path)
+        self.rev = rev
+        self.budget = budget
+        self.max_blob_bytes = max_blob_bytes
+        self._cache_entries = cache_entries
+        self._cache_bytes = cache_bytes
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cached_bytes = 0
+        self._info_cache: dict[str, GitObjectInfo | None] = {}
+        self._check = _CatFile(self.repo_path, "--batch-check", budget)
+        self._batch = _CatFile(self.repo_path, "--batch", budget)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._check.close()
+            self._batch.close()
+
+    def _deadline(self) -> Optional[float]:
+        """When the next pipe read gives up: the budget's call/repo limit, else the default call timeout."""
+        if self.budget is not None:
+            timeout, _ = self.budget.call_limits()
+        else:
+            timeout = DEFAULT_CALL_TIMEOUT_SECONDS
+        return time.monotonic() + timeout if timeout is not None else None
+
+    def _spec(self, path: str, rev: str | None) -> str:
+        return f"{rev or self.rev}:{path.replace(chr(92), '/').lstrip('/')}"
+
+    def info(self, path: str, rev: str | None = None) -> GitObjectInfo | None:
+        """Return (sha, type, size) for ``rev:path`` or None when it doesn't exist."""
+        spec = self._spec(path, rev)
+        with self._lock:
+            if spec not in self._info_cache:
+                info = self._check.request(spec, self._deadline())
+                if info is None and self._check.broken:
+                    return None  # failed, not missing: don't remember it
+                self._info_cache[spec] = info
+            return self._info_cache[spec]
+
+    def read_bytes(self, path: str, rev: str | None = None) -> bytes | None:
+        """Return blob contents for ``rev:path``.
+
+        Returns None for missing paths, non-blobs, blobs larger than
+        ``max_blob_bytes``, or when the repo's git budget is spent.
+        """
+        spec = self._spec(path, rev)
+        with self._lock:
+            cached = self._cache.get(spec)
+            if cached is not None:
+                self._cache.move_to_end(spec)
+                return cached
+
+        info = self.info(path, rev)
+        if info is None or info.type != "blob" or info.size > self.max_blob_bytes:
+            return None
+        if self.budget is not None:
+            if self.budget.exhausted:
+                self.budget.mark_partial()
+                return None
+
+        with self._lock:
+            deadline = self._deadline()
+            header = self._batch.request(info.sha, deadline)
+            if header is None:
+                return None
+            data = self._batch.read_body(header.size, deadline)
+            if data is None:
+                return None
+            self._remember(spec, data)
+
+        if self.budget is not None:
+            self.budget.charge(len(data))
+        return data
+
+    def read_text(self, path: str, rev: str | None = None) -> str | None:
+        data = self.read_bytes(path, rev)
+        if data is None:
+            return None
+        return data.decode("utf-8", errors="ignore")
+
+    def blob_size(self, path: str, rev: str | None = None) -> int | None:
+        info = self.info(path, rev)
+        return info.size if info is not None and info.type == "blob" else None
+
+    def iter_tree(self, rev: str | None = None) -> Iterator[TreeEntry]:
+        """Yield every blob in ``rev`` with its size, from a single ``ls-tree`` call."""
+        result = run_git(
+            self.repo_path,
+            ["ls-tree", "-r", "-l", "-z", "--full-tree", rev or self.rev],
+            budget=self.budget,
+        )
+        if result.returncode not in (0, None) and not result.partial:
+            return
+        records = result.stdout.split("\0")
+        if result.partial and records:
+            records = records[:-1]  # last record may be cut
+        for record in records:
+            meta, sep, path = record.partition("\t")
+            if not sep:
+                continue
+            fields = meta.split()
+            if len(fields) != 4 or fields[1] != "blob":
+                continue
+            size = int(fields[3]) if fields[3].isdigit() else 0
+            yield TreeEntry(path=path, sha=fields[2], size=size)
+
+    def _remember(self, spec: str, data: bytes) -> None:
+        if len(data) > self._cache_bytes:
+            return
+        self._cache[spec] = data
+        self._cached_bytes += len(data)
+        while self._cache and (
+            len(self._cache) > self._cache_entries or self._cached_bytes > self._cache_bytes
+        ):
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+
+def read_repo_text(
+    repo_path: Pathish, rel_path: str, reader: Optional[GitObjectReader] = None
+) -> str | None:
+    """Read a repo file from HEAD via ``reader``, falling back to the working tree.
+
+    The fallback keeps detectors working on plain directories and on files that
+    exist on disk but were never committed.
+    """
+    if reader is not None:
+        text = reader.read_text(rel_path)
+        if text is not None:
+            return text
+    target = Path(repo_path) / rel_path
+    if not target.is_file():
+        return None
+    try:
+        return target.read_text(errors="ignore")
+    except Exception:
+        return None
@@ -2,21 +2,33 @@
 #Owner: Evan/van-cpu
 
 import asyncio
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.exc import SQLAlchemyError
 from artifactminer.db.models import Consent, UserAIntelligenceSummary
 from artifactminer.db.database import SessionLocal
+from artifactminer.db.consent_snapshot import ConsentSnapshot, invalidate_consent_snapshot, load_consent_snapshot
+from artifactminer.db.llm_cache import (
+    DEFAULT_LLM_CACHE_POLICY,
+    LLMCachePolicy,
+    llm_cache_key,
+    lookup_llm_response,
+    store_llm_response,
+)
 from artifactminer.RepositoryIntelligence.repo_intelligence_main import isGitRepo, Pathish
-from artifactminer.helpers.openai import get_gpt5_nano_response
-from artifactminer.helpers.ollama import get_ollama_response
+from artifactminer.helpers.llm_dispatch import dispatch_llm_request
+from artifactminer.helpers.openai import GPT5_NANO_MODEL, get_gpt5_nano_response
+from artifactminer.helpers.ollama import (
+    DEFAULT_MODEL as OLLAMA_MODEL,
+    ERROR_PREFIX as OLLAMA_ERROR_PREFIX,
+    RESPONSE_FORMAT as OLLAMA_FORMAT,
+    get_ollama_response,
+)
 
 
-def get_user_llm_selection() -> str:
-    db = SessionLocal() #create a new database session
+def get_user_llm_selection(consent: Optional[ConsentSnapshot] = None) -> str:
     try:
-        consent = db.get(Consent, 1)
-        if consent is None: #no consent row means default to ollama
-            consent = db.query(Consent).order_by(Consent.id.desc()).first() #get the latest consent row if multiple exist
-        return consent.LLM_model if consent and consent.LLM_model else "chatGPT"#return user's LLM selection or default to "chatGPT"
+        consent = consent or load_consent_snapshot() #cached; only reads the db after a consent change
+        return consent.llm_model #user's LLM selection, "chatGPT" when unset
     except Exception as e:
         print(f"An error occurred: {e}")
         return "chatGPT"
@@ -33,23 +45,69 @@ def set_user_llm_selection(model: str):
         db.commit()
     finally:
         db.close()
+    invalidate_consent_snapshot()
 
-async def getLLMResponse(prompt: str) -> str:
-    if get_user_llm_selection() == "chatGPT":
-        return await get_gpt5_nano_response(prompt)
-    else:
-        return get_ollama_response(prompt)
+def llm_request_target(selection: str) -> Tuple[str, str, Dict[str, Any]]:
+    """(provider, model, options) a prompt is sent with for the user's LLM selection."""
+    if selection == "chatGPT":
+        return "openai", GPT5_NANO_MODEL, {}
+    return "ollama", OLLAMA_MODEL, {"format": OLLAMA_FORMAT}
 
-# Check if user has allowed LLM usage via consent
-def user_allows_llm() -> bool:
-    db = SessionLocal() #create a new database session
+
+def _cached_llm_response(key: str, policy: LLMCachePolicy) -> Optional[str]:
+    db = SessionLocal()
     try:
-        consent = db.get(Consent, 1)
-        if consent is None: #no consent row means no consent given
-            consent = db.query(Consent).order_by(Consent.id.desc()).first() #get the latest consent row if multiple exist
-        return bool(consent and (consent.consent_level or "").lower() in ("local-llm", "cloud"))
+        return lookup_llm_response(db, key, policy=policy)
+    except SQLAlchemyError as e: #a cache that can't be read is a miss, never a failed analysis
+        print(f"LLM cache lookup failed: {e}")
+        return None
+    finally:
+        db.close()
+
+
+def _cache_llm_response(key: str, response: str, provider: str, model: str, policy: LLMCachePolicy) -> None:
+    db = SessionLocal()
+    try:
+        store_llm_response(db, key, response, provider=provider, model=model, policy=policy)
+    except SQLAlchemyError as e:
+        print(f"LLM cache store failed: {e}")
     finally:
         db.close()
+
+
+async def getLLMResponse(
+    prompt: str,
+    consent: Optional[ConsentSnapshot] = None,
+    cache_policy: LLMCachePolicy = DEFAULT_LLM_CACHE_POLICY,
+) -> str:
+    #identical prompts to the same provider/model/options are answered from the persistent cache
+    provider, model, options = llm_request_target(get_user_llm_selection(consent))
+    key = llm_cache_key(provider, model, options, prompt) if cache_policy.enabled else None
+    if key is not None:
+        #SQLite calls block; keep them off the event loop like the Ollama client
+        cached = await asyncio.to_thread(_cached_llm_response, key, cache_policy)
+        if cached is not None:
+            return cached
+
+    #the dispatcher bounds concurrency and request rate per provider and retries transient errors
+    if provider == "openai":
+        response = await dispatch_llm_request(provider, lambda: get_gpt5_nano_response(prompt))
+    else:
+        #the Ollama client blocks; run it off the event loop, as a future so the dispatcher
+        #keeps Ollama's slot until the thread returns even if the deadline gives up on it
+        loop = asyncio.get_running_loop()
+        response = await dispatch_llm_request(
+            provider, lambda: loop.run_in_executor(None, get_ollama_response, prompt, model)
+        )
+
+    #errors come back from Ollama as text; don't keep them, or empty answers
+    if key is not None and response and not response.startswith(OLLAMA_ERROR_PREFIX):
+        await asyncio.to_thread(_cache_llm_response, key, response, provider, model, cache_policy)
+    return response
+
+# Check if user has allowed LLM usage via consent
+def user_allows_llm(consent: Optional[ConsentSnapshot] = None) -> bool:
+    return (consent or load_consent_snapshot()).allows_llm #no consent row means no consent given
 # Set user consent level for LLM usage
 def set_user_consent(level: str):
     db = SessionLocal()
@@ -59,6 +117,7 @@ def set_user_consent(level: str):
         db.commit()
     finally:
         db.close()
+    invalidate_consent_snapshot()
 
 from typing import List
 
@@ -104,11 +163,12 @@ def group_additions_into_blocks(
 
 
 # Create a summary of user additions using LLM
-async def createAIsummaryFromUserAdditions(additions: List[str]) -> str:
+async def createAIsummaryFromUserAdditions(additions: List[str], consent: Optional[ConsentSnapshot] = None) -> str:
     #Each addition in additions is a string of added lines from a single commit
     if not additions:
         return "No additions found for the specified user."
-    if not user_allows_llm():
+    consent = consent or load_consent_snapshot() #one consent read shared by every prompt below
+    if not user_allows_llm(consent):
         return "User has not consented to LLM usage."
     
     # Build all prompts for concurrent execution
@@ -138,11 +198,11 @@ async def createAIsummaryFromUserAdditions(additions: List[str]) -> str:
         prompt += f"{addition}\n\n"
         prompts.append(prompt)
     
-    # Execute all LLM calls concurrently
-    intermediate_summaries = await asyncio.gather(*[getLLMResponse(p) for p in prompts])
+    # Execute all LLM calls concurrently (the LLM dispatcher caps how many are in flight)
+    intermediate_summaries = await asyncio.gather(*[getLLMResponse(p, consent) for p in prompts])
     intermediate_summary = "".join(intermediate_summaries)
 
-    final_summary = "LLM model used: " + get_user_llm_selection() + "\n\n" + await getLLMResponse(
+    final_summary = "LLM model used: " + get_user_llm_selection(consent) + "\n\n" + await getLLMResponse(
     "Create a polished, portfolio-ready summary of this student's overall code contributions. "
     "Only highlight strengths, technical skills, and positive impact. "
     "Do not mention weaknesses, issues, inconsistencies, or anything negative. "
@@ -151,23 +211,25 @@ async def createAIsummaryFromUserAdditions(additions: List[str]) -> str:
     "Keep the tone professional and achievement-oriented. "
     "Be concise and produce a cohesive paragraph or a short set of strong bullets. "
     "Here are the aggregated commit analyses:\n\n"
-    + intermediate_summary
+    + intermediate_summary,
+    consent,
 )
 
     return final_summary
 
 
 # Create a summary of user additions using LLM if consented and without LLM if not
-async def createSummaryFromUserAdditions(additions: List[str]) -> str:
+async def createSummaryFromUserAdditions(additions: List[str], consent: Optional[ConsentSnapshot] = None) -> str:
     summary: str
     if not additions:
         return "No additions found for the specified user."
-    if not user_allows_llm():
+    consent = consent or load_consent_snapshot()
+    if not user_allows_llm(consent):
         #User has not consented to LLM usage we will create a summary without LLM, placeholder for now
         summary = "User has not consented to LLM usage. Summary generation without LLM is not yet implemented."
     else:
         #User has consented to LLM usage we will create a summary with LLM
-        summary = await createAIsummaryFromUserAdditions(additions)
+        summary = await createAIsummaryFromUserAdditions(additions, consent)
     return summary
 
 
@@ -1,16 +1,20 @@
 #Part of the Repository Intelligence Module
 #Owner: Evan/van-cpu
-import subprocess
 import os
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterable, Optional, Union, List
 from pathlib import Path
-import git
+from artifactminer.helpers.lazy_import import lazy_module
 from artifactminer.db.models import RepoStat
 from artifactminer.db.database import SessionLocal
 from artifactminer.RepositoryIntelligence.framework_detector import detect_frameworks
+from artifactminer.RepositoryIntelligence.git_runner import RepoGitBudget, iter_within_budget, run_git
+from artifactminer.RepositoryIntelligence.object_reader import GitObjectReader
+from artifactminer.RepositoryIntelligence.manifest_index import DependencyIndex, build_dependency_index
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
+git = lazy_module("git")  # GitPython loads on first use, not at import
 
 @dataclass
 class RepoStats: #This is the basic Repo class for storing the results of the git files.
@@ -32,19 +36,17 @@ def isGitRepo(path :os.PathLike | str) -> bool:#This function checks whether the
 
 Pathish = Union[os.PathLike, str]#pathlike will accept anything that looks like a path as a string
 
-def runGit(repo_path: Pathish, args: Iterable[str]) -> str: #This function will take the git repo path and run the given git command in the repo. It will fail if the Repo is not a git repo or git is not working properly
+def runGit(repo_path: Pathish, args: Iterable[str], budget: Optional[RepoGitBudget] = None) -> str: #This function will take the git repo path and run the given git command in the repo. It will fail if the Repo is not a git repo or git is not working properly
 #Example : runGit("/path/to/my/repo/", ["rev-parse", "--is-inside-work-tree"]) would return true if that was a real repo
-    result = subprocess.run(# run the git command
-        ["git", *args], #git plus the cmd, we use "rev-parse --is-inside-work-tree" in our example
-        cwd=Path(repo_path),#run it in the selected git repo, we use "/path/to/my/repo/" in the example
-        check=True, #If a non-zero exit happens a called process error is thrown
-        stdout=subprocess.PIPE, #captures output
-        stderr=subprocess.PIPE, #captures errors
-        text=True, #set text to string and not bytes
+    result = run_git( # run the git command through the bounded runner so a stuck git can't hang analysis
+        repo_path, #run it in the selected git repo, we use "/path/to/my/repo/" in the example
+        args, #git plus the cmd, we use "rev-parse --is-inside-work-tree" in our example
+        budget=budget, #optional per-repo time/byte budget shared with the other git calls for this repo
+        check=True, #non-zero exit raises CalledProcessError, hitting the budget raises GitBudgetExceededError
     )
     return result.stdout #return gits printed output
 
-def calculateRepoHealth(repo_path: Pathish, last_commit: Optional[datetime], total_commits: int) -> float:
+def calculateRepoHealth(repo_path: Pathish, last_commit: Optional[datetime], total_commits: int, tree: Optional[RepoTreeSnapshot] = None) -> float:
     """Calculate repository health score (0-100) based on documentation, recency, activity, and best practices.
     
     Health indicators:
@@ -54,10 +56,14 @@ def calculateRepoHealth(repo_path: Pathish, last_commit: Optional[datetime], tot
     - Test presence (test files/directories) - 15 points
     - Configuration files (.gitignore, etc.) - 10 points
     
+    Args:
+        tree: Optional shared snapshot of the repo's files. One is scanned when omitted.
+
     Returns:
         float: Health score from 0.0 to 100.0
     """
-    repo_path = Path(repo_path)
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
     score = 0.0
     
     # Documentation presence (30 points max)
@@ -70,8 +76,7 @@ def calculateRepoHealth(repo_path: Pathish, last_commit: Optional[datetime], tot
         'docs': 2,  # directory
     }
     for doc, points in doc_files.items():
-        doc_path = repo_path / doc
-        if doc_path.exists():
+        if tree.exists(doc):
             score += points
     
     # Commit recency (25 points max)
@@ -107,14 +112,13 @@ def calculateRepoHealth(repo_path: Pathish, last_commit: Optional[datetime], tot
     ]
     test_score = 0
     for indicator in test_indicators:
-        test_path = repo_path / indicator
-        if test_path.exists():
+        if tree.exists(indicator):
             test_score = 15
             break
     # Also check for test files in src
     if test_score == 0:
         for pattern in ['test_*.py', '*_test.py', '*.test.js', '*.spec.js']:
-            if list(repo_path.rglob(pattern)):
+            if tree.match_name(pattern):
                 test_score = 15
                 break
     score += test_score
@@ -123,7 +127,7 @@ def calculateRepoHealth(repo_path: Pathish, last_commit: Optional[datetime], tot
     config_files = ['.gitignore', '.editorconfig', '.prettierrc', '.eslintrc', 'pyproject.toml']
     config_score = 0
     for config in config_files:
-        if (repo_path / config).exists():
+        if tree.exists(config):
             config_score += 2
             if config_score >= 10:
                 break
@@ -131,9 +135,12 @@ def calculateRepoHealth(repo_path: Pathish, last_commit: Optional[datetime], tot
     
     return round(min(score, 100.0), 2)
 
-def getRepoStats(repo_path: Pathish) -> RepoStats: #This function will get the basic repo stats for a given git repo path
+def getRepoStats(repo_path: Pathish, budget: Optional[RepoGitBudget] = None, reader: Optional[GitObjectReader] = None, tree: Optional[RepoTreeSnapshot] = None, dependency_index: Optional[DependencyIndex] = None) -> RepoStats: #This function will get the basic repo stats for a given git repo path, bounded by the optional per-repo git budget
     if not isGitRepo(repo_path): #check if its a git repo
         raise ValueError(f"The path {repo_path} is not a git repository.") #raise error if not
+    if reader is None: #no shared reader from the caller, use a short-lived one for this call
+        with GitObjectReader(repo_path, budget=budget) as own_reader:
+            return getRepoStats(repo_path, budget=budget, reader=own_reader, tree=tree, dependency_index=dependency_index)
 
     repo = git.Repo(repo_path) #initialize the git repo object
 
@@ -142,37 +149,39 @@ def getRepoStats(repo_path: Pathish) -> RepoStats: #This function will get the b
 
     # Get primary language by analyzing file extensions
     language_counter = Counter()
-    if repo.head.is_valid():
-        commit = repo.head.commit
-    else:
+    if not repo.head.is_valid():
         print("Repository has no commits")
         raise ValueError("Repository has not commits.")
     
-    for blob in commit.tree.traverse(): #traverse all files in the repo
-        if blob.type == 'blob': #if its a file
-            ext = Path(blob.path).suffix.lower() #get the file extension
-            if ext: #if it has an extension
-                language_counter[ext] += 1 #count it
+    for entry in reader.iter_tree(): #every file in HEAD with its blob size, from one ls-tree call
+        ext = Path(entry.path).suffix.lower() #get the file extension
+        if ext: #if it has an extension
+            language_counter[ext] += 1 #count it
     primary_language = language_counter.most_common(1)[0][0] if language_counter else "Unknown"
     languages = [lang for lang, _ in language_counter.most_common()] #list of languages used in the repo
     language_percentages = [count / sum(language_counter.values()) * 100 for _, count in language_counter.most_common()] #percentage of each language used
 
     # Detect frameworks
-    frameworks = detect_frameworks(repo_path)
+    if tree is None: #one file listing for manifest discovery and the health check
+        tree = RepoTreeSnapshot.scan(repo_path)
+    dependency_index = dependency_index or build_dependency_index(repo_path, reader=reader, tree=tree) #every manifest parsed once, nested workspaces included
+    frameworks = detect_frameworks(repo_path, index=dependency_index)
+
+    # Walk history once; stops early (partial) if the repo's git budget runs out
+    commits = list(iter_within_budget(repo.iter_commits(), budget))#list of all commits in the repo
 
     # Check if the repository is collaborative
     is_collaborative = len(repo.remotes) > 0 # if there are remotes, its collaborative
     # Email-based check for multiple contributors
-    authors = {commit.author.email for commit in repo.iter_commits()}
+    authors = {commit.author.email for commit in commits}
     is_collaborative = is_collaborative or len(authors) > 1
 
     # Get first and last commit dates
-    commits = list(repo.iter_commits())#list of all commits in the repo
     first_commit = datetime.fromtimestamp(commits[-1].committed_date) if commits else None #Formatted as year-month-day hour:minute:second
     last_commit = datetime.fromtimestamp(commits[0].committed_date) if commits else None #Formatted as year-month-day hour:minute:second
     
     # Calculate repository health score
-    health_score = calculateRepoHealth(repo_path, last_commit, len(commits))
+    health_score = calculateRepoHealth(repo_path, last_commit, len(commits), tree=tree) #reuses the caller's tree snapshot when given
 
     return RepoStats(
         project_name=project_name,
@@ -188,12 +197,15 @@ def getRepoStats(repo_path: Pathish) -> RepoStats: #This function will get the b
         health_score=health_score,
     )
 
-def saveRepoStats(stats, db=None):
+def saveRepoStats(stats, db=None, *, extraction_root=None, portfolio_id=None):
     """Save repository statistics to database.
     
     Args:
         stats: RepoStats object to save
         db: Optional SQLAlchemy session. If None, creates a new session.
+        extraction_root: Extraction directory the repo was found under; lets
+            portfolio/timeline queries scope by indexed equality.
+        portfolio_id: Portfolio of the uploaded ZIP, when it has one.
     """
     own_session = db is None
     if own_session:
@@ -212,6 +224,8 @@ def saveRepoStats(stats, db=None):
             total_commits=stats.total_commits,
             frameworks=stats.frameworks,
             health_score=stats.health_score,
+            extraction_root=extraction_root,
+            portfolio_id=portfolio_id,
         )
         db.add(repo_stat)
         # Ensure an ID is assigned even when the caller manages the session.
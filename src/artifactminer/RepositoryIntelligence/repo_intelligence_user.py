@@ -3,18 +3,22 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Callable, Iterator, NamedTuple, Optional, List, Sequence
 from pathlib import Path
-import git
+from artifactminer.helpers.lazy_import import lazy_module
 from sqlalchemy import inspect, or_
 from artifactminer.db.database import SessionLocal
+from artifactminer.db.consent_snapshot import ConsentSnapshot, load_consent_snapshot
+from artifactminer.db.user_stats import latest_user_repo_stats
 from artifactminer.RepositoryIntelligence.repo_intelligence_main import isGitRepo, Pathish
-from artifactminer.RepositoryIntelligence.activity_classifier import classify_commit_activities 
-from artifactminer.RepositoryIntelligence.repo_intelligence_AI import user_allows_llm, createSummaryFromUserAdditions, saveUserIntelligenceSummary, group_additions_into_blocks
+from artifactminer.RepositoryIntelligence.git_runner import RepoGitBudget, iter_within_budget, read_commit_patch
+from artifactminer.RepositoryIntelligence.activity_classifier import classify_user_commits, is_commit_classified
+from artifactminer.RepositoryIntelligence.repo_intelligence_AI import createSummaryFromUserAdditions, saveUserIntelligenceSummary, group_additions_into_blocks
 from email_validator import validate_email, EmailNotValidError
 from sqlalchemy.orm import Session
 from artifactminer.db.models import RepoStat, UserRepoStat, UserAnswer
 from pathlib import Path as PathLib
+git = lazy_module("git")  # GitPython loads on first use, not at import
 
 @dataclass
 class UserRepoStats:
@@ -29,9 +33,11 @@ class UserRepoStats:
     user_role: Optional[str] = None
 
 
-def getUserRepoStats(repo_path: Pathish, user_email: str) -> UserRepoStats: 
+def getUserRepoStats(repo_path: Pathish, user_email: str, budget: Optional[RepoGitBudget] = None) -> UserRepoStats: 
     if not isGitRepo(repo_path): 
         raise ValueError(f"The path {repo_path} is not a git repository.") 
+    if not user_email:
+        raise ValueError("A user email is required to compute user repo stats.")
     try:
         user_email = validate_email(user_email, check_deliverability=False).email
     except EmailNotValidError as e:
@@ -40,16 +46,28 @@ def getUserRepoStats(repo_path: Pathish, user_email: str) -> UserRepoStats:
 
     repo = git.Repo(repo_path) #initialize the git repo object
 
+    commits = list(iter_within_budget(repo.iter_commits(author=user_email), budget)) #Get all commits by the specified user email, stopping early if the repo's git budget runs out
+    total_repo_commits = sum(1 for _ in iter_within_budget(repo.iter_commits(), budget)) #Count all commits in the repo
+    stats = summarizeUserCommits(repo_path, commits, total_repo_commits)
+    if not commits:
+        return stats #return empty stats if no commits by user
+
+    stats.commitActivities = classify_user_commits( #get the user's commit activities breakdown, one commit at a time; commits classified before are neither re-read nor reclassified
+        iter_user_additions(repo_path, user_email, max_commits=5000, budget=budget, is_known=is_commit_classified),
+        read_commit=lambda sha: read_commit_additions(repo_path, sha, budget=budget), #a known commit evicted from the memo since is read after all
+    )
+    return stats
+
+
+def summarizeUserCommits(repo_path: Pathish, commits: Sequence, total_repo_commits: int) -> UserRepoStats: #Commit-history metrics from an already walked list of the user's commits (newest first); no git calls, no activity breakdown
     project_name = Path(repo_path).name #Get project name from the folder name
     project_path = str(repo_path) # Get the full project path
-    commits = list(repo.iter_commits(author=user_email)) #Get all commits by the specified user email
-    total_repo_commits = list(repo.iter_commits()) #Get all commits in the repo
     if not commits:
-        return UserRepoStats(project_name=project_name, project_path=project_path) #return empty stats if no commits by user
+        return UserRepoStats(project_name=project_name, project_path=project_path)
     first_commit = datetime.fromtimestamp(commits[-1].committed_date)
     last_commit = datetime.fromtimestamp(commits[0].committed_date)
     total_commits = len(commits) #total number of commits by the user not the repo
-    userStatspercentages = (total_commits / len(total_repo_commits)) * 100 if total_repo_commits else 0 #calculate user contribution percentage
+    userStatspercentages = (total_commits / total_repo_commits) * 100 if total_repo_commits else 0 #calculate user contribution percentage
     
     delta = last_commit - first_commit
     weeks = delta.total_seconds() / 604800  # seconds in a week, weeks between first and last commit, to calculate commit frequency more accurately then just dividing by total weeks in delta
@@ -58,18 +76,14 @@ def getUserRepoStats(repo_path: Pathish, user_email: str) -> UserRepoStats:
     else:
         commitFrequency = total_commits / weeks #average commits per week
 
-
-    commitActivities = classify_commit_activities(collect_user_additions(repo_path, user_email, max_commits=5000)) #get the user's commit activities breakdown
-
     return UserRepoStats( #return the populated UserRepoStats dataclass
         project_name=project_name,
-        project_path=str(repo_path),
+        project_path=project_path,
         first_commit=first_commit,
         last_commit=last_commit,
         total_commits=total_commits,
         userStatspercentages=userStatspercentages,
         commitFrequency=commitFrequency,
-        commitActivities=commitActivities
     )
 
 # Extract added lines from a unified diff
@@ -89,6 +103,23 @@ def extract_added_lines(patch_text: str) -> str:
             added.append(line[1:])
     return "\n".join(added)
 
+class CommitAdditions(NamedTuple):
+    """One commit's added lines, as yielded by `iter_user_additions`."""
+    sha: str
+    text: Optional[str]  # None when `is_known` accepted the commit, so its patch wasn't read
+    partial: bool = False  # the patch was cut by max_patch_bytes or the git budget
+
+def read_commit_additions(
+    repo_path: Pathish,
+    sha: str,
+    max_patch_bytes: int = 200_000,
+    budget: Optional[RepoGitBudget] = None,
+) -> CommitAdditions:
+    """Read and parse one commit's patch into its added lines."""
+    patch = read_commit_patch(repo_path, sha, max_patch_bytes=max_patch_bytes, budget=budget)
+    added_only = extract_added_lines(patch).strip()
+    return CommitAdditions(sha, added_only, partial=patch.endswith("... [truncated]"))
+
 # Collect lines added by a specific user across their commits
 def collect_user_additions(
     repo_path: Pathish,
@@ -98,11 +129,44 @@ def collect_user_additions(
     max_commits: int = 500, #maximum number of commits to process
     skip_merges: bool = True, #whether to skip merge commits
     max_patch_bytes: int = 200_000,  # cap raw patch text per commit before parsing
+    budget: Optional[RepoGitBudget] = None, # per-repo git time/byte budget; history walk stops early when spent
 ) -> List[str]:
     """
     Walk the repo history and return a list where each item is the combined *added lines*
     from a single commit authored by `user_email`. Ordered oldest → newest.
     """
+    return [
+        commit.text
+        for commit in iter_user_additions(
+            repo_path,
+            user_email,
+            since=since,
+            until=until,
+            max_commits=max_commits,
+            skip_merges=skip_merges,
+            max_patch_bytes=max_patch_bytes,
+            budget=budget,
+        )
+        if commit.text
+    ]
+
+def iter_user_additions(
+    repo_path: Pathish,
+    user_email: str,
+    since: Optional[str] = None,
+    until: str = "HEAD",
+    max_commits: int = 500,
+    skip_merges: bool = True,
+    max_patch_bytes: int = 200_000,
+    budget: Optional[RepoGitBudget] = None,
+    is_known: Optional[Callable[[str], bool]] = None, # commits it accepts are yielded with text None, without reading their patch
+) -> Iterator[CommitAdditions]:
+    """
+    Same walk as `collect_user_additions`, but yields one `CommitAdditions` per commit
+    (empty ones included) so callers (activity classifier, skill extractor) can keep running
+    counters instead of holding every patch in memory. Repo and email are validated up front,
+    not on first next().
+    """
     # validate repo path
     if not isGitRepo(repo_path):
         raise ValueError(f"The path {repo_path} is not a git repository.")
@@ -116,7 +180,7 @@ def collect_user_additions(
     repo = git.Repo(repo_path)
 
     # pull commits authored by this email; filter merges if requested
-    commits = list(repo.iter_commits(rev=until, since=since, max_count=max_commits)) #get commits in range from since to until, up to max_commits, ordered newest -> oldest
+    commits = list(iter_within_budget(repo.iter_commits(rev=until, since=since, max_count=max_commits), budget)) #get commits in range from since to until, up to max_commits, ordered newest -> oldest
     if skip_merges: #filter out merge commits, basically any commit with more than 1 parent in order to only get direct commits
         commits = [c for c in commits if len(getattr(c, "parents", [])) <= 1]
 
@@ -125,26 +189,15 @@ def collect_user_additions(
     # we’ll return in chronological order (oldest -> newest) for nicer AI summaries
     commits.reverse()
 
-    additions_per_commit: List[str] = []
-    for c in commits:
-        # unified diff for this commit
-        patch = repo.git.show(
-            c.hexsha,
-            "--patch",
-            "--unified=3",
-            "--no-color",
-            "--no-ext-diff",
-        )
+    def _additions() -> Iterator[CommitAdditions]:
+        for c in commits:
+            if is_known is not None and is_known(c.hexsha):
+                yield CommitAdditions(c.hexsha, None) #caller already has this commit's result, skip the patch read
+                continue
+            # unified diff for this commit, read and parsed only when the caller asks for it
+            yield read_commit_additions(repo_path, c.hexsha, max_patch_bytes=max_patch_bytes, budget=budget)
 
-        # optional safety cap (before parsing)
-        if len(patch) > max_patch_bytes:
-            patch = patch[:max_patch_bytes] + "\n... [truncated]"
-
-        added_only = extract_added_lines(patch).strip()
-        if added_only:
-            additions_per_commit.append(added_only)
-
-    return additions_per_commit
+    return _additions()
 
 def split_text_into_chunks(text: str, max_chunk_size: int) -> List[str]:
     """Split text into chunks of at most `max_chunk_size` characters."""
@@ -207,7 +260,7 @@ def saveUserRepoStats(stats: UserRepoStats, db=None):
         if own_session:
             db.close()
 
-async def generate_summaries_for_ranked(db: Session, top=3, extraction_path: str = None) -> list[dict]:
+async def generate_summaries_for_ranked(db: Session, top=3, extraction_path: str = None, consent: Optional[ConsentSnapshot] = None) -> list[dict]:
     """
     Summarize the top-ranked repositories for the current user.
 
@@ -219,6 +272,7 @@ async def generate_summaries_for_ranked(db: Session, top=3, extraction_path: str
     - We persist results into UserAIntelligenceSummary.
     
     Note: Processes all repos concurrently for maximum performance.
+    Consent is read once (or taken from ``consent``) and shared by every repo.
     """
     import asyncio
     
@@ -258,19 +312,15 @@ async def generate_summaries_for_ranked(db: Session, top=3, extraction_path: str
     )
 
     user_email = email_answer.answer_text.strip() if email_answer else None
+    if consent is None:
+        consent = load_consent_snapshot(db)
+
+    latest_stats = latest_user_repo_stats(db, [repo.project_path for repo in top_repos])
 
     async def process_repo(repo: RepoStat) -> dict:
         """Process a single repo and return its summary."""
         # Default summary uses template
-        user_stats = (
-            db.query(UserRepoStat)
-            .filter(
-                UserRepoStat.project_name == repo.project_name,
-                UserRepoStat.project_path == repo.project_path,
-            )
-            .order_by(UserRepoStat.id.desc())
-            .first()
-        )
+        user_stats = latest_stats.get((repo.project_name, repo.project_path))
         pct = user_stats.userStatspercentages if user_stats and user_stats.userStatspercentages is not None else 0
         role_text = user_stats.user_role.strip() if user_stats and user_stats.user_role else None
 
@@ -291,17 +341,18 @@ async def generate_summaries_for_ranked(db: Session, top=3, extraction_path: str
             )
 
         # If we have consent + a valid email, try the LLM-based summary instead
-        if user_allows_llm() and user_email:
+        if consent.allows_llm and user_email:
             try:
                 # Ensure path is absolute for git operations
                 repo_path_absolute = str(Path(repo.project_path).resolve())
                 additions = collect_user_additions(
                     repo_path=repo_path_absolute,
                     user_email=user_email,
+                    budget=RepoGitBudget(),
                 )
                 if additions:
                     grouped = group_additions_into_blocks(additions, max_chars_per_block=1000, max_blocks=1)
-                    ai_summary = await createSummaryFromUserAdditions(grouped)
+                    ai_summary = await createSummaryFromUserAdditions(grouped, consent=consent)
                     print("\n AI Summary Generated for", repo.project_name, ":", ai_summary)
                     summary_text += " AI summary: " + ai_summary
             except Exception as e:
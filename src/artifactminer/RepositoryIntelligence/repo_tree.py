@@ -0,0 +1,203 @@
+"""Shared file-tree snapshot for the Repository Intelligence Module.
+
+Detectors used to walk the repository on their own (``rglob`` per pattern,
+``rglob("*")`` per signal family), so one analysis walked the same tree dozens
+of times. ``RepoTreeSnapshot`` walks it once, with a pruned ``os.scandir`` walk
+or from ``git ls-files``, and answers the lookups detectors actually need from
+in-memory indexes: by basename, by suffix, and by directory prefix.
+
+All paths are repo-relative and use ``/`` separators.
+"""
+
+from __future__ import annotations
+
+import os
+from bisect import bisect_left
+from collections import Counter
+from fnmatch import fnmatchcase
+from pathlib import Path, PurePosixPath
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from artifactminer.RepositoryIntelligence.git_runner import Pathish, RepoGitBudget, run_git
+
+# VCS metadata is never part of the project; everything else is kept so results
+# match what the per-detector ``rglob`` walks used to see.
+DEFAULT_PRUNED_DIRS: FrozenSet[str] = frozenset({".git", ".hg", ".svn"})
+
+_GLOB_CHARS = frozenset("*?[")
+
+__all__ = [
+    "DEFAULT_PRUNED_DIRS",
+    "RepoTreeSnapshot",
+]
+
+
+class RepoTreeSnapshot:
+    """Immutable listing of a repository's files and directories.
+
+    Build one per repository and hand it to every detector::
+
+        tree = RepoTreeSnapshot.scan(repo_path)
+        tree.with_name("Dockerfile")      # every Dockerfile, any depth
+        tree.with_suffix(".py")           # every Python file
+        tree.under(".github/workflows")   # every file below a directory
+    """
+
+    def __init__(self, root: Pathish, files: Iterable[str], dirs: Iterable[str] = ()) -> None:
+        self.root = Path(root)
+        self.files: Tuple[str, ...] = tuple(sorted(set(files)))
+        all_dirs = set(dirs)
+        for rel in self.files:  # make sure every ancestor directory is known
+            parent = rel.rpartition("/")[0]
+            while parent and parent not in all_dirs:
+                all_dirs.add(parent)
+                parent = parent.rpartition("/")[0]
+        self.dirs: FrozenSet[str] = frozenset(all_dirs)
+        self._file_set: FrozenSet[str] = frozenset(self.files)
+        self._by_name: Dict[str, List[str]] = {}
+        self._by_suffix: Dict[str, List[str]] = {}
+        for rel in self.files:
+            name = rel.rpartition("/")[2]
+            self._by_name.setdefault(name, []).append(rel)
+            self._by_suffix.setdefault(PurePosixPath(name).suffix.lower(), []).append(rel)
+
+    # ------------------------------------------------------------------ builders
+
+    @classmethod
+    def scan(
+        cls,
+        repo_path: Pathish,
+        *,
+        prune: FrozenSet[str] = DEFAULT_PRUNED_DIRS,
+    ) -> "RepoTreeSnapshot":
+        """Walk the working tree once with ``os.scandir``, skipping ``prune`` dirs.
+
+        Symlinked directories are listed but not descended into, so link cycles
+        can't make the walk run forever.
+        """
+        root = Path(repo_path)
+        files: List[str] = []
+        dirs: List[str] = []
+        stack = [("", str(root))]
+        while stack:
+            rel_dir, abs_dir = stack.pop()
+            try:
+                with os.scandir(abs_dir) as entries:
+                    for entry in entries:
+                        rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name in prune:
+                                    continue
+                                dirs.append(rel)
+                                stack.append((rel, entry.path))
+                            elif entry.is_file():
+                                files.append(rel)
+                            elif entry.is_dir():  # symlink to a directory
+                                dirs.append(rel)
+                        except OSError:
+                            continue
+            except OSError:
+                continue  # unreadable or vanished directory
+        return cls(root, files, dirs)
+
+    @classmethod
+    def from_git(
+        cls,
+        repo_path: Pathish,
+        *,
+        budget: Optional[RepoGitBudget] = None,
+        include_untracked: bool = True,
+    ) -> "RepoTreeSnapshot":
+        """Build the snapshot from ``git ls-files`` (tracked plus non-ignored files).
+
+        Falls back to ``scan`` when git fails, e.g. for a plain directory.
+        """
+        args = ["ls-files", "-z", "--cached"]
+        if include_untracked:
+            args += ["--others", "--exclude-standard"]
+        result = run_git(repo_path, args, budget=budget)
+        if result.returncode != 0 and not result.partial:
+            return cls.scan(repo_path)
+        records = result.stdout.split("\0")
+        if result.partial and records:
+            records = records[:-1]  # last record may be cut
+        return cls(repo_path, (rec for rec in records if rec))
+
+    # ------------------------------------------------------------------ lookups
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __bool__(self) -> bool:
+        # A scanned empty repo is still a snapshot; don't let ``__len__`` make it falsy
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.files)
+
+    def is_file(self, rel: str) -> bool:
+        return _normalize(rel) in self._file_set
+
+    def is_dir(self, rel: str) -> bool:
+        return _normalize(rel) in self.dirs
+
+    def exists(self, rel: str) -> bool:
+        rel = _normalize(rel)
+        return rel in self._file_set or rel in self.dirs
+
+    def with_name(self, name: str) -> List[str]:
+        """Files anywhere in the tree whose basename is exactly ``name``."""
+        return list(self._by_name.get(name, ()))
+
+    def with_suffix(self, suffix: str) -> List[str]:
+        """Files whose (last, case-insensitive) suffix is ``suffix``, e.g. ``.py``."""
+        return list(self._by_suffix.get(suffix.lower(), ()))
+
+    def match_name(self, pattern: str) -> List[str]:
+        """Files anywhere in the tree whose basename matches a glob pattern.
+
+        Equivalent to ``Path.rglob(pattern)`` restricted to files. Literal names
+        and ``*.ext`` patterns are answered from the indexes; other patterns are
+        matched once per distinct basename rather than once per file.
+        """
+        if not _GLOB_CHARS.intersection(pattern):
+            return self.with_name(pattern)
+        if pattern.startswith("*.") and not _GLOB_CHARS.intersection(pattern[1:]):
+            tail = pattern[1:]  # ".ext" or ".test.js"
+            bucket = self._by_suffix.get("." + tail.rpartition(".")[2].lower(), ())
+            matched = [rel for rel in bucket if rel.endswith(tail)]
+            matched += self._by_name.get(tail, ())  # dotfiles named exactly ".ext"
+            return sorted(set(matched))
+        matched: List[str] = []
+        for name, paths in self._by_name.items():
+            if fnmatchcase(name, pattern):
+                matched.extend(paths)
+        return sorted(matched)
+
+    def under(self, prefix: str) -> List[str]:
+        """Files below directory ``prefix`` at any depth (empty prefix = all files)."""
+        prefix = _normalize(prefix)
+        if not prefix:
+            return list(self.files)
+        start = f"{prefix}/"
+        idx = bisect_left(self.files, start)
+        matched: List[str] = []
+        for rel in self.files[idx:]:
+            if not rel.startswith(start):
+                break
+            matched.append(rel)
+        return matched
+
+    def children(self, prefix: str) -> List[str]:
+        """Files directly inside directory ``prefix`` (like ``Path.glob("*")``)."""
+        depth = _normalize(prefix).count("/") + 1 if _normalize(prefix) else 0
+        return [rel for rel in self.under(prefix) if rel.count("/") == depth]
+
+    def suffix_counts(self) -> Counter:
+        """Count files by lower-cased suffix ("" for files without one)."""
+        return Counter({suffix: len(paths) for suffix, paths in self._by_suffix.items()})
+
+
+def _normalize(rel: str) -> str:
+    return rel.replace("\\", "/").strip("/")
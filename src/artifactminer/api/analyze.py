@@ -27,13 +27,17 @@ from collections.abc import Callable
 from fastapi import APIRouter, Body, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from ..db import get_db
+from ..db import (
+    get_db,
+    invalidate_portfolio_snapshots,
+    load_consent_snapshot,
+    normalize_extraction_root,
+)
 from ..helpers.zip_utils import safe_extract_zip
 from ..db.models import (
     UploadedZip,
     Question,
     UserAnswer,
-    Consent,
     RepoStat,
 )
 from .schemas import (
@@ -42,33 +46,40 @@ from .schemas import (
     SummaryResult,
     AnalyzeRequest,
     AnalyzeResponse,
+    AnalysisTimings,
 )
 from ..RepositoryIntelligence.repo_intelligence_main import (
     getRepoStats,
     saveRepoStats,
     isGitRepo,
 )
+from ..RepositoryIntelligence.git_runner import GitBudget, RepoGitBudget
+from ..RepositoryIntelligence.manifest_index import build_dependency_index
+from ..RepositoryIntelligence.object_reader import GitObjectReader
+from ..RepositoryIntelligence.repo_tree import RepoTreeSnapshot
 from ..RepositoryIntelligence.repo_intelligence_user import (
     getUserRepoStats,
     saveUserRepoStats,
-    collect_user_additions,
+    CommitAdditions,
+    iter_user_additions,
     generate_summaries_for_ranked,
 )
 from ..skills.deep_analysis import DeepRepoAnalyzer
 from ..skills.persistence import persist_extracted_skills
-from ..evidence.orchestrator import (
-    persist_generated_evidence,
-    persist_insights_as_project_evidence,
-)
+from ..evidence.orchestrator import EvidenceBatchWriter
 from ..evidence.extractors import (
     git_stats_to_evidence,
     infra_signals_to_evidence,
+    insights_to_evidence,
     repo_quality_to_evidence,
 )
+from ..helpers.profiling import RunProfiler
 from ..helpers.project_ranker import rank_projects
 
 router = APIRouter(prefix="/analyze", tags=["analysis"])
 EXTRACTION_BASE_DIR = Path("./.extracted")
+# Time/byte limits applied to all git work for a single repo during analysis
+ANALYSIS_GIT_BUDGET = GitBudget()
 
 
 def get_user_email(db: Session) -> str:
@@ -111,8 +122,7 @@ def get_consent_level(db: Session) -> str:
     Returns:
         Consent level string: 'full', 'no_llm', or 'none'
     """
-    consent = db.query(Consent).filter(Consent.id == 1).first()
-    return consent.consent_level if consent else "none"
+    return load_consent_snapshot(db).consent_level
 
 
 def discover_git_repos(base_path: Path) -> List[Path]:
@@ -270,21 +280,9 @@ def _get_progress_callback() -> Callable[[int, int, str], None] | None:
     return None
 
 
-def _persist_optional_evidence(
-    db: Session,
-    *,
-    repo_stat_id: int,
-    evidence_items: list,
-) -> None:
-    """Persist generated evidence rows when there are items to store."""
-    if not evidence_items:
-        return
-    persist_generated_evidence(
-        db=db,
-        repo_stat_id=repo_stat_id,
-        evidence_items=evidence_items,
-        commit=False,
-    )
+def _get_profiler() -> RunProfiler | None:
+    """Dependency hook for a caller-owned profiler (e.g. CLI trace export); API uses None."""
+    return None
 
 
 @router.post("/{zip_id}", response_model=AnalyzeResponse)
@@ -295,6 +293,7 @@ async def analyze_zip(
     progress_callback: Callable[[int, int, str], None] | None = Depends(
         _get_progress_callback
     ),
+    profiler: RunProfiler | None = Depends(_get_profiler),
 ):
     """
     Master orchestration endpoint: analyze all git repos in an uploaded ZIP.
@@ -322,6 +321,10 @@ async def analyze_zip(
     - Call Evan's generate_summaries_for_ranked() → create summaries
       (Uses LLM if consent='full', otherwise template fallback)
 
+    **Timings:**
+    - Every stage runs inside a ``RunProfiler`` span (per repo where it applies)
+    - ``request.include_timings`` returns the aggregated spans in ``timings``
+
     **Error Handling:**
     - Individual repo failures are logged but don't stop the pipeline
     - Transaction is committed after all repos are processed
@@ -344,31 +347,37 @@ async def analyze_zip(
         )
 
     user_email = get_user_email(db)
-    consent_level = get_consent_level(db)
+    consent = load_consent_snapshot(db)
+    consent_level = consent.consent_level
+
+    profiler = profiler or RunProfiler()
 
     print(
         f"[analyze] Starting analysis for zip_id={zip_id}, user={user_email}, consent={consent_level}"
     )
-    extraction_path = extract_zip_to_persistent_location(uploaded_zip.path, zip_id)
+    with profiler.span("extraction", bytes=Path(uploaded_zip.path).stat().st_size):
+        extraction_path = extract_zip_to_persistent_location(uploaded_zip.path, zip_id)
 
     # Update the UploadedZip record with extraction path
     uploaded_zip.extraction_path = str(extraction_path)
 
     # Find all git repositories (optionally scoped by selected directories)
-    if request and request.directories is not None:
-        if not request.directories:
-            raise HTTPException(
-                status_code=400, detail="No directories provided for analysis"
-            )
-        selected_paths = resolve_selected_dirs(extraction_path, request.directories)
-        if not selected_paths:
-            raise HTTPException(
-                status_code=400,
-                detail="No selected directories found in extracted ZIP",
-            )
-        git_repos = discover_git_repos_from_multiple_paths(selected_paths)
-    else:
-        git_repos = discover_git_repos(extraction_path)
+    with profiler.span("discovery") as discovery_span:
+        if request and request.directories is not None:
+            if not request.directories:
+                raise HTTPException(
+                    status_code=400, detail="No directories provided for analysis"
+                )
+            selected_paths = resolve_selected_dirs(extraction_path, request.directories)
+            if not selected_paths:
+                raise HTTPException(
+                    status_code=400,
+                    detail="No selected directories found in extracted ZIP",
+                )
+            git_repos = discover_git_repos_from_multiple_paths(selected_paths)
+        else:
+            git_repos = discover_git_repos(extraction_path)
+        discovery_span.count = len(git_repos)
 
     if not git_repos:
         raise HTTPException(
@@ -385,14 +394,42 @@ async def analyze_zip(
 
     for idx, repo_path in enumerate(git_repos):
         print(f"[analyze] Processing: {repo_path.name}")
+        repo_name = repo_path.name
 
         if progress_callback:
             # Treat `current` as number of repos completed so far (0..total).
             progress_callback(idx, len(git_repos), repo_path.name)
 
+        git_budget = RepoGitBudget(ANALYSIS_GIT_BUDGET)
+        # One persistent cat-file reader per repo, shared by all detectors
+        object_reader = GitObjectReader(repo_path, budget=git_budget)
+
         try:
-            repo_stats = getRepoStats(repo_path)
-            repo_stat = saveRepoStats(repo_stats, db=db)
+            # One file listing per repo, shared by health scoring and every detector
+            with profiler.span("tree_scan", repo=repo_name) as span:
+                repo_tree = RepoTreeSnapshot.scan(repo_path)
+                span.count = len(repo_tree)
+            # Manifests parsed once, shared by framework detection and skill extraction
+            with profiler.span("manifests", repo=repo_name) as span:
+                dependency_index = build_dependency_index(
+                    repo_path, reader=object_reader, tree=repo_tree
+                )
+                span.count = len(dependency_index.manifests)
+            with profiler.span("getRepoStats", repo=repo_name):
+                repo_stats = getRepoStats(
+                    repo_path,
+                    budget=git_budget,
+                    reader=object_reader,
+                    tree=repo_tree,
+                    dependency_index=dependency_index,
+                )
+            with profiler.span("persistence.repo_stats", repo=repo_name):
+                repo_stat = saveRepoStats(
+                    repo_stats,
+                    db=db,
+                    extraction_root=normalize_extraction_root(extraction_path),
+                    portfolio_id=uploaded_zip.portfolio_id,
+                )
             if repo_stat is None:
                 raise ValueError(f"Failed to persist repo stats for {repo_path.name}")
 
@@ -407,8 +444,11 @@ async def analyze_zip(
             user_last_commit = None
 
             try:
-                user_stats = getUserRepoStats(repo_path, user_email)
-                saveUserRepoStats(user_stats, db=db)
+                with profiler.span("getUserRepoStats", repo=repo_name) as span:
+                    user_stats = getUserRepoStats(repo_path, user_email, budget=git_budget)
+                    span.count = user_stats.total_commits
+                with profiler.span("persistence.user_stats", repo=repo_name):
+                    saveUserRepoStats(user_stats, db=db)
                 user_contribution_pct = user_stats.userStatspercentages
                 user_total_commits = user_stats.total_commits
                 user_commit_frequency = user_stats.commitFrequency
@@ -419,45 +459,62 @@ async def analyze_zip(
                 # has no commits in this repo.
                 print(f"[analyze] Note: {repo_path.name}: {e}")
 
-            additions_text = ""
+            # Per-commit additions keyed by sha; analyzers stream them instead of one joined string
+            user_additions: List[CommitAdditions] = []
             if user_stats is not None:
                 try:
-                    user_additions = collect_user_additions(
-                        repo_path=str(repo_path), user_email=user_email, max_commits=500
-                    )
-                    additions_text = "\n".join(user_additions)
+                    with profiler.span("additions", repo=repo_name) as span:
+                        user_additions = [
+                            commit
+                            for commit in iter_user_additions(
+                                repo_path=str(repo_path),
+                                user_email=user_email,
+                                max_commits=500,
+                                budget=git_budget,
+                            )
+                            if commit.text
+                        ]
+                        span.count = len(user_additions)
+                        span.bytes = sum(len(commit.text.encode()) for commit in user_additions)
                 except Exception as e:
                     print(
                         f"[analyze] Warning: Could not collect additions for {repo_path.name}: {e}"
                     )
-                    additions_text = ""
-
-            deep_result = analyzer.analyze(
-                repo_path=str(repo_path),
-                repo_stat=repo_stat,
-                user_email=user_email,
-                user_contributions={"additions": additions_text},
-                consent_level=consent_level,
-                user_stats=user_stats,
-            )
+                    user_additions = []
+
+            with profiler.span("deep_analysis", repo=repo_name) as span:
+                deep_result = analyzer.analyze(
+                    repo_path=str(repo_path),
+                    repo_stat=repo_stat,
+                    user_email=user_email,
+                    user_contributions={"additions": user_additions},
+                    consent_level=consent_level,
+                    user_stats=user_stats,
+                    git_budget=git_budget,
+                    object_reader=object_reader,
+                    repo_tree=repo_tree,
+                    dependency_index=dependency_index,
+                    profiler=profiler,
+                )
+                span.count = len(deep_result.skills)
 
             skills_count = len(deep_result.skills)
             insights_count = len(deep_result.insights)
 
-            persist_extracted_skills(
-                db=db,
-                repo_stat_id=repo_stat.id,
-                extracted=deep_result.skills,
-                user_email=user_email,
-                commit=False,  # Batch commit at end
-            )
+            with profiler.span("persistence.skills", repo=repo_name, count=skills_count):
+                persist_extracted_skills(
+                    db=db,
+                    repo_stat_id=repo_stat.id,
+                    extracted=deep_result.skills,
+                    user_email=user_email,
+                    commit=False,  # Batch commit at end
+                )
 
-            persist_insights_as_project_evidence(
-                db=db,
-                repo_stat_id=repo_stat.id,
-                insights=deep_result.insights,
-                repo_last_commit=repo_last_commit,
-                commit=False,
+            # Every evidence source for this repo: one dedupe prefetch, one insert,
+            # each source still capped at MAX_AUTOGENERATED_EVIDENCE_PER_RUN
+            evidence_writer = EvidenceBatchWriter(db, repo_stat.id)
+            evidence_writer.add(
+                insights_to_evidence(deep_result.insights, repo_last_commit=repo_last_commit)
             )
             evidence_date = repo_last_commit.date() if repo_last_commit else None
 
@@ -467,8 +524,14 @@ async def analyze_zip(
                 (deep_result.repo_quality, lambda s: repo_quality_to_evidence(s, evidence_date=evidence_date)),
             ]:
                 if signal:
-                    _persist_optional_evidence(db=db, repo_stat_id=repo_stat.id, evidence_items=converter(signal))
+                    evidence_writer.add(converter(signal))
+            with profiler.span("persistence.evidence", repo=repo_name) as span:
+                span.count = len(evidence_writer.flush(commit=False))
 
+            if git_budget.partial:
+                print(
+                    f"[analyze] Warning: {repo_path.name}: git budget exhausted, results are partial"
+                )
             print(
                 f"[analyze] Completed {repo_path.name}: {skills_count} skills, {insights_count} insights"
             )
@@ -486,6 +549,7 @@ async def analyze_zip(
                     user_commit_frequency=user_commit_frequency,
                     user_first_commit=user_first_commit,
                     user_last_commit=user_last_commit,
+                    partial=git_budget.partial,
                 )
             )
 
@@ -497,6 +561,7 @@ async def analyze_zip(
                     project_name=repo_path.name,
                     project_path=str(repo_path),
                     error=str(e),
+                    partial=git_budget.partial,
                 )
             )
             if progress_callback:
@@ -513,12 +578,16 @@ async def analyze_zip(
                     project_name=repo_path.name,
                     project_path=str(repo_path),
                     error=f"{type(e).__name__}: {str(e)}",
+                    partial=git_budget.partial,
                 )
             )
             if progress_callback:
                 progress_callback(idx + 1, len(git_repos), repo_path.name)
             continue
 
+        finally:
+            object_reader.close()
+
         if progress_callback:
             progress_callback(idx + 1, len(git_repos), repo_path.name)
 
@@ -526,7 +595,9 @@ async def analyze_zip(
 
     rankings: List[RankingResult] = []
     try:
-        ranking_data = rank_projects(str(extraction_path), user_email)
+        with profiler.span("ranking") as span:
+            ranking_data = rank_projects(str(extraction_path), user_email)
+            span.count = len(ranking_data)
         for rank_info in ranking_data:
             repo_stat = (
                 db.query(RepoStat)
@@ -544,6 +615,7 @@ async def analyze_zip(
                     score=rank_info["score"],
                     total_commits=rank_info["total_commits"],
                     user_commits=rank_info["user_commits"],
+                    partial=rank_info.get("partial", False),
                 )
             )
 
@@ -552,16 +624,20 @@ async def analyze_zip(
         # Continue without rankings
 
     # Commit all changes before summary generation
-    db.commit()
+    with profiler.span("persistence.commit"):
+        invalidate_portfolio_snapshots(db, [uploaded_zip.portfolio_id])
+        db.commit()
     print("[analyze] Generating summaries...")
 
     summaries: List[SummaryResult] = []
     try:
         # generate_summaries_for_ranked uses project_path from DB to access git repos
         # This is why we persist to ./extracted/ instead of using temp directory
-        summary_data = await generate_summaries_for_ranked(
-            db, top=3, extraction_path=str(extraction_path)
-        )
+        with profiler.span("summaries") as span:
+            summary_data = await generate_summaries_for_ranked(
+                db, top=3, extraction_path=str(extraction_path), consent=consent
+            )
+            span.count = len(summary_data)
 
         for item in summary_data:
             summaries.append(
@@ -578,6 +654,10 @@ async def analyze_zip(
         traceback.print_exc()
         # Continue without summaries
 
+    # Summaries are saved on their own sessions; drop anything rebuilt meanwhile
+    invalidate_portfolio_snapshots(db, [uploaded_zip.portfolio_id])
+    db.commit()
+
     print(
         f"[analyze] Analysis complete: {len(repos_analyzed)} repos, {len(rankings)} ranked, {len(summaries)} summaries"
     )
@@ -591,4 +671,9 @@ async def analyze_zip(
         summaries=summaries,
         consent_level=consent_level,
         user_email=user_email,
+        timings=(
+            AnalysisTimings(**profiler.summary())
+            if request and request.include_timings
+            else None
+        ),
     )
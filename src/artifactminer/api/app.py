@@ -5,12 +5,14 @@ from pathlib import Path
 from typing import List
 
 from fastapi import FastAPI, Depends
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
 
 from fastapi import HTTPException
 from email_validator import validate_email, EmailNotValidError
 
+from .responses import DEFAULT_GZIP_COMPRESS_LEVEL, DEFAULT_GZIP_MINIMUM_SIZE
 from .schemas import (
     HealthStatus,
     QuestionResponse,
@@ -24,8 +26,10 @@ from ..db import (
     Question,
     UserAnswer,
     get_db,
+    invalidate_portfolio_snapshots,
     seed_questions,
 )
+from ..db.migrations import DEFAULT_MIGRATION_MODE, ensure_schema
 from .consent import router as consent_router
 from .zip import router as zip_router
 from .openai import router as openai_router
@@ -49,13 +53,29 @@ from .retrieval import router as retrieval_router
 from .views import router as views_router
 
 
-def create_app() -> FastAPI:
-    """Construct the FastAPI instance so tests or scripts can customize it."""
+def create_app(
+    *,
+    gzip_minimum_size: int | None = DEFAULT_GZIP_MINIMUM_SIZE,
+    migrations: str = DEFAULT_MIGRATION_MODE,
+) -> FastAPI:
+    """Construct the FastAPI instance so tests or scripts can customize it.
+
+    Responses of at least ``gzip_minimum_size`` bytes are gzipped for clients
+    that accept it (the TUI's httpx client does); ``None`` turns compression off.
+    ``migrations`` is a mode from ``db.migrations.MIGRATION_MODES`` (default from
+    ``ARTIFACTMINER_MIGRATIONS``, else "check").
+    """
     app = FastAPI(
         title="Artifact Miner API",
         description="Backend services powering the Artifact Miner TUI.",
         version="0.1.0",
     )
+    if gzip_minimum_size is not None:
+        app.add_middleware(
+            GZipMiddleware,
+            minimum_size=gzip_minimum_size,
+            compresslevel=DEFAULT_GZIP_COMPRESS_LEVEL,
+        )
 
     thumbnails_dir = Path("./uploads/thumbnails")
     thumbnails_dir.mkdir(parents=True, exist_ok=True)
@@ -65,13 +85,8 @@ def create_app() -> FastAPI:
         name="project-thumbnails",
     )
 
-    # Run Alembic migrations on startup to keep the DB schema in sync
-    from alembic.config import Config as AlembicConfig
-    from alembic import command as alembic_command
-
-    _repo_root = Path(__file__).resolve().parents[3]
-    alembic_cfg = AlembicConfig(str(_repo_root / "alembic.ini"))
-    alembic_command.upgrade(alembic_cfg, "head")
+    # Keep the DB schema in sync; Alembic only runs if the revision is behind
+    ensure_schema(migrations)
 
     # Initialize database schema and seed
     db = SessionLocal()
@@ -178,6 +193,7 @@ def create_app() -> FastAPI:
                 db.add(ua)
                 saved_answers.append(ua)
 
+        invalidate_portfolio_snapshots(db)  # the email answer scopes portfolio summaries
         db.commit()
         for ans in saved_answers:
             db.refresh(ans)
@@ -210,6 +226,7 @@ def create_app() -> FastAPI:
             # Save both within the same transaction
             saveRepoStats(repo_stats, db=db)
             saveUserRepoStats(user_stats, db=db)
+            invalidate_portfolio_snapshots(db)  # not tied to a portfolio
             db.commit()
 
             return {
@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from .schemas import ConsentResponse, ConsentUpdateRequest
-from ..db import Consent, get_db
+from ..db import Consent, get_db, invalidate_consent_snapshot, invalidate_portfolio_snapshots
 
 
 router = APIRouter(tags=["consent"])
@@ -45,6 +45,8 @@ async def update_consent(payload: ConsentUpdateRequest, db: Session = Depends(ge
         consent.accepted_at = None
 
     db.add(consent)
+    invalidate_portfolio_snapshots(db)  # portfolios report the consent level
     db.commit()
+    invalidate_consent_snapshot()
     db.refresh(consent)
     return consent
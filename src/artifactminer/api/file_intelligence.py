@@ -1,6 +1,7 @@
 import os
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException
-from git import List
 from sqlalchemy.orm import Session
 
 from artifactminer.FileIntelligence.file_intelligence_main import get_crawler_file_contents
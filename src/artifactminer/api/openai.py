@@ -4,6 +4,7 @@ OpenAI API module: endpoints for interacting with OpenAI models.
 
 from fastapi import APIRouter, HTTPException
 
+from ..helpers.llm_dispatch import LLMDeadlineExceeded, dispatch_llm_request
 from ..helpers.openai import get_gpt5_nano_response_async
 from .schemas import OpenAIRequest, OpenAIResponse
 
@@ -18,8 +19,14 @@ async def call_openai(request: OpenAIRequest) -> OpenAIResponse:
         raise HTTPException(status_code=422, detail="Prompt cannot be empty")
 
     try:
-        response_text = await get_gpt5_nano_response_async(request.prompt)
+        response_text = await dispatch_llm_request(
+            "openai", lambda: get_gpt5_nano_response_async(request.prompt)
+        )
         return OpenAIResponse(response=response_text)
+    except LLMDeadlineExceeded as e:
+        raise HTTPException(
+            status_code=504, detail="OpenAI API did not respond in time"
+        ) from e
     except Exception as e:
         raise HTTPException(
             status_code=500, detail="Failed to get response from OpenAI API"
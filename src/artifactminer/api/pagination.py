@@ -0,0 +1,209 @@
+"""Keyset (cursor) pagination and ``fields=`` projection shared by list endpoints.
+
+A page is requested with ``limit`` and continued with the opaque ``cursor``
+returned in the ``X-Next-Cursor`` response header. The cursor holds the sort
+key values of the last row served, so the next page is a range scan on the
+sort keys instead of an ``OFFSET`` that re-reads every skipped row. Sort keys
+always end in a unique column, which makes the order total.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Iterable, Mapping, Sequence
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import and_, false, or_, true
+
+from .responses import FastJSONResponse
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
+
+
+def limit_query(description: str = "Page size; the next page's cursor is sent in X-Next-Cursor"):
+    return Query(default=None, ge=1, le=MAX_PAGE_SIZE, description=description)
+
+
+def cursor_query():
+    return Query(default=None, description=f"Opaque cursor from a previous {NEXT_CURSOR_HEADER} header")
+
+
+def fields_query():
+    return Query(
+        default=None,
+        description="Comma-separated response fields to return; other columns are not read",
+    )
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a keyset ordering and where its NULLs sort."""
+
+    column: Any
+    descending: bool = False
+    nulls_last: bool = False
+
+    def order_by(self):
+        clause = self.column.desc() if self.descending else self.column.asc()
+        return clause.nullslast() if self.nulls_last else clause.nullsfirst()
+
+    def after(self, value):
+        """Rows strictly after ``value`` in this key's order."""
+        if value is None:
+            # NULLs first: every non-NULL follows; NULLs last: nothing does
+            return false() if self.nulls_last else self.column.isnot(None)
+        beyond = self.column < value if self.descending else self.column > value
+        return or_(beyond, self.column.is_(None)) if self.nulls_last else beyond
+
+    def equals(self, value):
+        return self.column.is_(None) if value is None else self.column == value
+
+
+def keyset_order(keys: Sequence[SortKey]) -> list:
+    return [key.order_by() for key in keys]
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[Any]):
+    """WHERE clause for rows after ``values`` in the lexicographic order of ``keys``."""
+    clause = false()
+    for key, value in reversed(list(zip(keys, values))):
+        clause = or_(key.after(value), and_(key.equals(value), clause))
+    return clause if keys else true()
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, width: int) -> list[Any]:
+    """Sort key values from ``cursor``; 400 if it is malformed or for another endpoint."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != width:
+            raise ValueError("wrong cursor width")
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError, binascii.Error, json.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+
+def parse_fields(
+    fields: str | None, allowed: Iterable[str], always: Iterable[str] = ("id",)
+) -> list[str] | None:
+    """Requested field names in response order, or ``None`` for the full shape.
+
+    ``always`` fields (the row identity) are included even if not asked for.
+    """
+    if fields is None:
+        return None
+    allowed = list(allowed)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(allowed))
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown fields: {unknown}. Allowed: {allowed}",
+        )
+    requested.update(name for name in always if name in allowed)
+    return [name for name in allowed if name in requested]
+
+
+def _key_label(index: int) -> str:
+    return f"_keyset_{index}"
+
+
+def apply_keyset(query, keys: Sequence[SortKey], *, limit: int | None, cursor: str | None):
+    """Order ``query`` by ``keys``, resume it after ``cursor``, and fetch one extra row.
+
+    The key values are appended to each result row so ``page_rows`` can build
+    the next cursor without knowing what else the query selects.
+    """
+    query = query.add_columns(*(key.column.label(_key_label(i)) for i, key in enumerate(keys)))
+    if cursor is not None:
+        query = query.where(keyset_after(keys, decode_cursor(cursor, len(keys))))
+    query = query.order_by(*keyset_order(keys))
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def page_rows(
+    rows: Sequence[Any], keys: Sequence[SortKey], limit: int | None
+) -> tuple[list[Any], str | None]:
+    """Trim an ``apply_keyset`` result to the page and return the next cursor, if any."""
+    rows = list(rows)
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]._mapping
+    return rows, encode_cursor([last[_key_label(i)] for i in range(len(keys))])
+
+
+def projection(columns: Mapping[str, Any], fields: Sequence[str]) -> list:
+    """Labelled columns for the requested ``fields`` out of a name -> column map."""
+    return [columns[name].label(name) for name in fields if name in columns]
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def projected_response(
+    rows: Iterable[Any], fields: Sequence[str], next_cursor: str | None = None
+) -> FastJSONResponse:
+    """JSON list of just ``fields`` from each row, with the next cursor header if any.
+
+    Bypasses the route's ``response_model``, whose required fields a partial
+    item would fail. Rows may be result rows or plain mappings.
+    """
+    items = []
+    for row in rows:
+        values = getattr(row, "_mapping", row)
+        items.append({name: values[name] for name in fields})
+    response = FastJSONResponse(content=items)
+    set_next_cursor(response, next_cursor)
+    return response
+
+
+__all__ = [
+    "MAX_PAGE_SIZE",
+    "NEXT_CURSOR_HEADER",
+    "SortKey",
+    "apply_keyset",
+    "cursor_query",
+    "decode_cursor",
+    "encode_cursor",
+    "fields_query",
+    "keyset_after",
+    "keyset_order",
+    "limit_query",
+    "page_rows",
+    "parse_fields",
+    "projected_response",
+    "projection",
+    "set_next_cursor",
+]
@@ -2,8 +2,10 @@
 
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import or_
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from pydantic import TypeAdapter
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from .analyze import get_consent_level, get_user_email
@@ -28,11 +30,20 @@ from ..db import (
     ResumeItem,
     UploadedZip,
     UserAIntelligenceSummary,
-    UserRepoStat,
-    get_db,
+    get_async_db,
+    latest_user_repo_stats,
+    repo_scope_filter,
+)
+from ..db.portfolio_snapshots import (
+    load_portfolio_snapshot,
+    prefs_hash,
+    snapshot_generation,
+    store_portfolio_snapshot,
 )
 router = APIRouter(prefix="/portfolio", tags=["portfolio"])
 
+_DATETIME_JSON = TypeAdapter(datetime)
+
 
 def _normalize_tokens(values: list[str | int]) -> list[str]:
     return [str(value).strip() for value in values if str(value).strip()]
@@ -64,18 +75,13 @@ def _build_portfolio_project_items(
     project_paths = [project.project_path for project in projects]
     project_ids = [project.id for project in projects]
     
-    # Fetch user roles for all projects in one query
-    # Note: Multiple UserRepoStat entries can exist per project_path (e.g., multiple files).
-    # We use a dict to keep only one role per project (last one seen, which SQLAlchemy returns deterministically).
-    user_roles_map = {}
-    if project_paths:
-        user_roles = (
-            db.query(UserRepoStat)
-            .filter(UserRepoStat.project_path.in_(project_paths))
-            .order_by(UserRepoStat.project_path, UserRepoStat.id)
-            .all()
-        )
-        user_roles_map = {ur.project_path: ur.user_role for ur in user_roles}
+    # Fetch the latest user role for all projects in one query
+    # Note: Multiple UserRepoStat entries can exist per project_path (one per analysis run).
+    # Stats come back in id order, so the newest for each path wins.
+    user_roles_map = {
+        path: stat.user_role
+        for (_, path), stat in latest_user_repo_stats(db, project_paths).items()
+    }
     
     # Fetch evidence for all projects in one query
     evidence_map = {}
@@ -90,7 +96,7 @@ def _build_portfolio_project_items(
             if ev.repo_stat_id not in evidence_map:
                 evidence_map[ev.repo_stat_id] = []
             evidence_map[ev.repo_stat_id].append(
-                PortfolioEvidenceItem(
+                PortfolioEvidenceItem.model_construct(
                     id=ev.id,
                     type=ev.type,
                     content=ev.content,
@@ -101,7 +107,7 @@ def _build_portfolio_project_items(
     
     # Build portfolio project items
     return [
-        PortfolioProjectItem(
+        PortfolioProjectItem.model_construct(
             id=project.id,
             project_name=project.project_name,
             project_path=project.project_path,
@@ -164,14 +170,14 @@ def _apply_preferences(
     )
 
 
-@router.post("/generate", response_model=PortfolioGenerationResponse)
-async def generate_portfolio(
-    request: PortfolioGenerationRequest, db: Session = Depends(get_db)
-) -> PortfolioGenerationResponse:
-    portfolio_id = request.portfolio_id.strip()
-    if not portfolio_id:
-        raise HTTPException(status_code=422, detail="portfolio_id cannot be empty.")
+def _assemble_portfolio(
+    db: Session, portfolio_id: str, prefs: RepresentationPreferences
+) -> dict:
+    """Response fields shared by ``POST /portfolio/generate`` and ``GET /portfolio/{id}``.
 
+    Items are built with ``model_construct``: the values come straight from
+    typed columns, so validating them again only costs time on large portfolios.
+    """
     portfolio_exists = (
         db.query(UploadedZip.id)
         .filter(UploadedZip.portfolio_id == portfolio_id)
@@ -206,14 +212,13 @@ async def generate_portfolio(
             detail="Portfolio has no analyzed ZIPs yet. Run /analyze/{zip_id} for uploaded ZIPs first.",
         )
 
-    prefs = get_prefs(db, portfolio_id)
     consent_level = get_consent_level(db)
     user_email = get_user_email(db)
 
     projects = (
         db.query(RepoStat)
         .filter(RepoStat.deleted_at.is_(None))
-        .filter(_build_path_boundary_filter(RepoStat.project_path, extraction_prefixes))
+        .filter(repo_scope_filter(extraction_prefixes))
         .all()
     )
 
@@ -245,7 +250,7 @@ async def generate_portfolio(
             .all()
         )
         resume_items = [
-            ResumeItemResponse(
+            ResumeItemResponse.model_construct(
                 id=item.id,
                 title=item.title,
                 content=item.content,
@@ -270,7 +275,7 @@ async def generate_portfolio(
             .all()
         )
         summaries = [
-            SummaryResponse(
+            SummaryResponse.model_construct(
                 id=row.id,
                 repo_path=row.repo_path,
                 user_email=row.user_email,
@@ -281,18 +286,16 @@ async def generate_portfolio(
         ]
 
     skills_chronology: list[SkillChronologyItem] = []
-    if selected_paths:
-        skills_chronology = fetch_skill_chronology(
-            db, project_path_prefixes=selected_paths
-        )
+    if selected_project_ids:
+        # The selected projects themselves; their paths are not extraction roots
+        skills_chronology = fetch_skill_chronology(db, repo_stat_ids=selected_project_ids)
 
     project_items = _build_portfolio_project_items(selected_projects, db)
 
-    return PortfolioGenerationResponse(
+    return dict(
         success=bool(selected_projects),
         portfolio_id=portfolio_id,
         consent_level=consent_level,
-        generated_at=datetime.now(UTC).replace(tzinfo=None),
         preferences=prefs,
         projects=project_items,
         resume_items=resume_items,
@@ -302,159 +305,85 @@ async def generate_portfolio(
     )
 
 
-@router.get("/{portfolio_id}", response_model=PortfolioDisplayResponse)
-async def get_portfolio(
-    portfolio_id: str, db: Session = Depends(get_db)
-) -> PortfolioDisplayResponse:
-    """Get portfolio display data by ID.
-    
-    Returns portfolio showcase with projects, summaries, skills, and project details.
-    Includes project role, thumbnail, and evidence for each project.
-    Respects RepresentationPrefs for ordering and filtering.
+def _materialized_portfolio(db: Session, portfolio_id: str) -> tuple[str, str]:
+    """``(payload_json, etag)`` from the portfolio's snapshot, built and stored on a miss.
+
+    The payload leaves out ``generated_at``, which ``_snapshot_response`` stamps
+    per response, so the ETag tracks the portfolio's data rather than build time.
+    Plain sync ORM code, run on the async session through ``run_sync``.
     """
     portfolio_id = portfolio_id.strip()
     if not portfolio_id:
         raise HTTPException(status_code=422, detail="portfolio_id cannot be empty.")
 
-    # Verify portfolio exists
-    portfolio_exists = (
-        db.query(UploadedZip.id)
-        .filter(UploadedZip.portfolio_id == portfolio_id)
-        .first()
+    generation = snapshot_generation(db)
+    prefs = get_prefs(db, portfolio_id)
+    digest = prefs_hash(prefs.model_dump_json())
+    snapshot = load_portfolio_snapshot(db, portfolio_id, digest)
+    if snapshot is not None:
+        return snapshot.payload_json, snapshot.etag
+
+    # Generate and display responses share one shape, so one payload serves both.
+    # Every field is typed DB data or an already-built model, so skip re-validation.
+    fields = _assemble_portfolio(db, portfolio_id, prefs)
+    payload = PortfolioDisplayResponse.model_construct(**fields).model_dump_json(
+        exclude={"generated_at"}
     )
-    if not portfolio_exists:
-        raise HTTPException(status_code=404, detail="Portfolio not found.")
+    etag = store_portfolio_snapshot(db, portfolio_id, digest, payload, generation=generation)
+    return payload, etag
 
-    # Get analyzed ZIPs for this portfolio
-    zips = (
-        db.query(UploadedZip)
-        .filter(UploadedZip.portfolio_id == portfolio_id)
-        .filter(UploadedZip.extraction_path.isnot(None))
-        .order_by(UploadedZip.uploaded_at.asc())
-        .all()
-    )
-    if not zips:
-        raise HTTPException(
-            status_code=400,
-            detail="Portfolio has no analyzed ZIPs yet. Run /analyze/{zip_id} for uploaded ZIPs first.",
-        )
 
-    extraction_prefixes = sorted(
-        {
-            z.extraction_path.rstrip("/")
-            for z in zips
-            if z.extraction_path and z.extraction_path.strip()
-        }
-    )
-    if not extraction_prefixes:
-        raise HTTPException(
-            status_code=400,
-            detail="Portfolio has no analyzed ZIPs yet. Run /analyze/{zip_id} for uploaded ZIPs first.",
-        )
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
 
-    prefs = get_prefs(db, portfolio_id)
-    consent_level = get_consent_level(db)
-    user_email = get_user_email(db)
 
-    # Fetch all projects for this portfolio
-    projects = (
-        db.query(RepoStat)
-        .filter(RepoStat.deleted_at.is_(None))
-        .filter(_build_path_boundary_filter(RepoStat.project_path, extraction_prefixes))
-        .all()
-    )
+def _stamp_generated_at(payload: str) -> bytes:
+    """Prepend the current ``generated_at`` to a snapshot payload's JSON object."""
+    stamp = _DATETIME_JSON.dump_json(datetime.now(UTC).replace(tzinfo=None))
+    return b'{"generated_at":' + stamp + b"," + payload[1:].encode("utf-8")
 
-    # Apply preferences (ordering and filtering)
-    errors: list[str] = []
-    selected_projects = _apply_preferences(projects, prefs, errors)
-    if not selected_projects:
-        raise HTTPException(
-            status_code=400,
-            detail="No projects available after applying preferences. No portfolio to generate.",
-        )
-    
-    selected_project_ids = [project.id for project in selected_projects]
-    selected_paths = sorted({project.project_path.rstrip("/") for project in selected_projects})
 
-    # Fetch resume items
-    resume_items: list[ResumeItemResponse] = []
-    if selected_project_ids:
-        rows = (
-            db.query(ResumeItem, RepoStat)
-            .join(RepoStat, ResumeItem.repo_stat_id == RepoStat.id)
-            .filter(RepoStat.deleted_at.is_(None))
-            .filter(ResumeItem.repo_stat_id.in_(selected_project_ids))
-            .order_by(
-                RepoStat.last_commit.desc().nullslast(),
-                ResumeItem.created_at.desc(),
-                ResumeItem.id.desc(),
-            )
-            .all()
-        )
-        resume_items = [
-            ResumeItemResponse(
-                id=item.id,
-                title=item.title,
-                content=item.content,
-                category=item.category,
-                project_name=repo.project_name,
-                created_at=item.created_at,
-            )
-            for item, repo in rows
-        ]
+def _snapshot_response(payload: str, etag: str, if_none_match: str | None = None) -> Response:
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+    if if_none_match and _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=_stamp_generated_at(payload), media_type="application/json", headers=headers
+    )
 
-    # Fetch summaries
-    summaries: list[SummaryResponse] = []
-    if selected_paths:
-        summary_rows = (
-            db.query(UserAIntelligenceSummary)
-            .filter(UserAIntelligenceSummary.user_email == user_email)
-            .filter(
-                _build_path_boundary_filter(
-                    UserAIntelligenceSummary.repo_path, selected_paths
-                )
-            )
-            .order_by(UserAIntelligenceSummary.generated_at.desc())
-            .all()
-        )
-        summaries = [
-            SummaryResponse(
-                id=row.id,
-                repo_path=row.repo_path,
-                user_email=row.user_email,
-                summary_text=row.summary_text,
-                generated_at=row.generated_at,
-            )
-            for row in summary_rows
-        ]
 
-    # Fetch skills chronology
-    skills_chronology: list[SkillChronologyItem] = []
-    if selected_paths:
-        skills_chronology = fetch_skill_chronology(db, project_path_prefixes=selected_paths)
+@router.post("/generate", response_model=PortfolioGenerationResponse)
+async def generate_portfolio(
+    request: PortfolioGenerationRequest, db: AsyncSession = Depends(get_async_db)
+) -> Response:
+    payload, etag = await db.run_sync(_materialized_portfolio, request.portfolio_id)
+    return _snapshot_response(payload, etag)
 
-    # Build complete project items with role, thumbnail, and evidence
-    project_items = _build_portfolio_project_items(selected_projects, db)
 
-    return PortfolioDisplayResponse(
-        success=bool(selected_projects),
-        portfolio_id=portfolio_id,
-        consent_level=consent_level,
-        generated_at=datetime.now(UTC).replace(tzinfo=None),
-        preferences=prefs,
-        projects=project_items,
-        resume_items=resume_items,
-        summaries=summaries,
-        skills_chronology=skills_chronology,
-        errors=errors,
-    )
+@router.get("/{portfolio_id}", response_model=PortfolioDisplayResponse)
+async def get_portfolio(
+    portfolio_id: str,
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """Get portfolio display data by ID.
+    
+    Returns portfolio showcase with projects, summaries, skills, and project details.
+    Includes project role, thumbnail, and evidence for each project.
+    Respects RepresentationPrefs for ordering and filtering.
+    Served from the portfolio's materialized snapshot with an ETag; a matching
+    ``If-None-Match`` gets 304 Not Modified.
+    """
+    payload, etag = await db.run_sync(_materialized_portfolio, portfolio_id)
+    return _snapshot_response(payload, etag, if_none_match)
 
 
 @router.post("/{portfolio_id}/edit", response_model=PortfolioEditResponse)
 async def edit_portfolio(
     portfolio_id: str,
     request: PortfolioEditRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> PortfolioEditResponse:
     """Edit/customize portfolio content. Updates showcase selection, ordering, and preferences.
 
@@ -474,16 +403,14 @@ async def edit_portfolio(
         raise HTTPException(status_code=422, detail="portfolio_id cannot be empty.")
 
     # Verify portfolio exists
-    portfolio_exists = (
-        db.query(UploadedZip.id)
-        .filter(UploadedZip.portfolio_id == portfolio_id)
-        .first()
+    portfolio_exists = await db.scalar(
+        select(UploadedZip.id).where(UploadedZip.portfolio_id == portfolio_id).limit(1)
     )
     if not portfolio_exists:
         raise HTTPException(status_code=404, detail="Portfolio not found.")
 
     # Save preferences (PortfolioEditRequest inherits from RepresentationPreferences)
-    saved_prefs = save_prefs(db, portfolio_id, request)
+    saved_prefs = await db.run_sync(save_prefs, portfolio_id, request)
 
     return PortfolioEditResponse(
         success=True,
@@ -6,11 +6,24 @@ from typing import List
 from urllib.parse import urlparse
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, UploadFile, File, Form
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from fastapi import Query
+from .pagination import (
+    SortKey,
+    apply_keyset,
+    cursor_query,
+    fields_query,
+    limit_query,
+    page_rows,
+    parse_fields,
+    projected_response,
+    projection,
+    set_next_cursor,
+)
 from .schemas import (
     ProjectTimelineItem,
     ProjectRankingItem,
@@ -27,7 +40,16 @@ from .schemas import (
     EvidenceDeleteResponse,
     EvidenceType,
 )
-from ..db import RepoStat, UserRepoStat, ProjectEvidence, get_db
+from ..db import (
+    ProjectEvidence,
+    ProjectSkill,
+    RepoStat,
+    UserRepoStat,
+    get_async_db,
+    invalidate_portfolio_snapshots,
+    latest_user_repo_stats,
+    repo_scope_filter,
+)
 from ..helpers.project_ranker import rank_projects
 
 
@@ -38,24 +60,17 @@ ALLOWED_THUMBNAIL_SUFFIXES = {".png", ".jpg", ".jpeg"}
 ALLOWED_THUMBNAIL_CONTENT_TYPES = {"image/png", "image/jpeg"}
 
 
-def _get_latest_user_repo_stat_for_project(db: Session, repo_stat: RepoStat) -> UserRepoStat | None:
-    return (
-        db.query(UserRepoStat)
-        .filter(
-            UserRepoStat.project_name == repo_stat.project_name,
-            UserRepoStat.project_path == repo_stat.project_path,
-        )
-        .order_by(UserRepoStat.id.desc())
-        .first()
-    )
+async def _get_latest_user_repo_stat_for_project(
+    db: AsyncSession, repo_stat: RepoStat
+) -> UserRepoStat | None:
+    stats = await db.run_sync(latest_user_repo_stats, [repo_stat.project_path])
+    return stats.get((repo_stat.project_name, repo_stat.project_path))
 
 
-def _get_active_project(project_id: int, db: Session) -> RepoStat:
+async def _get_active_project(project_id: int, db: AsyncSession) -> RepoStat:
     """Return the project or raise 404 if missing / soft-deleted."""
-    project = (
-        db.query(RepoStat)
-        .filter(RepoStat.id == project_id, RepoStat.deleted_at.is_(None))
-        .first()
+    project = await db.scalar(
+        select(RepoStat).where(RepoStat.id == project_id, RepoStat.deleted_at.is_(None))
     )
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -134,42 +149,75 @@ async def _save_thumbnail_upload(file: UploadFile) -> str:
     return f"/uploads/thumbnails/{saved_filename}"
 
 
+PROJECT_SORT = (
+    SortKey(RepoStat.created_at, descending=True, nulls_last=True),
+    SortKey(RepoStat.id, descending=True),
+)
+PROJECT_FIELDS = {name: getattr(RepoStat, name) for name in ProjectResponse.model_fields}
+
+EVIDENCE_SORT = (SortKey(ProjectEvidence.created_at), SortKey(ProjectEvidence.id))
+EVIDENCE_FIELDS = {
+    "id": ProjectEvidence.id,
+    "type": ProjectEvidence.type,
+    "content": ProjectEvidence.content,
+    "source": ProjectEvidence.source,
+    "date": ProjectEvidence.date,
+    "project_id": ProjectEvidence.repo_stat_id,
+}
+
+
 @router.get("", response_model=list[ProjectResponse])
 async def get_projects(
-    limit: int | None = Query(default=None, ge=1, description="Max results to return"),
+    response: Response,
+    limit: int | None = limit_query("Max results to return"),
     offset: int | None = Query(default=0, ge=0, description="Number of results to skip"),
-    db: Session = Depends(get_db),
+    cursor: str | None = cursor_query(),
+    fields: str | None = fields_query(),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[ProjectResponse]:
-    """List all projects, excluding soft-deleted."""
-    query = (
-        db.query(RepoStat)
-        .filter(RepoStat.deleted_at.is_(None))
-        .order_by(RepoStat.created_at.desc())
-    )
+    """List all projects, excluding soft-deleted, newest first.
 
+    Prefer ``cursor`` over ``offset`` for paging: it resumes after the last
+    project served instead of re-reading the skipped ones.
+    """
+    selected = parse_fields(fields, PROJECT_FIELDS)
+    if selected is None:
+        query = select(RepoStat)
+    else:
+        query = select(*projection(PROJECT_FIELDS, selected))
+    query = apply_keyset(
+        query.where(RepoStat.deleted_at.is_(None)), PROJECT_SORT, limit=limit, cursor=cursor
+    )
     if offset:
         query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
 
-    return query.all()
+    rows, next_cursor = page_rows((await db.execute(query)).all(), PROJECT_SORT, limit)
+    if selected is not None:
+        return projected_response(rows, selected, next_cursor)
+    set_next_cursor(response, next_cursor)
+    return [row[0] for row in rows]
 
 
 @router.get("/{project_id:int}", response_model=ProjectDetailResponse)
 async def get_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ProjectDetailResponse:
     """Get single project by ID with related skills and resume items."""
-    repo_stat = (
-        db.query(RepoStat)
-        .filter(RepoStat.id == project_id, RepoStat.deleted_at.is_(None))
-        .first()
+    # Async sessions cannot lazy-load, so pull the related rows up front
+    repo_stat = await db.scalar(
+        select(RepoStat)
+        .where(RepoStat.id == project_id, RepoStat.deleted_at.is_(None))
+        .options(
+            selectinload(RepoStat.project_skills).selectinload(ProjectSkill.skill),
+            selectinload(RepoStat.resume_items),
+            selectinload(RepoStat.evidence),
+        )
     )
     if not repo_stat:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    latest_user_stat = _get_latest_user_repo_stat_for_project(db, repo_stat)
+    latest_user_stat = await _get_latest_user_repo_stat_for_project(db, repo_stat)
     role = latest_user_stat.user_role if latest_user_stat else None
 
     skills = [
@@ -229,10 +277,10 @@ async def upsert_project_thumbnail(
     project_id: int,
     file: UploadFile | None = File(default=None),
     thumbnail_url: str | None = Form(default=None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ProjectThumbnailResponse:
     """Set or update a project's thumbnail from either upload or external URL."""
-    project = _get_active_project(project_id, db)
+    project = await _get_active_project(project_id, db)
     normalized_url = _normalize_thumbnail_url(thumbnail_url)
 
     if file is not None and normalized_url is not None:
@@ -255,8 +303,9 @@ async def upsert_project_thumbnail(
 
     previous_thumbnail_url = project.thumbnail_url
     project.thumbnail_url = new_thumbnail_url
-    db.commit()
-    db.refresh(project)
+    await db.run_sync(invalidate_portfolio_snapshots, [project.portfolio_id])
+    await db.commit()
+    await db.refresh(project)
 
     if previous_thumbnail_url != new_thumbnail_url:
         _delete_existing_local_thumbnail(previous_thumbnail_url)
@@ -273,13 +322,11 @@ async def upsert_project_thumbnail(
 async def upsert_project_role(
     project_id: int,
     payload: ProjectRoleUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ProjectRoleResponse:
     """Set or update the user's role for a project."""
-    repo_stat = (
-        db.query(RepoStat)
-        .filter(RepoStat.id == project_id, RepoStat.deleted_at.is_(None))
-        .first()
+    repo_stat = await db.scalar(
+        select(RepoStat).where(RepoStat.id == project_id, RepoStat.deleted_at.is_(None))
     )
     if not repo_stat:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -288,14 +335,16 @@ async def upsert_project_role(
     if not normalized_role:
         raise HTTPException(status_code=422, detail="Role must not be empty")
 
-    updated_rows = (
-        db.query(UserRepoStat)
-        .filter(
+    result = await db.execute(
+        update(UserRepoStat)
+        .where(
             UserRepoStat.project_name == repo_stat.project_name,
             UserRepoStat.project_path == repo_stat.project_path,
         )
-        .update({UserRepoStat.user_role: normalized_role}, synchronize_session=False)
+        .values(user_role=normalized_role)
+        .execution_options(synchronize_session=False)
     )
+    updated_rows = result.rowcount
 
     if updated_rows == 0:
         db.add(
@@ -306,7 +355,8 @@ async def upsert_project_role(
             )
         )
 
-    db.commit()
+    await db.run_sync(invalidate_portfolio_snapshots, [repo_stat.portfolio_id])
+    await db.commit()
 
     return ProjectRoleResponse(
         project_id=repo_stat.id,
@@ -323,10 +373,10 @@ async def upsert_project_role(
 async def create_evidence(
     project_id: int,
     body: EvidenceCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> EvidenceResponse:
     """Attach evidence of success to a project."""
-    project = _get_active_project(project_id, db)
+    project = await _get_active_project(project_id, db)
 
     evidence = ProjectEvidence(
         repo_stat_id=project.id,
@@ -336,8 +386,9 @@ async def create_evidence(
         date=body.date,
     )
     db.add(evidence)
-    db.commit()
-    db.refresh(evidence)
+    await db.run_sync(invalidate_portfolio_snapshots, [project.portfolio_id])
+    await db.commit()
+    await db.refresh(evidence)
 
     return EvidenceResponse(
         id=evidence.id,
@@ -352,19 +403,30 @@ async def create_evidence(
 @router.get("/{project_id:int}/evidence", response_model=list[EvidenceResponse])
 async def list_evidence(
     project_id: int,
+    response: Response,
     type: EvidenceType | None = Query(default=None, description="Filter by evidence type"),
-    db: Session = Depends(get_db),
+    limit: int | None = limit_query(),
+    cursor: str | None = cursor_query(),
+    fields: str | None = fields_query(),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[EvidenceResponse]:
-    """List all evidence for a project, with optional type filter."""
-    project = _get_active_project(project_id, db)
+    """List all evidence for a project, oldest first, with optional type filter."""
+    project = await _get_active_project(project_id, db)
+    selected = parse_fields(fields, EVIDENCE_FIELDS)
 
-    query = db.query(ProjectEvidence).filter(
-        ProjectEvidence.repo_stat_id == project.id
-    )
+    if selected is None:
+        query = select(ProjectEvidence)
+    else:
+        query = select(*projection(EVIDENCE_FIELDS, selected))
+    query = query.where(ProjectEvidence.repo_stat_id == project.id)
     if type is not None:
-        query = query.filter(ProjectEvidence.type == type)
+        query = query.where(ProjectEvidence.type == type)
 
-    rows = query.order_by(ProjectEvidence.created_at).all()
+    query = apply_keyset(query, EVIDENCE_SORT, limit=limit, cursor=cursor)
+    rows, next_cursor = page_rows((await db.execute(query)).all(), EVIDENCE_SORT, limit)
+    if selected is not None:
+        return projected_response(rows, selected, next_cursor)
+    set_next_cursor(response, next_cursor)
     return [
         EvidenceResponse(
             id=ev.id,
@@ -374,7 +436,7 @@ async def list_evidence(
             date=ev.date,
             project_id=project.id,
         )
-        for ev in rows
+        for ev, *_ in rows
     ]
 
 
@@ -385,24 +447,23 @@ async def list_evidence(
 async def delete_evidence(
     project_id: int,
     evidence_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> EvidenceDeleteResponse:
     """Remove a single evidence item from a project."""
-    project = _get_active_project(project_id, db)
+    project = await _get_active_project(project_id, db)
 
-    evidence = (
-        db.query(ProjectEvidence)
-        .filter(
+    evidence = await db.scalar(
+        select(ProjectEvidence).where(
             ProjectEvidence.id == evidence_id,
             ProjectEvidence.repo_stat_id == project.id,
         )
-        .first()
     )
     if not evidence:
         raise HTTPException(status_code=404, detail="Evidence not found")
 
-    db.delete(evidence)
-    db.commit()
+    await db.delete(evidence)
+    await db.run_sync(invalidate_portfolio_snapshots, [project.portfolio_id])
+    await db.commit()
 
     return EvidenceDeleteResponse(success=True, deleted_id=evidence_id)
 
@@ -417,7 +478,7 @@ def fetch_project_timeline(
 ) -> list[ProjectTimelineItem]:
     """Return stored project activity windows with optional filtering.
 
-    `project_path_prefixes` filters RepoStat.project_path by SQL LIKE prefix (e.g. extraction root).
+    `project_path_prefixes` are extraction roots; see `repo_scope_filter`.
     """
     now = datetime.now(UTC).replace(tzinfo=None)
     six_months_ago = now - timedelta(days=180)
@@ -433,9 +494,7 @@ def fetch_project_timeline(
     )
 
     if project_path_prefixes:
-        query = query.filter(
-            or_(*[RepoStat.project_path.like(f"{prefix}%") for prefix in project_path_prefixes])
-        )
+        query = query.filter(repo_scope_filter(project_path_prefixes))
 
     repo_stats: List[RepoStat] = query.all()
 
@@ -476,10 +535,10 @@ async def get_project_timeline(
     start_date: date | None = None,
     end_date: date | None = None,
     active_only: bool | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[ProjectTimelineItem]:
-    return fetch_project_timeline(
-        db,
+    return await db.run_sync(
+        fetch_project_timeline,
         start_date=start_date,
         end_date=end_date,
         active_only=active_only,
@@ -489,7 +548,7 @@ async def get_project_timeline(
 @router.delete("/{project_id:int}", response_model=DeleteResponse)
 async def delete_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DeleteResponse:
     """Soft-delete a project (RepoStat) record by ID.
 
@@ -500,10 +559,8 @@ async def delete_project(
     No files on disk are affected - this only modifies the database.
     """
     # Find RepoStat by ID (only non-deleted)
-    repo_stat = (
-        db.query(RepoStat)
-        .filter(RepoStat.id == project_id, RepoStat.deleted_at.is_(None))
-        .first()
+    repo_stat = await db.scalar(
+        select(RepoStat).where(RepoStat.id == project_id, RepoStat.deleted_at.is_(None))
     )
 
     # Handle not found (or already deleted)
@@ -513,7 +570,8 @@ async def delete_project(
     # Soft delete - set timestamp
     project_name = repo_stat.project_name
     repo_stat.deleted_at = datetime.now(UTC).replace(tzinfo=None)
-    db.commit()
+    await db.run_sync(invalidate_portfolio_snapshots, [repo_stat.portfolio_id])
+    await db.commit()
 
     return DeleteResponse(
         success=True,
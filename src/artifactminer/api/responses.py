@@ -0,0 +1,40 @@
+"""Response classes and compression settings for large API payloads.
+
+Routes with a ``response_model`` are already serialized straight to JSON bytes
+by pydantic-core, which is as fast as orjson on these payloads (see
+``tests/api/bench_portfolio_payload.py``); giving them a custom response class
+would turn that fast path off. ``FastJSONResponse`` is for responses built by
+hand from plain data, such as ``fields=`` projections.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
+# Responses smaller than this are sent uncompressed; gzip costs more than it saves
+DEFAULT_GZIP_MINIMUM_SIZE = 1024
+DEFAULT_GZIP_COMPRESS_LEVEL = 6
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed.
+
+    orjson encodes datetimes, dates and UUIDs natively, so the content does not
+    need a ``jsonable_encoder`` pass first; without orjson it gets one.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+__all__ = ["DEFAULT_GZIP_COMPRESS_LEVEL", "DEFAULT_GZIP_MINIMUM_SIZE", "FastJSONResponse"]
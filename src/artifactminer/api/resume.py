@@ -5,7 +5,7 @@ from typing import List
 from fastapi import APIRouter, Body, Depends, HTTPException, Path as ApiPath
 from sqlalchemy.orm import Session
 
-from ..db import get_db, ProjectEvidence, RepoStat, ResumeItem, UserRepoStat
+from ..db import get_db, invalidate_portfolio_snapshots, ProjectEvidence, RepoStat, ResumeItem, latest_user_repo_stats
 from .schemas import (
     ResumeItemResponse,
     ResumeGenerationRequest,
@@ -16,6 +16,8 @@ from .analyze import get_user_email, get_consent_level
 from ..skills.deep_analysis import DeepRepoAnalyzer
 from ..skills.persistence import persist_extracted_skills
 from ..evidence.orchestrator import persist_insights_as_project_evidence
+from ..RepositoryIntelligence.git_runner import RepoGitBudget
+from ..RepositoryIntelligence.object_reader import GitObjectReader
 from ..RepositoryIntelligence.repo_intelligence_user import collect_user_additions
 
 router = APIRouter(
@@ -67,16 +69,19 @@ async def generate_resume_for_project(
                 f"{deleted_evidence_items} ProjectEvidence rows for {repo_stat.project_name}"
             )
 
+    # One git budget for all history reads on this project
+    git_budget = RepoGitBudget()
+
     # Collect user additions for analysis context
-    additions_text = ""
+    user_additions: List[str] = []
     if repo_stat.project_path and Path(repo_stat.project_path).exists():
         try:
             user_additions = collect_user_additions(
                 repo_path=str(repo_stat.project_path),
                 user_email=user_email,
                 max_commits=500,
+                budget=git_budget,
             )
-            additions_text = "\n".join(user_additions)
         except Exception as e:
             warning_msg = f"Could not collect additions for {repo_stat.project_name}: {e}"
             print(f"[resume_generate] Warning: {warning_msg}")
@@ -85,13 +90,18 @@ async def generate_resume_for_project(
     # Run deep analysis to extract insights
     analyzer = DeepRepoAnalyzer(enable_llm=False)
 
+    repo_path = str(repo_stat.project_path) if repo_stat.project_path else ""
+    object_reader = GitObjectReader(repo_path, budget=git_budget) if repo_path else None
+
     try:
         deep_result = analyzer.analyze(
-            repo_path=str(repo_stat.project_path) if repo_stat.project_path else "",
+            repo_path=repo_path,
             repo_stat=repo_stat,
             user_email=user_email,
-            user_contributions={"additions": additions_text},
+            user_contributions={"additions": user_additions},
             consent_level=consent_level,
+            git_budget=git_budget,
+            object_reader=object_reader,
         )
 
         # Persist skills
@@ -129,6 +139,10 @@ async def generate_resume_for_project(
         errors.append(error_msg)
         return 0, errors, warnings
 
+    finally:
+        if object_reader is not None:
+            object_reader.close()
+
 
 @router.post("/generate", response_model=ResumeGenerationResponse)
 async def generate_resume_items(
@@ -238,6 +252,7 @@ async def generate_resume_items(
 
     # Commit all changes
     try:
+        invalidate_portfolio_snapshots(db, [project.portfolio_id for project in projects])
         db.commit()
     except Exception as e:
         db.rollback()
@@ -302,6 +317,7 @@ async def edit_resume_item(
         resume_item.category = request.category
 
     try:
+        invalidate_portfolio_snapshots(db, [repo_stat.portfolio_id] if repo_stat else [])
         db.commit()
         db.refresh(resume_item)
     except Exception as e:
@@ -313,14 +329,8 @@ async def edit_resume_item(
 
     role: str | None = None
     if repo_stat:
-        latest_user_stat = (
-            db.query(UserRepoStat)
-            .filter(
-                UserRepoStat.project_name == repo_stat.project_name,
-                UserRepoStat.project_path == repo_stat.project_path,
-            )
-            .order_by(UserRepoStat.id.desc())
-            .first()
+        latest_user_stat = latest_user_repo_stats(db, [repo_stat.project_path]).get(
+            (repo_stat.project_name, repo_stat.project_path)
         )
         role = latest_user_stat.user_role if latest_user_stat else None
 
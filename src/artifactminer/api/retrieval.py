@@ -4,15 +4,28 @@ These endpoints serve data for the final portfolio/resume generation.
 All are GET-only with no side effects (write operations moved to resume.py).
 """
 
-from datetime import datetime
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from sqlalchemy import or_, func
+from sqlalchemy import func, literal, or_, select, union_all
 from collections import defaultdict
 
+from .pagination import (
+    SortKey,
+    apply_keyset,
+    cursor_query,
+    fields_query,
+    keyset_order,
+    limit_query,
+    page_rows,
+    parse_fields,
+    projected_response,
+    projection,
+    set_next_cursor,
+)
 from .schemas import (
     SkillChronologyItem,
     SkillResponse,
@@ -21,22 +34,49 @@ from .schemas import (
     UserAIIntelligenceSummaryResponse,
 )
 from ..db import (
-    get_db,
+    get_async_db,
     ProjectSkill,
     UserProjectSkill,
-    UserRepoStat,
     Skill,
     RepoStat,
     ResumeItem,
     UserAIntelligenceSummary,
+    latest_user_repo_stats,
+    repo_scope_filter,
 )
 
 
 router = APIRouter(tags=["retrieval"])
 
 
+SKILL_SORT = (SortKey(Skill.name), SortKey(Skill.id))
+SKILL_FIELDS = {"id": Skill.id, "name": Skill.name, "category": Skill.category}
+
+RESUME_SORT = (
+    SortKey(RepoStat.last_commit, descending=True, nulls_last=True),
+    SortKey(ResumeItem.id, descending=True),
+)
+RESUME_FIELDS = {
+    "id": ResumeItem.id,
+    "title": ResumeItem.title,
+    "content": ResumeItem.content,
+    "category": ResumeItem.category,
+    "project_name": RepoStat.project_name,
+    "created_at": ResumeItem.created_at,
+}
+
+SUMMARY_SORT = (
+    SortKey(UserAIntelligenceSummary.generated_at, descending=True, nulls_last=True),
+    SortKey(UserAIntelligenceSummary.id, descending=True),
+)
+SUMMARY_FIELDS = {
+    name: getattr(UserAIntelligenceSummary, name) for name in SummaryResponse.model_fields
+}
+
+
 @router.get("/skills", response_model=List[SkillResponse])
 async def get_skills(
+    response: Response,
     category: str | None = Query(
         default=None,
         description="Filter skills by category (e.g., 'Programming Languages').",
@@ -45,38 +85,43 @@ async def get_skills(
         default=False,
         description="Include count of projects using each skill.",
     ),
-    db: Session = Depends(get_db),
+    limit: int | None = limit_query(),
+    cursor: str | None = cursor_query(),
+    fields: str | None = fields_query(),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[SkillResponse]:
-    """Get all skills from the Skill table.
+    """Get all skills from the Skill table, ordered by name.
 
     Returns a list of all skills with optional filtering by category.
     Optionally includes an aggregate count of projects using each skill.
     """
-    query = db.query(Skill)
+    selected = parse_fields(fields, SkillResponse.model_fields)
+    query = select(*projection(SKILL_FIELDS, ("id", "name", "category")))
 
     if category:
-        query = query.filter(Skill.category == category)
+        query = query.where(Skill.category == category)
 
-    query = query.order_by(Skill.name.asc())
-    skills = query.all()
+    query = apply_keyset(query, SKILL_SORT, limit=limit, cursor=cursor)
+    skills, next_cursor = page_rows((await db.execute(query)).all(), SKILL_SORT, limit)
 
     # Pre-compute project counts in bulk (2 queries total) to avoid N+1
     project_count_map: dict[int, int] | None = None
-    if include_project_count:
+    if include_project_count and (selected is None or "project_count" in selected):
+        page_ids = [skill.id for skill in skills]
         # Collect (skill_id, repo_stat_id) pairs from both tables in two queries
         skill_repo_pairs: dict[int, set[int]] = defaultdict(set)
 
-        for skill_id, repo_stat_id in (
-            db.query(ProjectSkill.skill_id, ProjectSkill.repo_stat_id)
+        for skill_id, repo_stat_id in await db.execute(
+            select(ProjectSkill.skill_id, ProjectSkill.repo_stat_id)
             .join(RepoStat, ProjectSkill.repo_stat_id == RepoStat.id)
-            .filter(RepoStat.deleted_at.is_(None))
+            .where(RepoStat.deleted_at.is_(None), ProjectSkill.skill_id.in_(page_ids))
         ):
             skill_repo_pairs[skill_id].add(repo_stat_id)
 
-        for skill_id, repo_stat_id in (
-            db.query(UserProjectSkill.skill_id, UserProjectSkill.repo_stat_id)
+        for skill_id, repo_stat_id in await db.execute(
+            select(UserProjectSkill.skill_id, UserProjectSkill.repo_stat_id)
             .join(RepoStat, UserProjectSkill.repo_stat_id == RepoStat.id)
-            .filter(RepoStat.deleted_at.is_(None))
+            .where(RepoStat.deleted_at.is_(None), UserProjectSkill.skill_id.in_(page_ids))
         ):
             skill_repo_pairs[skill_id].add(repo_stat_id)
 
@@ -99,140 +144,216 @@ async def get_skills(
             )
         )
 
+    if selected is not None:
+        return projected_response(
+            (item.model_dump() for item in result), selected, next_cursor
+        )
+    set_next_cursor(response, next_cursor)
     return result
 
 
-def fetch_skill_chronology(
-    db: Session,
+CHRONOLOGY_COLUMNS = tuple(SkillChronologyItem.model_fields)
+
+
+def skill_chronology_rows(
     *,
     project_path_prefixes: list[str] | None = None,
-) -> list[SkillChronologyItem]:
-    """Get chronological list of skills ordered by when they were first demonstrated.
+    repo_stat_ids: list[int] | None = None,
+    first_use_only: bool = False,
+):
+    """Chronology rows as a subquery: a ``UNION ALL`` of the project and user skill links.
+
+    Each row carries only the item's scalar columns plus ``source`` (0 for
+    ProjectSkill, 1 for UserProjectSkill) and ``link_id``, which complete the
+    order after the date (see ``skill_chronology_sort``). With
+    ``first_use_only`` only each skill's earliest row is kept, i.e. the
+    ``MIN(first_commit)`` per skill together with the project it came from.
 
-    `project_path_prefixes` filters RepoStat.project_path by SQL LIKE prefix (e.g. extraction root).
+    `project_path_prefixes` are extraction roots; see `repo_scope_filter`.
+    `repo_stat_ids` limits the rows to those projects.
     """
-    items: list[SkillChronologyItem] = []
 
-    project_query = (
-        db.query(ProjectSkill, Skill, RepoStat)
-        .join(Skill, ProjectSkill.skill_id == Skill.id)
-        .join(RepoStat, ProjectSkill.repo_stat_id == RepoStat.id)
-        .filter(RepoStat.deleted_at.is_(None))
+    def links(link, source: int):
+        query = (
+            select(
+                RepoStat.first_commit.label("date"),
+                Skill.name.label("skill"),
+                RepoStat.project_name.label("project"),
+                link.proficiency.label("proficiency"),
+                Skill.category.label("category"),
+                Skill.id.label("skill_id"),
+                literal(source).label("source"),
+                link.id.label("link_id"),
+            )
+            .join_from(link, Skill, link.skill_id == Skill.id)
+            .join(RepoStat, link.repo_stat_id == RepoStat.id)
+            .where(RepoStat.deleted_at.is_(None))
+        )
+        if project_path_prefixes:
+            query = query.where(repo_scope_filter(project_path_prefixes))
+        if repo_stat_ids is not None:
+            query = query.where(RepoStat.id.in_(repo_stat_ids))
+        return query
+
+    rows = union_all(links(ProjectSkill, 0), links(UserProjectSkill, 1)).subquery("chronology")
+    if not first_use_only:
+        return rows
+
+    first_use = func.row_number().over(
+        partition_by=rows.c.skill_id,
+        order_by=[key.order_by() for key in skill_chronology_sort(rows)],
     )
-
-    user_query = (
-        db.query(UserProjectSkill, Skill, RepoStat)
-        .join(Skill, UserProjectSkill.skill_id == Skill.id)
-        .join(RepoStat, UserProjectSkill.repo_stat_id == RepoStat.id)
-        .filter(RepoStat.deleted_at.is_(None))
+    ranked = select(rows, first_use.label("first_use")).subquery("ranked")
+    return select(*(ranked.c[name] for name in rows.c.keys())).where(
+        ranked.c.first_use == 1
+    ).subquery("first_uses")
+
+
+def skill_chronology_sort(rows) -> tuple[SortKey, ...]:
+    """Oldest first, undated last; project links before user links on the same date."""
+    return (
+        SortKey(rows.c.date, nulls_last=True),
+        SortKey(rows.c.source),
+        SortKey(rows.c.link_id),
     )
 
-    if project_path_prefixes:
-        path_filter = or_(
-            *[
-                RepoStat.project_path.like(f"{prefix}%")
-                for prefix in project_path_prefixes
-            ]
-        )
-        project_query = project_query.filter(path_filter)
-        user_query = user_query.filter(path_filter)
-
-    project_results = project_query.all()
-    user_results = user_query.all()
-
-    for project_skill, skill, repo_stat in project_results:
-        items.append(
-            SkillChronologyItem(
-                date=repo_stat.first_commit,
-                skill=skill.name,
-                project=repo_stat.project_name,
-                proficiency=project_skill.proficiency,
-                category=skill.category,
-            )
-        )
 
-    for user_skill, skill, repo_stat in user_results:
-        items.append(
-            SkillChronologyItem(
-                date=repo_stat.first_commit,
-                skill=skill.name,
-                project=repo_stat.project_name,
-                proficiency=user_skill.proficiency,
-                category=skill.category,
-            )
-        )
+def fetch_skill_chronology(
+    db: Session,
+    *,
+    project_path_prefixes: list[str] | None = None,
+    repo_stat_ids: list[int] | None = None,
+    first_use_only: bool = False,
+) -> list[SkillChronologyItem]:
+    """Get chronological list of skills ordered by when they were first demonstrated.
 
-    items.sort(key=lambda item: item.date or datetime.max)
-    return items
+    Ordering (and, with ``first_use_only``, de-duplication by skill) happens in
+    SQL; only the item columns are read. See ``skill_chronology_rows``.
+    """
+    rows = skill_chronology_rows(
+        project_path_prefixes=project_path_prefixes,
+        repo_stat_ids=repo_stat_ids,
+        first_use_only=first_use_only,
+    )
+    query = select(*(rows.c[name] for name in CHRONOLOGY_COLUMNS)).order_by(
+        *keyset_order(skill_chronology_sort(rows))
+    )
+    # Typed columns straight from the database; skip re-validating each row
+    return [SkillChronologyItem.model_construct(**row._mapping) for row in db.execute(query)]
 
 
 @router.get("/skills/chronology", response_model=List[SkillChronologyItem])
 async def get_skill_chronology(
-    db: Session = Depends(get_db),
+    response: Response,
+    first_use_only: bool = Query(
+        default=False,
+        description="Only each skill's earliest use, instead of every project using it.",
+    ),
+    limit: int | None = limit_query(),
+    cursor: str | None = cursor_query(),
+    fields: str | None = fields_query(),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[SkillChronologyItem]:
     """Get chronological list of skills ordered by when they were first demonstrated.
 
-    Joins ProjectSkill -> Skill -> RepoStat to get skill info with project dates.
+    Joins ProjectSkill/UserProjectSkill -> Skill -> RepoStat to get skill info with project dates.
     Ordered by RepoStat.first_commit ASC (oldest first) to show skill progression.
 
     Milestone Req #19: Chronological list of skills.
     """
-    return fetch_skill_chronology(db)
+    selected = parse_fields(fields, CHRONOLOGY_COLUMNS, always=())
+    rows = skill_chronology_rows(first_use_only=first_use_only)
+    sort = skill_chronology_sort(rows)
+
+    query = select(*(rows.c[name].label(name) for name in selected or CHRONOLOGY_COLUMNS))
+    query = apply_keyset(query, sort, limit=limit, cursor=cursor)
+    items, next_cursor = page_rows((await db.execute(query)).all(), sort, limit)
+
+    if selected is not None:
+        return projected_response(items, selected, next_cursor)
+    set_next_cursor(response, next_cursor)
+    return [
+        SkillChronologyItem(**{name: item._mapping[name] for name in CHRONOLOGY_COLUMNS})
+        for item in items
+    ]
 
 
 @router.get("/resume", response_model=List[ResumeItemResponse])
 async def get_resume_items(
+    response: Response,
     project_id: int | None = Query(
         default=None,
         description="Filter resume items by project (repo_stat_id). "
         "Use this to show resume section for a specific project.",
     ),
-    db: Session = Depends(get_db),
+    limit: int | None = limit_query(),
+    cursor: str | None = cursor_query(),
+    fields: str | None = fields_query(),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[ResumeItemResponse]:
     """Retrieve all resume items, sorted by project's last commit (newest first).
 
-    Default sort: RepoStat.last_commit DESC (reverse-chronological for resumes).
+    Default sort: RepoStat.last_commit DESC (reverse-chronological for resumes),
+    then newest item first.
     Optional filter: ?project_id=123 to get items for a specific project.
 
     Milestone Req #14: Retrieve previously generated resume items.
     Milestone Req #12: Output all key information for a project (via project_id filter).
     """
-    query = db.query(ResumeItem, RepoStat).outerjoin(
+    selected = parse_fields(fields, ResumeItemResponse.model_fields)
+    if selected is None:
+        query = select(ResumeItem, RepoStat)
+    else:
+        columns = dict(RESUME_FIELDS)
+        read = list(selected)
+        if "role" in selected:
+            # Role lookup is keyed by the project's name and path
+            columns["project_path"] = RepoStat.project_path
+            read += [name for name in ("project_name", "project_path") if name not in read]
+        query = select(*projection(columns, read))
+    query = query.select_from(ResumeItem).outerjoin(
         RepoStat, ResumeItem.repo_stat_id == RepoStat.id
     )
 
     # Exclude soft-deleted projects (but keep items with no repo_stat)
-    query = query.filter(or_(RepoStat.deleted_at.is_(None), RepoStat.id.is_(None)))
+    query = query.where(or_(RepoStat.deleted_at.is_(None), RepoStat.id.is_(None)))
 
     if project_id is not None:
-        query = query.filter(ResumeItem.repo_stat_id == project_id)
+        query = query.where(ResumeItem.repo_stat_id == project_id)
 
     # Sort by last_commit DESC; items without repo_stat go last
-    query = query.order_by(RepoStat.last_commit.desc().nullslast())
-
-    results = query.all()
-
-    role_cache: dict[tuple[str, str], str | None] = {}
+    query = apply_keyset(query, RESUME_SORT, limit=limit, cursor=cursor)
+    results, next_cursor = page_rows((await db.execute(query)).all(), RESUME_SORT, limit)
+
+    if selected is not None:
+        items = [dict(row._mapping) for row in results]
+        if "role" in selected:
+            roles = await _latest_roles(
+                db,
+                {
+                    (item["project_name"], item["project_path"])
+                    for item in items
+                    if item["project_name"] is not None
+                },
+            )
+            for item in items:
+                item["role"] = roles.get((item["project_name"], item["project_path"]))
+        return projected_response(items, selected, next_cursor)
+
+    roles = await _latest_roles(
+        db,
+        {
+            (repo_stat.project_name, repo_stat.project_path)
+            for _, repo_stat, *_ in results
+            if repo_stat is not None
+        },
+    )
     response_items: list[ResumeItemResponse] = []
 
-    for resume_item, repo_stat in results:
+    for resume_item, repo_stat, *_ in results:
         role: str | None = None
         if repo_stat:
-            key = (repo_stat.project_name, repo_stat.project_path)
-            if key not in role_cache:
-                latest_user_stat = (
-                    db.query(UserRepoStat)
-                    .filter(
-                        UserRepoStat.project_name == repo_stat.project_name,
-                        UserRepoStat.project_path == repo_stat.project_path,
-                    )
-                    .order_by(UserRepoStat.id.desc())
-                    .first()
-                )
-                role_cache[key] = (
-                    latest_user_stat.user_role if latest_user_stat else None
-                )
-            role = role_cache[key]
+            role = roles.get((repo_stat.project_name, repo_stat.project_path))
 
         response_items.append(
             ResumeItemResponse(
@@ -246,13 +367,22 @@ async def get_resume_items(
             )
         )
 
+    set_next_cursor(response, next_cursor)
     return response_items
 
 
+async def _latest_roles(
+    db: AsyncSession, projects: set[tuple[str, str]]
+) -> dict[tuple[str, str], str | None]:
+    """User role from the latest UserRepoStat of each (project_name, project_path)."""
+    stats = await db.run_sync(latest_user_repo_stats, {path for _, path in projects})
+    return {key: stat.user_role for key, stat in stats.items()}
+
+
 @router.get("/resume/{resume_id}", response_model=ResumeItemResponse)
 async def get_resume_item_by_id(
     resume_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ResumeItemResponse:
     """Retrieve a single resume item by its ID.
 
@@ -260,11 +390,12 @@ async def get_resume_item_by_id(
     Orphan items (no associated project) are returned with project_name: null.
     """
     result = (
-        db.query(ResumeItem, RepoStat)
-        .outerjoin(RepoStat, ResumeItem.repo_stat_id == RepoStat.id)
-        .filter(ResumeItem.id == resume_id)
-        .first()
-    )
+        await db.execute(
+            select(ResumeItem, RepoStat)
+            .outerjoin(RepoStat, ResumeItem.repo_stat_id == RepoStat.id)
+            .where(ResumeItem.id == resume_id)
+        )
+    ).first()
 
     if result is None:
         raise HTTPException(status_code=404, detail="Resume item not found")
@@ -286,27 +417,40 @@ async def get_resume_item_by_id(
 
 @router.get("/summaries", response_model=List[SummaryResponse])
 async def get_summaries(
+    response: Response,
     user_email: str = Query(
         ...,  # Required parameter
         description="User email to filter summaries. "
         "REQUIRED: Each user only sees their own AI-generated contribution summaries.",
     ),
-    db: Session = Depends(get_db),
+    limit: int | None = limit_query(),
+    cursor: str | None = cursor_query(),
+    fields: str | None = fields_query(),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[SummaryResponse]:
-    """Retrieve AI-generated contribution summaries for a specific user.
+    """Retrieve AI-generated contribution summaries for a specific user, newest first.
 
     Query param `user_email` is MANDATORY - summaries are user-scoped.
     This ensures users only retrieve their own portfolio data.
 
     Milestone Req #14: Retrieve portfolio info.
     """
-    summaries = (
-        db.query(UserAIntelligenceSummary)
-        .filter(UserAIntelligenceSummary.user_email == user_email)
-        .order_by(UserAIntelligenceSummary.generated_at.desc())
-        .all()
+    selected = parse_fields(fields, SUMMARY_FIELDS)
+    if selected is None:
+        query = select(UserAIntelligenceSummary)
+    else:
+        query = select(*projection(SUMMARY_FIELDS, selected))
+    query = apply_keyset(
+        query.where(UserAIntelligenceSummary.user_email == user_email),
+        SUMMARY_SORT,
+        limit=limit,
+        cursor=cursor,
     )
+    summaries, next_cursor = page_rows((await db.execute(query)).all(), SUMMARY_SORT, limit)
 
+    if selected is not None:
+        return projected_response(summaries, selected, next_cursor)
+    set_next_cursor(response, next_cursor)
     return [
         SummaryResponse(
             id=s.id,
@@ -315,7 +459,7 @@ async def get_summaries(
             summary_text=s.summary_text,
             generated_at=s.generated_at,
         )
-        for s in summaries
+        for s, *_ in summaries
     ]
 
 
@@ -323,15 +467,13 @@ async def get_summaries(
 async def get_AI_summaries(
     user_email: str,
     repo_path: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    summaries_query = (
-        db.query(UserAIntelligenceSummary)
-        .filter(
+    summaries_query = await db.scalars(
+        select(UserAIntelligenceSummary).where(
             UserAIntelligenceSummary.user_email == user_email,
             UserAIntelligenceSummary.repo_path.like(f"{repo_path}%"),
         )
-        .all()
     )
     return [
         UserAIIntelligenceSummaryResponse(
@@ -434,6 +434,10 @@ class ProjectRankingItem(BaseModel):
     score: float = Field(description="User's contribution percentage (0-100).")
     total_commits: int = Field(description="Total commits in the project.")
     user_commits: int = Field(description="Commits by the user.")
+    partial: bool = Field(
+        default=False,
+        description="True when the history read was cut short by the git budget.",
+    )
 
 
 class RepoAnalysisResult(BaseModel):
@@ -462,6 +466,10 @@ class RepoAnalysisResult(BaseModel):
     user_last_commit: datetime | None = Field(
         default=None, description="Timestamp of the user's last commit in the repo."
     )
+    partial: bool = Field(
+        default=False,
+        description="True when git history was cut short by the per-repo time/byte budget.",
+    )
     error: str | None = None
 
 
@@ -472,6 +480,7 @@ class RankingResult(BaseModel):
     score: float = Field(description="User contribution percentage (0-100)")
     total_commits: int
     user_commits: int
+    partial: bool = False
 
 
 class SummaryResult(BaseModel):
@@ -491,6 +500,29 @@ class AnalyzeRequest(BaseModel):
             "Paths are relative to the extracted ZIP root."
         ),
     )
+    include_timings: bool = Field(
+        default=False,
+        description="Return per-stage timings for the run in AnalyzeResponse.timings.",
+    )
+
+
+class StageTiming(BaseModel):
+    """Aggregated time spent in one pipeline stage."""
+
+    seconds: float
+    calls: int
+    count: int | None = Field(
+        default=None, description="Items processed (files, commits, rows...), when known."
+    )
+    bytes: int | None = None
+
+
+class AnalysisTimings(BaseModel):
+    """Per-stage timings for one analyze run, run-wide and per repository."""
+
+    total_seconds: float
+    stages: dict[str, StageTiming]
+    repos: dict[str, dict[str, StageTiming]]
 
 
 class AnalyzeResponse(BaseModel):
@@ -504,6 +536,9 @@ class AnalyzeResponse(BaseModel):
     summaries: list[SummaryResult]
     consent_level: str
     user_email: str
+    timings: AnalysisTimings | None = Field(
+        default=None, description="Set when the request asked for include_timings."
+    )
 
 
 class SummaryListResponse(BaseModel):
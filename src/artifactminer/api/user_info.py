@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 from artifactminer.db.models import Question, UserAnswer
 
 from .schemas import UserAnswerCreate, UserAnswerResponse
-from ..db import get_db
+from ..db import get_db, invalidate_portfolio_snapshots
 
 router = APIRouter(tags=["user_info"])
 
@@ -80,12 +80,14 @@ def user_email_to_db(db: Session, email: str) -> UserAnswer:
             answered_at=datetime.now(UTC).replace(tzinfo=None),
         )
         db.add(email_answer)
+        invalidate_portfolio_snapshots(db)  # portfolios show the user's summaries
         db.commit()
         db.refresh(email_answer)
     else:
         email_answer.answer_text = email.strip().lower()
         email_answer.answered_at = datetime.now(UTC).replace(tzinfo=None)
 
+        invalidate_portfolio_snapshots(db)
         db.commit()
         db.refresh(email_answer)
 
@@ -6,10 +6,11 @@ import json
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from .schemas import RepresentationPreferences
-from ..db import RepresentationPrefs, get_db
+from ..db import RepresentationPrefs, get_async_db, invalidate_portfolio_snapshots
 
 
 router = APIRouter(prefix="/views", tags=["views"])
@@ -45,6 +46,7 @@ def save_prefs(
         row.prefs_json = prefs_json
         row.updated_at = datetime.now(UTC).replace(tzinfo=None)
 
+    invalidate_portfolio_snapshots(db, [portfolio_id])
     db.commit()
     db.refresh(row)
     return prefs
@@ -52,17 +54,17 @@ def save_prefs(
 
 @router.get("/{portfolio_id}/prefs", response_model=RepresentationPreferences)
 async def get_representation_prefs(
-    portfolio_id: str, db: Session = Depends(get_db)
+    portfolio_id: str, db: AsyncSession = Depends(get_async_db)
 ) -> RepresentationPreferences:
     """Fetch representation preferences for a portfolio; returns defaults if not set."""
-    return get_prefs(db, portfolio_id)
+    return await db.run_sync(get_prefs, portfolio_id)
 
 
 @router.put("/{portfolio_id}/prefs", response_model=RepresentationPreferences)
 async def update_representation_prefs(
     portfolio_id: str,
     payload: RepresentationPreferences,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RepresentationPreferences:
     """Update representation preferences for a portfolio."""
-    return save_prefs(db, portfolio_id, payload)
+    return await db.run_sync(save_prefs, portfolio_id, payload)
@@ -14,7 +14,8 @@ from artifactminer.cli.views import (
     display_repo_details,
 )
 from artifactminer.cli.upload import upload_zip
-from artifactminer.db import SessionLocal, UploadedZip
+from artifactminer.helpers.profiling import RunProfiler
+from artifactminer.db import SessionLocal, UploadedZip, repo_scope_filter
 from artifactminer.db.models import ResumeItem, UserAIntelligenceSummary, RepoStat
 from artifactminer.tui.helpers import export_to_json, export_to_text
 from rich.progress import (
@@ -26,7 +27,13 @@ from rich.progress import (
 )
 from datetime import datetime, UTC
 
-from artifactminer.db import Consent, Question, UserAnswer
+from artifactminer.db import (
+    Consent,
+    Question,
+    UserAnswer,
+    invalidate_consent_snapshot,
+    invalidate_portfolio_snapshots,
+)
 
 
 def _repo_directory_values(selected_repos: list[Path], extraction_root: str | None) -> list[str]:
@@ -52,7 +59,9 @@ def setup_consent(db: Session, level: str) -> None:
         consent.consent_level = level
         if level in ("full", "no_llm"):
             consent.accepted_at = datetime.now(UTC)
+    invalidate_portfolio_snapshots(db)
     db.commit()
+    invalidate_consent_snapshot()
 
 
 def setup_user_email(db: Session, email: str) -> None:
@@ -70,6 +79,7 @@ def setup_user_email(db: Session, email: str) -> None:
         answered_at=datetime.now(UTC),
     )
     db.add(answer)
+    invalidate_portfolio_snapshots(db)
     db.commit()
 
 
@@ -115,8 +125,14 @@ async def run_analysis(
     user_email: str,
     selected_repos: list[Path] | None = None,
     zip_id: int | None = None,
+    profile_path: Path | None = None,
+    trace_path: Path | None = None,
 ) -> None:
-    """Run analysis pipeline with optional repo selection."""
+    """Run analysis pipeline with optional repo selection.
+
+    ``profile_path`` / ``trace_path`` write the run's stage timings as a JSON
+    report and as a Chrome trace (chrome://tracing, Perfetto) respectively.
+    """
     db: Session = SessionLocal()
     try:
         print(f"Setting consent level: {consent_level}")
@@ -147,6 +163,7 @@ async def run_analysis(
         else:
             print("Analyzing all discovered repositories...")
 
+        profiler = RunProfiler()
         progress, progress_callback = create_repo_progress(expected_total)
         with progress:
             analyze_result = await analyze_zip(
@@ -154,7 +171,12 @@ async def run_analysis(
                 request=request,
                 db=db,
                 progress_callback=progress_callback,
+                profiler=profiler,
             )
+        if profile_path:
+            print(f"Timing report written to: {profiler.write_json(profile_path)}")
+        if trace_path:
+            print(f"Chrome trace written to: {profiler.write_chrome_trace(trace_path)}")
 
         display_repo_details(analyze_result)
 
@@ -171,7 +193,7 @@ async def run_analysis(
             .join(RepoStat, ResumeItem.repo_stat_id == RepoStat.id)
             .filter(
                 RepoStat.deleted_at.is_(None),
-                or_(*[RepoStat.project_path.like(f"{prefix}%") for prefix in prefixes]),
+                repo_scope_filter(prefixes),
             )
         )
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import datetime as dt
 from pathlib import Path
 
 from sqlalchemy.orm import Session
@@ -50,19 +49,15 @@ def display_skills_chronology(db: Session, extraction_path: str) -> None:
     items = fetch_skill_chronology(
         db,
         project_path_prefixes=extraction_prefixes(extraction_path),
+        first_use_only=True,
     )
 
     if not items:
         print("  No skills data available.\n")
         return
 
-    items.sort(key=lambda item: item.date or dt.max)
-
-    seen: set[str] = set()
-    unique_items = [item for item in items if not (item.skill in seen or seen.add(item.skill))]
-
     by_category: dict[str, list] = defaultdict(list)
-    for item in unique_items:
+    for item in items:
         by_category[item.category or "Other"].append(item)
 
     for category, skills in by_category.items():
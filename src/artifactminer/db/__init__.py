@@ -1,6 +1,15 @@
 """Database module exposing models, session management, and utilities."""
 
-from .database import Base, engine, SessionLocal, get_db
+from .database import (
+    AsyncSessionLocal,
+    Base,
+    SessionLocal,
+    async_engine_for,
+    engine,
+    get_async_db,
+    get_db,
+    get_db_engine,
+)
 from .models import (
     Artifact,
     Question,
@@ -16,14 +25,30 @@ from .models import (
     UserAIntelligenceSummary,
     ProjectEvidence,
     RepresentationPrefs,
+    PortfolioSnapshot,
+    PortfolioSnapshotVersion,
+    LLMResponseCacheEntry,
+)
+from .consent_snapshot import (
+    ConsentSnapshot,
+    invalidate_consent_snapshot,
+    load_consent_snapshot,
 )
+from .llm_cache import llm_cache_stats
+from .portfolio_snapshots import invalidate_portfolio_snapshots
+from .scoping import normalize_extraction_root, repo_scope_filter
 from .seed import seed_questions, seed_repo_stats
+from .user_stats import latest_user_repo_stats, latest_user_repo_stats_query
 
 __all__ = [
     "Base",
     "engine",
     "SessionLocal",
     "get_db",
+    "get_db_engine",
+    "AsyncSessionLocal",
+    "async_engine_for",
+    "get_async_db",
     "Artifact",
     "Question",
     "Consent",
@@ -38,6 +63,18 @@ __all__ = [
     "UserAIntelligenceSummary",
     "ProjectEvidence",
     "RepresentationPrefs",
+    "PortfolioSnapshot",
+    "PortfolioSnapshotVersion",
+    "LLMResponseCacheEntry",
+    "ConsentSnapshot",
+    "invalidate_consent_snapshot",
+    "load_consent_snapshot",
+    "invalidate_portfolio_snapshots",
+    "llm_cache_stats",
+    "normalize_extraction_root",
+    "repo_scope_filter",
     "seed_questions",
     "seed_repo_stats",
+    "latest_user_repo_stats",
+    "latest_user_repo_stats_query",
 ]
@@ -0,0 +1,103 @@
+"""Read-once view of the consent row, cached in process until consent changes."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from dataclasses import dataclass
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .database import SessionLocal, engine as default_engine
+from .models import Consent
+
+# Consent levels under which prompts may be sent to an LLM
+LLM_CONSENT_LEVELS = ("local-llm", "cloud")
+DEFAULT_LLM_MODEL = "chatGPT"
+
+
+@dataclass(frozen=True)
+class ConsentSnapshot:
+    """Consent level and LLM selection as of one read of the ``consents`` table.
+
+    Load it once per request or job with ``load_consent_snapshot`` and pass it
+    down, instead of re-querying consent for every repo, file, or prompt.
+    """
+
+    consent_level: str = "none"
+    llm_model: str = DEFAULT_LLM_MODEL
+
+    @property
+    def allows_llm(self) -> bool:
+        return self.consent_level.lower() in LLM_CONSENT_LEVELS
+
+    @classmethod
+    def from_row(cls, consent: Consent | None) -> "ConsentSnapshot":
+        if consent is None:
+            return cls()
+        return cls(
+            consent_level=consent.consent_level or "none",
+            llm_model=consent.LLM_model or DEFAULT_LLM_MODEL,
+        )
+
+
+_SNAPSHOTS: "weakref.WeakKeyDictionary[Engine, ConsentSnapshot]" = weakref.WeakKeyDictionary()
+_SNAPSHOTS_LOCK = threading.Lock()
+# Bumped on every invalidation, so a read that raced with a write is not cached
+_generation = 0
+
+
+def _read_snapshot(db: Session) -> ConsentSnapshot:
+    consent = db.get(Consent, 1)
+    if consent is None:  # fall back to the latest row if several exist
+        consent = db.query(Consent).order_by(Consent.id.desc()).first()
+    return ConsentSnapshot.from_row(consent)
+
+
+def load_consent_snapshot(db: Session | None = None) -> ConsentSnapshot:
+    """The cached snapshot for ``db``'s database, read from it on a miss.
+
+    Without ``db`` the app database is used, and a session is only opened
+    (and closed) on a cache miss.
+    """
+    bind = db.get_bind() if db is not None else default_engine
+    with _SNAPSHOTS_LOCK:
+        snapshot = _SNAPSHOTS.get(bind)
+        generation = _generation
+    if snapshot is not None:
+        return snapshot
+
+    if db is not None:
+        snapshot = _read_snapshot(db)
+    else:
+        session = SessionLocal()
+        try:
+            snapshot = _read_snapshot(session)
+        finally:
+            session.close()
+    with _SNAPSHOTS_LOCK:
+        if generation == _generation:
+            _SNAPSHOTS[bind] = snapshot
+    return snapshot
+
+
+def invalidate_consent_snapshot() -> None:
+    """Drop every cached snapshot. Writers of ``consents`` call this after committing.
+
+    Clears all databases rather than one: an async session's ``run_sync`` reads
+    through a twin engine of the same database, which is cached under its own key.
+    """
+    global _generation
+    with _SNAPSHOTS_LOCK:
+        _generation += 1
+        _SNAPSHOTS.clear()
+
+
+__all__ = [
+    "ConsentSnapshot",
+    "DEFAULT_LLM_MODEL",
+    "LLM_CONSENT_LEVELS",
+    "invalidate_consent_snapshot",
+    "load_consent_snapshot",
+]
@@ -1,20 +1,225 @@
-from sqlalchemy import create_engine
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from fastapi import Depends
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./artifactminer.db"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """Connect-time pragmas and pool sizing for a SQLite engine.
+
+    WAL lets readers (``/portfolio``, ``/projects``) proceed while a writer
+    (``saveRepoStats``, ``persist_extracted_skills``) holds the lock, and
+    ``busy_timeout`` makes a second writer wait instead of failing with
+    ``database is locked``. ``synchronous=NORMAL`` is durable across app
+    crashes under WAL; only an OS crash can lose the last commits.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5_000
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size_kib: int = 64 * 1024
+    temp_store: str = "MEMORY"
+    pool_size: int = 8
+    max_overflow: int = 8
+    pool_timeout: float = 30.0
+
+    def pragmas(self, *, in_memory: bool = False) -> list[tuple[str, str | int]]:
+        pragmas: list[tuple[str, str | int]] = [
+            ("busy_timeout", self.busy_timeout_ms),
+            ("synchronous", self.synchronous),
+            ("cache_size", -self.cache_size_kib),  # negative = KiB, not pages
+            ("temp_store", self.temp_store),
+        ]
+        if not in_memory:
+            # Neither applies to a private in-memory database
+            pragmas[:0] = [("journal_mode", self.journal_mode), ("mmap_size", self.mmap_size)]
+        return pragmas
+
+
+# Named profiles, selected with ARTIFACTMINER_SQLITE_PROFILE
+SQLITE_PROFILES: dict[str, SQLiteProfile | None] = {
+    "default": SQLiteProfile(),
+    # WAL, but fsync on every commit
+    "durable": SQLiteProfile(synchronous="FULL"),
+    # Plain rollback-journal engine with driver defaults (the pre-profile behaviour)
+    "legacy": None,
+}
+
+
+def sqlite_profile(name: str) -> SQLiteProfile | None:
+    """The profile registered as ``name`` in ``SQLITE_PROFILES``."""
+    if name not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLite profile {name!r}; expected one of {tuple(SQLITE_PROFILES)}"
+        )
+    return SQLITE_PROFILES[name]
+
+
+def _is_memory_url(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def create_sqlite_engine(
+    url: str = SQLALCHEMY_DATABASE_URL,
+    profile: SQLiteProfile | None = SQLITE_PROFILES["default"],
+    **kwargs,
+) -> Engine:
+    """Create a SQLite engine with ``profile``'s pragmas applied to every new connection.
+
+    ``profile=None`` returns a plain engine. Extra keyword arguments go to
+    ``create_engine`` and win over the profile's pool settings.
+    """
+    connect_args = {"check_same_thread": False, **kwargs.pop("connect_args", {})}
+    if profile is None:
+        return create_engine(url, connect_args=connect_args, **kwargs)
+
+    in_memory = _is_memory_url(url)
+    # The driver's own lock wait, in seconds, matches busy_timeout
+    connect_args.setdefault("timeout", profile.busy_timeout_ms / 1000)
+    if not in_memory:
+        kwargs.setdefault("pool_size", profile.pool_size)
+        kwargs.setdefault("max_overflow", profile.max_overflow)
+        kwargs.setdefault("pool_timeout", profile.pool_timeout)
+    engine = create_engine(url, connect_args=connect_args, **kwargs)
+    _install_pragmas(engine, profile.pragmas(in_memory=in_memory))
+    _ENGINE_PROFILES[engine] = profile
+    return engine
+
+
+def _install_pragmas(engine: Engine, pragmas: list[tuple[str, str | int]]) -> None:
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):  # noqa: ARG001
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+# Profile each engine from create_sqlite_engine was built with, reused by its async twin
+_ENGINE_PROFILES: "weakref.WeakKeyDictionary[Engine, SQLiteProfile]" = weakref.WeakKeyDictionary()
+
+
+engine = create_sqlite_engine(
+    SQLALCHEMY_DATABASE_URL,
+    sqlite_profile(os.getenv("ARTIFACTMINER_SQLITE_PROFILE", "default")),
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
-def get_db():
+def get_db_engine() -> Engine:
+    """The app database's engine, as a dependency.
+
+    ``get_db`` and ``get_async_db`` both bind to it, so overriding this one
+    dependency points every session an app (or test) opens at another database.
+    """
+    return engine
+
+
+def get_db(bind: Engine = Depends(get_db_engine)):
     """Database session dependency."""
-    db = SessionLocal()
+    db = SessionLocal(bind=bind)
     try:
         yield db
     finally:
         db.close()
+
+
+class _BorrowedConnection:
+    """A sync engine's sqlite3 connection lent to aiosqlite; closing it is a no-op.
+
+    A private in-memory database exists only on its one connection, so the
+    async engine runs on that connection and leaves closing it to its owner.
+    """
+
+    def __init__(self, connection) -> None:
+        object.__setattr__(self, "_connection", connection)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name, value) -> None:
+        setattr(self._connection, name, value)
+
+    def close(self) -> None:
+        pass
+
+
+_ASYNC_ENGINES: "weakref.WeakKeyDictionary[Engine, AsyncEngine]" = weakref.WeakKeyDictionary()
+_ASYNC_ENGINES_LOCK = threading.Lock()
+
+
+def _create_async_twin(sync_engine: Engine) -> AsyncEngine:
+    url = sync_engine.url
+    if url.get_backend_name() != "sqlite":
+        raise ValueError(f"No async driver configured for {url.get_backend_name()!r}")
+    import aiosqlite  # only needed once something asks for an async session
+
+    # NullPool: aiosqlite runs each connection on a non-daemon thread, so a pooled
+    # connection left open at shutdown would keep the process alive. Opening a
+    # SQLite connection per session is cheap by comparison.
+    if url.database in (None, "", ":memory:") or url.query.get("mode") == "memory":
+        raw = sync_engine.raw_connection()
+        shared = raw.driver_connection
+        raw.close()
+
+        async def connect():
+            return await aiosqlite.Connection(lambda: _BorrowedConnection(shared), 64)
+
+        return create_async_engine("sqlite+aiosqlite://", async_creator=connect, poolclass=NullPool)
+
+    profile = _ENGINE_PROFILES.get(sync_engine)
+    connect_args = {"timeout": profile.busy_timeout_ms / 1000} if profile else {}
+    async_engine = create_async_engine(
+        url.set(drivername="sqlite+aiosqlite"), connect_args=connect_args, poolclass=NullPool
+    )
+    if profile is not None:
+        _install_pragmas(async_engine.sync_engine, profile.pragmas())
+    return async_engine
+
+
+def async_engine_for(sync_engine: Engine) -> AsyncEngine:
+    """The aiosqlite engine over the same database as ``sync_engine`` (created once).
+
+    File databases get a second engine on the same file with the same profile.
+    In-memory databases are expected to sit on a ``StaticPool`` (as in tests);
+    the async engine then shares that single connection.
+    """
+    with _ASYNC_ENGINES_LOCK:
+        async_engine = _ASYNC_ENGINES.get(sync_engine)
+        if async_engine is None:
+            async_engine = _ASYNC_ENGINES[sync_engine] = _create_async_twin(sync_engine)
+        return async_engine
+
+
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+async def get_async_db(
+    sync_engine: Engine = Depends(get_db_engine),
+) -> AsyncIterator[AsyncSession]:
+    """Async session dependency, on the database ``get_db_engine`` resolves to.
+
+    Only the async twin of that engine is used; no sync session is opened.
+    Awaiting queries frees the event loop for other requests while SQLite
+    works on the aiosqlite thread.
+    """
+    async with AsyncSessionLocal(bind=async_engine_for(sync_engine)) as session:
+        yield session
@@ -0,0 +1,217 @@
+"""Persistent, content-addressed cache of LLM responses.
+
+The same commits are summarized again on every portfolio regeneration and an
+unchanged résumé is re-analyzed on every upload. A prompt sent to the same
+provider and model with the same options is answered from this table instead,
+which costs a SQLite read rather than an LLM round trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import weakref
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import Any, Mapping
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .models import LLMResponseCacheEntry
+
+
+@dataclass(frozen=True)
+class LLMCachePolicy:
+    """Expiry and size bound for the response cache.
+
+    Entries older than ``ttl`` are misses (a later store overwrites them);
+    once a store takes the table past ``max_entries`` rows, expired entries
+    and then the least recently used are deleted.
+    """
+
+    enabled: bool = True
+    ttl: timedelta = timedelta(days=30)
+    max_entries: int = 5_000
+
+
+# ARTIFACTMINER_LLM_CACHE=off sends every prompt to the provider
+DEFAULT_LLM_CACHE_POLICY = LLMCachePolicy(
+    enabled=os.getenv("ARTIFACTMINER_LLM_CACHE", "on").lower() != "off"
+)
+
+
+@dataclass(frozen=True)
+class LLMCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_STATS_LOCK = threading.Lock()
+_stats = LLMCacheStats()
+
+
+def _count(**deltas: int) -> None:
+    global _stats
+    with _STATS_LOCK:
+        _stats = replace(_stats, **{name: getattr(_stats, name) + n for name, n in deltas.items()})
+
+
+def llm_cache_stats() -> LLMCacheStats:
+    """Process-wide counters since start (or the last reset)."""
+    with _STATS_LOCK:
+        return _stats
+
+
+def reset_llm_cache_stats() -> None:
+    global _stats
+    with _STATS_LOCK:
+        _stats = LLMCacheStats()
+
+
+# Rows per cache database as last counted plus inserts since, so a store only
+# counts (and evicts) once the table may have passed max_entries. Other
+# processes' inserts aren't seen, which only delays an eviction.
+_ROW_COUNTS_LOCK = threading.Lock()
+_row_counts: "weakref.WeakKeyDictionary[Engine, int]" = weakref.WeakKeyDictionary()
+
+
+def _set_row_count(db: Session, rows: int) -> None:
+    with _ROW_COUNTS_LOCK:
+        _row_counts[db.get_bind()] = rows
+
+
+def _row_count_after_insert(db: Session) -> int:
+    with _ROW_COUNTS_LOCK:
+        rows = _row_counts.get(db.get_bind())
+    if rows is None:
+        rows = db.scalar(select(func.count()).select_from(LLMResponseCacheEntry))
+    else:
+        rows += 1
+    _set_row_count(db, rows)
+    return rows
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def llm_cache_key(
+    provider: str, model: str, options: Mapping[str, Any] | None, prompt: str
+) -> str:
+    """Address of one request: any change to the provider, model, options or prompt misses."""
+    prompt_digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    material = json.dumps(
+        [provider, model, dict(options or {}), prompt_digest],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def lookup_llm_response(
+    db: Session, key: str, *, policy: LLMCachePolicy = DEFAULT_LLM_CACHE_POLICY
+) -> str | None:
+    """The cached response for ``key``, or ``None`` when absent or expired."""
+    entry = db.get(LLMResponseCacheEntry, key)
+    now = _now()
+    if entry is None or entry.created_at < now - policy.ttl:
+        _count(misses=1)
+        return None
+    entry.last_used_at = now
+    entry.hit_count += 1
+    db.commit()
+    _count(hits=1)
+    return entry.response_text
+
+
+def evict_llm_responses(
+    db: Session, *, policy: LLMCachePolicy = DEFAULT_LLM_CACHE_POLICY
+) -> int:
+    """Delete expired entries, then the least recently used beyond ``max_entries``."""
+    result = db.execute(
+        delete(LLMResponseCacheEntry).where(LLMResponseCacheEntry.created_at < _now() - policy.ttl)
+    )
+    evicted = result.rowcount or 0
+    rows = db.scalar(select(func.count()).select_from(LLMResponseCacheEntry))
+    overflow = rows - policy.max_entries
+    if overflow > 0:
+        oldest = (
+            select(LLMResponseCacheEntry.key)
+            .order_by(LLMResponseCacheEntry.last_used_at, LLMResponseCacheEntry.key)
+            .limit(overflow)
+        )
+        result = db.execute(
+            delete(LLMResponseCacheEntry).where(LLMResponseCacheEntry.key.in_(oldest))
+        )
+        evicted += result.rowcount or 0
+        rows -= result.rowcount or 0
+    _set_row_count(db, rows)
+    if evicted:
+        _count(evictions=evicted)
+    return evicted
+
+
+def store_llm_response(
+    db: Session,
+    key: str,
+    response_text: str,
+    *,
+    provider: str,
+    model: str,
+    policy: LLMCachePolicy = DEFAULT_LLM_CACHE_POLICY,
+) -> None:
+    """Insert or refresh the entry for ``key`` and keep the table within ``policy``.
+
+    Only an insert that takes the table past ``max_entries`` runs an eviction.
+    """
+    now = _now()
+    existing = select(LLMResponseCacheEntry.key).where(LLMResponseCacheEntry.key == key)
+    is_new = db.scalar(existing) is None
+    stmt = insert(LLMResponseCacheEntry).values(
+        key=key,
+        provider=provider,
+        model=model,
+        response_text=response_text,
+        created_at=now,
+        last_used_at=now,
+        hit_count=0,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                name: stmt.excluded[name]
+                for name in ("response_text", "created_at", "last_used_at", "hit_count")
+            },
+        )
+    )
+    if is_new and _row_count_after_insert(db) > policy.max_entries:
+        evict_llm_responses(db, policy=policy)
+    db.commit()
+    _count(stores=1)
+
+
+__all__ = [
+    "DEFAULT_LLM_CACHE_POLICY",
+    "LLMCachePolicy",
+    "LLMCacheStats",
+    "evict_llm_responses",
+    "llm_cache_key",
+    "llm_cache_stats",
+    "lookup_llm_response",
+    "reset_llm_cache_stats",
+    "store_llm_response",
+]
@@ -0,0 +1,66 @@
+"""Startup schema check: run Alembic only when the database is behind.
+
+Reading ``alembic_version`` is one query; importing Alembic and loading every
+revision script to discover there is nothing to do costs a few hundred
+milliseconds on each process start. ``SCHEMA_HEAD`` must name the newest
+revision in ``alembic/versions`` (a test keeps the two in step).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from .database import engine as default_engine
+
+SCHEMA_HEAD = "d9b3e5f7a1c4"
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+
+# "check": upgrade only if the stored revision differs from SCHEMA_HEAD
+# "upgrade": always run ``alembic upgrade head`` (the pre-check behaviour)
+# "off": never migrate (the schema is managed elsewhere)
+MIGRATION_MODES = ("check", "upgrade", "off")
+DEFAULT_MIGRATION_MODE = os.getenv("ARTIFACTMINER_MIGRATIONS", "check")
+
+
+def current_revisions(bind: Engine = default_engine) -> set[str]:
+    """Revisions stamped in ``alembic_version``; empty for an unmigrated database."""
+    try:
+        with bind.connect() as conn:
+            return set(conn.execute(text("SELECT version_num FROM alembic_version")).scalars())
+    except OperationalError:  # no alembic_version table yet
+        return set()
+
+
+def upgrade_to_head() -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(str(ALEMBIC_INI)), "head")
+
+
+def ensure_schema(mode: str = DEFAULT_MIGRATION_MODE, bind: Engine = default_engine) -> bool:
+    """Bring the app database to ``SCHEMA_HEAD`` as ``mode`` allows; True if Alembic ran."""
+    if mode not in MIGRATION_MODES:
+        raise ValueError(f"Unknown migration mode {mode!r}; expected one of {MIGRATION_MODES}")
+    if mode == "off":
+        return False
+    if mode == "check" and current_revisions(bind) == {SCHEMA_HEAD}:
+        return False
+    upgrade_to_head()
+    return True
+
+
+__all__ = [
+    "DEFAULT_MIGRATION_MODE",
+    "MIGRATION_MODES",
+    "SCHEMA_HEAD",
+    "current_revisions",
+    "ensure_schema",
+    "upgrade_to_head",
+]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, Date, Boolean, JSON, ForeignKey, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, Float, String, DateTime, Date, Boolean, JSON, ForeignKey, Index, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime, UTC
 
@@ -50,6 +50,13 @@ class Consent(Base):
 
 class RepoStat(Base):#model for storing repository statistics
     __tablename__ = "repo_stats"
+    __table_args__ = (
+        # Portfolio / extraction scoping as indexed equality instead of LIKE scans
+        Index("ix_repo_stats_portfolio_id_deleted_at", "portfolio_id", "deleted_at"),
+        Index("ix_repo_stats_extraction_root_deleted_at", "extraction_root", "deleted_at"),
+        Index("ix_repo_stats_project_path_deleted_at", "project_path", "deleted_at"),
+        Index("ix_repo_stats_project_name_id", "project_name", "id"),  # latest row per name
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     project_name = Column(String, nullable=False)
@@ -71,6 +78,8 @@ class RepoStat(Base):#model for storing repository statistics
     deleted_at = Column(DateTime, nullable=True)
     health_score = Column(Float, nullable=True)  # Repository health indicator (0-100)
     thumbnail_url = Column(String, nullable=True)  # Project thumbnail (uploaded local URL path or external URL)
+    extraction_root = Column(String, nullable=True)  # UploadedZip.extraction_path the repo was analyzed from
+    portfolio_id = Column(String, nullable=True)  # UploadedZip.portfolio_id at analysis time
 
     # Relationships
     project_skills = relationship("ProjectSkill", back_populates="repo_stat", cascade="all, delete-orphan")
@@ -82,6 +91,11 @@ class RepoStat(Base):#model for storing repository statistics
 
 class UserRepoStat(Base):#model for storing user-specific repository statistics by project_name: str first_commit,last_commit,total_commits,userStatspercentages, and commitFrequency
     __tablename__ = "user_repo_stats"
+    __table_args__ = (
+        # Latest stats per project: equality on name/path, newest id first
+        Index("ix_user_repo_stats_project_name_path_id", "project_name", "project_path", "id"),
+        Index("ix_user_repo_stats_project_path_id", "project_path", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     project_name = Column(String, nullable=False)
@@ -103,6 +117,9 @@ class UserRepoStat(Base):#model for storing user-specific repository statistics
 
 class UserAIntelligenceSummary(Base):
     __tablename__ = "user_intelligence_summaries"
+    __table_args__ = (
+        Index("ix_user_intelligence_summaries_user_email_repo_path", "user_email", "repo_path"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     repo_path = Column(String, nullable=False)
@@ -230,6 +247,7 @@ class UserProjectSkill(Base):
 
 class ResumeItem(Base):
     __tablename__ = "resume_items"
+    __table_args__ = (Index("ix_resume_items_repo_stat_id", "repo_stat_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -261,6 +279,7 @@ class Export(Base):
 
 class ProjectEvidence(Base):
     __tablename__ = "project_evidence"
+    __table_args__ = (Index("ix_project_evidence_repo_stat_id_date", "repo_stat_id", "date"),)
 
     id = Column(Integer, primary_key=True, index=True)
     repo_stat_id = Column(Integer, ForeignKey("repo_stats.id", ondelete="CASCADE"), nullable=False)
@@ -288,3 +307,59 @@ class RepresentationPrefs(Base):
         default=lambda: datetime.now(UTC).replace(tzinfo=None),
         onupdate=lambda: datetime.now(UTC).replace(tzinfo=None),
     )
+
+
+class PortfolioSnapshot(Base):
+    """Serialized portfolio response, materialized per portfolio and preferences.
+
+    Rows are deleted (see ``invalidate_portfolio_snapshots``) whenever data
+    shown in the portfolio changes, and rebuilt on the next read.
+    """
+
+    __tablename__ = "portfolio_snapshots"
+
+    portfolio_id = Column(String, primary_key=True)
+    prefs_hash = Column(String(64), primary_key=True)
+    etag = Column(String(64), nullable=False)
+    payload_json = Column(Text, nullable=False)
+    built_at = Column(
+        DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None)
+    )
+
+
+class PortfolioSnapshotVersion(Base):
+    """Single-row invalidation counter for ``portfolio_snapshots``.
+
+    Bumped in the transaction of every invalidation, so any process building a
+    snapshot can tell whether a write landed since it started.
+    """
+
+    __tablename__ = "portfolio_snapshot_version"
+
+    id = Column(Integer, primary_key=True)
+    generation = Column(Integer, nullable=False, default=0)
+
+
+class LLMResponseCacheEntry(Base):
+    """LLM completion cached by provider, model, options and prompt (see ``db.llm_cache``).
+
+    Rows older than the cache TTL are treated as misses, and the least
+    recently used rows are evicted once the table exceeds its size bound.
+    """
+
+    __tablename__ = "llm_response_cache"
+    __table_args__ = (
+        Index("ix_llm_response_cache_last_used_at", "last_used_at"),  # LRU eviction
+    )
+
+    key = Column(String(64), primary_key=True)
+    provider = Column(String, nullable=False)
+    model = Column(String, nullable=False)
+    response_text = Column(Text, nullable=False)
+    created_at = Column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC).replace(tzinfo=None)
+    )
+    last_used_at = Column(
+        DateTime, nullable=False, default=lambda: datetime.now(UTC).replace(tzinfo=None)
+    )
+    hit_count = Column(Integer, nullable=False, default=0)
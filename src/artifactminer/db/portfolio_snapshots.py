@@ -0,0 +1,119 @@
+"""Materialized portfolio responses: lookup, store, and invalidation on writes."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import UTC, datetime
+from typing import Iterable
+
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from .models import PortfolioSnapshot, PortfolioSnapshotVersion
+
+# The one PortfolioSnapshotVersion row; created by the first invalidation
+_VERSION_ROW_ID = 1
+
+
+def prefs_hash(prefs_json: str) -> str:
+    """Key component for one set of representation preferences."""
+    return hashlib.sha256(prefs_json.encode("utf-8")).hexdigest()
+
+
+def _current_generation():
+    return func.coalesce(
+        select(PortfolioSnapshotVersion.generation)
+        .where(PortfolioSnapshotVersion.id == _VERSION_ROW_ID)
+        .scalar_subquery(),
+        0,
+    )
+
+
+def snapshot_generation(db: Session) -> int:
+    """Committed invalidation count; pass it back to ``store_portfolio_snapshot``."""
+    return db.scalar(select(_current_generation()))
+
+
+def load_portfolio_snapshot(
+    db: Session, portfolio_id: str, prefs_digest: str
+) -> PortfolioSnapshot | None:
+    return db.get(PortfolioSnapshot, (portfolio_id, prefs_digest))
+
+
+def store_portfolio_snapshot(
+    db: Session,
+    portfolio_id: str,
+    prefs_digest: str,
+    payload_json: str,
+    *,
+    generation: int,
+) -> str:
+    """Persist a freshly built payload and return its ETag.
+
+    The row is skipped when an invalidation happened since ``generation`` was
+    taken, since the payload may predate that write; the ETag is still returned.
+    The check is part of the insert, so an invalidation committed by another
+    process (or still holding the write lock) is seen too.
+    """
+    etag = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()[:32]
+    values = {
+        "portfolio_id": portfolio_id,
+        "prefs_hash": prefs_digest,
+        "etag": etag,
+        "payload_json": payload_json,
+        "built_at": datetime.now(UTC).replace(tzinfo=None),
+    }
+    columns = PortfolioSnapshot.__table__.c
+    row = select(
+        *[literal(value, type_=columns[name].type) for name, value in values.items()]
+    ).where(_current_generation() == generation)
+    stmt = insert(PortfolioSnapshot).from_select(list(values), row)
+    # End the read transaction the payload was built in: SQLite can't turn a
+    # read snapshot older than the latest commit into a write
+    db.commit()
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["portfolio_id", "prefs_hash"],
+            set_={key: stmt.excluded[key] for key in ("etag", "payload_json", "built_at")},
+        )
+    )
+    db.commit()
+    return etag
+
+
+def invalidate_portfolio_snapshots(
+    db: Session, portfolio_ids: Iterable[str | None] | None = None
+) -> None:
+    """Delete snapshots of ``portfolio_ids`` (every portfolio if omitted) in ``db``'s transaction.
+
+    Call before committing any write to data a portfolio shows. ``None`` among
+    the ids stands for rows with no known portfolio (e.g. repos analyzed
+    before ``RepoStat.portfolio_id`` existed), which drops all snapshots.
+    The generation bump commits with the write, so builds that started
+    before it don't store their snapshot afterwards.
+    """
+    stmt = delete(PortfolioSnapshot)
+    if portfolio_ids is not None:
+        ids = set(portfolio_ids)
+        if None not in ids:
+            if not ids:
+                return
+            stmt = stmt.where(PortfolioSnapshot.portfolio_id.in_(sorted(ids)))
+    bump = insert(PortfolioSnapshotVersion).values(id=_VERSION_ROW_ID, generation=1)
+    db.execute(
+        bump.on_conflict_do_update(
+            index_elements=["id"],
+            set_={"generation": PortfolioSnapshotVersion.generation + 1},
+        )
+    )
+    db.execute(stmt)
+
+
+__all__ = [
+    "invalidate_portfolio_snapshots",
+    "load_portfolio_snapshot",
+    "prefs_hash",
+    "snapshot_generation",
+    "store_portfolio_snapshot",
+]
@@ -0,0 +1,35 @@
+"""Query filters that scope RepoStat rows to the extraction roots they came from."""
+
+from sqlalchemy import and_, false, or_
+
+from .models import RepoStat
+
+
+def normalize_extraction_root(path: str) -> str:
+    """The form stored in ``RepoStat.extraction_root`` (no trailing slash)."""
+    return str(path).rstrip("/")
+
+
+def repo_scope_filter(extraction_roots: list[str]):
+    """RepoStat rows analyzed under any of ``extraction_roots``.
+
+    Rows stamped with ``extraction_root`` match by indexed equality. Rows
+    analyzed before the column existed (and not backfilled) fall back to
+    ``project_path`` matching at a path boundary, which only scans the
+    ``extraction_root IS NULL`` slice.
+    """
+    roots = sorted(
+        {normalize_extraction_root(root) for root in extraction_roots if root and str(root).strip()}
+    )
+    # false() first: an empty roots list must match nothing
+    legacy_paths = or_(
+        false(),
+        *[
+            or_(RepoStat.project_path == root, RepoStat.project_path.like(f"{root}/%"))
+            for root in roots
+        ]
+    )
+    return or_(
+        RepoStat.extraction_root.in_(roots),
+        and_(RepoStat.extraction_root.is_(None), legacy_paths),
+    )
@@ -0,0 +1,52 @@
+"""Latest ``UserRepoStat`` per project, resolved for many projects in one query."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session, aliased
+
+from .models import UserRepoStat
+
+
+def latest_user_repo_stats_query(project_paths: Iterable[str]) -> Select:
+    """Newest ``UserRepoStat`` row of each project under ``project_paths``.
+
+    Every analysis run appends a row, so a project can have many; this ranks
+    them with ``ROW_NUMBER() OVER (PARTITION BY project_path, project_name
+    ORDER BY id DESC)`` and keeps rank 1, which reads the
+    ``(project_path, id)`` index instead of one query per project. Rows come
+    back in id order.
+    """
+    ranked = (
+        select(
+            UserRepoStat,
+            func.row_number()
+            .over(
+                partition_by=(UserRepoStat.project_path, UserRepoStat.project_name),
+                order_by=UserRepoStat.id.desc(),
+            )
+            .label("rank"),
+        )
+        .where(UserRepoStat.project_path.in_(sorted(set(project_paths))))
+        .subquery()
+    )
+    latest = aliased(UserRepoStat, ranked)
+    return select(latest).where(ranked.c.rank == 1).order_by(latest.id)
+
+
+def latest_user_repo_stats(
+    db: Session, project_paths: Iterable[str]
+) -> dict[tuple[str, str], UserRepoStat]:
+    """Newest ``UserRepoStat`` keyed by ``(project_name, project_path)``."""
+    project_paths = set(project_paths)
+    if not project_paths:
+        return {}
+    return {
+        (stat.project_name, stat.project_path): stat
+        for stat in db.scalars(latest_user_repo_stats_query(project_paths))
+    }
+
+
+__all__ = ["latest_user_repo_stats", "latest_user_repo_stats_query"]
@@ -3,11 +3,13 @@
 from artifactminer.evidence.models import EvidenceItem
 from artifactminer.evidence.orchestrator import (
     MAX_AUTOGENERATED_EVIDENCE_PER_RUN,
+    EvidenceBatchWriter,
     persist_generated_evidence,
     persist_insights_as_project_evidence,
 )
 
 __all__ = [
+    "EvidenceBatchWriter",
     "EvidenceItem",
     "MAX_AUTOGENERATED_EVIDENCE_PER_RUN",
     "persist_generated_evidence",
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Iterable
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from artifactminer.db.models import ProjectEvidence, RepoStat
@@ -24,6 +25,97 @@ def _evidence_key(item_type: str, content: str) -> tuple[str, str]:
     return (_normalize_token(item_type), _normalize_token(content))
 
 
+class EvidenceBatchWriter:
+    """Collect evidence from every bridge for one repo and write it in one go.
+
+    Each ``add`` call is one source (insights, git stats, infra, quality) and
+    keeps its own ``max_items`` cap, exactly as separate
+    ``persist_generated_evidence`` calls would. ``flush`` validates the
+    repo once, loads the existing evidence keys with a single query, dedupes
+    every source against them and against each other, and inserts all new
+    rows with one multi-row insert.
+    """
+
+    def __init__(self, db: Session, repo_stat_id: int) -> None:
+        if not isinstance(db, Session):
+            raise ValueError("db must be a SQLAlchemy Session")
+        self.db = db
+        self.repo_stat_id = repo_stat_id
+        self._sources: list[tuple[list[EvidenceItem], int]] = []
+
+    def add(
+        self,
+        evidence_items: Iterable[EvidenceItem],
+        *,
+        max_items: int = MAX_AUTOGENERATED_EVIDENCE_PER_RUN,
+    ) -> None:
+        """Queue one source's items; at most ``max_items`` new rows are kept from it."""
+        if max_items < 0:
+            raise ValueError("max_items must be >= 0")
+        self._sources.append((list(evidence_items) if max_items else [], max_items))
+
+    def flush(self, *, commit: bool = True) -> list[ProjectEvidence]:
+        """Dedupe all queued sources and insert the new rows; returns them in order."""
+        sources, self._sources = self._sources, []
+        if self.db.get(RepoStat, self.repo_stat_id) is None:
+            raise ValueError(f"RepoStat {self.repo_stat_id} does not exist")
+
+        new_rows: list[dict] = []
+        if any(items for items, _ in sources):
+            existing_rows = (
+                self.db.query(ProjectEvidence.type, ProjectEvidence.content)
+                .filter(ProjectEvidence.repo_stat_id == self.repo_stat_id)
+                .all()
+            )
+            seen_keys = {_evidence_key(item_type, content) for item_type, content in existing_rows}
+            for items, max_items in sources:
+                new_rows.extend(self._select_new(items, max_items, seen_keys))
+
+        created: list[ProjectEvidence] = []
+        if new_rows:
+            # One batched INSERT ... RETURNING for every source. RETURNING order isn't
+            # guaranteed for batched rows, so put them back in queue order by key.
+            inserted = self.db.scalars(insert(ProjectEvidence).returning(ProjectEvidence), new_rows)
+            by_key = {_evidence_key(row.type, row.content): row for row in inserted}
+            created = [by_key[_evidence_key(row["type"], row["content"])] for row in new_rows]
+        if commit:
+            self.db.commit()
+        return created
+
+    def _select_new(
+        self,
+        evidence_items: list[EvidenceItem],
+        max_items: int,
+        seen_keys: set[tuple[str, str]],
+    ) -> list[dict]:
+        rows: list[dict] = []
+        for item in evidence_items:
+            if len(rows) >= max_items:
+                break
+
+            item_type = (item.type or "").strip()
+            content = (item.content or "").strip()
+            if not item_type or not content:
+                continue
+
+            dedupe_key = _evidence_key(item_type, content)
+            if dedupe_key in seen_keys:
+                continue
+            seen_keys.add(dedupe_key)
+
+            source = (item.source or "").strip() or None
+            rows.append(
+                {
+                    "repo_stat_id": self.repo_stat_id,
+                    "type": item_type,
+                    "content": content,
+                    "source": source,
+                    "date": item.date,
+                }
+            )
+        return rows
+
+
 def persist_generated_evidence(
     db: Session,
     repo_stat_id: int,
@@ -33,53 +125,13 @@ def persist_generated_evidence(
     commit: bool = True,
 ) -> list[ProjectEvidence]:
     """Persist generated evidence with dedupe and per-run insert cap."""
-    if not isinstance(db, Session):
-        raise ValueError("db must be a SQLAlchemy Session")
+    writer = EvidenceBatchWriter(db, repo_stat_id)
     if max_items < 0:
         raise ValueError("max_items must be >= 0")
     if max_items == 0:
         return []
-
-    if not db.query(RepoStat).filter(RepoStat.id == repo_stat_id).first():
-        raise ValueError(f"RepoStat {repo_stat_id} does not exist")
-
-    existing_rows = (
-        db.query(ProjectEvidence.type, ProjectEvidence.content)
-        .filter(ProjectEvidence.repo_stat_id == repo_stat_id)
-        .all()
-    )
-    seen_keys = {_evidence_key(item_type, content) for item_type, content in existing_rows}
-
-    created: list[ProjectEvidence] = []
-    for item in evidence_items:
-        if len(created) >= max_items:
-            break
-
-        item_type = (item.type or "").strip()
-        content = (item.content or "").strip()
-        if not item_type or not content:
-            continue
-
-        dedupe_key = _evidence_key(item_type, content)
-        if dedupe_key in seen_keys:
-            continue
-        seen_keys.add(dedupe_key)
-
-        source = (item.source or "").strip() or None
-        row = ProjectEvidence(
-            repo_stat_id=repo_stat_id,
-            type=item_type,
-            content=content,
-            source=source,
-            date=item.date,
-        )
-        db.add(row)
-        created.append(row)
-
-    if commit:
-        db.commit()
-
-    return created
+    writer.add(evidence_items, max_items=max_items)
+    return writer.flush(commit=commit)
 
 
 def persist_insights_as_project_evidence(
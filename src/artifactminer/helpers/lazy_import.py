@@ -0,0 +1,43 @@
+"""Deferred imports for heavy dependencies that only some code paths need."""
+
+from __future__ import annotations
+
+import importlib
+import types
+
+
+class _LazyModule(types.ModuleType):
+    """Stand-in for a module that imports it on first attribute access.
+
+    Attribute reads, writes and deletes go to the real module, so
+    ``mock.patch("pkg.mod.git.Repo")`` patches ``git.Repo`` itself. The real
+    import goes through ``importlib`` and is guarded by the import lock, so
+    first use from several threads is safe.
+    """
+
+    def _load(self) -> types.ModuleType:
+        return importlib.import_module(self.__name__)
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value) -> None:
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_module(name: str) -> types.ModuleType:
+    """``name`` as a module object that is only imported when first used.
+
+    Use it for dependencies like GitPython whose import cost every process
+    would otherwise pay at startup, even when it never touches a repository.
+    """
+    return _LazyModule(name)
+
+
+__all__ = ["lazy_module"]
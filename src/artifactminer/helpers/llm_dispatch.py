@@ -0,0 +1,258 @@
+"""Bounded, rate-limited dispatch of LLM requests.
+
+Summaries fan out: ``createAIsummaryFromUserAdditions`` gathers one prompt per
+commit block, and ``generate_summaries_for_ranked`` gathers across repos on top
+of that. Every LLM call goes through ``dispatch_llm_request`` so those bursts
+queue behind a per-provider concurrency limit and token bucket instead of
+reaching OpenAI as a wall of 429s or oversubscribing the single local Ollama
+model. Retryable failures (rate limits, timeouts, 5xx, dropped connections)
+are retried with exponential backoff and full jitter, and each request has a
+deadline that covers its queueing, attempts and backoff. A blocking client
+(Ollama) runs on an executor thread that a deadline can't stop, so its slot
+stays taken until the thread returns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Mapping, Optional, TypeVar
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+# openai's transient errors, matched by name so the openai package stays lazy
+RETRYABLE_ERROR_NAMES = frozenset(
+    {"APIConnectionError", "APITimeoutError", "InternalServerError", "RateLimitError"}
+)
+
+__all__ = [
+    "DEFAULT_PROVIDER_LIMITS",
+    "LLMDeadlineExceeded",
+    "LLMDispatcher",
+    "ProviderLimits",
+    "TokenBucket",
+    "backoff_delay",
+    "dispatch_llm_request",
+    "is_retryable",
+    "llm_dispatcher",
+]
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Concurrency, rate and retry settings for one provider. ``None`` disables a limit.
+
+    ``deadline`` is in seconds per request, including time spent waiting
+    for a slot or a token and the backoff between attempts.
+    """
+
+    max_concurrency: int = 4
+    requests_per_minute: Optional[float] = None
+    burst: int = 1  # token bucket capacity
+    max_retries: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    deadline: Optional[float] = 300.0
+
+
+DEFAULT_PROVIDER_LIMITS: Dict[str, ProviderLimits] = {
+    # Below gpt-5-nano's lowest-tier request limit, with room for the /openai endpoint
+    "openai": ProviderLimits(max_concurrency=8, requests_per_minute=400, burst=8),
+    # One local model answers one prompt at a time; more would only queue inside Ollama
+    "ollama": ProviderLimits(max_concurrency=1, deadline=600.0),
+}
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """A request did not complete (including retries) within its deadline."""
+
+    def __init__(self, provider: str, deadline: float) -> None:
+        self.provider = provider
+        self.deadline = deadline
+        super().__init__(f"{provider} request missed its {deadline:g}s deadline")
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether ``exc`` is transient: a timeout, lost connection, 429 or 5xx."""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    if any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(exc).__mro__):
+        return True
+    return getattr(exc, "status_code", None) in RETRYABLE_STATUS_CODES
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header on the error's HTTP response, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):  # missing, or an HTTP date
+        return None
+
+
+def backoff_delay(attempt: int, limits: ProviderLimits, retry_after: Optional[float] = None) -> float:
+    """Full-jitter exponential backoff before retry ``attempt`` (0-based).
+
+    A server-provided ``retry_after`` is a floor: retrying sooner would only
+    be rejected again.
+    """
+    delay = random.uniform(0, min(limits.backoff_max, limits.backoff_base * 2**attempt))
+    return max(delay, retry_after or 0.0)
+
+
+class TokenBucket:
+    """Async token bucket refilling ``rate`` tokens per second up to ``capacity``.
+
+    Waiters are served in arrival order, so a backlog drains at ``rate``
+    after the initial burst.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class _ProviderState:
+    def __init__(self, limits: ProviderLimits) -> None:
+        self.semaphore = asyncio.Semaphore(limits.max_concurrency)
+        self.bucket = (
+            TokenBucket(limits.requests_per_minute / 60.0, limits.burst)
+            if limits.requests_per_minute
+            else None
+        )
+
+
+def _release_slot(state: _ProviderState, abandoned: asyncio.Future) -> None:
+    """Free the slot of a thread whose caller stopped waiting, consuming its outcome."""
+    if not abandoned.cancelled():
+        abandoned.exception()  # no one awaits it; don't log it as never retrieved
+    state.semaphore.release()
+
+
+class LLMDispatcher:
+    """Applies ``ProviderLimits`` to every request for a provider.
+
+    Semaphores and buckets are kept per event loop (asyncio primitives can't
+    be shared across loops), so the limits hold within each loop: the API
+    server's, or one ``asyncio.run`` analysis job.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, ProviderLimits] | None = None,
+        default: ProviderLimits | None = None,
+    ) -> None:
+        self.limits = dict(DEFAULT_PROVIDER_LIMITS if limits is None else limits)
+        self.default = default or ProviderLimits()
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _ProviderState]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def limits_for(self, provider: str) -> ProviderLimits:
+        return self.limits.get(provider, self.default)
+
+    def _state(self, provider: str) -> _ProviderState:
+        states = self._states.setdefault(asyncio.get_running_loop(), {})
+        if provider not in states:
+            states[provider] = _ProviderState(self.limits_for(provider))
+        return states[provider]
+
+    async def run(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[T]],
+        *,
+        deadline: Optional[float] = None,
+    ) -> T:
+        """Await ``call()`` within the provider's limits and return its result.
+
+        ``call`` is invoked once per attempt and returns a coroutine, or for
+        a blocking client the future from ``loop.run_in_executor``.
+        ``deadline`` overrides the provider's; when it passes,
+        ``LLMDeadlineExceeded`` is raised. Non-retryable errors, and the
+        last retryable one, propagate.
+        """
+        limits = self.limits_for(provider)
+        deadline = limits.deadline if deadline is None else deadline
+        if deadline is None:
+            return await self._attempts(provider, limits, call, None)
+        scope = asyncio.timeout(deadline)
+        try:
+            async with scope:
+                return await self._attempts(provider, limits, call, time.monotonic() + deadline)
+        except TimeoutError as exc:
+            if not scope.expired():
+                raise
+            raise LLMDeadlineExceeded(provider, deadline) from exc
+
+    async def _attempts(
+        self,
+        provider: str,
+        limits: ProviderLimits,
+        call: Callable[[], Awaitable[T]],
+        expires_at: Optional[float],
+    ) -> T:
+        state = self._state(provider)
+        attempt = 0
+        while True:
+            await state.semaphore.acquire()
+            holds_slot = True
+            try:
+                if state.bucket is not None:
+                    await state.bucket.acquire()
+                pending = call()
+                if isinstance(pending, asyncio.Future):
+                    # An executor thread outlives a cancelled await; if the
+                    # deadline cancels us, the slot is freed when it returns
+                    try:
+                        return await asyncio.shield(pending)
+                    except asyncio.CancelledError:
+                        holds_slot = False
+                        pending.add_done_callback(lambda _: _release_slot(state, pending))
+                        raise
+                return await pending
+            except Exception as exc:
+                if attempt >= limits.max_retries or not is_retryable(exc):
+                    raise
+                error = exc
+            finally:
+                if holds_slot:
+                    state.semaphore.release()
+            # Back off without holding a slot, so other requests can use it
+            delay = backoff_delay(attempt, limits, _retry_after(error))
+            if expires_at is not None and time.monotonic() + delay >= expires_at:
+                raise error  # the retry could not finish in time anyway
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+llm_dispatcher = LLMDispatcher()
+
+
+async def dispatch_llm_request(
+    provider: str, call: Callable[[], Awaitable[T]], *, deadline: Optional[float] = None
+) -> T:
+    """Run ``call`` through the process-wide ``llm_dispatcher``."""
+    return await llm_dispatcher.run(provider, call, deadline=deadline)
@@ -1,22 +1,33 @@
 """Utilities for interacting with a local Ollama LLM."""
 
-try:
-    from ollama import chat  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover
-    chat = None
 from pydantic import BaseModel
 
 __all__ = ["get_ollama_response"]
 
 DEFAULT_MODEL = "llama3"  # or mistral, gemma, etc.
+ERROR_PREFIX = "[Ollama error]"
 
 
 class OllamaTextResponse(BaseModel):
     content: str
 
 
+# Structured-output schema sent with every chat request
+RESPONSE_FORMAT = OllamaTextResponse.model_json_schema()
+
+
+def _load_chat():
+    """``ollama.chat``, imported on first use; ``None`` if ollama is not installed."""
+    try:
+        from ollama import chat  # type: ignore
+    except ModuleNotFoundError:  # pragma: no cover
+        return None
+    return chat
+
+
 def get_ollama_response(prompt: str, model: str = DEFAULT_MODEL) -> str:
     try:
+        chat = _load_chat()
         if chat is None:
             raise RuntimeError(
                 "Ollama is not installed. Install it (e.g. `pip install ollama`) to enable local LLM responses."
@@ -24,7 +35,7 @@ def get_ollama_response(prompt: str, model: str = DEFAULT_MODEL) -> str:
         response = chat(
             model=model,
             messages=[{"role": "user", "content": prompt}],
-            format=OllamaTextResponse.model_json_schema(),
+            format=RESPONSE_FORMAT,
         )
         message_content = response.message.content
         if message_content is None:
@@ -32,4 +43,4 @@ def get_ollama_response(prompt: str, model: str = DEFAULT_MODEL) -> str:
         parsed = OllamaTextResponse.model_validate_json(message_content)
         return parsed.content.strip()
     except Exception as exc:
-        return f"[Ollama error] {exc}"
+        return f"{ERROR_PREFIX} {exc}"
@@ -4,7 +4,6 @@ import threading
 from typing import List
 
 from dotenv import load_dotenv
-from openai import AsyncOpenAI, OpenAI
 
 load_dotenv()
 
@@ -12,9 +11,13 @@ __all__ = [
     "get_gpt5_nano_response",
     "get_gpt5_nano_response_async",
     "get_gpt5_nano_response_sync",
+    "GPT5_NANO_MODEL",
 ]
 
-# Lazy initialization - clients are created only when first used
+GPT5_NANO_MODEL = "gpt-5-nano"
+
+# Lazy initialization - clients are created only when first used, and the
+# openai package (slow to import) is only imported then too
 _async_client = None
 _sync_client = None
 _lock = threading.Lock()
@@ -26,9 +29,11 @@ def _get_async_client():
     if _async_client is None:
         with _lock:
             if _async_client is None:
-                _async_client = (
-                    AsyncOpenAI()
-                )  # Only 1 request can now create the global async client
+                from openai import AsyncOpenAI
+
+                # Only 1 request can now create the global async client. Retries
+                # are left to helpers.llm_dispatch, which backs off across all callers
+                _async_client = AsyncOpenAI(max_retries=0)
     return _async_client
 
 
@@ -38,6 +43,8 @@ def _get_sync_client():
     if _sync_client is None:
         with _lock:
             if _sync_client is None:
+                from openai import OpenAI
+
                 _sync_client = (
                     OpenAI()
                 )  # Only 1 request can create the global sync client
@@ -57,7 +64,7 @@ async def get_gpt5_nano_response_async(prompt: str) -> str:
 
     # Use the shared async client instance
     response = await _get_async_client().responses.create(
-        model="gpt-5-nano", input=prompt
+        model=GPT5_NANO_MODEL, input=prompt
     )
 
     if getattr(response, "output_text", None):
@@ -89,7 +96,7 @@ def get_gpt5_nano_response_sync(prompt: str) -> str:
     """
 
     # Use the shared sync client instance
-    response = _get_sync_client().responses.create(model="gpt-5-nano", input=prompt)
+    response = _get_sync_client().responses.create(model=GPT5_NANO_MODEL, input=prompt)
 
     if getattr(response, "output_text", None):
         return response.output_text
@@ -0,0 +1,149 @@
+"""Lightweight timing spans for the analysis pipeline, aggregated per repo and per run."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+@dataclass
+class Span:
+    """One timed stage. ``start`` is seconds since the profiler was created."""
+
+    name: str
+    repo: str | None
+    start: float
+    duration: float = 0.0
+    count: int | None = None
+    bytes: int | None = None
+    thread: int = 0
+
+
+def _aggregate(spans: Iterable[Span]) -> Dict[str, Dict[str, Any]]:
+    """Stage name -> total seconds, number of spans, and summed counts/bytes."""
+    stages: Dict[str, Dict[str, Any]] = {}
+    for span in spans:
+        stage = stages.setdefault(
+            span.name, {"seconds": 0.0, "calls": 0, "count": None, "bytes": None}
+        )
+        stage["seconds"] += span.duration
+        stage["calls"] += 1
+        for key in ("count", "bytes"):
+            value = getattr(span, key)
+            if value is not None:
+                stage[key] = (stage[key] or 0) + value
+    return stages
+
+
+class RunProfiler:
+    """Collects spans for one analysis run. Safe to use from several threads.
+
+    Usage::
+
+        profiler = RunProfiler()
+        with profiler.span("getRepoStats", repo="my-repo") as span:
+            ...
+            span.count = n_files
+        profiler.summary()              # per-stage totals, run-wide and per repo
+        profiler.write_chrome_trace(p)  # open in chrome://tracing or Perfetto
+    """
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._wall_origin = time.time()
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        repo: str | None = None,
+        count: int | None = None,
+        bytes: int | None = None,
+    ) -> Iterator[Span]:
+        """Time the ``with`` block; set ``count``/``bytes`` on the yielded span."""
+        span = Span(
+            name=name,
+            repo=repo,
+            start=time.perf_counter() - self._origin,
+            count=count,
+            bytes=bytes,
+            thread=threading.get_ident(),
+        )
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - self._origin - span.start
+            with self._lock:
+                self._spans.append(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return sorted(self._spans, key=lambda span: span.start)
+
+    def summary(self) -> Dict[str, Any]:
+        """Run-wide and per-repo stage totals (the ``AnalyzeResponse.timings`` shape)."""
+        spans = self.spans
+        repos: Dict[str, List[Span]] = {}
+        for span in spans:
+            if span.repo is not None:
+                repos.setdefault(span.repo, []).append(span)
+        return {
+            "total_seconds": time.perf_counter() - self._origin,
+            "stages": _aggregate(spans),
+            "repos": {repo: _aggregate(repo_spans) for repo, repo_spans in repos.items()},
+        }
+
+    def to_json(self) -> Dict[str, Any]:
+        """``summary()`` plus every raw span."""
+        return {
+            **self.summary(),
+            "started_at": self._wall_origin,
+            "spans": [asdict(span) for span in self.spans],
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Spans as Chrome trace-event "complete" events (microsecond timestamps)."""
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            args = {
+                key: value
+                for key, value in (("repo", span.repo), ("count", span.count), ("bytes", span.bytes))
+                if value is not None
+            }
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.repo or "run",
+                    "ph": "X",
+                    "ts": round(span.start * 1_000_000, 3),
+                    "dur": round(span.duration * 1_000_000, 3),
+                    "pid": pid,
+                    "tid": span.thread,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.to_json(), indent=2))
+        return path
+
+    def write_chrome_trace(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.to_chrome_trace()))
+        return path
+
+
+__all__ = ["RunProfiler", "Span"]
@@ -1,8 +1,11 @@
-import subprocess
-import re
 from pathlib import Path
 from typing import Dict, List, Set
 
+from artifactminer.RepositoryIntelligence.git_runner import GitBudget, RepoGitBudget, run_git
+
+# Ranking only needs author emails, so it gets a tighter budget than full analysis.
+RANKING_GIT_BUDGET = GitBudget(call_timeout=20.0, repo_timeout=20.0)
+
 
 def _discover_git_projects(base_path: Path) -> Set[Path]:
     """Return all directories under base_path that contain a `.git` folder."""
@@ -16,14 +19,21 @@ def _discover_git_projects(base_path: Path) -> Set[Path]:
     return repo_dirs
 
 
-def rank_projects(projects_dir: str, user_email: str) -> List[Dict]:
+def rank_projects(
+    projects_dir: str, user_email: str, budget: GitBudget | None = None
+) -> List[Dict]:
     """
     Ranks projects in the given directory based on the user's contribution percentage,
     identified strictly by their email address.
 
+    Author emails are streamed from ``git log --all`` under a per-repo git budget.
+    A repo whose history cannot be read within the budget is still ranked from
+    the commits read so far and is flagged ``partial`` instead of being dropped.
+
     Args:
         projects_dir: Path to the directory containing project subdirectories.
         user_email: The email of the user to calculate contributions for.
+        budget: Per-repo git time/byte limits (defaults to RANKING_GIT_BUDGET).
 
     Returns:
         A list of dictionaries, each containing:
@@ -31,6 +41,7 @@ def rank_projects(projects_dir: str, user_email: str) -> List[Dict]:
             - score: User's contribution percentage (0-100)
             - total_commits: Total number of commits in the project
             - user_commits: Number of commits by the user
+            - partial: True if the history walk was cut short by the budget
     """
     projects = []
     base_path = Path(projects_dir)
@@ -43,40 +54,29 @@ def rank_projects(projects_dir: str, user_email: str) -> List[Dict]:
 
     for project_path in repo_paths:
         try:
-            # Get commit counts per author with email
-            output = subprocess.check_output(
-                ["git", "shortlog", "-s", "-n", "-e", "--all"],
-                cwd=str(project_path),
-                text=True,
-                stderr=subprocess.DEVNULL,
-                timeout=5,
+            # One author email per commit, across all refs (same scope as shortlog --all)
+            result = run_git(
+                project_path,
+                ["log", "--all", "--format=%aE"],
+                budget=RepoGitBudget(budget or RANKING_GIT_BUDGET),
             )
+            if result.returncode not in (0, None) and not result.partial:
+                continue
+
+            lines = result.stdout.split("\n")
+            if result.partial and lines:
+                lines = lines[:-1]  # cut short (bytes or time): last line may be half an email
 
             total_commits = 0
             user_commits = 0
 
-            for line in output.strip().split("\n"):
-                if not line.strip():
-                    continue
-
-                parts = line.strip().split(maxsplit=1)
-                if len(parts) < 2:
-                    continue
-
-                try:
-                    count = int(parts[0])
-                    rest = parts[1]
-
-                    total_commits += count
-
-                    email_match = re.search(r"<([^>]+)>", rest)
-                    if email_match:
-                        author_email = email_match.group(1).lower().strip()
-                        if author_email == target_email:
-                            user_commits += count
-
-                except ValueError:
+            for line in lines:
+                author_email = line.strip().lower()
+                if not author_email:
                     continue
+                total_commits += 1
+                if author_email == target_email:
+                    user_commits += 1
 
             score = (user_commits / total_commits * 100) if total_commits else 0.0
 
@@ -86,11 +86,10 @@ def rank_projects(projects_dir: str, user_email: str) -> List[Dict]:
                     "score": round(score, 2),
                     "total_commits": total_commits,
                     "user_commits": user_commits,
+                    "partial": result.partial,
                 }
             )
 
-        except subprocess.CalledProcessError:
-            continue
         except Exception as e:
             print(f"Error processing {project_path.name}: {e}")
             continue
@@ -35,6 +35,19 @@ def main() -> None:
         help="User email for analysis tracking (default: cli-user@example.com)",
     )
 
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="Write per-stage analysis timings to this JSON file",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="Write analysis timings as a Chrome trace (chrome://tracing, Perfetto)",
+    )
+
     args = parser.parse_args()
 
     if args.input and args.output:
@@ -52,7 +65,16 @@ def main() -> None:
 
         consent = args.consent or "no_llm"
         email = args.user_email or "cli-user@example.com"
-        asyncio.run(run_analysis(input_path, output_path, consent, email))
+        asyncio.run(
+            run_analysis(
+                input_path,
+                output_path,
+                consent,
+                email,
+                profile_path=args.profile,
+                trace_path=args.trace,
+            )
+        )
         return
 
     from artifactminer.cli.interactive import run_interactive
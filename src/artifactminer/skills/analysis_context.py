@@ -0,0 +1,154 @@
+"""Per-run state shared by every extractor in one ``DeepRepoAnalyzer.analyze`` call."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Set
+
+from artifactminer.RepositoryIntelligence.git_runner import (
+    RepoGitBudget,
+    iter_within_budget,
+    run_git,
+)
+from artifactminer.RepositoryIntelligence.manifest_index import (
+    DependencyIndex,
+    build_dependency_index,
+)
+from artifactminer.RepositoryIntelligence.object_reader import GitObjectReader
+from artifactminer.RepositoryIntelligence.repo_intelligence_main import isGitRepo
+from artifactminer.RepositoryIntelligence.repo_intelligence_user import summarizeUserCommits
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
+from artifactminer.skills.user_profile import build_user_profile
+from artifactminer.helpers.lazy_import import lazy_module
+
+git = lazy_module("git")  # GitPython loads on first use, not at import
+
+_UNSET = object()
+
+
+@dataclass
+class RepoAnalysisContext:
+    """History-derived values for one repo and user, each computed at most once.
+
+    Skill extraction, git stats, infra and quality signals all read from the
+    same context, so the user's history is walked once per ``analyze`` call:
+    ``user_commits`` feeds the user profile, the contribution metrics and the
+    commit-window count alike. ``user_stats`` passed by the caller (e.g. from
+    ``getUserRepoStats``) is used as is.
+
+    Values are memoized under a per-key lock, so extractors running on
+    different threads share one computation instead of racing to repeat it.
+    """
+
+    repo_path: str
+    user_email: str
+    user_contributions: Dict[str, Any] = field(default_factory=dict)
+    git_budget: RepoGitBudget | None = None
+    object_reader: GitObjectReader | None = None
+    repo_tree: RepoTreeSnapshot | None = None
+    dependency_index: DependencyIndex | None = None
+    preloaded_user_stats: Any = None
+    repo_stat: Any = None
+    consent_level: str = "none"
+    _cache: Dict[str, Any] = field(default_factory=dict, repr=False)
+    _locks: Dict[str, threading.Lock] = field(default_factory=dict, repr=False)
+    _guard: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        self.repo_path = str(self.repo_path)
+        if not self.user_email or not str(self.user_email).strip():
+            raise ValueError("A user email is required to analyze a repository")
+        # Keep the case: git's --author match is case-sensitive
+        self.user_email = self.user_email.strip()
+        self.user_contributions = dict(self.user_contributions or {})
+
+    def _memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        value = self._cache.get(key, _UNSET)
+        if value is not _UNSET:
+            return value
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            value = self._cache.get(key, _UNSET)
+            if value is _UNSET:
+                value = self._cache[key] = compute()
+        return value
+
+    @property
+    def touched_paths(self) -> Set[str] | None:
+        """Paths the caller scoped the run to (``user_contributions["touched_paths"]``)."""
+        return self.user_contributions.get("touched_paths")
+
+    @property
+    def is_git_repo(self) -> bool:
+        return self._memo("is_git_repo", lambda: isGitRepo(self.repo_path))
+
+    def manifests(self) -> DependencyIndex:
+        """The caller's dependency index, or one parsed from the shared tree."""
+        if self.dependency_index is None:
+            self.dependency_index = self._memo(
+                "manifests",
+                lambda: build_dependency_index(
+                    self.repo_path, reader=self.object_reader, tree=self.repo_tree
+                ),
+            )
+        return self.dependency_index
+
+    def user_commits(self) -> List[Any]:
+        """The user's commits, newest first, from one budget-bounded history walk."""
+        return self._memo("user_commits", self._walk_user_commits)
+
+    def walked_user_commits(self) -> List[Any] | None:
+        """``user_commits()`` if something already walked the history, else None; never walks."""
+        value = self._cache.get("user_commits", _UNSET)
+        return None if value is _UNSET else value
+
+    def total_commit_count(self) -> int:
+        return self._memo("total_commit_count", self._count_all_commits)
+
+    def user_profile(self) -> Dict[str, Any] | None:
+        """``build_user_profile`` over the shared history walk."""
+        return self._memo(
+            "user_profile",
+            lambda: build_user_profile(
+                self.repo_path,
+                self.user_email,
+                budget=self.git_budget,
+                commits=self.user_commits(),
+            ),
+        )
+
+    def user_stats(self) -> Any:
+        """Caller's preloaded stats, or contribution metrics from the shared walk."""
+        if self.preloaded_user_stats is not None:
+            return self.preloaded_user_stats
+        if not self.is_git_repo:
+            return None
+        return self._memo(
+            "user_stats",
+            lambda: summarizeUserCommits(
+                self.repo_path, self.user_commits(), self.total_commit_count()
+            ),
+        )
+
+    # ----------------------- internal helpers ----------------------- #
+    def _walk_user_commits(self) -> List[Any]:
+        if not self.is_git_repo:
+            return []
+        try:
+            repo = git.Repo(self.repo_path)
+            return list(
+                iter_within_budget(repo.iter_commits(author=self.user_email), self.git_budget)
+            )
+        except Exception:
+            return []
+
+    def _count_all_commits(self) -> int:
+        if not self.is_git_repo:
+            return 0
+        result = run_git(self.repo_path, ["rev-list", "--count", "HEAD"], budget=self.git_budget)
+        try:
+            return int(result.stdout.strip()) if result.ok else 0
+        except ValueError:
+            return 0
@@ -3,8 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import fields
+from pathlib import Path
 from typing import Any, Dict, List
 
+from artifactminer.helpers.profiling import RunProfiler
+from artifactminer.RepositoryIntelligence.git_runner import RepoGitBudget
+from artifactminer.RepositoryIntelligence.manifest_index import DependencyIndex
+from artifactminer.RepositoryIntelligence.object_reader import GitObjectReader
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
+from artifactminer.skills.analysis_context import RepoAnalysisContext
+from artifactminer.skills.extractor_registry import (
+    DEFAULT_EXTRACTOR_WORKERS,
+    ExtractorRegistry,
+    SignalExtractor,
+)
 from artifactminer.skills.models import (
     DeepAnalysisResult,
     ExtractedSkill,
@@ -55,9 +67,62 @@ class DeepRepoAnalyzer:
         },
     }
 
-    def __init__(self, enable_llm: bool = False) -> None:
+    # Extractors whose results fill the named DeepAnalysisResult fields
+    _BUILTIN_EXTRACTORS = ("skills", "insights", "git_stats", "infra_signals", "repo_quality")
+
+    def __init__(
+        self, enable_llm: bool = False, max_workers: int = DEFAULT_EXTRACTOR_WORKERS
+    ) -> None:
         self.extractor = SkillExtractor(enable_llm=enable_llm)
+        self.max_workers = max_workers
         self._validate_insight_rules()
+        self.registry = self._build_registry()
+
+    def _build_registry(self) -> ExtractorRegistry:
+        """Built-in extractors; register more on ``self.registry`` to extend a run."""
+        return ExtractorRegistry(
+            [
+                SignalExtractor(
+                    "skills",
+                    self._run_skill_extraction,
+                    inputs=frozenset({"history", "tree", "manifests", "additions"}),
+                ),
+                SignalExtractor(
+                    "insights",
+                    lambda context, upstream: self._derive_insights(upstream["skills"]),
+                    depends_on=("skills",),
+                ),
+                SignalExtractor(
+                    "git_stats",
+                    lambda context, upstream: self._extract_git_stats(
+                        context.repo_path,
+                        context.user_email,
+                        context.user_contributions,
+                        context=context,
+                    ),
+                    inputs=frozenset({"history"}),
+                ),
+                SignalExtractor(
+                    "infra_signals",
+                    lambda context, upstream: self._extract_infra_signals(
+                        context.repo_path,
+                        context.user_contributions,
+                        repo_tree=context.repo_tree,
+                    ),
+                    inputs=frozenset({"tree"}),
+                ),
+                SignalExtractor(
+                    "repo_quality",
+                    lambda context, upstream: self._extract_repo_quality(
+                        context.repo_path,
+                        context.user_contributions,
+                        object_reader=context.object_reader,
+                        repo_tree=context.repo_tree,
+                    ),
+                    inputs=frozenset({"tree"}),
+                ),
+            ]
+        )
 
     def analyze(
         self,
@@ -67,29 +132,74 @@ class DeepRepoAnalyzer:
         user_contributions: Dict | None = None,
         consent_level: str = "none",
         user_stats: Any = None,
+        git_budget: RepoGitBudget | None = None,
+        object_reader: GitObjectReader | None = None,
+        repo_tree: RepoTreeSnapshot | None = None,
+        dependency_index: DependencyIndex | None = None,
+        profiler: RunProfiler | None = None,
     ) -> DeepAnalysisResult:
-        """Run baseline skill extraction, then derive insights from user-attributed skills."""
-        skills = self.extractor.extract_skills(
+        """Run baseline skill extraction, then derive insights from user-attributed skills.
+
+        ``git_budget`` bounds every git call made for this repo; when it runs out
+        the history-derived signals are computed from what was read so far.
+        ``object_reader`` lets detectors read manifests and configs from HEAD
+        over one persistent ``cat-file`` process instead of the working tree.
+        ``repo_tree`` is the file listing shared by every filesystem detector;
+        it is scanned once here when the caller doesn't pass one.
+        All extractors share one ``RepoAnalysisContext``, so the user's history
+        is walked once per call and ``user_stats`` is never recomputed. They run
+        through ``self.registry``: independent extractors overlap on a thread
+        pool and each one's wall time lands in ``DeepAnalysisResult.timings``.
+        ``dependency_index`` is the repo's parsed manifests, shared with
+        framework detection; skill extraction builds one when omitted.
+        """
+        context = RepoAnalysisContext(
             repo_path=repo_path,
-            repo_stat=repo_stat,
             user_email=user_email,
             user_contributions=user_contributions or {},
+            git_budget=git_budget,
+            object_reader=object_reader,
+            repo_tree=repo_tree if repo_tree is not None else RepoTreeSnapshot.scan(repo_path),
+            dependency_index=dependency_index,
+            preloaded_user_stats=user_stats,
+            repo_stat=repo_stat,
             consent_level=consent_level,
         )
-        insights = self._derive_insights(skills)
+        span = None
+        if profiler is not None:
+            repo_name = Path(repo_path).name
 
-        git_stats = self._extract_git_stats(
-            repo_path, user_email, user_contributions, user_stats
+            def span(name: str):
+                return profiler.span(f"signal.{name}", repo=repo_name)
+
+        results, timings = self.registry.run(
+            context, max_workers=self.max_workers, span=span
         )
-        infra_signals = self._extract_infra_signals(repo_path, user_contributions)
-        repo_quality = self._extract_repo_quality(repo_path, user_contributions)
 
         return DeepAnalysisResult(
-            skills=skills,
-            insights=insights,
-            git_stats=git_stats,
-            infra_signals=infra_signals,
-            repo_quality=repo_quality,
+            **{name: results[name] for name in self._BUILTIN_EXTRACTORS if name in results},
+            extra_signals={
+                name: value
+                for name, value in results.items()
+                if name not in self._BUILTIN_EXTRACTORS
+            },
+            timings=timings,
+        )
+
+    def _run_skill_extraction(
+        self, context: RepoAnalysisContext, upstream: Dict[str, Any]
+    ) -> List[ExtractedSkill]:
+        return self.extractor.extract_skills(
+            repo_path=context.repo_path,
+            repo_stat=context.repo_stat,
+            user_email=context.user_email,
+            user_contributions=context.user_contributions,
+            consent_level=context.consent_level,
+            git_budget=context.git_budget,
+            object_reader=context.object_reader,
+            repo_tree=context.repo_tree,
+            dependency_index=context.manifests(),
+            context=context,
         )
 
     def _extract_git_stats(
@@ -98,16 +208,33 @@ class DeepRepoAnalyzer:
         user_email: str,
         user_contributions: Dict | None,
         user_stats: Any = None,
+        *,
+        git_budget: RepoGitBudget | None = None,
+        context: RepoAnalysisContext | None = None,
     ) -> GitStatsResult | None:
         """Extract git contribution metrics for the user."""
         touched_paths = (
             user_contributions.get("touched_paths") if user_contributions else None
         )
         kwargs = {"touched_paths": touched_paths}
+        if context is not None:
+            git_budget = git_budget or context.git_budget
+            if context.is_git_repo:
+                if user_stats is None:
+                    user_stats = context.user_stats()
+                # Reuse the history only if it was walked anyway; otherwise the
+                # window count is one since-bounded query, not a full walk
+                walked = context.walked_user_commits()
+                if walked is not None:
+                    kwargs["user_commits"] = walked
         if user_stats is not None:
             kwargs["user_stats"] = user_stats
+        if git_budget is not None:
+            kwargs["budget"] = git_budget
         stats = get_git_stats(repo_path, user_email, **kwargs)
-        patterns = detect_git_patterns(repo_path, touched_paths=touched_paths)
+        patterns = detect_git_patterns(
+            repo_path, touched_paths=touched_paths, budget=git_budget
+        )
 
         if not stats and not patterns:
             return None
@@ -120,12 +247,14 @@ class DeepRepoAnalyzer:
         self,
         repo_path: str,
         user_contributions: Dict | None,
+        *,
+        repo_tree: RepoTreeSnapshot | None = None,
     ) -> InfraSignalsResult | None:
         """Extract infrastructure and DevOps configuration signals."""
         touched_paths = (
             user_contributions.get("touched_paths") if user_contributions else None
         )
-        signals = get_infra_signals(repo_path, touched_paths=touched_paths)
+        signals = get_infra_signals(repo_path, touched_paths=touched_paths, tree=repo_tree)
         if not signals:
             return None
 
@@ -137,12 +266,23 @@ class DeepRepoAnalyzer:
         self,
         repo_path: str,
         user_contributions: Dict | None,
+        *,
+        object_reader: GitObjectReader | None = None,
+        repo_tree: RepoTreeSnapshot | None = None,
     ) -> RepoQualityResult | None:
         """Extract repository quality signals."""
         touched_paths = (
             user_contributions.get("touched_paths") if user_contributions else None
         )
-        return get_repo_quality_signals(repo_path, touched_paths=touched_paths) or None
+        return (
+            get_repo_quality_signals(
+                repo_path,
+                touched_paths=touched_paths,
+                reader=object_reader,
+                tree=repo_tree,
+            )
+            or None
+        )
 
     def _validate_insight_rules(self) -> None:
         """Fail fast if insight rules reference skills that do not exist."""
@@ -0,0 +1,190 @@
+"""Pluggable signal extractors run as a dependency DAG over one analysis context."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, FrozenSet, Iterable, List, Tuple
+
+from artifactminer.skills.analysis_context import RepoAnalysisContext
+
+# Worker threads per repo; extractors are mostly git subprocess and file I/O bound
+DEFAULT_EXTRACTOR_WORKERS = 4
+
+# Inputs an extractor may declare, and how each is loaded into the shared context.
+# Loads go through the context's per-key memo, so concurrent extractors that
+# declare the same input wait on a single load.
+EXTRACTOR_INPUTS: Dict[str, Callable[[RepoAnalysisContext], Any]] = {
+    "history": lambda context: context.user_commits(),
+    "tree": lambda context: context.repo_tree,
+    "manifests": lambda context: context.manifests(),
+    # Additions are streamed by the extractor itself; nothing to preload
+    "additions": lambda context: None,
+}
+
+# Inputs whose loaded objects are not thread-safe: GitPython commits share their
+# Repo's persistent cat-file pipes, so extractors declaring "history" take turns
+# while tree- and manifest-only extractors overlap with them.
+EXCLUSIVE_INPUTS = frozenset({"history"})
+
+ExtractorFn = Callable[[RepoAnalysisContext, Dict[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class SignalExtractor:
+    """One named extractor: ``run(context, upstream_results) -> result``.
+
+    ``inputs`` names the context resources it reads (see ``EXTRACTOR_INPUTS``);
+    ``depends_on`` names extractors whose results it needs. ``upstream_results``
+    holds exactly those results, keyed by extractor name.
+    """
+
+    name: str
+    run: ExtractorFn
+    inputs: FrozenSet[str] = frozenset()
+    depends_on: Tuple[str, ...] = ()
+
+
+class ExtractorRegistry:
+    """Ordered set of extractors executed concurrently where the DAG allows."""
+
+    def __init__(self, extractors: Iterable[SignalExtractor] = ()) -> None:
+        self._extractors: Dict[str, SignalExtractor] = {}
+        for extractor in extractors:
+            self.add(extractor)
+
+    def add(self, extractor: SignalExtractor) -> SignalExtractor:
+        if extractor.name in self._extractors:
+            raise ValueError(f"Extractor '{extractor.name}' is already registered")
+        unknown = set(extractor.inputs) - set(EXTRACTOR_INPUTS)
+        if unknown:
+            raise ValueError(
+                f"Extractor '{extractor.name}' declares unknown inputs: {sorted(unknown)}"
+            )
+        self._extractors[extractor.name] = extractor
+        return extractor
+
+    def register(
+        self,
+        name: str,
+        *,
+        inputs: Iterable[str] = (),
+        depends_on: Iterable[str] = (),
+    ) -> Callable[[ExtractorFn], ExtractorFn]:
+        """Decorator form of ``add``."""
+
+        def decorator(fn: ExtractorFn) -> ExtractorFn:
+            self.add(
+                SignalExtractor(
+                    name=name,
+                    run=fn,
+                    inputs=frozenset(inputs),
+                    depends_on=tuple(depends_on),
+                )
+            )
+            return fn
+
+        return decorator
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._extractors)
+
+    def topological_order(self) -> List[str]:
+        """Registration order, adjusted so every extractor follows its dependencies."""
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Extractor dependency cycle: {' -> '.join(path + (name,))}")
+            if name not in self._extractors:
+                raise ValueError(f"Extractor '{path[-1]}' depends on unknown '{name}'")
+            state[name] = 1
+            for dep in self._extractors[name].depends_on:
+                visit(dep, path + (name,))
+            state[name] = 2
+            order.append(name)
+
+        for name in self._extractors:
+            visit(name, ())
+        return order
+
+    def run(
+        self,
+        context: RepoAnalysisContext,
+        *,
+        max_workers: int = DEFAULT_EXTRACTOR_WORKERS,
+        span: Callable[[str], ContextManager[Any]] | None = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """Run every extractor once; return ``(results, seconds_per_extractor)``.
+
+        An extractor starts as soon as all of its ``depends_on`` have finished,
+        so independent extractors overlap on the pool, except that those sharing
+        an ``EXCLUSIVE_INPUTS`` resource run one at a time. Its timing covers
+        loading its declared inputs plus its own work. The first failure is re-raised
+        once running extractors settle; extractors not yet started are skipped.
+        ``span(name)``, when given, wraps each extractor's timed section (e.g.
+        ``RunProfiler.span``) so the same interval shows up in a run profile.
+        """
+        order = self.topological_order()
+        results: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        if not order:
+            return results, timings
+
+        locks = {resource: threading.Lock() for resource in EXCLUSIVE_INPUTS}
+
+        def execute(extractor: SignalExtractor, upstream: Dict[str, Any]) -> Any:
+            with ExitStack() as stack:
+                for resource in sorted(extractor.inputs & EXCLUSIVE_INPUTS):
+                    stack.enter_context(locks[resource])
+                if span is not None:
+                    stack.enter_context(span(extractor.name))
+                started = time.perf_counter()
+                try:
+                    for resource in sorted(extractor.inputs):
+                        EXTRACTOR_INPUTS[resource](context)
+                    return extractor.run(context, upstream)
+                finally:
+                    timings[extractor.name] = time.perf_counter() - started
+
+        pending = list(order)
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(order))),
+            thread_name_prefix="extractor",
+        ) as pool:
+            while pending or running:
+                for name in list(pending):
+                    extractor = self._extractors[name]
+                    if all(dep in results for dep in extractor.depends_on):
+                        upstream = {dep: results[dep] for dep in extractor.depends_on}
+                        running[pool.submit(execute, extractor, upstream)] = name
+                        pending.remove(name)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        for other in running:
+                            other.cancel()
+                        wait(running)
+                        raise error
+                    results[name] = future.result()
+
+        return {name: results[name] for name in order}, timings
+
+
+__all__ = [
+    "DEFAULT_EXTRACTOR_WORKERS",
+    "EXCLUSIVE_INPUTS",
+    "EXTRACTOR_INPUTS",
+    "ExtractorRegistry",
+    "SignalExtractor",
+]
@@ -1,7 +1,7 @@
 """Lightweight data models used across skill extraction."""
 
 from dataclasses import dataclass, field
-from typing import Any, Iterable, List
+from typing import Any, Dict, Iterable, List
 
 
 @dataclass
@@ -82,3 +82,7 @@ class DeepAnalysisResult:
     git_stats: GitStatsResult | None = None
     infra_signals: InfraSignalsResult | None = None
     repo_quality: RepoQualityResult | None = None
+    # Results of extractors registered beyond the built-in ones, by name
+    extra_signals: Dict[str, Any] = field(default_factory=dict)
+    # Wall-clock seconds per extractor for this repo
+    timings: Dict[str, float] = field(default_factory=dict)
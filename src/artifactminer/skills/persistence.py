@@ -2,10 +2,150 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List
 
 from artifactminer.skills.models import ExtractedSkill
 
+# Dialects whose INSERT supports ``ON CONFLICT ... DO UPDATE``
+_UPSERT_DIALECTS = ("sqlite", "postgresql")
+# Rounds of re-merging evidence that a concurrent writer changed under us
+_MAX_EVIDENCE_MERGE_ATTEMPTS = 3
+
+
+def _merge_extracted(extracted: List[ExtractedSkill]) -> Dict[str, ExtractedSkill]:
+    """Collapse repeated skill names: keep highest proficiency, union evidence in order."""
+    merged: Dict[str, ExtractedSkill] = {}
+    for sk in extracted:
+        current = merged.get(sk.skill)
+        if current is None:
+            merged[sk.skill] = ExtractedSkill(
+                skill=sk.skill,
+                category=sk.category,
+                evidence=list(dict.fromkeys(sk.evidence)),
+                proficiency=sk.proficiency,
+            )
+        else:
+            current.proficiency = max(current.proficiency, sk.proficiency)
+            current.add_evidence(sk.evidence)
+    return merged
+
+
+def _dialect_insert(db):
+    """Return the dialect's ``insert`` construct with upsert support, or None."""
+    name = db.get_bind().dialect.name
+    if name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert
+
+
+def _ensure_skill_ids(db, merged: Dict[str, ExtractedSkill]) -> Dict[str, int]:
+    """Map skill name -> Skill.id, creating missing rows with one multi-row insert."""
+    from sqlalchemy import insert as core_insert, select
+    from artifactminer.db.models import Skill
+
+    names = list(merged)
+    ids = dict(db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(names))).all())
+    missing = [name for name in names if name not in ids]
+    if not missing:
+        return ids
+
+    rows = [{"name": name, "category": merged[name].category} for name in missing]
+    insert = _dialect_insert(db)
+    if insert is not None:
+        # Another writer may have created the row since the lookup; keep theirs.
+        stmt = insert(Skill).values(rows).on_conflict_do_nothing(index_elements=["name"])
+    else:
+        stmt = core_insert(Skill).values(rows)
+    db.execute(stmt)
+    ids.update(db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(missing))).all())
+    return ids
+
+
+def _upsert_junction_rows(db, insert, model, scope, conflict_cols, skill_ids, merged) -> None:
+    """Upsert one junction row per merged skill without overwriting concurrent writes.
+
+    Proficiency is merged in SQL, keeping the higher of the stored and new
+    value. Evidence is a JSON list SQL can't union, so it is merged with the
+    value read here and written only where the stored value still equals it;
+    rows another writer changed in between are read and merged again. Rows
+    still contended after ``_MAX_EVIDENCE_MERGE_ATTEMPTS`` rounds are merged
+    under a row lock instead.
+    """
+    from sqlalchemy import and_, case, cast, false, func, literal, or_, select, update
+    from sqlalchemy.dialects.postgresql import JSONB
+
+    postgres = db.get_bind().dialect.name == "postgresql"
+    greatest = func.greatest if postgres else func.max
+    scope_filter = [getattr(model, col) == value for col, value in scope.items()]
+
+    def decoded(expr):
+        # Compare JSON values, not their text: spacing and key order may differ
+        return cast(expr, JSONB) if postgres else func.json(expr)
+
+    def stored_evidence(skill_ids_, *, lock=False):
+        query = select(model.skill_id, model.evidence).where(
+            *scope_filter, model.skill_id.in_(skill_ids_)
+        )
+        return dict(db.execute(query.with_for_update() if lock else query).all())
+
+    def merged_evidence(stored, sk):
+        return list(dict.fromkeys([*(stored or []), *sk.evidence]))
+
+    pending = {skill_ids[name]: sk for name, sk in merged.items()}
+    for _ in range(_MAX_EVIDENCE_MERGE_ATTEMPTS):
+        seen = stored_evidence(list(pending))
+        rows, unchanged, wanted = [], [], {}
+        for skill_id, sk in pending.items():
+            evidence = merged_evidence(seen.get(skill_id), sk)
+            if skill_id in seen:
+                unchanged.append(
+                    and_(
+                        model.skill_id == skill_id,
+                        func.coalesce(decoded(model.evidence), decoded(literal("null")))
+                        == decoded(literal(seen[skill_id], type_=model.evidence.type)),
+                    )
+                )
+            wanted[skill_id] = evidence
+            rows.append(
+                {**scope, "skill_id": skill_id, "proficiency": sk.proficiency, "evidence": evidence}
+            )
+
+        stmt = insert(model).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_cols,
+            set_={
+                "proficiency": greatest(
+                    func.coalesce(model.proficiency, 0.0), stmt.excluded.proficiency
+                ),
+                "evidence": case(
+                    (or_(false(), *unchanged), stmt.excluded.evidence), else_=model.evidence
+                ),
+            },
+        )
+        db.execute(stmt)
+
+        written = stored_evidence(list(pending))
+        pending = {
+            skill_id: sk
+            for skill_id, sk in pending.items()
+            if not set(wanted[skill_id]) <= set(written.get(skill_id) or [])
+        }
+        if not pending:
+            return
+
+    # Still contended: read-modify-write under a row lock. (SQLite has no row
+    # locks, but this transaction already holds the database write lock.)
+    for skill_id, stored in stored_evidence(list(pending), lock=True).items():
+        db.execute(
+            update(model)
+            .where(*scope_filter, model.skill_id == skill_id)
+            .values(evidence=merged_evidence(stored, pending[skill_id]))
+        )
+
 
 def persist_extracted_skills(
     db,
@@ -20,6 +160,13 @@ def persist_extracted_skills(
     Saves skills to either ProjectSkill (repo-level) or UserProjectSkill
     (user-attributed) based on whether user_email is provided.
 
+    Runs a fixed number of statements regardless of how many skills are
+    passed: one ``IN`` lookup (plus one multi-row insert) for master Skill
+    rows, one read of the repo's stored evidence, one
+    ``INSERT ... ON CONFLICT DO UPDATE`` that merges proficiency in SQL and
+    replaces evidence only where it is unchanged since that read, and one
+    read to confirm it.
+
     Args:
         db: SQLAlchemy Session instance.
         repo_stat_id: Foreign key to the RepoStat being analyzed.
@@ -35,82 +182,73 @@ def persist_extracted_skills(
     Raises:
         ValueError: If db is not a SQLAlchemy Session or RepoStat doesn't exist.
     """
+    from sqlalchemy import select
     from sqlalchemy.orm import Session
-    from artifactminer.db.models import Skill, ProjectSkill, RepoStat, UserProjectSkill
+    from artifactminer.db.models import ProjectSkill, RepoStat, UserProjectSkill
 
     if not isinstance(db, Session):
         raise ValueError("db must be a SQLAlchemy Session")
 
-    if not db.query(RepoStat).filter(RepoStat.id == repo_stat_id).first():
+    if db.get(RepoStat, repo_stat_id) is None:
         raise ValueError(f"RepoStat {repo_stat_id} does not exist")
 
     normalized_email = user_email.strip().lower() if user_email else None
-    saved = []
-
-    for sk in extracted:
-        # Ensure the master Skill row exists (shared across all projects)
-        skill_row = db.query(Skill).filter(Skill.name == sk.skill).first()
-        if not skill_row:
-            skill_row = Skill(name=sk.skill, category=sk.category)
-            db.add(skill_row)
-            db.flush()  # Get the ID before creating junction record
-
-        # Route to UserProjectSkill or ProjectSkill based on email
-        if normalized_email:
-            proj_skill = (
-                db.query(UserProjectSkill)
-                .filter(
-                    UserProjectSkill.repo_stat_id == repo_stat_id,
-                    UserProjectSkill.skill_id == skill_row.id,
-                    UserProjectSkill.user_email == normalized_email,
+    merged = _merge_extracted(extracted)
+    if not merged:
+        if commit:
+            db.commit()
+        return []
+
+    db.flush()  # pending ORM changes must be visible to the Core statements below
+    skill_ids = _ensure_skill_ids(db, merged)
+
+    # Route to UserProjectSkill or ProjectSkill based on email
+    if normalized_email:
+        model = UserProjectSkill
+        scope = {"repo_stat_id": repo_stat_id, "user_email": normalized_email}
+        conflict_cols = ["repo_stat_id", "skill_id", "user_email"]
+    else:
+        # Generic repo-level skill (no user attribution)
+        model = ProjectSkill
+        scope = {"repo_stat_id": repo_stat_id}
+        conflict_cols = ["repo_stat_id", "skill_id"]
+    scope_filter = [getattr(model, col) == value for col, value in scope.items()]
+    wanted_ids = [skill_ids[name] for name in merged]
+
+    insert = _dialect_insert(db)
+    if insert is not None:
+        _upsert_junction_rows(db, insert, model, scope, conflict_cols, skill_ids, merged)
+    else:
+        # No upsert support: merge into the stored rows, add the rest, one flush
+        current = {
+            row.skill_id: row
+            for row in db.query(model).filter(*scope_filter, model.skill_id.in_(wanted_ids))
+        }
+        for name, sk in merged.items():
+            row = current.get(skill_ids[name])
+            if row is None:
+                db.add(
+                    model(
+                        **scope,
+                        skill_id=skill_ids[name],
+                        proficiency=sk.proficiency,
+                        evidence=list(sk.evidence),
+                    )
                 )
-                .first()
-            )
-
-            if proj_skill:
-                # Merge: keep highest proficiency, union evidence
-                proj_skill.proficiency = max(
-                    (proj_skill.proficiency or 0.0), sk.proficiency
-                )
-                existing_evidence = set(proj_skill.evidence or [])
-                proj_skill.evidence = list(existing_evidence.union(sk.evidence))
-            else:
-                proj_skill = UserProjectSkill(
-                    repo_stat_id=repo_stat_id,
-                    skill_id=skill_row.id,
-                    user_email=normalized_email,
-                    proficiency=sk.proficiency,
-                    evidence=list(sk.evidence),
-                )
-                db.add(proj_skill)
-        else:
-            # Generic repo-level skill (no user attribution)
-            proj_skill = (
-                db.query(ProjectSkill)
-                .filter(
-                    ProjectSkill.repo_stat_id == repo_stat_id,
-                    ProjectSkill.skill_id == skill_row.id,
-                )
-                .first()
-            )
-
-            if proj_skill:
-                # Merge: keep highest proficiency, union evidence
-                proj_skill.proficiency = max(
-                    (proj_skill.proficiency or 0.0), sk.proficiency
-                )
-                existing_evidence = set(proj_skill.evidence or [])
-                proj_skill.evidence = list(existing_evidence.union(sk.evidence))
             else:
-                proj_skill = ProjectSkill(
-                    repo_stat_id=repo_stat_id,
-                    skill_id=skill_row.id,
-                    proficiency=sk.proficiency,
-                    evidence=list(sk.evidence),
-                )
-                db.add(proj_skill)
-
-        saved.append(proj_skill)
+                row.proficiency = max(row.proficiency or 0.0, sk.proficiency)
+                row.evidence = list(dict.fromkeys([*(row.evidence or []), *sk.evidence]))
+        db.flush()
+
+    saved_by_skill = {
+        row.skill_id: row
+        for row in db.execute(
+            select(model)
+            .where(*scope_filter, model.skill_id.in_(wanted_ids))
+            .execution_options(populate_existing=True)
+        ).scalars()
+    }
+    saved = [saved_by_skill[skill_id] for skill_id in wanted_ids if skill_id in saved_by_skill]
 
     if commit:
         db.commit()
@@ -2,36 +2,65 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Set
+from typing import Dict, Iterable, Iterator, Set, Tuple
 
+from artifactminer.mappings import DEPENDENCY_SKILLS
+from artifactminer.RepositoryIntelligence.manifest_index import (
+    DependencyIndex,
+    NeedleTable,
+    build_dependency_index,
+)
+from artifactminer.RepositoryIntelligence.object_reader import GitObjectReader
 from artifactminer.skills.signals.file_signals import path_in_touched
 
+# Dependency -> (skill, category) tables per ecosystem, normalized once at import
+_DEPENDENCY_SKILL_TABLES: Dict[str, NeedleTable[Tuple[str, str]]] = {
+    ecosystem: NeedleTable(ecosystem, needles) for ecosystem, needles in DEPENDENCY_SKILLS.items()
+}
+
 
 def dependency_hits(
-    repo_path: str, needle: str, *, touched_paths: Set[str] | None = None
+    repo_path: str,
+    needle: str,
+    *,
+    ecosystem: str = "cross",
+    touched_paths: Set[str] | None = None,
+    reader: GitObjectReader | None = None,
+    index: DependencyIndex | None = None,
 ) -> int:
-    """Count mentions of a dependency across common manifests, optionally scoped to user edits."""
-    total_hits = 0
-    manifests = [
-        "pyproject.toml",
-        "requirements.txt",
-        "Pipfile",
-        "package.json",
-        "go.mod",
-        "pom.xml",
-        "build.gradle",
-        "build.gradle.kts",
-    ]
-    for manifest in manifests:
-        if touched_paths is not None and not path_in_touched(manifest, touched_paths):
-            continue
-        target = Path(repo_path) / manifest
-        if not target.exists():
-            continue
-        try:
-            content = target.read_text().lower()
-            total_hits += content.count(needle.lower())
-        except Exception:
+    """Count manifests declaring a dependency, optionally scoped to user edits.
+
+    ``index`` is the repo's parsed manifest index; pass the one built for the
+    run so manifests are not re-read per needle. Without it, one is built here
+    from HEAD through ``reader`` when supplied.
+    """
+    index = index or build_dependency_index(repo_path, reader=reader)
+    if touched_paths is None:
+        return index.count(ecosystem, needle)
+    return index.count(
+        ecosystem, needle, manifest_filter=lambda manifest: path_in_touched(manifest, touched_paths)
+    )
+
+
+def iter_dependency_skill_hits(
+    index: DependencyIndex,
+    ecosystems: Iterable[str],
+    *,
+    touched_paths: Set[str] | None = None,
+) -> Iterator[Tuple[str, str, str, int]]:
+    """Yield ``(dependency, skill, category, hits)`` for mapped dependencies in ``index``.
+
+    Only dependencies actually declared are visited, so the cost doesn't grow
+    with the size of ``DEPENDENCY_SKILLS``.
+    """
+    manifest_filter = None
+    if touched_paths is not None:
+        manifest_filter = lambda manifest: path_in_touched(manifest, touched_paths)  # noqa: E731
+    for ecosystem in ecosystems:
+        table = _DEPENDENCY_SKILL_TABLES.get(ecosystem)
+        if not table:
             continue
-    return total_hits
+        for dep, (skill_name, category) in table.find(index):
+            hits = index.count(ecosystem, dep, manifest_filter=manifest_filter)
+            if hits:
+                yield dep, skill_name, category, hits
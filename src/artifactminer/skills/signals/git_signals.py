@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from typing import Any, Dict, Set
-
-import git
+from typing import Any, Dict, Sequence, Set
 
+from artifactminer.RepositoryIntelligence.git_runner import RepoGitBudget, iter_within_budget
 from artifactminer.RepositoryIntelligence.repo_intelligence_main import isGitRepo
 from artifactminer.RepositoryIntelligence.repo_intelligence_user import getUserRepoStats
+from artifactminer.helpers.lazy_import import lazy_module
+
+git = lazy_module("git")  # GitPython loads on first use, not at import
 
 
 def get_git_stats(
@@ -18,10 +20,14 @@ def get_git_stats(
     window_days: int = 90,
     touched_paths: Set[str] | None = None,
     user_stats: Any = None,
+    budget: RepoGitBudget | None = None,
+    user_commits: Sequence[Any] | None = None,
 ) -> Dict[str, Any]:
     """Extract git contribution metrics for a user.
 
     Delegates to getUserRepoStats for core metrics, adds windowed commit count.
+    Pass ``user_stats`` and ``user_commits`` (the user's walked history) when the
+    caller already has them so no history is walked again.
 
     Returns:
         Dict with keys:
@@ -36,7 +42,7 @@ def get_git_stats(
 
     if user_stats is None:
         try:
-            user_stats = getUserRepoStats(repo_path, user_email)
+            user_stats = getUserRepoStats(repo_path, user_email, budget=budget)
         except Exception:
             return {}
 
@@ -49,7 +55,9 @@ def get_git_stats(
             "last_commit_date": None,
         }
 
-    commits_in_window = _count_commits_in_window(repo_path, user_email, window_days)
+    commits_in_window = _count_commits_in_window(
+        repo_path, user_email, window_days, budget=budget, commits=user_commits
+    )
 
     return {
         "commit_count_window": commits_in_window,
@@ -60,30 +68,49 @@ def get_git_stats(
     }
 
 
-def _count_commits_in_window(repo_path: str, user_email: str, window_days: int) -> int:
-    """Count user commits within the specified time window."""
-    try:
-        repo = git.Repo(repo_path)
-    except Exception:
-        return 0
+def _count_commits_in_window(
+    repo_path: str,
+    user_email: str,
+    window_days: int,
+    *,
+    budget: RepoGitBudget | None = None,
+    commits: Sequence[Any] | None = None,
+) -> int:
+    """Count user commits within the specified time window.
 
+    ``commits`` is the user's already walked history; it is filtered in memory
+    instead of asking git again.
+    """
     user_email = user_email.strip().lower()
     now = datetime.now(UTC)
     window_start = now - timedelta(days=window_days)
 
+    if commits is not None:
+        since = window_start.timestamp()
+        candidates = (c for c in commits if c.committed_date >= since)
+    else:
+        try:
+            repo = git.Repo(repo_path)
+        except Exception:
+            return 0
+        # Filter at git query level to avoid scanning full history on large repos.
+        candidates = iter_within_budget(
+            repo.iter_commits(author=user_email, since=window_start.isoformat()),
+            budget,
+        )
+
     count = 0
-    # Filter at git query level to avoid scanning full history on large repos.
-    for c in repo.iter_commits(
-        author=user_email,
-        since=window_start.isoformat(),
-    ):
+    for c in candidates:
         if (getattr(c.author, "email", "") or "").lower() == user_email:
             count += 1
     return count
 
 
 def detect_git_patterns(
-    repo_path: str, *, touched_paths: Set[str] | None = None
+    repo_path: str,
+    *,
+    touched_paths: Set[str] | None = None,
+    budget: RepoGitBudget | None = None,
 ) -> Dict[str, Any]:
     """Detect git workflow patterns from branch names and commit messages."""
     if not isGitRepo(repo_path):
@@ -117,7 +144,7 @@ def detect_git_patterns(
         pass
 
     try:
-        for commit in repo.iter_commits(max_count=100):
+        for commit in iter_within_budget(repo.iter_commits(max_count=100), budget):
             if len(commit.parents) > 1:
                 patterns["merge_commits"] += 1
     except Exception:
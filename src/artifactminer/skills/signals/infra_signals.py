@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from fnmatch import fnmatchcase
 from typing import Any, Dict, List, Set, Tuple
 
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
 from artifactminer.skills.signals.file_signals import path_in_touched
 
 
@@ -58,20 +59,21 @@ def detect_ci_cd(
     repo_path: str,
     *,
     touched_paths: Set[str] | None = None,
+    tree: RepoTreeSnapshot | None = None,
 ) -> List[Dict[str, Any]]:
     """Detect CI/CD configurations in the repository.
 
     Returns list of dicts with keys: tool, path, evidence_type
     """
     results: List[Dict[str, Any]] = []
-    root = Path(repo_path)
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
 
     for pattern, (tool_name, extensions) in CI_CD_PATTERNS.items():
         if touched_paths is not None and not path_in_touched(pattern, touched_paths):
             continue
 
-        candidate = root / pattern
-        if candidate.is_file():
+        if tree.is_file(pattern):
             results.append(
                 {
                     "tool": tool_name,
@@ -79,22 +81,22 @@ def detect_ci_cd(
                     "evidence_type": "ci_cd",
                 }
             )
-        elif candidate.is_dir():
+        elif tree.is_dir(pattern):
             if extensions:
+                children = tree.children(pattern)
                 for ext_pattern in extensions:
-                    for match in candidate.glob(ext_pattern):
-                        rel = str(match.relative_to(root))
-                        results.append(
-                            {
-                                "tool": tool_name,
-                                "path": rel,
-                                "evidence_type": "ci_cd",
-                            }
-                        )
+                    for rel in children:
+                        if fnmatchcase(rel.rpartition("/")[2], ext_pattern):
+                            results.append(
+                                {
+                                    "tool": tool_name,
+                                    "path": rel,
+                                    "evidence_type": "ci_cd",
+                                }
+                            )
             else:
-                for child in candidate.rglob("*"):
-                    if child.is_file() and child.suffix in (".yml", ".yaml"):
-                        rel = str(child.relative_to(root))
+                for rel in tree.under(pattern):
+                    if rel.endswith((".yml", ".yaml")):
                         results.append(
                             {
                                 "tool": tool_name,
@@ -110,28 +112,28 @@ def detect_docker(
     repo_path: str,
     *,
     touched_paths: Set[str] | None = None,
+    tree: RepoTreeSnapshot | None = None,
 ) -> List[Dict[str, Any]]:
     """Detect Docker-related configurations.
 
     Returns list of dicts with keys: tool, path, evidence_type
     """
     results: List[Dict[str, Any]] = []
-    root = Path(repo_path)
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
 
     for pattern, tool_name in DOCKER_PATTERNS.items():
         if touched_paths is not None and not path_in_touched(pattern, touched_paths):
             continue
 
-        for match in root.rglob(pattern):
-            if match.is_file():
-                rel = str(match.relative_to(root))
-                results.append(
-                    {
-                        "tool": tool_name,
-                        "path": rel,
-                        "evidence_type": "docker",
-                    }
-                )
+        for rel in tree.with_name(pattern):
+            results.append(
+                {
+                    "tool": tool_name,
+                    "path": rel,
+                    "evidence_type": "docker",
+                }
+            )
 
     return results
 
@@ -140,6 +142,7 @@ def detect_env_build(
     repo_path: str,
     *,
     touched_paths: Set[str] | None = None,
+    tree: RepoTreeSnapshot | None = None,
 ) -> List[Dict[str, Any]]:
     """Detect environment, build, and deployment configurations.
 
@@ -147,7 +150,8 @@ def detect_env_build(
     """
     results: List[Dict[str, Any]] = []
     seen_entries: Set[Tuple[str, str, str]] = set()
-    root = Path(repo_path)
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
 
     def _add_result(tool_name: str, rel_path: str, category: str) -> None:
         key = (tool_name, rel_path, category)
@@ -167,19 +171,14 @@ def detect_env_build(
         if touched_paths is not None and not path_in_touched(pattern, touched_paths):
             continue
 
-        candidate = root / pattern
-        if candidate.is_file():
+        if tree.is_file(pattern):
             _add_result(tool_name, pattern, category)
-        elif candidate.is_dir():
-            for child in candidate.rglob("*"):
-                if child.is_file():
-                    rel = str(child.relative_to(root))
-                    _add_result(tool_name, rel, category)
+        elif tree.is_dir(pattern):
+            for rel in tree.under(pattern):
+                _add_result(tool_name, rel, category)
         else:
-            for match in root.rglob(pattern):
-                if match.is_file():
-                    rel = str(match.relative_to(root))
-                    _add_result(tool_name, rel, category)
+            for rel in tree.with_name(pattern):
+                _add_result(tool_name, rel, category)
 
     return results
 
@@ -188,14 +187,17 @@ def get_infra_signals(
     repo_path: str,
     *,
     touched_paths: Set[str] | None = None,
+    tree: RepoTreeSnapshot | None = None,
 ) -> Dict[str, Any]:
     """Aggregate all infrastructure signals.
 
     Returns dict with keys: ci_cd, docker, env_build, summary
     """
-    ci_cd = detect_ci_cd(repo_path, touched_paths=touched_paths)
-    docker = detect_docker(repo_path, touched_paths=touched_paths)
-    env_build = detect_env_build(repo_path, touched_paths=touched_paths)
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
+    ci_cd = detect_ci_cd(repo_path, touched_paths=touched_paths, tree=tree)
+    docker = detect_docker(repo_path, touched_paths=touched_paths, tree=tree)
+    env_build = detect_env_build(repo_path, touched_paths=touched_paths, tree=tree)
 
     tools = set()
     for item in ci_cd + docker + env_build:
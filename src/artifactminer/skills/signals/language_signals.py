@@ -7,24 +7,28 @@ from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
 from artifactminer.mappings import CATEGORIES
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
 from artifactminer.skills.signals.file_signals import path_in_touched
 
 
-def count_files_by_ext(repo_path: str) -> Counter:
+def count_files_by_ext(repo_path: str, *, tree: RepoTreeSnapshot | None = None) -> Counter:
     """Count files by extension for a repository."""
-    counts: Counter = Counter()
-    for path in Path(repo_path).rglob("*"):
-        if path.is_file():
-            counts[path.suffix.lower()] += 1
-    return counts
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
+    return tree.suffix_counts()
 
 
 def language_signals(
-    repo_path: str, *, touched_paths: Set[str] | None = None
+    repo_path: str,
+    *,
+    touched_paths: Set[str] | None = None,
+    tree: RepoTreeSnapshot | None = None,
 ) -> List[Tuple[Tuple[str, str], str]]:
     """Infer languages from manifests and shebangs to avoid a giant hard-coded list."""
     signals: List[Tuple[Tuple[str, str], str]] = []
     root = Path(repo_path)
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
 
     key_files: Dict[str, Tuple[str, str]] = {
         "package.json": ("JavaScript", CATEGORIES["languages"]),
@@ -48,10 +52,10 @@ def language_signals(
         if touched_paths is not None and not path_in_touched(rel, touched_paths):
             continue
         if rel.startswith("."):
-            matches = list(root.glob(f"**/*{rel}"))
+            found = bool(tree.match_name(f"*{rel}"))
         else:
-            matches = list(root.glob(rel))
-        if matches:
+            found = tree.exists(rel)
+        if found:
             signals.append((mapping, f"Detected {rel}"))
 
     shebang_map = {
@@ -66,15 +70,14 @@ def language_signals(
     sample_limit = 50
     sampled = 0
     if touched_paths is not None:
-        candidate_paths = [root / p for p in touched_paths if (root / p).is_file()]
+        candidate_paths = sorted(p for p in touched_paths if tree.is_file(p))
     else:
-        candidate_paths = root.rglob("*")
+        candidate_paths = tree.files
 
-    for path in candidate_paths:
+    for rel in candidate_paths:
         if sampled >= sample_limit:
             break
-        if not path.is_file():
-            continue
+        path = root / rel
         try:
             first_line = path.open("r", encoding="utf-8", errors="ignore").readline()
         except Exception:
@@ -7,6 +7,8 @@ from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any, Dict, Set
 
+from artifactminer.RepositoryIntelligence.object_reader import GitObjectReader, read_repo_text
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
 from artifactminer.skills.models import RepoQualityResult
 from artifactminer.skills.signals.file_signals import path_in_touched
 
@@ -90,14 +92,18 @@ def _path_in_touched_ci(path: str, touched_paths: Set[str] | None) -> bool:
     return any(tp.lower().endswith(lower_path) for tp in touched_paths)
 
 
-def _has_test_config(root: Path, touched_paths: Set[str] | None) -> list[str]:
+def _has_test_config(
+    root: Path,
+    touched_paths: Set[str] | None,
+    reader: GitObjectReader | None = None,
+) -> list[str]:
     found = set()
     for cfg in TEST_CONFIG_FILES:
         if touched_paths and not path_in_touched(cfg, touched_paths):
             continue
-        p = root / cfg
-        if p.is_file():
-            content = p.read_text(errors="ignore").lower()
+        text = read_repo_text(root, cfg, reader)
+        if text is not None:
+            content = text.lower()
             if cfg == "pytest.ini" or "[pytest]" in content or "[tool:pytest]" in content:
                 found.add("pytest")
             if "tox" in content:
@@ -152,28 +158,30 @@ def detect_test_signals(
     repo_path: str,
     *,
     touched_paths: Set[str] | None = None,
+    reader: GitObjectReader | None = None,
+    tree: RepoTreeSnapshot | None = None,
 ) -> Dict[str, Any]:
     """Detect test infrastructure in repository."""
     root = Path(repo_path)
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
     seen_files: Set[str] = set()
-    test_dirs = sum(1 for dir_name in TEST_DIR_PATTERNS if (root / dir_name).is_dir())
+    test_dirs = sum(1 for dir_name in TEST_DIR_PATTERNS if tree.is_dir(dir_name))
     frameworks: set[str] = set()
 
-    for match in root.rglob("*"):
-        if not match.is_file():
-            continue
-        rel = str(match.relative_to(root))
+    for rel in tree.files:
         if touched_paths and not path_in_touched(rel, touched_paths):
             continue
+        name = rel.rpartition("/")[2]
 
-        if any(fnmatch(match.name, pattern) for pattern in TEST_FILE_PATTERNS):
+        if any(fnmatch(name, pattern) for pattern in TEST_FILE_PATTERNS):
             seen_files.add(rel)
             continue
 
-        if _is_in_test_dir(rel) and not fnmatch(match.name, "*.md"):
+        if _is_in_test_dir(rel) and not fnmatch(name, "*.md"):
             seen_files.add(rel)
 
-    frameworks.update(_has_test_config(root, touched_paths))
+    frameworks.update(_has_test_config(root, touched_paths, reader))
     frameworks.update(_infer_frameworks_from_test_files(seen_files))
 
     return {
@@ -188,19 +196,20 @@ def detect_docs_signals(
     repo_path: str,
     *,
     touched_paths: Set[str] | None = None,
+    tree: RepoTreeSnapshot | None = None,
 ) -> Dict[str, Any]:
     """Detect documentation in repository."""
-    root = Path(repo_path)
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
     found = {}
-    entries = {}
-    if root.exists():
-        entries = {entry.name.lower(): entry for entry in root.iterdir()}
+    # Top-level names, matched case-insensitively (readme.md, Docs/, ...)
+    entries = {rel.lower() for rel in tree.children("")}
+    entries.update(rel.lower() for rel in tree.dirs if "/" not in rel)
 
     for pattern, doc_type in DOCS_PATTERNS.items():
         if not _path_in_touched_ci(pattern, touched_paths):
             continue
-        candidate = entries.get(pattern.lower(), root / pattern)
-        if candidate.is_file() or candidate.is_dir():
+        if pattern.lower() in entries:
             found[doc_type] = True
 
     return {
@@ -215,9 +224,13 @@ def detect_quality_signals(
     repo_path: str,
     *,
     touched_paths: Set[str] | None = None,
+    reader: GitObjectReader | None = None,
+    tree: RepoTreeSnapshot | None = None,
 ) -> Dict[str, Any]:
     """Detect code quality tooling in repository."""
     root = Path(repo_path)
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
     tools = set()
     has_lint_config = False
     has_precommit = False
@@ -226,15 +239,14 @@ def detect_quality_signals(
     for pattern, tool_type in QUALITY_PATTERNS.items():
         if touched_paths and not path_in_touched(pattern, touched_paths):
             continue
-        candidate = root / pattern
-        if not candidate.is_file():
+        if not tree.is_file(pattern) and (reader is None or reader.blob_size(pattern) is None):
             continue
 
         if tool_type == "pre_commit":
             has_precommit = True
             tools.add("pre-commit")
         elif tool_type in ("pyproject", "setup_cfg", "ruff"):
-            content = candidate.read_text(errors="ignore").lower()
+            content = (read_repo_text(root, pattern, reader) or "").lower()
             if "[tool.ruff" in content or tool_type == "ruff":
                 has_lint_config = True
                 tools.add("ruff")
@@ -265,12 +277,18 @@ def get_repo_quality_signals(
     repo_path: str,
     *,
     touched_paths: Set[str] | None = None,
+    reader: GitObjectReader | None = None,
+    tree: RepoTreeSnapshot | None = None,
 ):
     """Aggregate all repository quality signals into a dataclass."""
+    if tree is None:
+        tree = RepoTreeSnapshot.scan(repo_path)
     merged = {
-        **detect_test_signals(repo_path, touched_paths=touched_paths),
-        **detect_docs_signals(repo_path, touched_paths=touched_paths),
-        **detect_quality_signals(repo_path, touched_paths=touched_paths),
+        **detect_test_signals(repo_path, touched_paths=touched_paths, reader=reader, tree=tree),
+        **detect_docs_signals(repo_path, touched_paths=touched_paths, tree=tree),
+        **detect_quality_signals(
+            repo_path, touched_paths=touched_paths, reader=reader, tree=tree
+        ),
     }
     valid = {f.name for f in fields(RepoQualityResult)}
     return RepoQualityResult(**{k: v for k, v in merged.items() if k in valid})
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Set
-
-from artifactminer.mappings import CATEGORIES, DEPENDENCY_SKILLS
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+from artifactminer.mappings import CATEGORIES
+from artifactminer.RepositoryIntelligence.git_runner import RepoGitBudget
+from artifactminer.RepositoryIntelligence.manifest_index import DependencyIndex, build_dependency_index
+from artifactminer.RepositoryIntelligence.object_reader import GitObjectReader
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
+from artifactminer.skills.analysis_context import RepoAnalysisContext
 from artifactminer.skills.models import ExtractedSkill
-from artifactminer.skills.signals.code_signals import collect_additions_text, iter_code_pattern_hits
-from artifactminer.skills.signals.dependency_signals import dependency_hits
+from artifactminer.skills.signals.code_signals import iter_code_pattern_hits, iter_commit_additions
+from artifactminer.skills.signals.dependency_signals import iter_dependency_skill_hits
 from artifactminer.skills.signals.language_signals import count_files_by_ext
 from artifactminer.skills.user_profile import build_user_profile
 from .skill_patterns import LANGUAGE_EXTENSIONS
@@ -29,6 +34,11 @@ class SkillExtractor:
         consent_level: str = "none",
         frameworks: List[str] | None = None,
         languages: List[str] | None = None,
+        git_budget: RepoGitBudget | None = None,
+        object_reader: GitObjectReader | None = None,
+        repo_tree: RepoTreeSnapshot | None = None,
+        dependency_index: DependencyIndex | None = None,
+        context: RepoAnalysisContext | None = None,
     ) -> List[ExtractedSkill]:
         repo_path = str(repo_path)
         user_contributions = dict(user_contributions or {})
@@ -46,16 +56,15 @@ class SkillExtractor:
         collab_flag = bool(getattr(repo_stat, "is_collaborative"))
 
         # Build a user-scoped profile when collaboration is enabled; force failure if no commits exist.
-        user_profile = build_user_profile(repo_path, normalized_email) if collab_flag else None
+        if not collab_flag:
+            user_profile = None
+        elif context is not None:
+            user_profile = context.user_profile()  # reuses the run's single history walk
+        else:
+            user_profile = build_user_profile(repo_path, normalized_email, budget=git_budget)
         if collab_flag and not user_profile:
             raise ValueError("No commits found for the specified user in this collaborative repo")
 
-        # Seed additions text for regex-based signals when the caller didn't provide any.
-        if user_profile and user_profile.get("additions_text"):
-            has_additions = user_contributions.get("additions") or user_contributions.get("user_additions")
-            if not has_additions:
-                user_contributions["additions"] = user_profile["additions_text"]
-
         user_contributions.setdefault("user_email", normalized_email)
 
         touched_paths: Set[str] | None = (
@@ -63,7 +72,7 @@ class SkillExtractor:
         )
 
         # ----------------------- language and framework signals ----------------------- #
-        file_counts = user_profile["file_counts"] if user_profile else count_files_by_ext(repo_path)
+        file_counts = user_profile["file_counts"] if user_profile else count_files_by_ext(repo_path, tree=repo_tree)
         total_files = max(sum(file_counts.values()), 1)
         detected_languages = set(lang.lower() for lang in (languages or []))
         scope_label = "user-touched" if user_profile else "repo"
@@ -120,24 +129,23 @@ class SkillExtractor:
         ecosystems = self._ecosystems(detected_languages)
 
         # ----------------------- dependency and filesystem signals ----------------------- #
-        for eco in ecosystems | {"cross"}:
-            for dep, (skill_name, category) in DEPENDENCY_SKILLS.get(eco, {}).items():
-                dep_hits = dependency_hits(repo_path, dep, touched_paths=touched_paths)
-                if dep_hits:
-                    scope_hint = "user-edited manifests" if user_profile else "manifests"
-                    evidence = [f"{dep_hits} occurrence(s) of '{dep}' in {scope_hint}"]
-                    proficiency = min(0.8, 0.45 + 0.1 * dep_hits)
-                    self._add_skill(skills, skill_name, category, evidence, proficiency)
+        dependency_index = dependency_index or build_dependency_index(
+            repo_path, reader=object_reader, tree=repo_tree
+        )
+        dep_hits_iter = iter_dependency_skill_hits(
+            dependency_index, sorted(ecosystems | {"cross"}), touched_paths=touched_paths
+        )
+        for dep, skill_name, category, dep_hits in dep_hits_iter:
+            scope_hint = "user-edited manifest(s)" if user_profile else "manifest(s)"
+            evidence = [f"'{dep}' declared in {dep_hits} {scope_hint}"]
+            proficiency = min(0.8, 0.45 + 0.1 * dep_hits)
+            self._add_skill(skills, skill_name, category, evidence, proficiency)
 
         # ----------------------- code signals ----------------------- #
-        additions_text = collect_additions_text(user_contributions)
-        if user_profile and user_profile.get("additions_text"):
-            if not additions_text:
-                additions_text = user_profile["additions_text"]
-            elif user_profile["additions_text"] not in additions_text:
-                additions_text = additions_text + "\n" + user_profile["additions_text"]
-
-        for pattern, hits in iter_code_pattern_hits(additions_text, ecosystems):
+        additions = self._iter_unique_additions(
+            user_contributions, user_profile.get("additions") if user_profile else None
+        )
+        for pattern, hits in iter_code_pattern_hits(additions, ecosystems):
             evidence = [f"{pattern.evidence} ({hits} match{'es' if hits != 1 else ''})"]
             prof = min(0.9, pattern.weight + 0.05 * hits)
             self._add_skill(skills, pattern.skill, pattern.category, evidence, prof)
@@ -145,6 +153,30 @@ class SkillExtractor:
         return list(skills.values())
 
     # ----------------------- internal helpers ----------------------- #
+    @staticmethod
+    def _iter_unique_additions(
+        user_contributions: Dict, profile_additions: Iterable[Tuple[str, str]] | None
+    ) -> Iterator[str]:
+        """Stream the caller's additions, then any profile commits not already seen.
+
+        Both sources are per-commit chunks of the same history, so a commit's
+        additions are counted once (by sha) even when both sources include it.
+        Different commits with identical added lines each count, and chunks
+        given without a sha are always kept.
+        """
+        seen: Set[str] = set()
+        for sha, chunk in iter_commit_additions(user_contributions):
+            if sha is not None:
+                if sha in seen:
+                    continue
+                seen.add(sha)
+            yield chunk
+        for sha, chunk in profile_additions or ():
+            if sha in seen:
+                continue
+            seen.add(sha)
+            yield chunk
+
     def _add_skill(
         self,
         skills: Dict[str, ExtractedSkill],
@@ -18,6 +18,9 @@ class CodePattern:
     evidence: str
     weight: float = 0.6
     ecosystems: tuple[str, ...] | None = None  # e.g., ("python",)
+    # Substrings at least one of which appears in every match; lets the matcher
+    # skip the regex entirely when none of them occur in the text.
+    literals: tuple[str, ...] | None = None
 
 
 LANGUAGE_EXTENSIONS: Dict[str, tuple[str, str]] = {
@@ -49,6 +52,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="async def usage in changes",
         ecosystems=("python",),
+        literals=("async",),
     ),
     CodePattern(
         skill="Error Handling",
@@ -56,12 +60,14 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="Custom exception detected",
         ecosystems=("python",),
+        literals=("Exception",),
     ),
     CodePattern(
         skill="SQL",
         regex=r"SELECT\s+.*\s+FROM",
         category=CATEGORIES["frameworks"],
         evidence="SQL query found in changes",
+        literals=("SELECT",),
     ),
     CodePattern(
         skill="Unit Testing",
@@ -69,6 +75,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="Testing imports detected",
         ecosystems=("python",),
+        literals=("unittest", "pytest."),
     ),
     CodePattern(
         skill="REST API Design",
@@ -76,6 +83,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["frameworks"],
         evidence="HTTP route handlers detected",
         ecosystems=("python",),
+        literals=("@router.",),
     ),
     CodePattern(
         skill="Data Validation",
@@ -83,6 +91,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["frameworks"],
         evidence="Pydantic models referenced",
         ecosystems=("python",),
+        literals=("pydantic",),
     ),
     CodePattern(
         skill="Dependency Injection",
@@ -90,6 +99,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="FastAPI Depends used",
         ecosystems=("python",),
+        literals=("Depends(",),
     ),
     CodePattern(
         skill="Logging",
@@ -97,6 +107,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="Logging statements present",
         ecosystems=None,
+        literals=("logging.",),
     ),
     CodePattern(
         skill="Command Line Tools",
@@ -104,6 +115,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["tools"],
         evidence="CLI parsing detected",
         ecosystems=("python",),
+        literals=("argparse", "click"),
     ),
     CodePattern(
         skill="Configuration Management",
@@ -111,6 +123,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="Env var configuration detected",
         ecosystems=("python",),
+        literals=("dotenv", "os.getenv"),
     ),
     CodePattern(
         skill="Annotation-based APIs",
@@ -118,6 +131,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["frameworks"],
         evidence="Java/Spring REST annotations detected",
         ecosystems=("java",),
+        literals=("@RestController", "@GetMapping", "@PostMapping", "@RequestMapping"),
     ),
     CodePattern(
         skill="JUnit Testing",
@@ -125,6 +139,7 @@ CODE_REGEX_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="JUnit tests detected",
         ecosystems=("java",),
+        literals=("@Test",),
     ),
     CodePattern(
         skill="TypeScript Typing",
@@ -144,6 +159,7 @@ DEEP_CODE_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="Resource caps or chunking present in changes",
         weight=0.68,
+        literals=("max_", "limit", "chunk", "batch", "throttle", "timeout"),
     ),
     # Data-structure sophistication
     CodePattern(
@@ -153,6 +169,7 @@ DEEP_CODE_PATTERNS: List[CodePattern] = [
         evidence="Specialized Python collections in changes",
         ecosystems=("python",),
         weight=0.7,
+        literals=("collections",),
     ),
     CodePattern(
         skill="Algorithm Optimization",
@@ -161,6 +178,7 @@ DEEP_CODE_PATTERNS: List[CodePattern] = [
         evidence="Algorithmic optimization techniques in changes",
         ecosystems=("python",),
         weight=0.72,
+        literals=("heapq", "bisect", "lru_cache"),
     ),
     # Abstraction / design
     CodePattern(
@@ -170,6 +188,7 @@ DEEP_CODE_PATTERNS: List[CodePattern] = [
         evidence="Dataclass-based modeling in changes",
         ecosystems=("python",),
         weight=0.65,
+        literals=("@dataclass",),
     ),
     CodePattern(
         skill="Abstract Interfaces",
@@ -177,6 +196,7 @@ DEEP_CODE_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="Abstract base classes or interfaces in changes",
         weight=0.75,
+        literals=("ABC", "Protocol", "abstractmethod", "interface"),
     ),
     # Robustness / error handling
     CodePattern(
@@ -185,6 +205,7 @@ DEEP_CODE_PATTERNS: List[CodePattern] = [
         category=CATEGORIES["practices"],
         evidence="Custom exception types declared in changes",
         weight=0.7,
+        literals=("Error(", "Exception("),
     ),
     CodePattern(
         skill="Context Management",
@@ -193,6 +214,7 @@ DEEP_CODE_PATTERNS: List[CodePattern] = [
         evidence="Context manager usage for resource safety in changes",
         ecosystems=("python",),
         weight=0.73,
+        literals=("with", "contextmanager", "__enter__", "__exit__"),
     ),
 ]
 
@@ -4,11 +4,17 @@ from __future__ import annotations
 
 from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Set
-
-import git
+from typing import Any, Dict, List, Sequence, Set, Tuple
 
+from artifactminer.RepositoryIntelligence.git_runner import (
+    RepoGitBudget,
+    iter_within_budget,
+    read_commit_patch,
+)
 from artifactminer.RepositoryIntelligence.repo_intelligence_main import isGitRepo
+from artifactminer.helpers.lazy_import import lazy_module
+
+git = lazy_module("git")  # GitPython loads on first use, not at import
 
 
 def extract_added_lines(patch_text: str) -> str:
@@ -30,23 +36,33 @@ def build_user_profile(
     *,
     max_commits: int = 400,
     max_patch_bytes: int = 200_000,
+    budget: RepoGitBudget | None = None,
+    commits: Sequence[Any] | None = None,
 ) -> Dict[str, Any] | None:
-    """Summarize a user's edits for collaborative repos (touched paths, file counts, added lines)."""
-    if not isGitRepo(repo_path):
-        return None
+    """Summarize a user's edits for collaborative repos (touched paths, file counts, added lines).
 
-    try:
-        repo = git.Repo(repo_path)
-    except Exception:
+    ``commits`` is the user's already walked history (newest first); when given,
+    its first ``max_commits`` entries are used instead of walking the repo again.
+    """
+    if not isGitRepo(repo_path):
         return None
 
-    commits = list(repo.iter_commits(author=user_email, max_count=max_commits))
+    if commits is not None:
+        commits = list(commits[:max_commits])
+    else:
+        try:
+            repo = git.Repo(repo_path)
+        except Exception:
+            return None
+        commits = list(
+            iter_within_budget(repo.iter_commits(author=user_email, max_count=max_commits), budget)
+        )
     if not commits:
         return None
 
     file_counts: Counter = Counter()
     touched_paths: Set[str] = set()
-    additions_by_commit: List[str] = []
+    additions_by_commit: List[Tuple[str, str]] = []
 
     for commit in commits:
         try:
@@ -63,18 +79,12 @@ def build_user_profile(
                 file_counts[suffix] += 1
 
         try:
-            patch = repo.git.show(
-                commit.hexsha,
-                "--patch",
-                "--unified=3",
-                "--no-color",
-                "--no-ext-diff",
+            patch = read_commit_patch(
+                repo_path, commit.hexsha, max_patch_bytes=max_patch_bytes, budget=budget
             )
-            if len(patch) > max_patch_bytes:
-                patch = patch[:max_patch_bytes] + "\n... [truncated]"
             added_only = extract_added_lines(patch).strip()
             if added_only:
-                additions_by_commit.append(added_only)
+                additions_by_commit.append((commit.hexsha, added_only))
         except Exception:
             continue
 
@@ -93,6 +103,6 @@ def build_user_profile(
     return {
         "file_counts": file_counts,
         "touched_paths": touched_paths,
-        "additions_text": "\n".join(additions_by_commit),
+        "additions": additions_by_commit,  # one (sha, added lines) pair per commit, never joined
         "manifest_edits": manifest_edits,
     }
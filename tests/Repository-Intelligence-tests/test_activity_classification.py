@@ -3,11 +3,14 @@
 # Tests for activity classification of user commits
 
 
+import subprocess
 import sys
 import os
 from pathlib import Path
 from datetime import datetime
 
+import pytest
+
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 
 from src.artifactminer.RepositoryIntelligence.activity_classifier import classify_commit_activities, print_activity_summary
@@ -69,3 +72,103 @@ def test_env_design_config_lines():
     summary = classify_commit_activities(additions)
     assert summary["config"]["lines_added"] == 2
 
+
+def test_generator_input_matches_list_input():
+    additions = ['def run():\n', '    assert run()\n', '# see figma mockup\n']
+    assert classify_commit_activities(iter(additions)) == classify_commit_activities(additions)
+
+
+def test_results_are_memoized_per_commit_sha(monkeypatch):
+    from src.artifactminer.RepositoryIntelligence import activity_classifier
+
+    activity_classifier.clear_commit_activity_cache()
+    first = activity_classifier.classify_user_commits(
+        [("abc123", "def test_run():\n    assert run()\n", False)]
+    )
+
+    monkeypatch.setattr(
+        activity_classifier, "classify_addition", lambda text: pytest.fail("reclassified")
+    )
+    assert activity_classifier.is_commit_classified("abc123")
+    assert activity_classifier.classify_user_commits([("abc123", None, False)]) == first
+    assert first["test"]["commits"] == 1
+
+
+def test_partial_patches_are_classified_but_not_memoized():
+    from src.artifactminer.RepositoryIntelligence import activity_classifier
+
+    activity_classifier.clear_commit_activity_cache()
+    summary = activity_classifier.classify_user_commits([("cut1", "x = 1\n", True)])
+
+    assert summary["code"]["lines_added"] == 1
+    assert not activity_classifier.is_commit_classified("cut1")
+
+
+def test_repeat_user_stats_skip_known_commit_patches(tmp_path, monkeypatch):
+    from src.artifactminer.RepositoryIntelligence import activity_classifier, repo_intelligence_user
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for args in (["init", "-q"], ["config", "user.email", "dev@example.com"], ["config", "user.name", "Dev"]):
+        subprocess.run(["git", *args], cwd=repo, check=True)
+    (repo / "app.py").write_text("def run():\n    return 1  # entry point\n")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=repo, check=True)
+
+    activity_classifier.clear_commit_activity_cache()
+    first = getUserRepoStats(repo, "dev@example.com").commitActivities
+    monkeypatch.setattr(
+        repo_intelligence_user, "read_commit_patch", lambda *a, **k: pytest.fail("patch re-read")
+    )
+    second = getUserRepoStats(repo, "dev@example.com").commitActivities
+
+    assert second == first
+    assert first["code"]["lines_added"] == 2
+
+
+def test_user_additions_are_keyed_and_flag_cut_patches(tmp_path):
+    from src.artifactminer.RepositoryIntelligence.repo_intelligence_user import iter_user_additions
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for args in (["init", "-q"], ["config", "user.email", "dev@example.com"], ["config", "user.name", "Dev"]):
+        subprocess.run(["git", *args], cwd=repo, check=True)
+    (repo / "app.py").write_text("def run():\n    return 1\n" * 50)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=repo, check=True)
+    sha = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+    (full,) = iter_user_additions(repo, "dev@example.com")
+    (cut,) = iter_user_additions(repo, "dev@example.com", max_patch_bytes=200)
+    (known,) = iter_user_additions(repo, "dev@example.com", is_known=lambda _: True)
+
+    assert (full.sha, full.partial) == (sha, False) and full.text.startswith("def run():")
+    assert (cut.sha, cut.partial) == (sha, True)
+    assert known == (sha, None, False)
+
+
+def test_commit_evicted_after_the_known_check_is_read_again():
+    from src.artifactminer.RepositoryIntelligence import activity_classifier
+
+    activity_classifier.clear_commit_activity_cache()
+    activity_classifier.classify_user_commits([("abc123", "x = 1\ny = 2\n", False)])
+
+    def evicted_after_check():
+        assert activity_classifier.is_commit_classified("abc123")  # so the patch isn't read
+        activity_classifier.clear_commit_activity_cache()
+        yield ("abc123", None, False)
+
+    reads = []
+
+    def read_commit(sha):
+        reads.append(sha)
+        return (sha, "x = 1\ny = 2\n", False)
+
+    summary = activity_classifier.classify_user_commits(evicted_after_check(), read_commit=read_commit)
+
+    assert reads == ["abc123"]
+    assert summary["code"]["lines_added"] == 2
+    assert activity_classifier.classify_commit("abc123", None).lines_added == 2
+    with pytest.raises(KeyError):
+        activity_classifier.clear_commit_activity_cache()
+        activity_classifier.classify_user_commits([("abc123", None, False)])
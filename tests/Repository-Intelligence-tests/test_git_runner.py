@@ -0,0 +1,92 @@
+import subprocess
+import time
+
+import pytest
+
+from artifactminer.RepositoryIntelligence.git_runner import (
+    GitBudget,
+    GitBudgetExceededError,
+    RepoGitBudget,
+    iter_within_budget,
+    read_commit_patch,
+    run_git,
+)
+from artifactminer.RepositoryIntelligence.repo_intelligence_main import runGit
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def small_repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "dev@example.com")
+    _git(repo, "config", "user.name", "Dev")
+    for i in range(3):
+        (repo / f"file{i}.py").write_text("print('hello')\n" * 50)
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", f"commit {i}")
+    return repo
+
+
+def test_run_git_returns_complete_output(small_repo):
+    result = run_git(small_repo, ["log", "--format=%s"])
+
+    assert result.ok
+    assert result.partial is False
+    assert result.stdout.splitlines() == ["commit 2", "commit 1", "commit 0"]
+
+
+def test_run_git_byte_cap_truncates_and_flags_partial(small_repo):
+    result = run_git(small_repo, ["log", "--patch"], max_bytes=100)
+
+    assert result.truncated is True
+    assert result.partial is True
+    assert len(result.stdout) <= 100
+
+
+def test_run_git_timeout_kills_child_processes(small_repo):
+    started = time.monotonic()
+    # Shell alias spawns a grandchild; cancellation must not wait for it.
+    result = run_git(small_repo, ["-c", "alias.slow=!sleep 30", "slow"], timeout=0.5)
+
+    assert result.timed_out is True
+    assert result.partial is True
+    assert time.monotonic() - started < 10
+
+
+def test_repo_budget_is_shared_across_calls(small_repo):
+    budget = RepoGitBudget(GitBudget(repo_max_bytes=60))
+
+    first = run_git(small_repo, ["log", "--format=%H"], budget=budget)
+    second = run_git(small_repo, ["log", "--format=%H"], budget=budget)
+
+    assert first.truncated is True
+    assert second.skipped is True
+    assert budget.partial is True
+
+
+def test_run_git_check_raises(small_repo):
+    with pytest.raises(subprocess.CalledProcessError):
+        run_git(small_repo, ["rev-parse", "does-not-exist"], check=True)
+
+    with pytest.raises(GitBudgetExceededError):
+        runGit(small_repo, ["log"], budget=RepoGitBudget(GitBudget(call_max_bytes=10)))
+
+
+def test_read_commit_patch_marks_truncation(small_repo):
+    patch = read_commit_patch(small_repo, "HEAD", max_patch_bytes=200)
+
+    assert patch.endswith("... [truncated]")
+    assert "diff --git" in patch
+
+
+def test_iter_within_budget_stops_when_time_runs_out():
+    budget = RepoGitBudget(GitBudget(repo_timeout=0.0))
+
+    assert list(iter_within_budget(range(10), budget)) == []
+    assert budget.partial is True
+    assert list(iter_within_budget(range(3), None)) == [0, 1, 2]
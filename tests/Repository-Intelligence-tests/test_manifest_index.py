@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+from artifactminer.RepositoryIntelligence.framework_detector import detect_frameworks
+from artifactminer.RepositoryIntelligence.manifest_index import (
+    NeedleTable,
+    build_dependency_index,
+    normalize_dependency,
+)
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
+from artifactminer.skills.signals.dependency_signals import (
+    dependency_hits,
+    iter_dependency_skill_hits,
+)
+
+
+def _write(root, rel, text):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    _write(tmp_path, "package.json", json.dumps({"devDependencies": {"typescript": "^5"}}))
+    _write(
+        tmp_path,
+        "packages/web/package.json",
+        json.dumps({"dependencies": {"react-native-foo": "1.0.0", "express": "^4"}}),
+    )
+    _write(tmp_path, "node_modules/react/package.json", json.dumps({"dependencies": {"react": "*"}}))
+    _write(tmp_path, "services/api/requirements-dev.txt", "Email_Validator>=2\n-r base.txt\n")
+    _write(tmp_path, "services/api/pom.xml", """<project>
+  <dependencies>
+    <dependency>
+      <groupId>org.springframework.boot</groupId>
+      <artifactId>spring-boot-starter-web</artifactId>
+    </dependency>
+  </dependencies>
+</project>""")
+    _write(tmp_path, "services/gw/go.mod", "module x\n\nrequire github.com/labstack/echo/v4 v4.11.0\n")
+    return tmp_path
+
+
+def test_nested_workspace_manifests_are_indexed(monorepo):
+    index = build_dependency_index(monorepo)
+
+    assert index.has("javascript", "express")
+    assert index.has("javascript", "typescript")
+    assert "node_modules/react/package.json" not in index.manifests
+
+
+def test_exact_names_do_not_match_longer_packages(monorepo):
+    index = build_dependency_index(monorepo)
+
+    assert not index.has("javascript", "react")
+    assert "React" not in detect_frameworks(str(monorepo))
+
+
+def test_python_names_are_pep503_normalized(monorepo):
+    index = build_dependency_index(monorepo)
+
+    assert normalize_dependency("python", "Email_Validator") == "email-validator"
+    assert index.has("python", "email-validator")
+    assert index.has("python", "email.validator")
+
+
+def test_java_and_go_match_at_boundaries(monorepo):
+    index = build_dependency_index(monorepo)
+
+    assert index.has("java", "spring-boot")
+    assert not index.has("java", "spring-boo")
+    assert index.has("go", "github.com/labstack/echo")
+    assert not index.has("go", "github.com/labstack/ech")
+
+
+def test_hits_count_declaring_manifests_and_honor_touched_paths(monorepo):
+    _write(monorepo, "packages/admin/package.json", json.dumps({"dependencies": {"express": "^4"}}))
+    index = build_dependency_index(monorepo)
+
+    assert dependency_hits(str(monorepo), "express", ecosystem="javascript", index=index) == 2
+    assert (
+        dependency_hits(
+            str(monorepo),
+            "express",
+            ecosystem="javascript",
+            touched_paths={"packages/admin/package.json"},
+            index=index,
+        )
+        == 1
+    )
+
+
+def test_shared_tree_and_index_avoid_rescans(monorepo, monkeypatch):
+    tree = RepoTreeSnapshot.scan(monorepo)
+    index = build_dependency_index(monorepo, tree=tree)
+    monkeypatch.setattr(
+        "artifactminer.RepositoryIntelligence.framework_detector.build_dependency_index",
+        lambda *a, **k: pytest.fail("manifests were parsed again"),
+    )
+
+    frameworks = detect_frameworks(str(monorepo), index=index)
+
+    assert "Spring Boot" in frameworks
+    assert "Echo" in frameworks
+
+
+def test_needle_table_returns_declared_needles_once_in_mapping_order(monorepo):
+    index = build_dependency_index(monorepo)
+    table = NeedleTable(
+        "java",
+        {"hibernate": "Hibernate", "spring-boot": "Spring Boot", "spring-boot-starter": "Spring Boot"},
+    )
+
+    assert table.find(index) == [
+        ("spring-boot", "Spring Boot"),
+        ("spring-boot-starter", "Spring Boot"),
+    ]
+    assert NeedleTable("python", {"Email_Validator": 1, "email-validator": 2}).find(index) == [
+        ("Email_Validator", 1)
+    ]
+
+
+def test_dependency_skill_hits_visit_only_declared_dependencies(monorepo):
+    index = build_dependency_index(monorepo)
+
+    hits = {dep: n for dep, _, _, n in iter_dependency_skill_hits(index, ["javascript", "python"])}
+
+    assert hits == {"express": 1, "typescript": 1, "email-validator": 1}
@@ -0,0 +1,112 @@
+import subprocess
+
+import pytest
+
+from artifactminer.RepositoryIntelligence.git_runner import GitBudget, RepoGitBudget
+from artifactminer.RepositoryIntelligence.object_reader import (
+    GitObjectReader,
+    read_repo_text,
+)
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def manifest_repo(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "web").mkdir(parents=True)
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "dev@example.com")
+    _git(repo, "config", "user.name", "Dev")
+    (repo / "requirements.txt").write_text("fastapi\nsqlalchemy\n")
+    (repo / "web" / "package.json").write_text('{"dependencies": {"react": "^18"}}')
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "init")
+    return repo
+
+
+def test_reads_blobs_from_head_not_working_tree(manifest_repo):
+    (manifest_repo / "requirements.txt").write_text("django\n")
+
+    with GitObjectReader(manifest_repo) as reader:
+        assert reader.read_text("requirements.txt") == "fastapi\nsqlalchemy\n"
+        assert "react" in reader.read_text("web/package.json")
+        assert reader.blob_size("requirements.txt") == len("fastapi\nsqlalchemy\n")
+
+
+def test_missing_paths_and_trees_return_none(manifest_repo):
+    with GitObjectReader(manifest_repo) as reader:
+        assert reader.read_bytes("pom.xml") is None
+        assert reader.read_bytes("web") is None
+        assert reader.blob_size("web") is None
+        # the pipe stays usable after a miss
+        assert reader.read_text("requirements.txt").startswith("fastapi")
+
+
+def test_lru_evicts_oldest_blob(manifest_repo):
+    with GitObjectReader(manifest_repo, cache_entries=1) as reader:
+        reader.read_bytes("requirements.txt")
+        reader.read_bytes("web/package.json")
+
+        assert list(reader._cache) == ["HEAD:web/package.json"]
+
+
+def test_iter_tree_lists_blobs_with_sizes(manifest_repo):
+    with GitObjectReader(manifest_repo) as reader:
+        entries = {entry.path: entry.size for entry in reader.iter_tree()}
+
+    assert entries == {
+        "requirements.txt": len("fastapi\nsqlalchemy\n"),
+        "web/package.json": len('{"dependencies": {"react": "^18"}}'),
+    }
+
+
+def test_spent_budget_skips_reads(manifest_repo):
+    budget = RepoGitBudget(GitBudget(repo_max_bytes=0))
+
+    with GitObjectReader(manifest_repo, budget=budget) as reader:
+        assert reader.read_bytes("requirements.txt") is None
+
+    assert budget.partial is True
+
+
+def test_read_repo_text_falls_back_to_disk(tmp_path, manifest_repo):
+    (manifest_repo / "untracked.txt").write_text("local only")
+    plain_dir = tmp_path / "plain"
+    plain_dir.mkdir()
+    (plain_dir / "go.mod").write_text("module example.com/app\n")
+
+    with GitObjectReader(manifest_repo) as reader:
+        assert read_repo_text(manifest_repo, "untracked.txt", reader) == "local only"
+    with GitObjectReader(plain_dir) as reader:
+        assert read_repo_text(plain_dir, "go.mod", reader).startswith("module")
+    assert read_repo_text(plain_dir, "missing.txt") is None
+
+
+def test_hung_cat_file_is_killed_at_the_call_deadline(manifest_repo, monkeypatch):
+    import time
+
+    from artifactminer.RepositoryIntelligence import object_reader
+
+    spawned = []
+    real_popen = subprocess.Popen
+
+    def hung_popen(argv, **kwargs):
+        # A cat-file that accepts requests but never answers
+        proc = real_popen(["sleep", "30"], **kwargs)
+        spawned.append(proc)
+        return proc
+
+    monkeypatch.setattr(object_reader.subprocess, "Popen", hung_popen)
+    budget = RepoGitBudget(GitBudget(call_timeout=0.2))
+
+    started = time.monotonic()
+    with GitObjectReader(manifest_repo, budget=budget) as reader:
+        assert reader.read_bytes("requirements.txt") is None
+        assert reader.read_bytes("web/package.json") is None  # not respawned
+
+    assert time.monotonic() - started < 5
+    assert budget.partial is True
+    assert len(spawned) == 1 and spawned[0].poll() is not None
@@ -0,0 +1,107 @@
+import subprocess
+
+import pytest
+
+from artifactminer.RepositoryIntelligence.repo_tree import RepoTreeSnapshot
+from artifactminer.skills.signals.infra_signals import get_infra_signals
+from artifactminer.skills.signals.language_signals import count_files_by_ext
+
+
+@pytest.fixture
+def sample_tree(tmp_path):
+    root = tmp_path / "repo"
+    for rel in [
+        "README.md",
+        "Dockerfile",
+        "services/api/Dockerfile",
+        "src/app.py",
+        "src/app.test.js",
+        "tests/test_app.py",
+        ".github/workflows/ci.yml",
+        ".github/workflows/nested/skip.yml",
+        ".git/config",
+    ]:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    (root / "docs").mkdir()
+    return root
+
+
+def test_scan_prunes_vcs_metadata_and_indexes_paths(sample_tree):
+    tree = RepoTreeSnapshot.scan(sample_tree)
+
+    assert not any(rel.startswith(".git/") for rel in tree)
+    assert tree.with_name("Dockerfile") == ["Dockerfile", "services/api/Dockerfile"]
+    assert tree.with_suffix(".PY") == ["src/app.py", "tests/test_app.py"]
+    assert tree.is_dir("docs") and tree.exists("docs")
+    assert tree.is_dir("services/api")
+    assert tree.is_file("src\\app.py")
+
+
+def test_match_name_matches_rglob_semantics(sample_tree):
+    tree = RepoTreeSnapshot.scan(sample_tree)
+
+    for pattern in ["test_*.py", "*.test.js", "*.yml", "Dockerfile", "*.md"]:
+        expected = sorted(
+            str(p.relative_to(sample_tree))
+            for p in sample_tree.rglob(pattern)
+            if p.is_file() and ".git" not in p.relative_to(sample_tree).parts
+        )
+        assert tree.match_name(pattern) == expected, pattern
+
+
+def test_under_and_children_use_directory_prefix(sample_tree):
+    tree = RepoTreeSnapshot.scan(sample_tree)
+
+    assert tree.under(".github/workflows") == [
+        ".github/workflows/ci.yml",
+        ".github/workflows/nested/skip.yml",
+    ]
+    assert tree.children(".github/workflows") == [".github/workflows/ci.yml"]
+    assert tree.under("src/app") == []
+
+
+def test_from_git_lists_tracked_and_untracked_files(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    (repo / ".gitignore").write_text("build/\n")
+    (repo / "main.go").write_text("package main\n")
+    (repo / "build").mkdir()
+    (repo / "build" / "out.bin").write_text("x")
+
+    tree = RepoTreeSnapshot.from_git(repo)
+
+    assert tree.files == (".gitignore", "main.go")
+
+
+def test_detectors_share_one_snapshot(sample_tree, monkeypatch):
+    tree = RepoTreeSnapshot.scan(sample_tree)
+    monkeypatch.setattr(
+        RepoTreeSnapshot,
+        "scan",
+        classmethod(lambda cls, *a, **k: pytest.fail("detector rescanned the tree")),
+    )
+
+    infra = get_infra_signals(str(sample_tree), tree=tree)
+    counts = count_files_by_ext(str(sample_tree), tree=tree)
+
+    assert {d["path"] for d in infra["docker"]} == {"Dockerfile", "services/api/Dockerfile"}
+    assert infra["summary"]["ci_cd_tools"] == ["GitHub Actions"]
+    assert counts[".py"] == 2
+
+
+def test_empty_snapshot_is_shared_not_rescanned(tmp_path, monkeypatch):
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    tree = RepoTreeSnapshot.scan(empty)
+    monkeypatch.setattr(
+        RepoTreeSnapshot,
+        "scan",
+        classmethod(lambda cls, *a, **k: pytest.fail("detector rescanned the tree")),
+    )
+
+    assert len(tree) == 0 and tree
+    get_infra_signals(str(empty), tree=tree)
+    assert count_files_by_ext(str(empty), tree=tree) == {}
@@ -0,0 +1,158 @@
+"""Serialization time and wire size of a large portfolio payload.
+
+Not collected by pytest; run directly:
+
+    python tests/api/bench_portfolio_payload.py [--projects 200] [--repeat 20]
+
+Seeds a fresh database with one portfolio of ``--projects`` projects (each
+with evidence, resume items, summaries and skills), assembles the
+``GET /portfolio/{id}`` fields the way the endpoint does, then times:
+
+- validating the response tree, which ``model_construct`` skips;
+- serializing it with pydantic-core, orjson and the stdlib ``json`` module;
+
+and reports the payload size raw and gzipped at the middleware's level.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import sessionmaker
+
+from artifactminer.api.portfolio import _assemble_portfolio
+from artifactminer.api.responses import DEFAULT_GZIP_COMPRESS_LEVEL, orjson
+from artifactminer.api.schemas import PortfolioDisplayResponse, RepresentationPreferences
+from artifactminer.db.database import Base, create_sqlite_engine
+from artifactminer.db.models import (
+    ProjectEvidence,
+    ProjectSkill,
+    Question,
+    RepoStat,
+    ResumeItem,
+    Skill,
+    UploadedZip,
+    UserAIntelligenceSummary,
+    UserAnswer,
+    UserRepoStat,
+)
+
+PORTFOLIO_ID = "bench-portfolio"
+EXTRACTION_ROOT = "/bench/extracted"
+
+
+def seed(Session, projects: int) -> None:
+    start = datetime(2020, 1, 1)
+    with Session() as db:
+        db.add(Question(id=1, key="email", question_text="Email?", order=1, required=True))
+        db.add(UserAnswer(question_id=1, answer_text="bench@example.com", answered_at=start))
+        db.add(
+            UploadedZip(
+                filename="bench.zip",
+                path="/bench/bench.zip",
+                portfolio_id=PORTFOLIO_ID,
+                extraction_path=EXTRACTION_ROOT,
+            )
+        )
+        skills = [Skill(name=f"Skill {n}", category=f"Category {n % 5}") for n in range(40)]
+        db.add_all(skills)
+        db.flush()
+        for n in range(projects):
+            path = f"{EXTRACTION_ROOT}/project-{n}"
+            repo = RepoStat(
+                project_name=f"project-{n}",
+                project_path=path,
+                extraction_root=EXTRACTION_ROOT,
+                portfolio_id=PORTFOLIO_ID,
+                languages=["Python", "TypeScript", "SQL"],
+                frameworks=["FastAPI", "React"],
+                first_commit=start + timedelta(days=n),
+                last_commit=start + timedelta(days=n + 90),
+                ranking_score=n / projects,
+                health_score=0.8,
+            )
+            db.add(repo)
+            db.flush()
+            db.add(UserRepoStat(project_name=repo.project_name, project_path=path, user_role="Lead"))
+            db.add_all(
+                ProjectSkill(repo_stat_id=repo.id, skill_id=skills[(n + k) % 40].id, proficiency=0.6)
+                for k in range(10)
+            )
+            db.add_all(
+                ProjectEvidence(repo_stat_id=repo.id, type="metric", content=f"Improved metric {k} " * 8,
+                                source="CI", date=(start + timedelta(days=n + k)).date())
+                for k in range(5)
+            )
+            db.add_all(
+                ResumeItem(repo_stat_id=repo.id, title=f"Shipped feature {k}",
+                           content="Designed and delivered a feature end to end. " * 4, category="Backend")
+                for k in range(3)
+            )
+            db.add(
+                UserAIntelligenceSummary(repo_path=path, user_email="bench@example.com",
+                                         summary_text="Contributed core services. " * 20,
+                                         generated_at=start + timedelta(days=n))
+            )
+        db.commit()
+
+
+def timed(fn, repeat: int) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        seed(Session, args.projects)
+        with Session() as db:
+            assemble_ms, fields = timed(
+                lambda: _assemble_portfolio(db, PORTFOLIO_ID, RepresentationPreferences()),
+                args.repeat,
+            )
+        engine.dispose()
+
+    constructed = PortfolioDisplayResponse.model_construct(**fields)
+    plain = constructed.model_dump(mode="python")
+    rows = [
+        ("assemble fields (DB + model_construct)", assemble_ms),
+        # What model_construct saves: validating the same tree from plain data
+        ("validate (skipped by model_construct)", timed(lambda: PortfolioDisplayResponse.model_validate(plain), args.repeat)[0]),
+        ("pydantic-core model_dump_json", timed(constructed.model_dump_json, args.repeat)[0]),
+        ("stdlib json + jsonable_encoder", timed(lambda: json.dumps(jsonable_encoder(constructed)), args.repeat)[0]),
+    ]
+    if orjson is not None:
+        rows.append(
+            ("orjson of model_dump()", timed(lambda: orjson.dumps(constructed.model_dump()), args.repeat)[0])
+        )
+
+    payload = constructed.model_dump_json().encode()
+    compressed = gzip.compress(payload, compresslevel=DEFAULT_GZIP_COMPRESS_LEVEL)
+
+    print(f"{args.projects} projects, best of {args.repeat}")
+    for label, ms in rows:
+        print(f"  {label:<40} {ms:>8.2f} ms")
+    print(f"  {'payload':<40} {len(payload) / 1024:>8.1f} KiB")
+    print(f"  {'payload gzipped':<40} {len(compressed) / 1024:>8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
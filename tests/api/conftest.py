@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 
 from artifactminer.api.app import create_app
 from artifactminer.api import local_llm
-from artifactminer.db import Base, get_db, seed_questions, seed_repo_stats
+from artifactminer.db import Base, get_db_engine, seed_questions, seed_repo_stats
 
 
 @pytest.fixture(scope="function")
@@ -21,15 +21,8 @@ def client():
     
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-    
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
     
     # Seed questions for the test database
     db = TestingSessionLocal()
@@ -291,6 +291,11 @@ class TestAnalyzeWithRealRepos:
                 user_contributions,
                 consent_level,
                 user_stats=None,
+                git_budget=None,
+                object_reader=None,
+                repo_tree=None,
+                dependency_index=None,
+                profiler=None,
             ):  # noqa: ARG002
                 return DeepAnalysisResult(
                     skills=[],
@@ -303,7 +308,7 @@ class TestAnalyzeWithRealRepos:
                     ],
                 )
 
-        async def fake_generate_summaries_for_ranked(db, top=3, extraction_path=None):  # noqa: ARG001
+        async def fake_generate_summaries_for_ranked(db, top=3, extraction_path=None, consent=None):  # noqa: ARG001
             return []
 
         monkeypatch.setattr(analyze_module, "DeepRepoAnalyzer", FakeAnalyzer)
@@ -348,6 +353,57 @@ class TestAnalyzeWithRealRepos:
             resume_items = project_detail.json()["resume_items"]
             assert all(item.get("category") != "Deep Insight" for item in resume_items)
 
+    def test_analyze_returns_stage_timings_when_requested(
+        self, client, tmp_path, monkeypatch, mock_projects_zip
+    ):
+        """include_timings adds run-wide and per-repo stage timings to the response."""
+        if not mock_projects_zip.exists():
+            pytest.skip("mock_projects.zip not found")
+
+        uploads_dir, _ = _setup_test_dirs(monkeypatch, tmp_path)
+
+        from artifactminer.api import zip as zip_module
+
+        monkeypatch.setattr(zip_module, "UPLOADS_DIR", uploads_dir)
+
+        async def fake_generate_summaries_for_ranked(db, top=3, extraction_path=None, consent=None):  # noqa: ARG001
+            return []
+
+        monkeypatch.setattr(
+            analyze_module,
+            "generate_summaries_for_ranked",
+            fake_generate_summaries_for_ranked,
+        )
+
+        files = {
+            "file": (
+                "mock_projects.zip",
+                open(mock_projects_zip, "rb"),
+                "application/zip",
+            )
+        }
+        zip_id = client.post("/zip/upload", files=files).json()["zip_id"]
+
+        _seed_user_email(client)
+        _set_consent(client, "none")
+
+        untimed = client.post(f"/analyze/{zip_id}")
+        assert untimed.status_code == 200
+        assert untimed.json()["timings"] is None
+
+        response = client.post(f"/analyze/{zip_id}", json={"include_timings": True})
+        assert response.status_code == 200
+        data = response.json()
+        timings = data["timings"]
+
+        assert {"extraction", "discovery", "ranking", "summaries"} <= set(timings["stages"])
+        assert timings["stages"]["discovery"]["count"] == data["repos_found"]
+        assert timings["stages"]["extraction"]["bytes"] > 0
+        successful = [repo for repo in data["repos_analyzed"] if not repo.get("error")]
+        for repo in successful:
+            repo_stages = timings["repos"][Path(repo["project_path"]).name]
+            assert {"getRepoStats", "deep_analysis", "signal.skills"} <= set(repo_stages)
+
 
 class TestAnalyzeHelperFunctions:
     """Tests for helper functions in analyze module."""
@@ -15,3 +15,10 @@ def test_analyze_repo(client):
     formatted_user_stats = f"UserRepoStat(total_commits={data['user_stats']['total_commits']}, user_commit_percentage={data['user_stats']['userStatspercentages']})"
     print("User Repo Stats:")
     print(formatted_user_stats)
+
+
+def test_analyze_repo_without_email_answer_is_rejected(client):
+    root = Path(__file__).resolve().parents[2]
+    response = client.post("/repos/analyze", params={"repo_path": root})
+    assert response.status_code == 400
+    assert "email is required" in response.json()["detail"]
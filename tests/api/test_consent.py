@@ -116,3 +116,19 @@ def test_invalid_consent_level(client):
     response = client.put("/consent", json={"consent_level": "invalid_level"})
 
     assert response.status_code == 422
+
+
+def test_put_consent_invalidates_cached_snapshot(client):
+    from artifactminer.db import get_db, get_db_engine, load_consent_snapshot
+
+    db = next(get_db(client.app.dependency_overrides[get_db_engine]()))
+    try:
+        assert load_consent_snapshot(db).allows_llm is False
+
+        client.put("/consent", json={"consent_level": "cloud"})
+
+        snapshot = load_consent_snapshot(db)
+        assert snapshot.consent_level == "cloud"
+        assert snapshot.allows_llm is True
+    finally:
+        db.close()
@@ -0,0 +1,175 @@
+"""Tests for keyset pagination and fields= projection on list endpoints."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+
+import pytest
+
+from artifactminer.db import (
+    ProjectEvidence,
+    ProjectSkill,
+    RepoStat,
+    ResumeItem,
+    Skill,
+    UserAIntelligenceSummary,
+    UserRepoStat,
+    get_db,
+    get_db_engine,
+)
+
+EMAIL = "student@example.com"
+
+
+@pytest.fixture
+def seeded(client):
+    db = next(get_db(client.app.dependency_overrides[get_db_engine]()))
+    projects = db.query(RepoStat).order_by(RepoStat.id).all()
+    # Same timestamp everywhere, so only the id tiebreak separates rows
+    stamp = datetime(2024, 5, 1, tzinfo=UTC).replace(tzinfo=None)
+    projects[1].last_commit = None
+
+    skills = [Skill(name=f"Skill {n}", category="Tools") for n in range(5)]
+    db.add_all(skills)
+    db.flush()
+    for project in projects[:2]:
+        db.add_all(
+            ProjectSkill(repo_stat_id=project.id, skill_id=skill.id, proficiency=0.5)
+            for skill in skills[:3]
+        )
+        db.add(
+            UserRepoStat(
+                project_name=project.project_name,
+                project_path=project.project_path,
+                user_role="Maintainer",
+            )
+        )
+    for project in projects:
+        db.add_all(
+            ResumeItem(title=f"{project.project_name} {n}", content="Did things",
+                       repo_stat_id=project.id, created_at=stamp)
+            for n in range(2)
+        )
+    db.add(ResumeItem(title="Orphan", content="No project"))
+    db.add_all(
+        UserAIntelligenceSummary(repo_path=f"/repo/{n}", user_email=EMAIL,
+                                 summary_text=f"Summary {n}", generated_at=stamp)
+        for n in range(5)
+    )
+    db.add_all(
+        ProjectEvidence(repo_stat_id=projects[0].id, type="metric", content=f"Metric {n}",
+                        date=date(2024, 1, n + 1), created_at=stamp)
+        for n in range(4)
+    )
+    db.commit()
+    project_ids = [project.id for project in projects]
+    db.close()
+    return project_ids
+
+
+def _walk(client, url, limit, **params):
+    """Every item of ``url``, fetched ``limit`` at a time by following the cursor."""
+    items, cursor, pages = [], None, 0
+    while True:
+        query = {**params, "limit": limit}
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get(url, params=query)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page) <= limit
+        items.extend(page)
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return items, pages
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        ("/projects", {}),
+        ("/resume", {}),
+        ("/summaries", {"user_email": EMAIL}),
+        ("/skills", {"include_project_count": True}),
+        ("/skills/chronology", {}),
+    ],
+)
+def test_cursor_walk_matches_unpaged_list(client, seeded, path, params):
+    full = client.get(path, params=params)
+    assert full.status_code == 200
+    assert "X-Next-Cursor" not in full.headers
+
+    walked, pages = _walk(client, path, 2, **params)
+
+    assert walked == full.json()
+    assert pages == -(-len(walked) // 2)
+
+
+def test_evidence_cursor_walk(client, seeded):
+    path = f"/projects/{seeded[0]}/evidence"
+    walked, pages = _walk(client, path, 3)
+
+    assert [item["content"] for item in walked] == [f"Metric {n}" for n in range(4)]
+    assert pages == 2
+
+
+def test_resume_orders_items_without_last_commit_last(client, seeded):
+    walked, _ = _walk(client, "/resume", 3)
+    undated = {"Orphan", "Legacy Data Pipeline 0", "Legacy Data Pipeline 1"}
+
+    assert {item["title"] for item in walked[-3:]} == undated
+    assert walked[-3]["title"] == "Orphan"  # newest item first among ties
+    assert {item["role"] for item in walked} == {"Maintainer", None}
+
+
+def test_fields_projects_only_requested_columns(client, seeded):
+    response = client.get("/projects", params={"fields": "project_name", "limit": 2})
+
+    assert response.status_code == 200
+    assert [set(item) for item in response.json()] == [{"id", "project_name"}] * 2
+    assert "X-Next-Cursor" in response.headers
+
+
+def test_fields_on_resume_computes_role_only_when_asked(client, seeded):
+    titles = client.get("/resume", params={"fields": "title"}).json()
+    roles = client.get("/resume", params={"fields": "title,role"}).json()
+
+    assert set(titles[0]) == {"id", "title"}
+    assert [item["title"] for item in roles] == [item["title"] for item in titles]
+    assert {item["role"] for item in roles} == {"Maintainer", None}
+
+
+def test_fields_on_chronology_and_summaries(client, seeded):
+    chronology = client.get("/skills/chronology", params={"fields": "skill,date"}).json()
+    summaries = client.get(
+        "/summaries", params={"user_email": EMAIL, "fields": "summary_text"}
+    ).json()
+
+    assert set(chronology[0]) == {"date", "skill"}
+    assert set(summaries[0]) == {"id", "summary_text"}
+
+
+def test_unknown_field_is_rejected(client, seeded):
+    response = client.get("/skills", params={"fields": "name,password"})
+
+    assert response.status_code == 422
+    assert "password" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "WzFd"])
+def test_malformed_cursor_is_rejected(client, seeded, cursor):
+    # "WzFd" decodes to [1], one key short of the projects sort
+    response = client.get("/projects", params={"limit": 1, "cursor": cursor})
+
+    assert response.status_code == 400
+
+
+def test_projected_values_serialize_like_full_items(client, seeded):
+    full = client.get("/projects").json()
+    projected = client.get("/projects", params={"fields": "first_commit,languages"}).json()
+
+    assert projected == [
+        {"id": item["id"], "languages": item["languages"], "first_commit": item["first_commit"]}
+        for item in full
+    ]
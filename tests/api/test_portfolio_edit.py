@@ -18,7 +18,7 @@ from artifactminer.db import (
     RepresentationPrefs,
     UploadedZip,
     UserAnswer,
-    get_db,
+    get_db_engine,
 )
 
 
@@ -33,15 +33,8 @@ def client_with_portfolio_data():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     now = datetime.now(UTC).replace(tzinfo=None)
     db = TestingSessionLocal()
@@ -14,15 +14,17 @@ from artifactminer.db import (
     Base,
     Consent,
     ProjectEvidence,
+    ProjectSkill,
     Question,
     RepoStat,
     RepresentationPrefs,
     ResumeItem,
+    Skill,
     UploadedZip,
     UserAIntelligenceSummary,
     UserAnswer,
     UserRepoStat,
-    get_db,
+    get_db_engine,
 )
 
 
@@ -37,15 +39,8 @@ def client_with_portfolio_data():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     now = datetime.now(UTC).replace(tzinfo=None)
     db = TestingSessionLocal()
@@ -198,15 +193,8 @@ def test_portfolio_generate_requires_analyzed_zips():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     db = TestingSessionLocal()
     now = datetime.now(UTC).replace(tzinfo=None)
@@ -235,15 +223,8 @@ def test_portfolio_generate_missing_email_returns_400():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     db = TestingSessionLocal()
     now = datetime.now(UTC).replace(tzinfo=None)
@@ -271,15 +252,8 @@ def test_portfolio_generate_uses_strict_path_boundaries():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     now = datetime.now(UTC).replace(tzinfo=None)
     db = TestingSessionLocal()
@@ -370,15 +344,8 @@ def client_with_complete_portfolio():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     now = datetime.now(UTC).replace(tzinfo=None)
     db = TestingSessionLocal()
@@ -566,15 +533,8 @@ def test_get_portfolio_no_analyzed_zips():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     now = datetime.now(UTC).replace(tzinfo=None)
     db = TestingSessionLocal()
@@ -632,15 +592,8 @@ def test_get_portfolio_without_role_and_evidence():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     now = datetime.now(UTC).replace(tzinfo=None)
     db = TestingSessionLocal()
@@ -688,3 +641,65 @@ def test_get_portfolio_without_role_and_evidence():
         assert project["evidence"] == []
     finally:
         app.dependency_overrides.clear()
+
+
+def test_portfolio_skills_chronology_covers_projects_with_extraction_root():
+    """Projects stamped with extraction_root keep their skills in the chronology."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    app = create_app()
+    app.dependency_overrides[get_db_engine] = lambda: engine
+
+    now = datetime.now(UTC).replace(tzinfo=None)
+    db = TestingSessionLocal()
+    db.add(Question(id=1, key="email", question_text="Email?", order=1, required=True))
+    db.add(UserAnswer(question_id=1, answer_text="student@example.com", answered_at=now))
+    db.add(Consent(id=1, consent_level="no_llm", accepted_at=now))
+    db.add(
+        UploadedZip(
+            id=50,
+            filename="rooted.zip",
+            path="/uploads/rooted.zip",
+            portfolio_id="portfolio-rooted",
+            extraction_path=".extracted/50",
+        )
+    )
+    for repo_id, name, root, skill in (
+        (300, "rooted", ".extracted/50", "Rust"),  # analyzed with extraction_root
+        (301, "legacy", None, "Go"),  # analyzed before the column existed
+    ):
+        db.add(
+            RepoStat(
+                id=repo_id,
+                project_name=name,
+                project_path=f".extracted/50/{name}",
+                portfolio_id="portfolio-rooted",
+                extraction_root=root,
+                ranking_score=80.0,
+                first_commit=now - timedelta(days=repo_id - 290),
+                last_commit=now,
+            )
+        )
+        db.add(Skill(id=repo_id, name=skill, category="Language"))
+        db.add(ProjectSkill(repo_stat_id=repo_id, skill_id=repo_id, proficiency=0.5))
+    db.commit()
+    db.close()
+
+    client = TestClient(app)
+    try:
+        resp = client.get("/portfolio/portfolio-rooted")
+
+        assert resp.status_code == 200
+        chronology = resp.json()["skills_chronology"]
+        assert sorted((item["skill"], item["project"]) for item in chronology) == [
+            ("Go", "legacy"),
+            ("Rust", "rooted"),
+        ]
+    finally:
+        app.dependency_overrides.clear()
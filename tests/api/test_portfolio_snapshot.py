@@ -0,0 +1,138 @@
+"""Tests for materialized portfolio snapshots, ETags, and invalidation."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from artifactminer.api.app import create_app
+from artifactminer.db import (
+    Base,
+    Consent,
+    PortfolioSnapshot,
+    Question,
+    RepoStat,
+    UploadedZip,
+    UserAnswer,
+    get_db_engine,
+)
+
+
+@pytest.fixture(scope="function")
+def seeded():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    app = create_app()
+    app.dependency_overrides[get_db_engine] = lambda: engine
+
+    now = datetime.now(UTC).replace(tzinfo=None)
+    db = TestingSessionLocal()
+    db.add(Question(id=1, key="email", question_text="Email?", order=1, required=True))
+    db.add(UserAnswer(question_id=1, answer_text="student@example.com", answered_at=now))
+    db.add(Consent(id=1, consent_level="no_llm", accepted_at=now))
+    for zip_id, portfolio_id, name in ((10, "portfolio-a", "Alpha"), (11, "portfolio-b", "Beta")):
+        db.add(
+            UploadedZip(
+                id=zip_id,
+                filename=f"{name}.zip",
+                path=f"/uploads/{name}.zip",
+                portfolio_id=portfolio_id,
+                extraction_path=f"/extracted/{zip_id}",
+            )
+        )
+        db.add(
+            RepoStat(
+                id=zip_id,
+                project_name=name,
+                project_path=f"/extracted/{zip_id}/{name.lower()}",
+                portfolio_id=portfolio_id,
+                extraction_root=f"/extracted/{zip_id}",
+                ranking_score=90.0,
+                first_commit=now - timedelta(days=30),
+                last_commit=now - timedelta(days=1),
+            )
+        )
+    db.commit()
+    db.close()
+
+    yield TestClient(app), TestingSessionLocal
+    app.dependency_overrides.clear()
+
+
+def _snapshot_ids(SessionLocal):
+    with SessionLocal() as db:
+        return sorted(row.portfolio_id for row in db.query(PortfolioSnapshot))
+
+
+def test_portfolio_is_served_from_snapshot_with_etag(seeded):
+    client, SessionLocal = seeded
+
+    first = client.get("/portfolio/portfolio-a")
+    etag = first.headers["etag"]
+    generated = client.post("/portfolio/generate", json={"portfolio_id": "portfolio-a"})
+    not_modified = client.get("/portfolio/portfolio-a", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.json()["projects"][0]["project_name"] == "Alpha"
+    generated_body, first_body = generated.json(), first.json()
+    assert generated_body.pop("generated_at") >= first_body.pop("generated_at")
+    assert generated_body == first_body  # same snapshot
+    assert generated.headers["etag"] == etag
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert _snapshot_ids(SessionLocal) == ["portfolio-a"]
+
+
+def test_generated_at_is_stamped_per_response_not_cached(seeded):
+    client, SessionLocal = seeded
+    client.get("/portfolio/portfolio-a")
+    with SessionLocal() as db:
+        assert "generated_at" not in db.query(PortfolioSnapshot).one().payload_json
+
+    before = datetime.now(UTC).replace(tzinfo=None)
+    generated = client.post("/portfolio/generate", json={"portfolio_id": "portfolio-a"})
+
+    assert datetime.fromisoformat(generated.json()["generated_at"]) >= before - timedelta(seconds=1)
+    assert _snapshot_ids(SessionLocal) == ["portfolio-a"]
+
+
+def test_edits_invalidate_only_the_touched_portfolio(seeded):
+    client, SessionLocal = seeded
+    etag_a = client.get("/portfolio/portfolio-a").headers["etag"]
+    client.get("/portfolio/portfolio-b")
+
+    created = client.post(
+        "/projects/10/evidence",
+        json={"type": "metric", "content": "Cut p95 latency by 40%"},
+    )
+    assert created.status_code == 201
+    assert _snapshot_ids(SessionLocal) == ["portfolio-b"]
+
+    rebuilt = client.get("/portfolio/portfolio-a", headers={"If-None-Match": etag_a})
+    assert rebuilt.status_code == 200
+    assert rebuilt.headers["etag"] != etag_a
+    assert rebuilt.json()["projects"][0]["evidence"][0]["content"] == "Cut p95 latency by 40%"
+
+    saved = client.put("/views/portfolio-b/prefs", json={"project_order": [11]})
+    assert saved.status_code == 200
+    assert _snapshot_ids(SessionLocal) == ["portfolio-a"]
+
+
+def test_consent_change_invalidates_every_snapshot(seeded):
+    client, SessionLocal = seeded
+    client.get("/portfolio/portfolio-a")
+    client.get("/portfolio/portfolio-b")
+
+    client.put("/consent", json={"consent_level": "cloud"})
+
+    assert _snapshot_ids(SessionLocal) == []
+    assert client.get("/portfolio/portfolio-a").json()["consent_level"] == "cloud"
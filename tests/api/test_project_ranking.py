@@ -1,5 +1,11 @@
 import unittest.mock
 
+from artifactminer.RepositoryIntelligence.git_runner import GitResult
+
+
+def _git_log_result(stdout: str) -> GitResult:
+    return GitResult(args=["log", "--all", "--format=%aE"], stdout=stdout, returncode=0)
+
 
 def test_project_ranking_returns_ranked_list(client, tmp_path):
     """Test that the endpoint returns ranked projects."""
@@ -7,10 +13,12 @@ def test_project_ranking_returns_ranked_list(client, tmp_path):
     project_dir.mkdir()
     (project_dir / ".git").mkdir()
 
-    mock_output = """   10\tUser One <user@example.com>
-   5\tUser Two <other@example.com>"""
+    mock_output = "user@example.com\n" * 10 + "other@example.com\n" * 5
 
-    with unittest.mock.patch("subprocess.check_output", return_value=mock_output):
+    with unittest.mock.patch(
+        "artifactminer.helpers.project_ranker.run_git",
+        return_value=_git_log_result(mock_output),
+    ):
         response = client.get(
             "/projects/ranking",
             params={"projects_dir": str(tmp_path), "user_email": "user@example.com"},
@@ -58,14 +66,14 @@ def test_project_ranking_multiple_projects(client, tmp_path):
     project2.mkdir()
     (project2 / ".git").mkdir()
 
-    def mock_shortlog(cmd, cwd, **kwargs):
-        if "project-high" in cwd:
-            return "   20\tUser <user@example.com>"
-        else:
-            return """   5\tUser <user@example.com>
-   15\tOther <other@example.com>"""
+    def mock_git_log(repo_path, args, **kwargs):
+        if "project-high" in str(repo_path):
+            return _git_log_result("user@example.com\n" * 20)
+        return _git_log_result("user@example.com\n" * 5 + "other@example.com\n" * 15)
 
-    with unittest.mock.patch("subprocess.check_output", side_effect=mock_shortlog):
+    with unittest.mock.patch(
+        "artifactminer.helpers.project_ranker.run_git", side_effect=mock_git_log
+    ):
         response = client.get(
             "/projects/ranking",
             params={"projects_dir": str(tmp_path), "user_email": "user@example.com"},
@@ -196,3 +196,13 @@ def test_project_role_upsert_not_found(client):
     )
     assert response.status_code == 404
     assert response.json()["detail"] == "Project not found"
+
+
+def test_get_projects_gzipped_when_accepted(client):
+    """Large responses are gzipped for clients that accept it; small ones are not."""
+    response = client.get("/projects", headers={"Accept-Encoding": "gzip"})
+    health = client.get("/health", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 4
+    assert "content-encoding" not in health.headers
@@ -1,6 +1,6 @@
 from contextlib import contextmanager
 
-from artifactminer.db import Question, UserAnswer, get_db
+from artifactminer.db import Question, UserAnswer, get_db, get_db_engine
 
 
 def _valid_answers_payload(**overrides):
@@ -19,9 +19,8 @@ def _valid_answers_payload(**overrides):
 
 @contextmanager
 def _db_session(client):
-    """Yield the current test DB session from the FastAPI dependency override."""
-    override = client.app.dependency_overrides[get_db]
-    generator = override()
+    """Yield a session on the test DB the FastAPI engine override points at."""
+    generator = get_db(client.app.dependency_overrides[get_db_engine]())
     db = next(generator)
     try:
         yield db
@@ -8,7 +8,7 @@ from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
 from artifactminer.api.app import create_app
-from artifactminer.db import Base, get_db, RepoStat, ResumeItem
+from artifactminer.db import Base, get_db_engine, RepoStat, ResumeItem
 
 
 @pytest.fixture(scope="function")
@@ -22,15 +22,8 @@ def client_with_data():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     # Seed test data
     db = TestingSessionLocal()
@@ -92,17 +85,9 @@ def client_empty():
         poolclass=StaticPool,
     )
     Base.metadata.create_all(bind=engine)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
 
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
     yield TestClient(app)
     app.dependency_overrides.clear()
 
@@ -118,15 +103,8 @@ def client_with_orphan_resume():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     db = TestingSessionLocal()
     resume_item = ResumeItem(
@@ -155,15 +133,8 @@ def client_with_soft_deleted_project():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     db = TestingSessionLocal()
     now = datetime.now(UTC).replace(tzinfo=None)
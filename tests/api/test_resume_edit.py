@@ -10,7 +10,7 @@ from fastapi.testclient import TestClient
 from artifactminer.api.app import create_app
 from artifactminer.db import (
     Base,
-    get_db,
+    get_db_engine,
     RepoStat,
     ResumeItem,
 )
@@ -27,15 +27,8 @@ def client_with_resume_item():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     db = TestingSessionLocal()
     now = datetime.now(UTC).replace(tzinfo=None)
@@ -116,15 +109,8 @@ def test_edit_resume_item_soft_deleted_project():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     db = TestingSessionLocal()
     now = datetime.now(UTC).replace(tzinfo=None)
@@ -11,7 +11,7 @@ from fastapi.testclient import TestClient
 from artifactminer.api.app import create_app
 from artifactminer.db import (
     Base,
-    get_db,
+    get_db_engine,
     RepoStat,
     ResumeItem,
     Question,
@@ -31,15 +31,8 @@ def client():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     # Seed test data
     db = TestingSessionLocal()
@@ -10,7 +10,7 @@ from fastapi.testclient import TestClient
 from artifactminer.api.app import create_app
 from artifactminer.db import (
     Base,
-    get_db,
+    get_db_engine,
     RepoStat,
     UserRepoStat,
     Skill,
@@ -32,15 +32,8 @@ def client_with_data():
     Base.metadata.create_all(bind=engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
-
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
 
     # Seed test data
     db = TestingSessionLocal()
@@ -167,17 +160,9 @@ def client_empty():
         poolclass=StaticPool,
     )
     Base.metadata.create_all(bind=engine)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
 
     app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_engine] = lambda: engine
     yield TestClient(app)
     app.dependency_overrides.clear()
 
@@ -204,6 +189,19 @@ def test_skills_chronology_returns_ordered_list(client_with_data):
     )
 
 
+def test_skills_chronology_first_use_only(client_with_data):
+    """first_use_only keeps each skill's earliest project, still oldest first."""
+    resp = client_with_data.get("/skills/chronology", params={"first_use_only": True})
+    assert resp.status_code == 200
+
+    assert [(item["skill"], item["project"]) for item in resp.json()] == [
+        ("Python", "OldProject"),
+        ("FastAPI", "NewProject"),
+    ]
+    # The ProjectSkill link wins over the user link on the same date
+    assert resp.json()[0]["proficiency"] == 0.7
+
+
 def test_skills_chronology_empty(client_empty):
     """Returns empty list when no data."""
     resp = client_empty.get("/skills/chronology")
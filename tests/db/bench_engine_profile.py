@@ -0,0 +1,96 @@
+"""Mixed read/write throughput of the SQLite engine profiles.
+
+Not collected by pytest; run directly:
+
+    python tests/db/bench_engine_profile.py [--seconds 5] [--writers 2] [--readers 6]
+
+Writers insert a RepoStat plus skills through ``persist_extracted_skills``
+(the analyze path); readers list live projects the way ``/projects`` does.
+Each profile gets a fresh database file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from artifactminer.db.database import SQLITE_PROFILES, Base, create_sqlite_engine
+from artifactminer.db.models import ProjectSkill, RepoStat
+from artifactminer.skills.models import ExtractedSkill
+from artifactminer.skills.persistence import persist_extracted_skills
+
+SKILLS = [ExtractedSkill(skill=f"Skill {i}", category="Bench", proficiency=0.5) for i in range(20)]
+
+
+def _write(Session) -> None:
+    with Session() as db:
+        repo = RepoStat(project_name="bench", project_path="/tmp/bench", languages=["Python"])
+        db.add(repo)
+        db.flush()
+        persist_extracted_skills(db, repo.id, SKILLS, commit=False)
+        db.commit()
+
+
+def _read(Session) -> None:
+    with Session() as db:
+        repos = (
+            db.query(RepoStat)
+            .filter(RepoStat.deleted_at.is_(None))
+            .order_by(RepoStat.id.desc())
+            .limit(50)
+            .all()
+        )
+        if repos:
+            db.query(ProjectSkill).filter(ProjectSkill.repo_stat_id == repos[0].id).all()
+
+
+def run_profile(name: str, seconds: float, writers: int, readers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", SQLITE_PROFILES[name])
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        counts = {"writes": 0, "reads": 0, "locked": 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+
+        def worker(op, key):
+            while time.perf_counter() < deadline:
+                try:
+                    op(Session)
+                    outcome = key
+                except OperationalError:  # "database is locked"
+                    outcome = "locked"
+                with lock:
+                    counts[outcome] += 1
+
+        threads = [threading.Thread(target=worker, args=(_write, "writes")) for _ in range(writers)]
+        threads += [threading.Thread(target=worker, args=(_read, "reads")) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+    return {key: value / seconds for key, value in counts.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=6)
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'writes/s':>10} {'reads/s':>10} {'locked/s':>10}")
+    for name in ("legacy", "default"):
+        result = run_profile(name, args.seconds, args.writers, args.readers)
+        print(f"{name:<10} {result['writes']:>10.1f} {result['reads']:>10.1f} {result['locked']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from artifactminer.db import AsyncSessionLocal, Base, Skill, async_engine_for
+from artifactminer.db import database
+from artifactminer.db.database import SQLiteProfile, create_sqlite_engine, get_async_db
+
+
+def _skill_names(async_engine):
+    async def read():
+        async with AsyncSessionLocal(bind=async_engine) as session:
+            return list(await session.scalars(select(Skill.name).order_by(Skill.name)))
+
+    return asyncio.run(read())
+
+
+def test_async_twin_reads_the_same_file_with_the_same_profile(tmp_path):
+    engine = create_sqlite_engine(
+        f"sqlite:///{tmp_path / 'app.db'}", SQLiteProfile(busy_timeout_ms=1234)
+    )
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(Skill(name="Python", category="Programming Languages"))
+        db.commit()
+
+    async_engine = async_engine_for(engine)
+
+    async def busy_timeout():
+        async with async_engine.connect() as conn:
+            return (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+
+    assert async_engine_for(engine) is async_engine
+    assert _skill_names(async_engine) == ["Python"]
+    assert asyncio.run(busy_timeout()) == 1234
+
+
+def test_async_twin_shares_a_static_pool_memory_database():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    async_engine = async_engine_for(engine)
+
+    async def write():
+        async with AsyncSessionLocal(bind=async_engine) as session:
+            session.add(Skill(name="Rust", category="Programming Languages"))
+            await session.commit()
+
+    # Each asyncio.run is a fresh event loop, as with TestClient requests
+    asyncio.run(write())
+    assert _skill_names(async_engine) == ["Rust"]
+    with sessionmaker(bind=engine)() as db:
+        assert db.scalars(select(Skill.name)).all() == ["Rust"]
+
+
+def test_get_async_db_opens_no_sync_session(monkeypatch):
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(Skill(name="Go", category="Programming Languages"))
+        db.commit()
+    monkeypatch.setattr(database, "SessionLocal", lambda: pytest.fail("sync session opened"))
+
+    async def read():
+        sessions = get_async_db(engine)
+        session = await anext(sessions)
+        try:
+            return list(await session.scalars(select(Skill.name)))
+        finally:
+            await sessions.aclose()
+
+    assert asyncio.run(read()) == ["Go"]
+
+
+def test_engine_override_redirects_sync_and_async_sessions():
+    from fastapi import Depends, FastAPI
+    from fastapi.testclient import TestClient
+
+    from artifactminer.db import get_db, get_db_engine
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(Skill(name="Elixir", category="Programming Languages"))
+        db.commit()
+
+    app = FastAPI()
+
+    @app.get("/sync")
+    def sync_names(db=Depends(get_db)):
+        return list(db.scalars(select(Skill.name)))
+
+    @app.get("/async")
+    async def async_names(db=Depends(get_async_db)):
+        return list(await db.scalars(select(Skill.name)))
+
+    app.dependency_overrides[get_db_engine] = lambda: engine
+    client = TestClient(app)
+
+    assert client.get("/sync").json() == ["Elixir"]
+    assert client.get("/async").json() == ["Elixir"]
@@ -0,0 +1,54 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from artifactminer.db import (
+    Base,
+    Consent,
+    ConsentSnapshot,
+    invalidate_consent_snapshot,
+    load_consent_snapshot,
+)
+
+
+def _session():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine)()
+
+
+def test_snapshot_is_read_once_until_invalidated():
+    engine, db = _session()
+    db.add(Consent(id=1, consent_level="local-llm", LLM_model="ollama"))
+    db.commit()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    first = load_consent_snapshot(db)
+    for _ in range(50):
+        assert load_consent_snapshot(db) is first
+    assert first == ConsentSnapshot(consent_level="local-llm", llm_model="ollama")
+    assert first.allows_llm
+    assert len(statements) == 1
+
+    db.get(Consent, 1).consent_level = "none"
+    db.commit()
+    assert load_consent_snapshot(db).allows_llm  # stale until a writer invalidates
+
+    invalidate_consent_snapshot()
+    assert load_consent_snapshot(db).consent_level == "none"
+
+
+def test_missing_row_yields_defaults_and_databases_are_cached_separately():
+    _, empty = _session()
+    _, other = _session()
+    other.add(Consent(id=1, consent_level="cloud"))
+    other.commit()
+
+    assert load_consent_snapshot(empty) == ConsentSnapshot()
+    assert load_consent_snapshot(empty).llm_model == "chatGPT"
+    assert load_consent_snapshot(other).consent_level == "cloud"
@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from artifactminer.db.database import (
+    SQLITE_PROFILES,
+    SQLiteProfile,
+    create_sqlite_engine,
+    sqlite_profile,
+)
+
+
+def _url(tmp_path):
+    return f"sqlite:///{tmp_path / 'app.db'}"
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_file_engine_applies_profile_pragmas(tmp_path):
+    engine = create_sqlite_engine(_url(tmp_path), SQLiteProfile(busy_timeout_ms=1234))
+
+    assert _pragma(engine, "journal_mode") == "wal"
+    assert _pragma(engine, "synchronous") == 1  # NORMAL
+    assert _pragma(engine, "busy_timeout") == 1234
+    assert _pragma(engine, "cache_size") == -64 * 1024
+    assert _pragma(engine, "temp_store") == 2  # MEMORY
+    assert engine.pool.size() == 8
+
+
+def test_memory_engine_skips_file_only_pragmas():
+    engine = create_sqlite_engine("sqlite:///:memory:", SQLiteProfile())
+
+    assert _pragma(engine, "journal_mode") == "memory"
+    assert _pragma(engine, "synchronous") == 1
+
+
+def test_without_profile_engine_keeps_driver_defaults(tmp_path):
+    engine = create_sqlite_engine(_url(tmp_path), profile=None)
+
+    assert _pragma(engine, "journal_mode") == "delete"
+
+
+def _count_during_exclusive_write(engine):
+    """Row count read by a second connection while another holds ``BEGIN EXCLUSIVE``."""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    writer = engine.raw_connection()
+    try:
+        cursor = writer.cursor()
+        cursor.execute("BEGIN EXCLUSIVE")
+        cursor.execute("INSERT INTO t VALUES (2)")
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT COUNT(*) FROM t")).scalar()
+    finally:
+        writer.rollback()
+        writer.close()
+
+
+def test_wal_reader_is_not_blocked_by_exclusive_write_transaction(tmp_path):
+    engine = create_sqlite_engine(_url(tmp_path), SQLiteProfile(busy_timeout_ms=100))
+
+    assert _count_during_exclusive_write(engine) == 1
+
+
+def test_rollback_journal_reader_is_blocked_by_exclusive_write_transaction(tmp_path):
+    # The same scenario without the profile: proves the test above depends on WAL
+    engine = create_sqlite_engine(_url(tmp_path), profile=None, connect_args={"timeout": 0.1})
+
+    with pytest.raises(OperationalError, match="database is locked"):
+        _count_during_exclusive_write(engine)
+
+
+def test_profile_names_resolve_and_typos_list_the_choices():
+    assert sqlite_profile("durable") is SQLITE_PROFILES["durable"]
+    assert sqlite_profile("legacy") is None
+
+    with pytest.raises(ValueError, match="Unknown SQLite profile 'wal'.*'default'"):
+        sqlite_profile("wal")
@@ -0,0 +1,172 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from artifactminer.db import Base, ConsentSnapshot, LLMResponseCacheEntry, llm_cache_stats
+from artifactminer.db.llm_cache import (
+    LLMCachePolicy,
+    llm_cache_key,
+    lookup_llm_response,
+    reset_llm_cache_stats,
+    store_llm_response,
+)
+from artifactminer.RepositoryIntelligence import repo_intelligence_AI
+
+
+@pytest.fixture
+def Session():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    reset_llm_cache_stats()
+    return sessionmaker(bind=engine)
+
+
+def _store(db, key, text="answer", policy=LLMCachePolicy()):
+    store_llm_response(db, key, text, provider="openai", model="gpt-5-nano", policy=policy)
+
+
+def test_key_covers_provider_model_options_and_prompt():
+    base = llm_cache_key("openai", "gpt-5-nano", {}, "prompt")
+
+    assert base == llm_cache_key("openai", "gpt-5-nano", None, "prompt")
+    assert llm_cache_key("ollama", "llama3", {"a": 1, "b": 2}, "p") == llm_cache_key(
+        "ollama", "llama3", {"b": 2, "a": 1}, "p"
+    )
+    assert len({
+        base,
+        llm_cache_key("ollama", "gpt-5-nano", {}, "prompt"),
+        llm_cache_key("openai", "gpt-5-mini", {}, "prompt"),
+        llm_cache_key("openai", "gpt-5-nano", {"temperature": 0}, "prompt"),
+        llm_cache_key("openai", "gpt-5-nano", {}, "prompt "),
+    }) == 5
+
+
+def test_lookup_counts_hits_and_misses(Session):
+    db = Session()
+    assert lookup_llm_response(db, "k") is None
+    _store(db, "k")
+
+    assert lookup_llm_response(db, "k") == "answer"
+    assert lookup_llm_response(db, "k") == "answer"
+    assert db.get(LLMResponseCacheEntry, "k").hit_count == 2
+    stats = llm_cache_stats()
+    assert (stats.hits, stats.misses, stats.stores) == (2, 1, 1)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+
+def test_expired_entries_miss_and_are_replaced(Session):
+    db = Session()
+    _store(db, "k", "old")
+    db.get(LLMResponseCacheEntry, "k").created_at -= timedelta(days=2)
+    db.commit()
+    policy = LLMCachePolicy(ttl=timedelta(days=1))
+
+    assert lookup_llm_response(db, "k", policy=policy) is None
+    _store(db, "k", "new", policy)
+    assert lookup_llm_response(db, "k", policy=policy) == "new"
+
+
+def test_least_recently_used_entries_evicted_past_max_entries(Session):
+    db = Session()
+    policy = LLMCachePolicy(max_entries=2)
+    _store(db, "a", policy=policy)
+    _store(db, "b", policy=policy)
+    for entry, minutes in ((db.get(LLMResponseCacheEntry, "a"), 2), (db.get(LLMResponseCacheEntry, "b"), 1)):
+        entry.last_used_at -= timedelta(minutes=minutes)
+    db.commit()
+    lookup_llm_response(db, "a", policy=policy)  # "b" is now least recently used
+
+    _store(db, "c", policy=policy)
+
+    assert sorted(db.scalars(select(LLMResponseCacheEntry.key))) == ["a", "c"]
+    assert llm_cache_stats().evictions == 1
+
+
+def test_stores_under_max_entries_do_not_count_or_evict(Session):
+    from sqlalchemy import event
+
+    db = Session()
+    policy = LLMCachePolicy(max_entries=3)
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    for key in ("a", "b", "c", "a"):
+        _store(db, key, policy=policy)
+
+    assert sum("count(" in sql.lower() for sql in statements) == 1  # the first store only
+    assert not any(sql.lstrip().upper().startswith("DELETE") for sql in statements)
+    _store(db, "d", policy=policy)
+    assert db.scalar(select(func.count()).select_from(LLMResponseCacheEntry)) == 3
+
+
+def test_get_llm_response_answers_repeated_prompts_from_cache(Session, monkeypatch):
+    calls = []
+
+    async def fake_gpt(prompt):
+        calls.append(prompt)
+        return f"summary of {prompt}"
+
+    monkeypatch.setattr(repo_intelligence_AI, "SessionLocal", Session)
+    monkeypatch.setattr(repo_intelligence_AI, "get_gpt5_nano_response", fake_gpt)
+    consent = ConsentSnapshot(consent_level="full", llm_model="chatGPT")
+
+    async def run():
+        first = await repo_intelligence_AI.getLLMResponse("commit diff", consent)
+        second = await repo_intelligence_AI.getLLMResponse("commit diff", consent)
+        other = await repo_intelligence_AI.getLLMResponse("other diff", consent)
+        uncached = await repo_intelligence_AI.getLLMResponse(
+            "commit diff", consent, cache_policy=LLMCachePolicy(enabled=False)
+        )
+        return first, second, other, uncached
+
+    first, second, other, uncached = asyncio.run(run())
+
+    assert first == second == uncached == "summary of commit diff"
+    assert other == "summary of other diff"
+    assert calls == ["commit diff", "other diff", "commit diff"]
+    assert (llm_cache_stats().hits, llm_cache_stats().misses) == (1, 2)
+
+
+def test_get_llm_response_does_not_cache_ollama_errors(Session, monkeypatch):
+    responses = iter(["[Ollama error] model not found", "local summary"])
+    monkeypatch.setattr(repo_intelligence_AI, "SessionLocal", Session)
+    monkeypatch.setattr(repo_intelligence_AI, "get_ollama_response", lambda prompt, model: next(responses))
+    consent = ConsentSnapshot(consent_level="local-llm", llm_model="ollama")
+
+    results = [asyncio.run(repo_intelligence_AI.getLLMResponse("diff", consent)) for _ in range(3)]
+
+    assert results == ["[Ollama error] model not found", "local summary", "local summary"]
+    assert Session().get(LLMResponseCacheEntry, llm_cache_key(
+        *repo_intelligence_AI.llm_request_target("ollama"), "diff"
+    )).provider == "ollama"
+
+
+def test_get_llm_response_keeps_cache_io_off_the_event_loop(monkeypatch):
+    import threading
+
+    threads = []
+    monkeypatch.setattr(
+        repo_intelligence_AI, "_cached_llm_response",
+        lambda key, policy: threads.append(threading.current_thread()),
+    )
+    monkeypatch.setattr(
+        repo_intelligence_AI, "_cache_llm_response",
+        lambda *args: threads.append(threading.current_thread()),
+    )
+
+    async def fake_gpt(prompt):
+        return "summary"
+
+    monkeypatch.setattr(repo_intelligence_AI, "get_gpt5_nano_response", fake_gpt)
+    consent = ConsentSnapshot(consent_level="full", llm_model="chatGPT")
+
+    assert asyncio.run(repo_intelligence_AI.getLLMResponse("diff", consent)) == "summary"
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
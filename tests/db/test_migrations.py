@@ -0,0 +1,71 @@
+import pytest
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+
+from artifactminer.db import migrations
+from artifactminer.db.migrations import ALEMBIC_INI, SCHEMA_HEAD, current_revisions, ensure_schema
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+
+
+@pytest.fixture
+def upgrades(monkeypatch):
+    calls = []
+    monkeypatch.setattr(migrations, "upgrade_to_head", lambda: calls.append("upgrade"))
+    return calls
+
+
+def _stamp(engine, revision):
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        conn.execute(text("INSERT INTO alembic_version VALUES (:rev)"), {"rev": revision})
+
+
+def test_schema_head_matches_alembic_scripts():
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+
+    assert script.get_current_head() == SCHEMA_HEAD
+
+
+def test_current_revisions_empty_without_version_table(engine):
+    assert current_revisions(engine) == set()
+
+
+def test_check_mode_skips_upgrade_at_head(engine, upgrades):
+    _stamp(engine, SCHEMA_HEAD)
+
+    assert ensure_schema("check", bind=engine) is False
+    assert upgrades == []
+
+
+def test_check_mode_upgrades_unmigrated_database(engine, upgrades):
+    assert ensure_schema("check", bind=engine) is True
+    assert upgrades == ["upgrade"]
+
+
+def test_check_mode_upgrades_older_revision(engine, upgrades):
+    _stamp(engine, "0000older000")
+
+    assert ensure_schema("check", bind=engine) is True
+    assert upgrades == ["upgrade"]
+
+
+def test_upgrade_mode_always_runs(engine, upgrades):
+    _stamp(engine, SCHEMA_HEAD)
+
+    assert ensure_schema("upgrade", bind=engine) is True
+    assert upgrades == ["upgrade"]
+
+
+def test_off_mode_never_runs(engine, upgrades):
+    assert ensure_schema("off", bind=engine) is False
+    assert upgrades == []
+
+
+def test_unknown_mode_rejected(engine, upgrades):
+    with pytest.raises(ValueError, match="Unknown migration mode"):
+        ensure_schema("sometimes", bind=engine)
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from artifactminer.db import Base, PortfolioSnapshot, invalidate_portfolio_snapshots
+from artifactminer.db.database import create_sqlite_engine
+from artifactminer.db.portfolio_snapshots import snapshot_generation, store_portfolio_snapshot
+
+
+@pytest.fixture
+def Session(tmp_path):
+    # A file database, so each session has its own connection like separate workers
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _store(db, generation):
+    return store_portfolio_snapshot(db, "p", "prefs", '{"ok": true}', generation=generation)
+
+
+def test_snapshot_is_stored_when_no_invalidation_intervened(Session):
+    with Session() as db:
+        etag = _store(db, snapshot_generation(db))
+
+        assert db.get(PortfolioSnapshot, ("p", "prefs")).etag == etag
+
+
+def test_snapshot_built_before_another_sessions_invalidation_is_not_stored(Session):
+    with Session() as reader, Session() as writer:
+        generation = snapshot_generation(reader)
+        reader.get(PortfolioSnapshot, ("p", "prefs"))  # the build's read transaction
+
+        invalidate_portfolio_snapshots(writer, ["p"])
+        writer.commit()
+
+        assert _store(reader, generation)
+        assert reader.get(PortfolioSnapshot, ("p", "prefs")) is None
+        assert snapshot_generation(reader) == generation + 1
+
+
+def test_rolled_back_invalidation_does_not_bump_the_generation(Session):
+    with Session() as db:
+        generation = snapshot_generation(db)
+        invalidate_portfolio_snapshots(db)
+        db.rollback()
+
+        assert snapshot_generation(db) == generation
@@ -0,0 +1,72 @@
+import warnings
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from artifactminer.db import Base, RepoStat, repo_scope_filter
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _names(db, roots):
+    return sorted(r.project_name for r in db.query(RepoStat).filter(repo_scope_filter(roots)))
+
+
+def test_stamped_rows_match_by_extraction_root(db):
+    db.add_all(
+        [
+            RepoStat(project_name="a", project_path="/x/.extracted/1/a", extraction_root=".extracted/1"),
+            RepoStat(project_name="b", project_path=".extracted/12/b", extraction_root=".extracted/12"),
+        ]
+    )
+    db.commit()
+
+    assert _names(db, [".extracted/1/"]) == ["a"]
+
+
+def test_unstamped_rows_fall_back_to_path_boundary(db):
+    db.add_all(
+        [
+            RepoStat(project_name="a", project_path=".extracted/1/a"),
+            RepoStat(project_name="b", project_path=".extracted/12/b"),
+            RepoStat(project_name="root", project_path=".extracted/1"),
+        ]
+    )
+    db.commit()
+
+    assert _names(db, [".extracted/1"]) == ["a", "root"]
+
+
+def test_no_roots_match_nothing(db):
+    db.add_all(
+        [
+            RepoStat(project_name="a", project_path=".extracted/1/a", extraction_root=".extracted/1"),
+            RepoStat(project_name="b", project_path=".extracted/2/b"),
+        ]
+    )
+    db.commit()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # or_() with no arguments is deprecated
+        assert _names(db, []) == []
+        assert _names(db, ["", "  "]) == []
+
+
+def test_scoped_lookup_uses_extraction_root_index(db):
+    plan = db.execute(
+        text(
+            "EXPLAIN QUERY PLAN SELECT id FROM repo_stats "
+            "WHERE extraction_root = :root AND deleted_at IS NULL"
+        ),
+        {"root": ".extracted/1"},
+    ).all()
+
+    assert "ix_repo_stats_extraction_root_deleted_at" in " ".join(row[-1] for row in plan)
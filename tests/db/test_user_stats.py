@@ -0,0 +1,35 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from artifactminer.db import Base, UserRepoStat, latest_user_repo_stats
+
+
+def test_latest_user_repo_stats_picks_newest_row_per_project_in_one_query():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        [
+            UserRepoStat(project_name="alpha", project_path="/r/alpha", user_role="Intern"),
+            UserRepoStat(project_name="beta", project_path="/r/beta", user_role="Lead"),
+            UserRepoStat(project_name="alpha", project_path="/r/alpha", user_role="Maintainer"),
+            # Same path under another name is a separate project
+            UserRepoStat(project_name="alpha-fork", project_path="/r/alpha", user_role="Fork"),
+            UserRepoStat(project_name="gamma", project_path="/r/gamma", user_role="Other"),
+        ]
+    )
+    db.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    stats = latest_user_repo_stats(db, ["/r/alpha", "/r/beta", "/r/alpha"])
+
+    assert {key: stat.user_role for key, stat in stats.items()} == {
+        ("alpha", "/r/alpha"): "Maintainer",
+        ("beta", "/r/beta"): "Lead",
+        ("alpha-fork", "/r/alpha"): "Fork",
+    }
+    assert len(statements) == 1
+    assert "row_number() OVER" in statements[0]
+    assert latest_user_repo_stats(db, []) == {}
+    db.close()
@@ -14,6 +14,7 @@ from artifactminer.db.models import ProjectEvidence, RepoStat
 from artifactminer.evidence.models import EvidenceItem
 from artifactminer.evidence.orchestrator import (
     MAX_AUTOGENERATED_EVIDENCE_PER_RUN,
+    EvidenceBatchWriter,
     persist_generated_evidence,
     persist_insights_as_project_evidence,
 )
@@ -183,3 +184,37 @@ def test_persist_generated_evidence_commit_false_rollback(db_session, repo_stat)
         .count()
         == 0
     )
+
+
+def test_batch_writer_dedupes_across_sources_with_one_insert(db_session, repo_stat):
+    from sqlalchemy import event
+
+    db_session.add(
+        ProjectEvidence(repo_stat_id=repo_stat.id, type="metric", content="Has README")
+    )
+    db_session.commit()
+
+    writer = EvidenceBatchWriter(db_session, repo_stat.id)
+    writer.add(
+        [EvidenceItem(type="evaluation", content=f"Insight {idx}") for idx in range(20)]
+    )
+    writer.add(
+        [
+            EvidenceItem(type="metric", content="has  readme"),
+            EvidenceItem(type="EVALUATION", content="insight 0"),
+            EvidenceItem(type="metric", content="Uses CI"),
+        ]
+    )
+
+    inserts = []
+    listener = lambda conn, cursor, statement, *rest: inserts.append(statement)  # noqa: E731
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        created = writer.flush()
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+
+    assert [row.content for row in created][-1] == "Uses CI"
+    assert len(created) == MAX_AUTOGENERATED_EVIDENCE_PER_RUN + 1  # each source keeps its own cap
+    assert sum(stmt.lstrip().upper().startswith("INSERT") for stmt in inserts) == 1
+    assert sum("FROM project_evidence" in stmt for stmt in inserts) == 1
@@ -0,0 +1,169 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from artifactminer.helpers.llm_dispatch import (
+    LLMDeadlineExceeded,
+    LLMDispatcher,
+    ProviderLimits,
+    backoff_delay,
+    is_retryable,
+)
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+class RateLimitError(Exception):
+    """Named like openai's, which is matched by class name."""
+
+
+def _dispatcher(**limits):
+    return LLMDispatcher({"test": ProviderLimits(**limits)})
+
+
+async def test_concurrency_is_capped_per_provider():
+    dispatcher = _dispatcher(max_concurrency=2)
+    in_flight = peak = 0
+
+    async def call(n):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return n
+
+    results = await asyncio.gather(*[dispatcher.run("test", lambda n=n: call(n)) for n in range(8)])
+
+    assert results == list(range(8))
+    assert peak == 2
+
+
+async def test_token_bucket_paces_requests_after_burst():
+    dispatcher = _dispatcher(max_concurrency=10, requests_per_minute=60 * 50, burst=2)
+    started = time.monotonic()
+
+    await asyncio.gather(*[dispatcher.run("test", lambda: asyncio.sleep(0)) for _ in range(7)])
+
+    # 2 immediately, then 5 more at 50 per second
+    assert time.monotonic() - started >= 0.09
+
+
+async def test_retryable_errors_are_retried_until_success():
+    dispatcher = _dispatcher(backoff_base=0.001)
+    errors = [FakeStatusError(429), RateLimitError("slow down"), ConnectionResetError()]
+
+    async def call():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    assert await dispatcher.run("test", call) == "ok"
+    assert errors == []
+
+
+async def test_non_retryable_and_exhausted_errors_propagate():
+    dispatcher = _dispatcher(max_retries=2, backoff_base=0.001)
+    attempts = []
+
+    async def bad_request():
+        attempts.append("400")
+        raise FakeStatusError(400)
+
+    async def overloaded():
+        attempts.append("503")
+        raise FakeStatusError(503)
+
+    with pytest.raises(FakeStatusError):
+        await dispatcher.run("test", bad_request)
+    with pytest.raises(FakeStatusError):
+        await dispatcher.run("test", overloaded)
+    assert attempts == ["400", "503", "503", "503"]
+
+
+async def test_deadline_covers_queueing_and_attempts():
+    dispatcher = _dispatcher(max_concurrency=1, deadline=0.05)
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    with pytest.raises(LLMDeadlineExceeded) as excinfo:
+        await dispatcher.run("test", hang)
+    assert excinfo.value.provider == "test"
+    # A retry that cannot finish in time is not attempted
+    with pytest.raises(FakeStatusError):
+        await dispatcher.run(
+            "test", lambda: _raise(FakeStatusError(429, {"retry-after": "5"})), deadline=1.0
+        )
+
+
+async def test_blocking_call_keeps_its_slot_until_the_thread_returns():
+    dispatcher = _dispatcher(max_concurrency=1, max_retries=0)
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def blocking():
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.2)
+        with lock:
+            in_flight -= 1
+        return "done"
+
+    loop = asyncio.get_running_loop()
+    call = lambda: loop.run_in_executor(None, blocking)  # noqa: E731
+    first = asyncio.create_task(dispatcher.run("test", call, deadline=0.05))
+    await asyncio.sleep(0.01)  # first takes the slot
+
+    # The deadline gives up on the first thread, but it still occupies the slot
+    second = await dispatcher.run("test", call, deadline=5)
+    with pytest.raises(LLMDeadlineExceeded):
+        await first
+
+    assert second == "done"
+    assert peak == 1
+
+
+async def test_call_timeouts_are_not_reported_as_deadline():
+    dispatcher = _dispatcher(max_retries=0)
+
+    with pytest.raises(TimeoutError) as excinfo:
+        await dispatcher.run("test", lambda: _raise(TimeoutError("read timeout")))
+    assert not isinstance(excinfo.value, LLMDeadlineExceeded)
+
+
+async def _raise(exc):
+    raise exc
+
+
+def test_backoff_is_jittered_capped_and_respects_retry_after():
+    limits = ProviderLimits(backoff_base=1.0, backoff_max=4.0)
+
+    for attempt in range(6):
+        for _ in range(20):
+            assert 0 <= backoff_delay(attempt, limits) <= min(4.0, 2**attempt)
+    assert backoff_delay(0, limits, retry_after=7.0) == 7.0
+
+
+def test_retryable_classification():
+    assert is_retryable(FakeStatusError(429)) and is_retryable(FakeStatusError(502))
+    assert is_retryable(TimeoutError()) and is_retryable(RateLimitError())
+    assert not is_retryable(FakeStatusError(401)) and not is_retryable(ValueError())
+
+
+def test_dispatcher_works_across_event_loops():
+    dispatcher = _dispatcher(max_concurrency=1, requests_per_minute=6000)
+
+    async def job():
+        return await asyncio.gather(*[dispatcher.run("test", lambda: asyncio.sleep(0, "ok")) for _ in range(3)])
+
+    assert asyncio.run(job()) == asyncio.run(job()) == ["ok"] * 3
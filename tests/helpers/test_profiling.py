@@ -0,0 +1,67 @@
+import json
+import threading
+
+from artifactminer.helpers.profiling import RunProfiler
+
+
+def test_spans_aggregate_per_stage_and_per_repo():
+    profiler = RunProfiler()
+    with profiler.span("discovery", count=2):
+        pass
+    for repo in ("alpha", "beta"):
+        with profiler.span("additions", repo=repo) as span:
+            span.count = 3
+            span.bytes = 100
+
+    summary = profiler.summary()
+
+    assert summary["stages"]["discovery"]["count"] == 2
+    assert summary["stages"]["additions"]["calls"] == 2
+    assert summary["stages"]["additions"]["count"] == 6
+    assert summary["stages"]["additions"]["bytes"] == 200
+    assert set(summary["repos"]) == {"alpha", "beta"}
+    assert "discovery" not in summary["repos"]["alpha"]
+    assert summary["total_seconds"] >= summary["stages"]["additions"]["seconds"]
+
+
+def test_span_is_recorded_when_the_block_raises():
+    profiler = RunProfiler()
+    try:
+        with profiler.span("getRepoStats", repo="alpha"):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+
+    assert [span.name for span in profiler.spans] == ["getRepoStats"]
+
+
+def test_spans_from_several_threads_are_all_kept():
+    profiler = RunProfiler()
+
+    def work(i):
+        with profiler.span(f"signal.{i}", repo="alpha"):
+            pass
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(profiler.summary()["repos"]["alpha"]) == 8
+
+
+def test_json_and_chrome_trace_exports(tmp_path):
+    profiler = RunProfiler()
+    with profiler.span("manifests", repo="alpha", count=4):
+        pass
+
+    report = json.loads(profiler.write_json(tmp_path / "profile.json").read_text())
+    trace = json.loads(profiler.write_chrome_trace(tmp_path / "trace.json").read_text())
+
+    assert report["spans"][0]["name"] == "manifests"
+    (event,) = trace["traceEvents"]
+    assert event["ph"] == "X"
+    assert event["name"] == "manifests"
+    assert event["args"] == {"repo": "alpha", "count": 4}
+    assert event["dur"] >= 0
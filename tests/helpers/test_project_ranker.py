@@ -2,11 +2,16 @@ import zipfile
 from pathlib import Path
 import pytest
 import unittest.mock
-import subprocess
 from artifactminer.helpers.project_ranker import rank_projects
+from artifactminer.RepositoryIntelligence.git_runner import GitResult
 from artifactminer.helpers.zip_utils import safe_extract_zip
 
 
+def _git_log_result(stdout: str, **flags) -> GitResult:
+    flags.setdefault("returncode", 0)
+    return GitResult(args=["log", "--all", "--format=%aE"], stdout=stdout, **flags)
+
+
 @pytest.fixture(scope="module")
 def real_projects_data(tmp_path_factory):
     # Locate the zip file
@@ -99,8 +104,11 @@ def test_rank_projects_zero_commits(tmp_path):
     project_dir.mkdir()
     (project_dir / ".git").mkdir()
 
-    # Mock subprocess to return empty string (no commits)
-    with unittest.mock.patch("subprocess.check_output", return_value=""):
+    # Mock git to return empty output (no commits)
+    with unittest.mock.patch(
+        "artifactminer.helpers.project_ranker.run_git",
+        return_value=_git_log_result(""),
+    ):
         results = rank_projects(str(tmp_path), "user@example.com")
 
     assert len(results) == 1
@@ -116,9 +124,10 @@ def test_rank_projects_git_failure(tmp_path):
     project_dir.mkdir()
     (project_dir / ".git").mkdir()
 
-    # Mock subprocess to raise CalledProcessError
+    # Mock git exiting with an error
     with unittest.mock.patch(
-        "subprocess.check_output", side_effect=subprocess.CalledProcessError(1, "git")
+        "artifactminer.helpers.project_ranker.run_git",
+        return_value=GitResult(args=[], returncode=128),
     ):
         results = rank_projects(str(tmp_path), "user@example.com")
 
@@ -131,14 +140,13 @@ def test_rank_projects_malformed_output(tmp_path):
     project_dir.mkdir()
     (project_dir / ".git").mkdir()
 
-    # Mock output with some valid and some invalid lines
-    mock_output = """
-       10\tValid User <user@example.com>
-       invalid line without tab or email
-       5\tAnother User <other@example.com>
-    """
+    # Mock output with blank and whitespace-only lines mixed in
+    mock_output = "\n" + "user@example.com\n" * 10 + "   \n" + "other@example.com\n" * 5 + "\n"
 
-    with unittest.mock.patch("subprocess.check_output", return_value=mock_output):
+    with unittest.mock.patch(
+        "artifactminer.helpers.project_ranker.run_git",
+        return_value=_git_log_result(mock_output),
+    ):
         results = rank_projects(str(tmp_path), "user@example.com")
 
     assert len(results) == 1
@@ -153,9 +161,12 @@ def test_rank_projects_case_insensitivity(tmp_path):
     project_dir.mkdir()
     (project_dir / ".git").mkdir()
 
-    mock_output = "   10\tUser Name <USER@EXAMPLE.COM>"
+    mock_output = "USER@EXAMPLE.COM\n" * 10
 
-    with unittest.mock.patch("subprocess.check_output", return_value=mock_output):
+    with unittest.mock.patch(
+        "artifactminer.helpers.project_ranker.run_git",
+        return_value=_git_log_result(mock_output),
+    ):
         # Pass lowercase email to function
         results = rank_projects(str(tmp_path), "user@example.com")
 
@@ -170,12 +181,55 @@ def test_rank_projects_no_user_commits(tmp_path):
     project_dir.mkdir()
     (project_dir / ".git").mkdir()
 
-    mock_output = "   20\tOther User <other@example.com>"
+    mock_output = "other@example.com\n" * 20
 
-    with unittest.mock.patch("subprocess.check_output", return_value=mock_output):
+    with unittest.mock.patch(
+        "artifactminer.helpers.project_ranker.run_git",
+        return_value=_git_log_result(mock_output),
+    ):
         results = rank_projects(str(tmp_path), "user@example.com")
 
     assert len(results) == 1
     assert results[0]["score"] == 0.0
     assert results[0]["total_commits"] == 20
     assert results[0]["user_commits"] == 0
+
+
+def test_rank_projects_keeps_partial_history(tmp_path):
+    """A repo that blows its git budget is ranked from what was read, not dropped."""
+    project_dir = tmp_path / "huge-history-project"
+    project_dir.mkdir()
+    (project_dir / ".git").mkdir()
+
+    # Byte cap hit mid-line: the trailing fragment must not be counted.
+    mock_output = "user@example.com\n" * 3 + "other@example.com\n" + "user@exa"
+
+    with unittest.mock.patch(
+        "artifactminer.helpers.project_ranker.run_git",
+        return_value=_git_log_result(mock_output, truncated=True, returncode=-9),
+    ):
+        results = rank_projects(str(tmp_path), "user@example.com")
+
+    assert len(results) == 1
+    assert results[0]["partial"] is True
+    assert results[0]["total_commits"] == 4
+    assert results[0]["user_commits"] == 3
+
+
+def test_rank_projects_drops_last_line_after_timeout(tmp_path):
+    """A timed-out read can end mid-line even when the fragment looks like an email."""
+    project_dir = tmp_path / "slow-project"
+    project_dir.mkdir()
+    (project_dir / ".git").mkdir()
+
+    mock_output = "user@example.com\n" * 2 + "other@example.com\n" + "user@example.co"
+
+    with unittest.mock.patch(
+        "artifactminer.helpers.project_ranker.run_git",
+        return_value=_git_log_result(mock_output, timed_out=True, returncode=-9),
+    ):
+        results = rank_projects(str(tmp_path), "user@example.co")
+
+    assert results[0]["partial"] is True
+    assert results[0]["total_commits"] == 3
+    assert results[0]["user_commits"] == 0
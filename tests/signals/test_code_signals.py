@@ -0,0 +1,105 @@
+import re
+
+from artifactminer.skills.signals.code_signals import (
+    CodePatternMatcher,
+    get_code_pattern_matcher,
+    iter_code_pattern_hits,
+)
+from artifactminer.skills.skill_patterns import CODE_REGEX_PATTERNS, CodePattern
+
+SAMPLE_ADDITIONS = """
+import logging
+from collections import Counter, defaultdict
+from pydantic import BaseModel
+from fastapi import Depends
+
+class ParseError(Exception):
+    pass
+
+class QuotaException(ParseError):
+    pass
+
+@router.get("/items")
+async def list_items(db = Depends(get_db)):
+    max_items = 50
+    with open("x") as fh:
+        logging.info("SELECT id FROM items")
+    return Counter()
+
+@dataclass
+class Item(BaseModel, ABC):
+    name: str
+"""
+
+
+def _findall_counts(text, patterns):
+    return [len(re.findall(p.regex, text, flags=re.MULTILINE)) for p in patterns]
+
+
+def test_matcher_counts_equal_findall_per_pattern():
+    text = SAMPLE_ADDITIONS * 3
+
+    matcher = CodePatternMatcher(CODE_REGEX_PATTERNS)
+
+    assert matcher.count(text) == _findall_counts(text, CODE_REGEX_PATTERNS)
+
+
+def test_pattern_literals_appear_in_every_match():
+    text = SAMPLE_ADDITIONS + "\n@Test\n@GetMapping\nimport unittest\nSELECT a\n FROM b\n"
+
+    for pattern in CODE_REGEX_PATTERNS:
+        if not pattern.literals:
+            continue
+        for match in re.finditer(pattern.regex, text, flags=re.MULTILINE):
+            assert any(lit in match.group(0) for lit in pattern.literals), pattern.skill
+
+
+def test_patterns_without_literals_present_are_skipped():
+    matcher = CodePatternMatcher(
+        [CodePattern(skill="A", regex=r"\bheapq\b", category="x", evidence="a", literals=("heapq",))]
+    )
+    matcher._compiled = [None]  # would raise if the regex were consulted
+
+    assert matcher.count("import bisect\n") == [0]
+
+
+def test_overlapping_patterns_are_counted_independently():
+    patterns = [
+        CodePattern(skill="A", regex=r"class\s+.*Exception", category="x", evidence="a"),
+        CodePattern(skill="B", regex=r"class\s+\w+(Error|Exception)\(", category="x", evidence="b"),
+        CodePattern(skill="C", regex=r"Error", category="x", evidence="c"),
+    ]
+    text = "class FooError(Exception):\nclass BarException(Base):\n"
+
+    assert CodePatternMatcher(patterns).skill_counts(text) == {"A": 2, "B": 2, "C": 1}
+
+
+def test_iter_hits_respects_ecosystem_gate():
+    text = "@Test\nasync def run():\n    pass\n"
+
+    python_skills = {p.skill for p, _ in iter_code_pattern_hits(text, {"python"})}
+    java_skills = {p.skill for p, _ in iter_code_pattern_hits(text, {"java"})}
+
+    assert "Asynchronous Programming" in python_skills
+    assert "Asynchronous Programming" not in java_skills
+    assert get_code_pattern_matcher(frozenset({"python"})) is get_code_pattern_matcher(
+        frozenset({"python"})
+    )
+
+
+def test_count_chunks_accumulates_without_joining():
+    chunks = ["async def a():\n    pass\n", "logging.info('x')\n", "async def b():\n    pass\n"]
+    matcher = get_code_pattern_matcher(frozenset({"python"}))
+
+    assert matcher.count_chunks(iter(chunks)) == matcher.count("\n".join(chunks))
+
+
+def test_iter_hits_accepts_generator_of_commit_chunks():
+    def commits():
+        yield "async def run():\n    pass\n"
+        yield "@dataclass\nclass Job:\n    pass\n"
+
+    hits = {p.skill: n for p, n in iter_code_pattern_hits(commits(), {"python"})}
+
+    assert hits["Asynchronous Programming"] == 1
+    assert hits["Dataclass Design"] == 1
@@ -168,3 +168,76 @@ def test_extract_git_stats_includes_commit_window_with_preloaded_user_stats(monk
 
     assert git_stats is not None
     assert git_stats.commit_count_window == 3
+
+
+def test_analyze_walks_user_history_once_and_never_calls_getUserRepoStats(tmp_path, monkeypatch):
+    import git
+
+    from artifactminer.skills.analysis_context import RepoAnalysisContext
+
+    repo_root = tmp_path / "collab_repo"
+    repo_root.mkdir()
+    repo = git.Repo.init(repo_root)
+    user = git.Actor("Target User", "target@example.com")
+    other = git.Actor("Other User", "other@example.com")
+    for name, actor in [("a.py", user), ("b.py", other), ("c.py", user)]:
+        (repo_root / name).write_text("import logging\nlogging.info('x')\n")
+        repo.index.add([name])
+        repo.index.commit(f"add {name}", author=actor, committer=actor)
+
+    walks = []
+    original_walk = RepoAnalysisContext._walk_user_commits
+
+    def counting_walk(self):
+        walks.append(self.user_email)
+        return original_walk(self)
+
+    monkeypatch.setattr(RepoAnalysisContext, "_walk_user_commits", counting_walk)
+    monkeypatch.setattr(
+        "artifactminer.skills.signals.git_signals.getUserRepoStats",
+        lambda *a, **k: pytest.fail("user stats recomputed"),
+    )
+
+    result = DeepRepoAnalyzer(enable_llm=False).analyze(
+        repo_path=str(repo_root),
+        repo_stat=DummyRepoStat(is_collaborative=True, languages=["Python"]),
+        user_email="target@example.com",
+        user_contributions={"additions": []},
+    )
+
+    assert walks == ["target@example.com"]
+    assert result.git_stats.commit_count_window == 2
+    assert result.git_stats.contribution_percent == pytest.approx(200 / 3)
+    assert "Logging" in {s.skill for s in result.skills}
+
+
+def test_extract_git_stats_with_preloaded_stats_does_not_walk_history(tmp_path, monkeypatch):
+    import git
+
+    from artifactminer.skills.analysis_context import RepoAnalysisContext
+
+    repo = git.Repo.init(tmp_path)
+    user = git.Actor("Target User", "target@example.com")
+    (tmp_path / "a.py").write_text("x = 1\n")
+    repo.index.add(["a.py"])
+    repo.index.commit("add a.py", author=user, committer=user)
+
+    preloaded_stats = MagicMock(total_commits=1, commitFrequency=1.0, userStatspercentages=100.0)
+    monkeypatch.setattr(
+        RepoAnalysisContext, "_walk_user_commits", lambda self: pytest.fail("full history walk")
+    )
+    context = RepoAnalysisContext(
+        repo_path=str(tmp_path),
+        user_email="target@example.com",
+        preloaded_user_stats=preloaded_stats,
+    )
+
+    git_stats = DeepRepoAnalyzer(enable_llm=False)._extract_git_stats(
+        str(tmp_path),
+        "target@example.com",
+        user_contributions=None,
+        user_stats=preloaded_stats,
+        context=context,
+    )
+
+    assert git_stats.commit_count_window == 1  # from the since-bounded query
@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+
+from artifactminer.skills.analysis_context import RepoAnalysisContext
+from artifactminer.skills.deep_analysis import DeepRepoAnalyzer
+from artifactminer.skills.extractor_registry import ExtractorRegistry, SignalExtractor
+
+
+@pytest.fixture
+def context(tmp_path):
+    return RepoAnalysisContext(repo_path=str(tmp_path), user_email="dev@example.com")
+
+
+def test_dependents_receive_upstream_results_in_dag_order(context):
+    registry = ExtractorRegistry()
+    registry.add(SignalExtractor("summary", lambda ctx, up: up["a"] + up["b"], depends_on=("a", "b")))
+    registry.add(SignalExtractor("a", lambda ctx, up: 1))
+    registry.add(SignalExtractor("b", lambda ctx, up: 2))
+
+    results, timings = registry.run(context)
+
+    assert registry.topological_order() == ["a", "b", "summary"]
+    assert results == {"a": 1, "b": 2, "summary": 3}
+    assert set(timings) == {"a", "b", "summary"}
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_independent_extractors_run_concurrently(context):
+    # Both extractors must be inside run() at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    registry = ExtractorRegistry()
+
+    @registry.register("left")
+    def left(ctx, upstream):
+        barrier.wait()
+        return threading.current_thread().name
+
+    @registry.register("right")
+    def right(ctx, upstream):
+        barrier.wait()
+        return threading.current_thread().name
+
+    results, _ = registry.run(context, max_workers=2)
+
+    assert results["left"] != results["right"]
+
+
+def test_declared_inputs_are_loaded_once_across_threads(context, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "artifactminer.skills.analysis_context.build_dependency_index",
+        lambda *a, **k: calls.append(1) or "index",
+    )
+    registry = ExtractorRegistry(
+        SignalExtractor(name, lambda ctx, up: ctx.manifests(), inputs=frozenset({"manifests"}))
+        for name in ("one", "two", "three")
+    )
+
+    results, _ = registry.run(context)
+
+    assert calls == [1]
+    assert set(results.values()) == {"index"}
+
+
+def test_first_failure_is_raised_and_dependents_are_skipped(context):
+    ran = []
+    registry = ExtractorRegistry(
+        [
+            SignalExtractor("broken", lambda ctx, up: (_ for _ in ()).throw(ValueError("boom"))),
+            SignalExtractor("after", lambda ctx, up: ran.append("after"), depends_on=("broken",)),
+        ]
+    )
+
+    with pytest.raises(ValueError, match="boom"):
+        registry.run(context)
+    assert ran == []
+
+
+def test_registry_rejects_cycles_and_unknown_inputs():
+    registry = ExtractorRegistry(
+        [
+            SignalExtractor("a", lambda ctx, up: None, depends_on=("b",)),
+            SignalExtractor("b", lambda ctx, up: None, depends_on=("a",)),
+        ]
+    )
+    with pytest.raises(ValueError, match="cycle"):
+        registry.topological_order()
+    with pytest.raises(ValueError, match="unknown inputs"):
+        ExtractorRegistry([SignalExtractor("c", lambda ctx, up: None, inputs=frozenset({"blame"}))])
+
+
+def test_analyzer_records_timings_and_runs_plugged_in_extractors(tmp_path):
+    (tmp_path / "main.py").write_text("print('hi')\n")
+    analyzer = DeepRepoAnalyzer(enable_llm=False)
+    analyzer.registry.add(
+        SignalExtractor(
+            "skill_count", lambda ctx, up: len(up["skills"]), depends_on=("skills",)
+        )
+    )
+
+    class RepoStat:
+        is_collaborative = False
+        Languages = languages = ["Python"]
+        frameworks = []
+
+    result = analyzer.analyze(
+        repo_path=str(tmp_path),
+        repo_stat=RepoStat(),
+        user_email="dev@example.com",
+        user_contributions={"additions": "import logging\n"},
+    )
+
+    assert set(result.timings) == {
+        "skills",
+        "insights",
+        "git_stats",
+        "infra_signals",
+        "repo_quality",
+        "skill_count",
+    }
+    assert result.extra_signals == {"skill_count": len(result.skills)}
+
+
+def test_context_requires_an_email_and_keeps_its_case(tmp_path):
+    for missing in (None, "", "  "):
+        with pytest.raises(ValueError, match="email is required"):
+            RepoAnalysisContext(repo_path=str(tmp_path), user_email=missing)
+
+    context = RepoAnalysisContext(repo_path=str(tmp_path), user_email=" Dev@Example.com ")
+
+    # git --author matches case-sensitively, so the address is only trimmed
+    assert context.user_email == "Dev@Example.com"
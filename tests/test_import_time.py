@@ -0,0 +1,104 @@
+"""Import-time guard for application startup.
+
+Importing the API app must not load the heavy optional dependencies; they are
+imported on first use. Run this file directly for a ``python -X importtime``
+breakdown of the slowest imports:
+
+    python tests/test_import_time.py [--module artifactminer.api.app] [--top 25]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+
+# Loaded lazily by the code paths that need them, never at startup
+LAZY_MODULES = ("openai", "ollama", "pypdf", "git", "alembic")
+
+
+def _run_import(module: str, cwd: Path, migrations: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    env = os.environ.copy()
+    existing_pythonpath = env.get("PYTHONPATH", "")
+    env["PYTHONPATH"] = (
+        f"{SRC_DIR}{os.pathsep}{existing_pythonpath}" if existing_pythonpath else str(SRC_DIR)
+    )
+    env["ARTIFACTMINER_MIGRATIONS"] = migrations
+    result = subprocess.run(
+        [sys.executable, *flags, "-c", f"import {module}"],
+        cwd=cwd,
+        env=env,
+        text=True,
+        capture_output=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result
+
+
+def migrate(cwd: Path) -> None:
+    """Create the relative SQLite database the app opens in ``cwd``, at head."""
+    _run_import("artifactminer.api.app", cwd, "upgrade")
+
+
+def import_times(module: str, cwd: Path) -> dict[str, tuple[int, int]]:
+    """``{module: (self_us, cumulative_us)}`` from ``python -X importtime -c "import module"``.
+
+    Runs in ``cwd`` with the default "check" migration mode, so against a
+    database already at head (see ``migrate``) this is a normal restart.
+    """
+    result = _run_import(module, cwd, "check", "-X", "importtime")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+@pytest.fixture(scope="module")
+def migrated_dir(tmp_path_factory):
+    cwd = tmp_path_factory.mktemp("startup")
+    migrate(cwd)
+    return cwd
+
+
+@pytest.mark.parametrize("module", ["artifactminer.api.app", "artifactminer.main"])
+def test_startup_does_not_import_heavy_dependencies(module, migrated_dir):
+    times = import_times(module, migrated_dir)
+    imported = {name.partition(".")[0] for name in times}
+
+    assert module in times
+    assert imported.isdisjoint(LAZY_MODULES), sorted(imported.intersection(LAZY_MODULES))
+
+
+def main() -> None:
+    import tempfile
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="artifactminer.api.app")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        migrate(Path(tmp))
+        times = import_times(args.module, Path(tmp))
+
+    total_us = times[args.module][1]
+    print(f"import {args.module}: {total_us / 1000:.1f} ms cumulative, {len(times)} modules")
+    ranked = sorted(times.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in ranked[: args.top]:
+        print(f"  {cumulative_us / 1000:>9.1f} ms  {self_us / 1000:>8.1f} ms self  {name}")
+    lazy = sorted({name.partition(".")[0] for name in times}.intersection(LAZY_MODULES))
+    print(f"lazy dependencies imported: {', '.join(lazy) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
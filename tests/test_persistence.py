@@ -172,3 +172,151 @@ def test_persist_skills_commit_false(db_session, repo_stat):
     db_session.rollback()
 
     assert db_session.query(Skill).filter(Skill.name == "Go").first() is None
+
+
+def test_persist_skills_uses_constant_round_trips(db_session, repo_stat):
+    """Statement count doesn't grow with the number of skills persisted."""
+    from sqlalchemy import event
+
+    def count_statements(n_skills, email):
+        statements = []
+        engine = db_session.get_bind()
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            persist_extracted_skills(
+                db_session,
+                repo_stat.id,
+                [
+                    ExtractedSkill(skill=f"Skill {email} {i}", category="X", evidence=[f"e{i}"])
+                    for i in range(n_skills)
+                ],
+                user_email=email,
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        return len(statements)
+
+    assert count_statements(3, "a@x.com") == count_statements(40, "b@x.com")
+    assert db_session.query(UserProjectSkill).count() == 43
+    assert all(row.created_at for row in db_session.query(Skill))
+
+
+def test_persist_skills_merges_duplicates_and_existing_rows(db_session, repo_stat):
+    """Repeated names in one call and rows from earlier calls merge into one row."""
+    persist_extracted_skills(
+        db_session,
+        repo_stat.id,
+        [ExtractedSkill(skill="Rust", category="Language", evidence=["a"], proficiency=0.7)],
+        user_email="dev@x.com",
+    )
+
+    saved = persist_extracted_skills(
+        db_session,
+        repo_stat.id,
+        [
+            ExtractedSkill(skill="Rust", category="Language", evidence=["b"], proficiency=0.4),
+            ExtractedSkill(skill="Rust", category="Language", evidence=["a", "c"], proficiency=0.6),
+        ],
+        user_email="dev@x.com",
+    )
+
+    assert len(saved) == 1
+    assert saved[0].proficiency == 0.7
+    assert saved[0].evidence == ["a", "b", "c"]
+    assert db_session.query(UserProjectSkill).count() == 1
+
+
+def test_persist_skills_keeps_evidence_written_concurrently(db_session, repo_stat):
+    """A write landing between the evidence read and the upsert is merged, not overwritten."""
+    from sqlalchemy import event, text
+
+    persist_extracted_skills(
+        db_session,
+        repo_stat.id,
+        [ExtractedSkill(skill="Rust", category="Language", evidence=["a"], proficiency=0.5)],
+        user_email="dev@x.com",
+    )
+    engine = db_session.get_bind()
+    raced = []
+
+    def other_writer(conn, cursor, statement, *args):
+        if not raced and statement.lstrip().upper().startswith("INSERT INTO USER_PROJECT_SKILLS"):
+            raced.append(statement)
+            cursor.execute(
+                "UPDATE user_project_skills SET evidence = '[\"a\", \"other\"]', proficiency = 0.9"
+            )
+
+    event.listen(engine, "before_cursor_execute", other_writer)
+    try:
+        saved = persist_extracted_skills(
+            db_session,
+            repo_stat.id,
+            [ExtractedSkill(skill="Rust", category="Language", evidence=["b"], proficiency=0.6)],
+            user_email="dev@x.com",
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", other_writer)
+
+    assert raced
+    assert saved[0].proficiency == 0.9
+    assert saved[0].evidence == ["a", "other", "b"]
+    assert db_session.execute(text("SELECT COUNT(*) FROM user_project_skills")).scalar() == 1
+
+
+def _persist_rust(db_session, repo_stat, evidence, proficiency=0.5):
+    return persist_extracted_skills(
+        db_session,
+        repo_stat.id,
+        [ExtractedSkill(skill="Rust", category="Language", evidence=evidence, proficiency=proficiency)],
+        user_email="dev@x.com",
+    )
+
+
+def test_persist_skills_compares_stored_evidence_by_value_not_text(db_session, repo_stat):
+    """Evidence stored with other spacing (another client, a migration) still merges first time."""
+    from sqlalchemy import event, text
+
+    _persist_rust(db_session, repo_stat, ["a"])
+    db_session.execute(text("UPDATE user_project_skills SET evidence = '[ \"a\" ,\"x\"]'"))
+    db_session.commit()
+    upserts = []
+    engine = db_session.get_bind()
+
+    def listener(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO user_project_skills"):
+            upserts.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        saved = _persist_rust(db_session, repo_stat, ["b"])
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert saved[0].evidence == ["a", "x", "b"]
+    assert len(upserts) == 1
+
+
+def test_persist_skills_merges_under_lock_when_every_round_races(db_session, repo_stat):
+    """A writer that keeps winning the race can't make new evidence disappear."""
+    from sqlalchemy import event
+
+    _persist_rust(db_session, repo_stat, ["a"])
+    engine = db_session.get_bind()
+    races = []
+
+    def other_writer(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO user_project_skills"):
+            races.append(statement)
+            cursor.execute(
+                "UPDATE user_project_skills SET evidence = ?", (f'["a", "other{len(races)}"]',)
+            )
+
+    event.listen(engine, "before_cursor_execute", other_writer)
+    try:
+        saved = _persist_rust(db_session, repo_stat, ["b"])
+    finally:
+        event.remove(engine, "before_cursor_execute", other_writer)
+
+    assert len(races) == 3  # every compare-and-set round lost
+    assert saved[0].evidence == ["a", "other3", "b"]
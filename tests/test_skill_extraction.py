@@ -145,3 +145,24 @@ def test_shared_dependency_mapping_drives_detector_and_extractor(tmp_path):
 
     frameworks = detect_frameworks(repo_root)
     assert "Flask" in frameworks
+
+
+def test_profile_additions_are_streamed_and_deduplicated_per_commit():
+    shared = "async def shared():\n    return 1"
+    profile_only = "async def profile_only():\n    return 2"
+
+    chunks = list(
+        SkillExtractor._iter_unique_additions(
+            {"additions": [("a1", shared), ("b2", "x = 1"), ("a1", shared)]},
+            [("a1", shared), ("c3", profile_only), ("d4", shared)],
+        )
+    )
+
+    # "d4" repeats a1's lines in another commit: it still counts
+    assert chunks == [shared, "x = 1", profile_only, shared]
+
+
+def test_additions_without_shas_are_never_deduplicated():
+    chunks = list(SkillExtractor._iter_unique_additions({"additions": ["x = 1", "x = 1"]}, None))
+
+    assert chunks == ["x = 1", "x = 1"]